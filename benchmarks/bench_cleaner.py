@@ -0,0 +1,68 @@
+"""교정 사전 크기별 clean_text 비용: 항목별 str.replace 반복 vs 단일 패스 Corrector.
+
+기본 교정 테이블(8개)에 합성 교정 항목을 더해 가며 문서당 교정 시간을 비교한다.
+
+실행: python -m benchmarks.bench_cleaner [--sizes 0 100 1000 10000]
+"""
+import argparse
+import json
+import random
+import time
+from pathlib import Path
+
+from src.parser.cleaner import clean_text
+from src.parser.corrections import Corrector, default_corrector
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+HANGUL = [chr(c) for c in range(0xAC00, 0xD7A4)]
+
+
+def _texts():
+    return [json.loads(p.read_text(encoding="utf-8"))["text"] for p in sorted(DATA_DIR.glob("*.json"))]
+
+
+def _table(extra: int, seed: int = 0) -> dict:
+    rng = random.Random(seed)
+    table = dict(default_corrector().table)
+    while len(table) < len(default_corrector().table) + extra:
+        old = "".join(rng.choice(HANGUL) for _ in range(rng.randint(2, 6)))
+        table.setdefault(old, old[::-1])
+    return table
+
+
+def _sequential(table: dict):
+    def run(text):
+        for old, new in table.items():
+            text = text.replace(old, new)
+        return text
+    return run
+
+
+def _bench(fn, texts, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        for t in texts:
+            fn(t)
+        best = min(best, time.perf_counter() - t0)
+    return best / len(texts) * 1e6
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[0, 100, 1000, 10000])
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args(argv)
+
+    texts = _texts()
+    print(f"{'entries':>8} {'str.replace us/doc':>19} {'corrector us/doc':>17} {'clean_text us/doc':>18}")
+    for size in args.sizes:
+        table = _table(size)
+        corrector = Corrector(table)
+        print(f"{len(table):>8} {_bench(_sequential(table), texts, args.repeat):19.1f} "
+              f"{_bench(corrector.apply, texts, args.repeat):17.1f} "
+              f"{_bench(lambda t: clean_text(t, corrector), texts, args.repeat):18.1f}")
+
+
+if __name__ == "__main__":
+    main()
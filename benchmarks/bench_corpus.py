@@ -0,0 +1,86 @@
+"""코퍼스 리더 벤치마크: 줄 인덱스 생성/로드, 레코드 임의 접근, 재개 위치로 이동하는 비용.
+
+합성 계근지 --docs건을 OCR 응답(단어 상자 포함) JSONL 한 파일로 만든 뒤
+- 인덱스 생성(mmap 스캔) vs 저장된 <입력>.idx 로드 시간(--repeat번 중 최솟값)
+- 임의 레코드 --lookups건: 인덱스 O(1) 접근 vs 처음부터 줄을 세어 찾기(레코드 100건만)
+- 90% 지점에서 재개: 인덱스로 바로 이동 vs 처음부터 줄 읽어 건너뛰기
+를 잰다. 추출 비용은 포함하지 않는다(재개 시 이미 처리한 레코드를 다시 추출하지 않는 이득은 별도).
+
+실행: python -m benchmarks.bench_corpus [--docs 200000 --lookups 10000]
+"""
+import argparse
+import json
+import random
+import tempfile
+import time
+from itertools import islice
+from pathlib import Path
+
+from benchmarks.synthetic import generate_corpus, to_ocr_response
+from src.pipeline.corpus import Corpus
+
+
+def write_dump(path: Path, n: int, seed: int) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        for ticket in generate_corpus(n, seed=seed):
+            f.write(json.dumps(to_ocr_response(ticket), ensure_ascii=False))
+            f.write("\n")
+
+
+def _best(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def _scan_to(path: Path, i: int) -> bytes:
+    """인덱스 없이 i번째 줄 찾기: 처음부터 줄을 읽어 건너뛴다."""
+    with open(path, "rb") as f:
+        return next(islice(f, i, None))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--docs", type=int, default=200_000)
+    parser.add_argument("--lookups", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        src = Path(tmp) / "dump.jsonl"
+        write_dump(src, args.docs, args.seed)
+        size_mb = src.stat().st_size / 1e6
+        print(f"입력 {args.docs}건, {size_mb:.0f} MB")
+
+        def cold():
+            Path(f"{src}.idx").unlink(missing_ok=True)
+            Corpus(src).close()
+
+        build_s = _best(cold, args.repeat)
+        load_s = _best(lambda: Corpus(src).close(), args.repeat)
+        print(f"인덱스 생성(mmap 스캔+저장) {build_s * 1e3:8.1f} ms  ({size_mb / build_s:.0f} MB/s)")
+        print(f"인덱스 로드(.idx)           {load_s * 1e3:8.1f} ms  "
+              f"(인덱스 {Path(f'{src}.idx').stat().st_size / 1e6:.1f} MB)")
+
+        positions = [rng.randrange(args.docs) for _ in range(args.lookups)]
+        with Corpus(src) as corpus:
+            indexed_s = _best(lambda: [corpus.record(i) for i in positions], args.repeat)
+            scan_positions = positions[:100]
+            scan_s = _best(lambda: [json.loads(_scan_to(src, i)) for i in scan_positions], 1)
+            print(f"\n임의 레코드 접근(파싱 포함)  인덱스 {indexed_s / len(positions) * 1e6:8.1f} µs/건   "
+                  f"처음부터 찾기 {scan_s / len(scan_positions) * 1e6:10.1f} µs/건")
+
+            resume_at = args.docs * 9 // 10
+            seek_s = _best(lambda: next(corpus.iter_records(resume_at)), args.repeat)
+            skip_s = _best(lambda: _scan_to(src, resume_at), args.repeat)
+            print(f"90% 지점에서 재개            인덱스 {seek_s * 1e3:8.3f} ms     "
+                  f"줄 건너뛰기 {skip_s * 1e3:10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""중복 스캔 제거 벤치마크: 전체 추출 vs 지문으로 중복 묶음마다 한 번만 추출.
+
+합성 계근지 중 --dup-rate 비율을 1~2번 다시 스캔한 사본(synthetic.rescan: OCR 노이즈만 다르고
+숫자는 같음)과 섞어 임시 디렉터리에 파일로 만든다. 결과 파일은 쓰지 않고(output_dir=None)
+읽기·정제·추출 시간만 비교하며(--repeat번 번갈아 실행해 최솟값), 중복 판정의 정밀도/재현율도 함께 출력한다.
+
+실행: python -m benchmarks.bench_dedup [--docs 2000 --dup-rate 0 0.1 0.3 --repeat 3]
+"""
+import argparse
+import json
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.synthetic import generate_corpus, rescan, to_ocr_response
+from src.parser.extractor import OcrExtractor
+from src.pipeline.dedup import Deduplicator
+from src.pipeline.document import process_file
+
+
+def write_corpus(directory: Path, n: int, dup_rate: float, seed: int):
+    """원본 n장 + 사본. 반환: (입력 순서 파일 목록, 사본 파일명 → 원본 파일명)
+
+    사본은 원본 바로 뒤가 아니라 원본 뒤 최대 100장 사이 아무 곳에나 끼워 넣는다.
+    """
+    rng = random.Random(seed)
+    keyed, truth = [], {}
+    for i, ticket in enumerate(generate_corpus(n, seed=seed)):
+        original = f"t{i:06d}.json"
+        copies = [(i, original, ticket.text)]
+        if rng.random() < dup_rate:
+            for j in range(rng.randint(1, 2)):
+                name = f"t{i:06d}_r{j}.json"
+                copies.append((i + rng.uniform(0.5, 100), name, rescan(ticket.text, rng)))
+                truth[name] = original
+        for key, name, text in copies:
+            path = directory / name
+            path.write_text(json.dumps(to_ocr_response(ticket._replace(text=text)), ensure_ascii=False),
+                            encoding="utf-8")
+            keyed.append((key, path))
+    keyed.sort(key=lambda item: item[0])
+    return [path for _, path in keyed], truth
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--docs", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--dup-rate", type=float, nargs="+", default=[0.0, 0.1, 0.3])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    extractor = OcrExtractor(typed=True)
+    print(f"{'dup rate':>8} {'files':>6} {'dups':>5} {'full(s)':>8} {'dedup(s)':>9} "
+          f"{'extracted':>9} {'precision':>9} {'recall':>7}")
+    for rate in args.dup_rate:
+        with tempfile.TemporaryDirectory() as tmp:
+            files, truth = write_corpus(Path(tmp), args.docs, rate, args.seed)
+
+            full_s = dedup_s = float("inf")
+            for _ in range(args.repeat):
+                t0 = time.perf_counter()
+                full = {name: extracted for name, extracted, _ in (process_file(f, extractor, None) for f in files)}
+                full_s = min(full_s, time.perf_counter() - t0)
+
+                t0 = time.perf_counter()
+                dedup = Deduplicator(extractor, None)
+                deduped = {name: extracted for name, extracted, _ in dedup.process(files)}
+                dedup_s = min(dedup_s, time.perf_counter() - t0)
+
+            assert deduped.keys() == full.keys()
+            found = dedup.duplicate_of
+            correct = sum(1 for name, rep in found.items() if truth.get(name) == rep)
+            precision = correct / len(found) if found else 1.0
+            recall = correct / len(truth) if truth else 1.0
+            print(f"{rate:8.2f} {len(files):6d} {len(truth):5d} {full_s:8.2f} {dedup_s:9.2f} "
+                  f"{len(files) - len(found):9d} {precision:9.3f} {recall:7.3f}")
+
+
+if __name__ == "__main__":
+    main()
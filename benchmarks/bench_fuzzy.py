@@ -0,0 +1,138 @@
+"""퍼지 라벨 색인 벤치마크: 조회 비용(선형 편집 거리 vs symmetric delete)과 깨진 라벨 복구율.
+
+1) 조회: ocr_repair 팩의 퍼지 라벨에 합성 라벨 N개를 더해 가며, 깨진 라벨 토큰 하나를 찾는 비용을 비교한다.
+   linear는 모든 라벨과 자모 편집 거리를 재고, index는 토큰의 삭제 변형만 사전에서 찾는다(캐시 없이 측정).
+2) 복구: 합성 계근지의 라벨 글자를 --garble 확률로 비슷한 글자로 바꾼 뒤('량'→'랑', '중'→'증' 등),
+   퍼지 색인 없이(기본 팩)/있이(ocr_repair 팩) 정제·추출해 필드별 정답률과 문서당 시간을 보고한다.
+
+실행: python -m benchmarks.bench_fuzzy [--sizes 0 1000 10000 --docs 2000 --garble 0.3]
+"""
+import argparse
+import random
+import time
+
+from benchmarks.synthetic import generate_corpus
+from src.parser.cleaner import clean_text
+from src.parser.extractor import OcrExtractor
+from src.parser.fuzzy import LabelIndex, allowed_distance, decompose, edit_distance, label_key
+from src.parser.rule_pack import compile_rules, load_rule_pack
+
+PACK = "ocr_repair"
+
+HANGUL = [chr(c) for c in range(0xAC00, 0xAC00 + 400)]
+# 계근지 라벨에서 자주 보이는 한 글자 오인식
+CONFUSIONS = {"량": "랑", "중": "증", "래": "레", "차": "자", "번": "벤", "일": "인", "처": "저", "총": "촘",
+              "공": "곰", "실": "싣", "계": "게", "거": "기", "호": "흐"}
+FIELDS = ("date", "car_number", "client_name", "total", "empty", "net")
+
+
+def _labels(extra: int, seed: int = 0) -> dict:
+    rng = random.Random(seed)
+    pack = load_rule_pack(PACK)
+    table = {c: list(pack.labels[c]) for c in pack.fuzzy_labels["categories"]}
+    cats = list(table)
+    for _ in range(extra):
+        table[rng.choice(cats)].append("".join(rng.choice(HANGUL) for _ in range(rng.randint(3, 7))))
+    return table
+
+
+def _linear(table: dict):
+    keys = [(decompose(key), allowed_distance(key)) for labels in table.values() for key in map(label_key, labels)]
+
+    def run(token):
+        token = decompose(token)
+        return min(((edit_distance(token, key, d), key) for key, d in keys if d), default=None)
+    return run
+
+
+def _garble(text: str, rng: random.Random, rate: float) -> str:
+    lines = []
+    for line in text.split("\n"):
+        if rng.random() < rate:
+            # 값(숫자) 앞의 라벨 자리에서만 바꾼다
+            head = len(line) - len(line.lstrip("* "))
+            end = next((i for i, ch in enumerate(line) if ch.isdigit() or ch == ":"), 0)
+            spots = [i for i in range(head, end) if line[i] in CONFUSIONS]
+            if spots:
+                i = rng.choice(spots)
+                line = line[:i] + CONFUSIONS[line[i]] + line[i + 1:]
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def _field_values(result, expected):
+    weights = result["weights"]
+    got = {"date": result["date"], "car_number": result["car_number"], "client_name": result["client_name"],
+           **{k: weights[k] for k in ("total", "empty", "net")}}
+    want = {k: expected[k] for k in ("date", "car_number", "client_name")}
+    want.update({k: expected["weights"][k] for k in ("total", "empty", "net")})
+    return got, want
+
+
+def bench_lookup(sizes, queries, repeat):
+    rng = random.Random(1)
+    print(f"{'labels':>7} {'linear us/lookup':>17} {'index us/lookup':>16} {'build ms':>9}")
+    for size in sizes:
+        table = _labels(size)
+        t0 = time.perf_counter()
+        index = LabelIndex(table)
+        build = time.perf_counter() - t0
+        keys = [label_key(label) for labels in table.values() for label in labels]
+        tokens = []
+        for _ in range(queries):
+            key = list(rng.choice(keys))
+            key[rng.randrange(len(key))] = rng.choice(HANGUL)
+            tokens.append("".join(key))
+        linear = _linear(table)
+        results = []
+        for fn, n in ((linear, max(1, repeat // max(1, size // 100))), (index._lookup, repeat)):
+            best = float("inf")
+            for _ in range(n):
+                t0 = time.perf_counter()
+                for token in tokens:
+                    fn(token)
+                best = min(best, time.perf_counter() - t0)
+            results.append(best / len(tokens) * 1e6)
+        print(f"{len(keys):>7} {results[0]:17.1f} {results[1]:16.1f} {build * 1e3:9.1f}")
+
+
+def bench_recovery(docs, rate, repeat):
+    rng = random.Random(2)
+    rules = compile_rules(PACK)
+    tickets = [(_garble(t.text, rng, rate), t.expected) for t in generate_corpus(docs, seed=0)]
+    extractor = OcrExtractor(rules=rules)
+    print(f"\n합성 계근지 {docs}건, 라벨 줄 오인식 확률 {rate}")
+    print(f"{'mode':<9} {'ms/doc':>7} " + " ".join(f"{f:>11}" for f in FIELDS))
+    for name, index in (("exact", None), ("fuzzy", rules.label_index)):
+        best = float("inf")
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            results = [extractor.extract(clean_text(text, rules.corrector, index)) for text, _ in tickets]
+            best = min(best, time.perf_counter() - t0)
+        correct = dict.fromkeys(FIELDS, 0)
+        total = dict.fromkeys(FIELDS, 0)
+        for result, (_, expected) in zip(results, tickets):
+            got, want = _field_values(result, expected)
+            for field in FIELDS:
+                if want[field] is None:
+                    continue
+                total[field] += 1
+                correct[field] += got[field] == want[field]
+        cells = " ".join(f"{correct[f] / total[f]:11.1%}" for f in FIELDS)
+        print(f"{name:<9} {best / docs * 1e3:7.3f} {cells}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[0, 1000, 10000])
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--docs", type=int, default=2000)
+    parser.add_argument("--garble", type=float, default=0.3)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+    bench_lookup(args.sizes, args.queries, args.repeat)
+    bench_recovery(args.docs, args.garble, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
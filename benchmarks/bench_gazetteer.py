@@ -0,0 +1,148 @@
+"""회사명 가제티어 벤치마크: 등록부 크기별 줄당 조회 비용과, 합성 계근지에서 이름 확정·NLP 보조 감소.
+
+1) 조회: 합성 계근지의 회사명에 무작위 회사명 N개를 더한 등록부로, 줄마다 모든 이름을 `in`으로 찾는
+   선형 검사와 Gazetteer.match(트라이 정규식 한 번)를 비교한다. 등록부 컴파일 시간과 규칙 팩
+   아티팩트(피클) 로드 시간도 보고한다.
+2) 추출: 기본 팩과 등록부 팩(extends default + gazetteer)으로 합성 계근지 --docs건을 정제·추출해
+   문서당 시간, 발급사/거래처 N/A 비율, 이름 때문에 NLP 보조로 넘어갈 문서 수와 그 보조가 nlp에 보낼
+   줄 수(주소 보조 제외), 등록부 정식 명칭과 일치한 비율을 비교한다. --plain-issuer 비율의 문서는
+   상단 발급사 줄의 '(주)'를 지워 휴리스틱이 발급사를 놓치는 경우를 만든다.
+
+실행: python -m benchmarks.bench_gazetteer [--sizes 1000 10000 50000 --docs 2000 --plain-issuer 0.5]
+"""
+import argparse
+import json
+import pickle
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.synthetic import COMPANIES, generate_corpus
+from src.parser.cleaner import clean_text
+from src.parser.extractor import OcrExtractor
+from src.parser.extractor_nlp_wrapper import OcrExtractorWithNlp
+from src.parser.gazetteer import Gazetteer, normalize_name
+from src.parser.rule_pack import DEFAULT_PACK_DIR, compile_rules
+
+HANGUL = [chr(c) for c in range(0xAC00, 0xAC00 + 400)]
+SUFFIXES = ["산업", "환경", "자원", "물류", "바이오", "개발", "상사", ""]
+LINES = [
+    "계량일자: 2026-02-02 0016", "차량번호: 8713", "거 래 처: 고요환경", "품명: 식물", "총중량: 12,480 kg",
+    "실 중 량: 5,010 kg", "* 위와 같이 계량하였음을 확인함.", "동우바이오(주)", "2026-02-02 05:37:55",
+    "37.105317, 127.375673", "(주) 하 은 펄 프", "경기도 화성시 팔탄면 노하길454번길 23",
+]
+
+
+def _registry(extra, seed=0):
+    rng = random.Random(seed)
+    registry = {name: [] for name in COMPANIES}
+    while len(registry) < len(COMPANIES) + extra:
+        name = "".join(rng.choice(HANGUL) for _ in range(rng.randint(2, 4))) + rng.choice(SUFFIXES)
+        registry.setdefault(name, [])
+    return registry
+
+
+def _best(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def _write_pack(directory, registry):
+    (directory / "partners").mkdir()
+    with open(directory / "partners" / "partners.tsv", "w", encoding="utf-8") as f:
+        for name in registry:
+            f.write(name + "\n")
+    path = directory / "partners.json"
+    path.write_text(json.dumps({"name": "partners", "version": "1", "extends": str(DEFAULT_PACK_DIR / "default.json"),
+                                "gazetteer": ["partners"]}), encoding="utf-8")
+    return path
+
+
+def bench_lookup(sizes, repeat):
+    print(f"{'names':>7} {'linear us/line':>15} {'trie us/line':>13} {'compile ms':>11} {'artifact ms':>12}")
+    for size in sizes:
+        registry = _registry(size)
+        t0 = time.perf_counter()
+        gazetteer = Gazetteer(registry)
+        compile_ms = (time.perf_counter() - t0) * 1e3
+        blob = pickle.dumps(gazetteer, protocol=pickle.HIGHEST_PROTOCOL)
+        load_ms = _best(lambda: pickle.loads(blob), 3) * 1e3
+        keys = list(gazetteer.names)
+        compact = [normalize_name(line) for line in LINES]
+
+        def linear():
+            for text in compact:
+                for key in keys:
+                    if key in text:
+                        break
+
+        def trie():
+            for line in LINES:
+                gazetteer.match(line)
+
+        n = len(LINES)
+        print(f"{len(gazetteer):>7} {_best(linear, max(1, repeat // 10)) / n * 1e6:15.1f} "
+              f"{_best(trie, repeat) / n * 1e6:13.2f} {compile_ms:11.1f} {load_ms:12.1f}")
+
+
+def _tickets(docs, plain_issuer, seed=0):
+    rng = random.Random(seed)
+    tickets = []
+    for ticket in generate_corpus(docs, seed=seed):
+        issuer = ticket.expected["issuer_name"]
+        if issuer is not None and rng.random() < plain_issuer:
+            ticket = ticket._replace(text=ticket.text.replace("(주) ", "", 1))
+        tickets.append((ticket, issuer))
+    return tickets
+
+
+def bench_extract(docs, extra, plain_issuer, repeat):
+    tickets = _tickets(docs, plain_issuer)
+    with tempfile.TemporaryDirectory() as tmp:
+        packs = {"default": compile_rules(), "gazetteer": compile_rules(_write_pack(Path(tmp), _registry(extra)))}
+    print(f"\n합성 계근지 {docs}건(상단 발급사 '(주)' 제거 {plain_issuer:.0%}), 등록부 {len(COMPANIES) + extra}개")
+    print(f"{'pack':<10} {'us/doc':>7} {'issuer N/A':>11} {'client N/A':>11} {'이름 NLP 문서':>12} {'NLP 줄':>7} "
+          f"{'정식 명칭 일치':>13}")
+    for name, rules in packs.items():
+        extractor = OcrExtractor(rules=rules)
+
+        def run():
+            return [(text, extractor.extract(text)) for text in
+                    (clean_text(t.text, rules.corrector, rules.label_index) for t, _ in tickets)]
+
+        seconds = _best(run, repeat)
+        pairs = run()
+        issuer_na = sum(r["issuer_name"] == "N/A" for _, r in pairs)
+        client_na = sum(r["client_name"] == "N/A" for _, r in pairs)
+        # 이름 필드 보조만(주소가 채워졌다고 보고) nlp에 보낼 줄
+        nlp_lines = [OcrExtractorWithNlp._candidate_lines(text, {**r, "issuer_address": ""}) for text, r in pairs]
+        canonical = checked = 0
+        for (ticket, issuer), (_, result) in zip(tickets, pairs):
+            canonical += result["client_name"] == ticket.expected["client_name"]
+            checked += 1
+            if issuer is not None:
+                canonical += result["issuer_name"] == issuer.replace("(주)", "")
+                checked += 1
+        print(f"{name:<10} {seconds / docs * 1e6:7.1f} {issuer_na / docs:11.1%} {client_na / docs:11.1%} "
+              f"{sum(1 for lines in nlp_lines if lines):>12} {sum(map(len, nlp_lines)):>7} {canonical / checked:13.1%}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--docs", type=int, default=2000)
+    parser.add_argument("--registry", type=int, default=10000, help="추출 비교에 쓰는 등록부 추가 이름 수")
+    parser.add_argument("--plain-issuer", type=float, default=0.5)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args(argv)
+    bench_lookup(args.sizes, args.repeat)
+    bench_extract(args.docs, args.registry, args.plain_issuer, max(1, args.repeat // 10))
+
+
+if __name__ == "__main__":
+    main()
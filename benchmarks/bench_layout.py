@@ -0,0 +1,78 @@
+"""레이아웃 인덱스 벤치마크: 페이지 단어 수에 따른 인덱스 구성/라벨-값 질의 비용.
+
+행마다 '라벨 값 kg' 단어가 놓인 합성 페이지를 만들어
+- build: PageIndex.from_page (꼭짓점 → 배열, 행 클러스터링, 정렬 인덱스)
+- resolve: 모든 행의 라벨 오른쪽 값 질의(resolve_weights)
+- naive: 라벨마다 페이지 전체 단어를 훑어 오른쪽·같은 높이 단어를 찾는 방식
+을 비교한다.
+
+실행: python -m benchmarks.bench_layout [--words 500 2000 8000]
+"""
+import argparse
+import random
+import time
+
+from src.parser.layout import MIN_OVERLAP, PageIndex, resolve_weights
+
+LABELS = ["총중량:", "공차중량:", "실중량:", "품명:", "비고"]
+
+
+def _word(text, x, y, w, h):
+    verts = [{"x": x, "y": y}, {"x": x + w, "y": y}, {"x": x + w, "y": y + h}, {"x": x, "y": y + h}]
+    return {"boundingBox": {"vertices": verts}, "confidence": 0.95, "text": text}
+
+
+def make_page(n_words: int, seed: int = 0) -> dict:
+    """한 행에 라벨 1개 + 시각 + 값 + kg (4단어)인 합성 페이지."""
+    rng = random.Random(seed)
+    words = []
+    for r in range(n_words // 4):
+        y = 40 + r * 60 + rng.randint(-3, 3)
+        words.append(_word(rng.choice(LABELS), 20, y, 160, 45))
+        words.append(_word(f"{rng.randint(0, 23):02d}:{rng.randint(0, 59):02d}", 200, y + 2, 90, 40))
+        words.append(_word(f"{rng.randint(1, 40) * 1000:,}", 320, y + 1, 120, 42))
+        words.append(_word("kg", 460, y + 2, 40, 40))
+    rng.shuffle(words)  # OCR 단어 순서는 보장되지 않는다
+    return {"words": words}
+
+
+def naive_right_of(boxes, i: int):
+    """boxes: 파이썬 리스트 [(x0, y0, x1, y1), ...] – 라벨 하나마다 전체 단어를 훑는다."""
+    _, y0, x1, y1 = boxes[i]
+    out = []
+    for j, (bx0, by0, bx1, by1) in enumerate(boxes):
+        overlap = min(by1, y1) - max(by0, y0)
+        if overlap >= MIN_OVERLAP * min(by1 - by0, y1 - y0) and (bx0 + bx1) / 2 > x1:
+            out.append(j)
+    return sorted(out, key=lambda j: boxes[j][0])
+
+
+def _best(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--words", type=int, nargs="+", default=[500, 2000, 8000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    print(f"{'words':>7} {'build(ms)':>10} {'resolve(ms)':>12} {'naive(ms)':>10}")
+    for n in args.words:
+        raw = make_page(n)
+        page = PageIndex.from_page(raw)
+        labels = [row[0] for row in page.rows()]
+        boxes = list(zip(page.x0.tolist(), page.y0.tolist(), page.x1.tolist(), page.y1.tolist()))
+        build = _best(lambda: PageIndex.from_page(raw), args.repeat)
+        resolve = _best(lambda: resolve_weights([page]), args.repeat)
+        naive = _best(lambda: [naive_right_of(boxes, i) for i in labels], 1)
+        print(f"{n:>7} {build * 1e3:10.2f} {resolve * 1e3:12.2f} {naive * 1e3:10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""문서별 로깅 비용 벤치마크: 동기 핸들러 vs 큐(백그라운드 스레드) vs 표본 기록.
+
+합성 계근지 추출 결과로 RunLog.document를 호출하며, 파이프라인 스레드가 문서당 쓰는
+시간(µs)을 잰다. 비동기 모드는 리스너가 큐를 다 비울 때까지(stop)의 시간도 따로 출력한다.
+콘솔 핸들러는 os.devnull로 보내고 파일 핸들러는 임시 디렉터리에 쓴다.
+
+실행: python -m benchmarks.bench_logging [--docs 20000]
+"""
+import argparse
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.synthetic import generate_corpus
+from src.parser.cleaner import clean_text
+from src.parser.extractor import OcrExtractor
+from src.pipeline.document import collect_warnings
+from src.utils.log import RunLog, configure_logging
+
+# (이름, 로그 형식, 비동기, 성공 줄 표본 간격)
+CONFIGS = [
+    ("sync text", "text", False, 1),
+    ("async text", "text", True, 1),
+    ("async json", "json", True, 1),
+    ("async json 1/100", "json", True, 100),
+    ("sync text 1/100", "text", False, 100),
+]
+
+
+def run(results, log_path: Path, log_format: str, async_handlers: bool, sample_every: int):
+    root = logging.getLogger()
+    saved = root.handlers[:]
+    root.handlers.clear()
+    listener = configure_logging(log_path, log_format, async_handlers)
+    handlers = listener.handlers if listener is not None else root.handlers
+    devnull = open(os.devnull, "w", encoding="utf-8")
+    for h in handlers:
+        if type(h) is logging.StreamHandler:
+            h.setStream(devnull)
+    try:
+        run_log = RunLog(logging.getLogger("bench"), sample_every=sample_every)
+        t0 = time.perf_counter()
+        for name, extracted, warnings in results:
+            run_log.document(name, extracted, warnings)
+        producer = time.perf_counter() - t0
+        drain = 0.0
+        if listener is not None:
+            t1 = time.perf_counter()
+            listener.stop()
+            drain = time.perf_counter() - t1
+    finally:
+        for h in root.handlers + (list(listener.handlers) if listener is not None else []):
+            h.close()
+        root.handlers[:] = saved
+        devnull.close()
+    return producer, drain
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--docs", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    extractor = OcrExtractor()
+    results = []
+    for i, ticket in enumerate(generate_corpus(args.docs, seed=args.seed)):
+        name = f"synthetic_{i:06d}.json"
+        extracted = extractor.extract(clean_text(ticket.text))
+        results.append((name, extracted, collect_warnings(name, extracted)))
+    n_warnings = sum(len(w) for _, _, w in results)
+    print(f"문서 {args.docs}건, 경고 {n_warnings}건")
+
+    print(f"{'mode':<18} {'µs/doc':>8} {'drain(ms)':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for i, (label, log_format, async_handlers, sample_every) in enumerate(CONFIGS):
+            producer, drain = run(results, Path(tmp) / f"run_{i}.log", log_format, async_handlers, sample_every)
+            print(f"{label:<18} {producer / args.docs * 1e6:8.2f} {drain * 1e3:10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""라벨 매칭 벤치마크: 범주별 any(k in line) 반복 vs 컴파일된 KeywordMatcher.
+
+라벨 목록을 합성 라벨로 부풀려 가며 줄당 매칭 비용을 비교한다.
+
+실행: python -m benchmarks.bench_matcher [--sizes 10 100 1000 10000]
+"""
+import argparse
+import random
+import time
+
+from src.parser.matcher import KeywordMatcher
+from src.parser.rule_pack import load_rule_pack
+
+LINES = [
+    "계량일자:2026-02-020016", "차량번호:8713", "거래처:곰욕환경폐기물", "품명:05:26:1812,480kg",
+    "중량:", "05:36:017,470kg", "실중량:5,010kg", "위와같이계량하였음을확인함.", "동우바이오(주)",
+    "2026-02-0205:37:55", "37.105317,127.375673",
+]
+HANGUL = [chr(c) for c in range(0xAC00, 0xAC00 + 400)]
+
+
+def _tables(extra: int, seed: int = 0) -> dict:
+    rng = random.Random(seed)
+    # 기본 규칙 팩의 라벨 + 무작위 추가 라벨
+    table = {category: list(labels) for category, labels in load_rule_pack().labels.items()}
+    cats = list(table)
+    for _ in range(extra):
+        table[rng.choice(cats)].append("".join(rng.choice(HANGUL) for _ in range(rng.randint(2, 5))) + ":")
+    return table
+
+
+def _bench(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        for line in LINES:
+            fn(line)
+        best = min(best, time.perf_counter() - t0)
+    return best / len(LINES) * 1e6
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[0, 100, 1000, 10000])
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args(argv)
+
+    print(f"{'extra labels':>12} {'any() us/line':>14} {'matcher us/line':>16}")
+    for size in args.sizes:
+        table = _tables(size)
+        matcher = KeywordMatcher(table)
+
+        def naive(line):
+            return {c for c, kws in table.items() if any(k in line for k in kws)}
+
+        repeat = max(3, args.repeat // max(1, size // 100))
+        print(f"{size:>12} {_bench(naive, repeat):14.2f} {_bench(matcher.scan, args.repeat):16.2f}")
+
+
+if __name__ == "__main__":
+    main()
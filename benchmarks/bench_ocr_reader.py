@@ -0,0 +1,109 @@
+"""OCR 응답 리더 벤치마크: json.load 전체 파싱 vs 점진적 text 리더.
+
+대형 합성 OCR 응답(pages × words)을 만들어 각 방식의 파싱 시간과
+최대 메모리(tracemalloc 피크, 가능하면 프로세스 peak RSS)를 측정한다.
+측정마다 새 프로세스를 띄워 RSS가 서로 섞이지 않게 한다.
+
+실행: python -m benchmarks.bench_ocr_reader [--pages 20 --words 2000 --repeat 5]
+"""
+import argparse
+import json
+import random
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+SAMPLE_TEXT = (
+    "계 량 증 명 서 \n계량일자: 2026-02-02 0016 \n차량번호: 8713 \n거 래 처: 곰욕환경폐기물 \n"
+    "총중량: 12,480 kg \n차중량: 7,470 kg \n실 중 량: 5,010 kg \n동우바이오(주) \n"
+)
+
+
+def _box(x, y, w, h):
+    return {"vertices": [{"x": x, "y": y}, {"x": x + w, "y": y}, {"x": x + w, "y": y + h}, {"x": x, "y": y + h}]}
+
+
+def make_response(pages: int, words: int, seed: int = 0) -> dict:
+    """실제 OCR 응답과 같은 구조(pages[].words[].boundingBox)의 합성 문서를 만든다."""
+    rng = random.Random(seed)
+    tokens = SAMPLE_TEXT.split()
+    page_list = []
+    for p in range(pages):
+        word_list = []
+        for i in range(words):
+            word_list.append({
+                "boundingBox": _box(rng.randint(0, 1100), rng.randint(0, 1900), rng.randint(20, 200), rng.randint(40, 100)),
+                "confidence": round(rng.uniform(0.5, 1.0), 4),
+                "id": i,
+                "text": rng.choice(tokens),
+            })
+        page_list.append({
+            "confidence": 0.92, "height": 1920, "id": p, "text": SAMPLE_TEXT,
+            "width": 1142, "words": word_list,
+        })
+    return {
+        "apiVersion": "1.1", "confidence": 0.9242,
+        "metadata": {"pages": [{"height": 1920, "page": p + 1, "width": 1142} for p in range(pages)]},
+        "mimeType": "multipart/form-data", "modelVersion": "ocr-250904",
+        "numBilledPages": pages, "pages": page_list, "text": SAMPLE_TEXT * pages,
+    }
+
+
+# 하위 프로세스에서 실행되는 측정 코드
+_CHILD = r'''
+import json, sys, time, tracemalloc
+mode, path, repeat = sys.argv[1], sys.argv[2], int(sys.argv[3])
+if mode == "incremental":
+    from src.pipeline.ocr_reader import read_ocr_text
+    run = lambda: read_ocr_text(path, with_confidence=True)
+else:
+    def run():
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return data.get("text", ""), data.get("confidence")
+times = []
+for _ in range(repeat):
+    t0 = time.perf_counter(); run(); times.append(time.perf_counter() - t0)
+tracemalloc.start(); run(); _, peak = tracemalloc.get_traced_memory(); tracemalloc.stop()
+rss = None
+try:
+    # VmHWM은 exec 이후 프로세스 자신의 최대 RSS (ru_maxrss는 fork 시 부모 값이 섞일 수 있음)
+    with open("/proc/self/status") as f:
+        rss = next(int(l.split()[1]) * 1024 for l in f if l.startswith("VmHWM:"))
+except (OSError, StopIteration):
+    pass
+print(json.dumps({"best_s": min(times), "traced_peak_bytes": peak, "peak_rss_bytes": rss}))
+'''
+
+
+def measure(mode: str, path: Path, repeat: int) -> dict:
+    root = Path(__file__).resolve().parent.parent
+    out = subprocess.run(
+        [sys.executable, "-c", _CHILD, mode, str(path), str(repeat)],
+        cwd=root, check=True, capture_output=True, text=True,
+    )
+    return json.loads(out.stdout)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=20)
+    parser.add_argument("--words", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "large_response.json"
+        path.write_text(json.dumps(make_response(args.pages, args.words), ensure_ascii=False), encoding="utf-8")
+        size_mb = path.stat().st_size / 1e6
+        print(f"합성 OCR 응답: pages={args.pages}, words/page={args.words}, {size_mb:.1f} MB")
+        print(f"{'mode':<12} {'best(ms)':>10} {'traced(MB)':>11} {'rss(MB)':>9}")
+        for mode in ("json.load", "incremental"):
+            r = measure(mode, path, args.repeat)
+            rss = f"{r['peak_rss_bytes'] / 1e6:9.1f}" if r["peak_rss_bytes"] else f"{'-':>9}"
+            print(f"{mode:<12} {r['best_s'] * 1e3:10.1f} {r['traced_peak_bytes'] / 1e6:11.1f} {rss}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""결과 기록 비용 벤치마크: 문서별 JSON 파일 vs 열 지향(CSV/Parquet) 배치 출력.
+
+합성 계근지를 한 번 추출해 둔 결과를 임시 디렉터리에 기록하며 건당 기록 시간을 잰다.
+- json: process_file과 같은 방식(문서마다 임시 파일 → 교체, indent=4)
+- csv / parquet: ColumnarWriter(row group 단위 기록, pyarrow 미설치 시 parquet 건너뜀)
+
+pandas/pyarrow import(프로세스당 1회, 수백 ms)는 건당 비용과 섞이지 않게 따로 출력한다.
+
+실행: python -m benchmarks.bench_output [--docs 20000 --row-group-size 10000]
+"""
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.synthetic import generate_corpus
+from src.parser.cleaner import clean_text
+from src.parser.extractor import OcrExtractor
+from src.pipeline.columnar import DEFAULT_ROW_GROUP_SIZE, ColumnarWriter
+from src.pipeline.document import output_path_for, write_result_json
+
+
+def bench_json(results, out_dir: Path) -> float:
+    t0 = time.perf_counter()
+    for name, extracted in results:
+        write_result_json(extracted, output_path_for(Path(name), out_dir))
+    return time.perf_counter() - t0
+
+
+def bench_columnar(results, path: Path, row_group_size: int) -> float:
+    t0 = time.perf_counter()
+    with ColumnarWriter(path, row_group_size=row_group_size) as writer:
+        for name, extracted in results:
+            writer.write(name, extracted)
+    return time.perf_counter() - t0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--docs", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--row-group-size", type=int, default=DEFAULT_ROW_GROUP_SIZE)
+    args = parser.parse_args(argv)
+
+    extractor = OcrExtractor()
+    results = [(f"synthetic_{i:06d}.json", extractor.extract(clean_text(t.text)))
+               for i, t in enumerate(generate_corpus(args.docs, seed=args.seed))]
+
+    t0 = time.perf_counter()
+    import pandas  # noqa: F401
+    print(f"pandas import: {(time.perf_counter() - t0) * 1e3:.0f} ms")
+    try:
+        t0 = time.perf_counter()
+        import pyarrow.parquet  # noqa: F401
+        print(f"pyarrow import: {(time.perf_counter() - t0) * 1e3:.0f} ms")
+    except ImportError:
+        pass
+
+    timings = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        (tmp / "json").mkdir()
+        timings["json"] = bench_json(results, tmp / "json")
+        timings["csv"] = bench_columnar(results, tmp / "results.csv", args.row_group_size)
+        try:
+            timings["parquet"] = bench_columnar(results, tmp / "results.parquet", args.row_group_size)
+        except ImportError as e:
+            print(f"parquet 건너뜀: {e}")
+        sizes = {
+            "json": sum(p.stat().st_size for p in (tmp / "json").iterdir()),
+            "csv": (tmp / "results.csv").stat().st_size,
+        }
+        if "parquet" in timings:
+            sizes["parquet"] = (tmp / "results.parquet").stat().st_size
+
+    base = timings["json"]
+    print(f"{'format':<8} {'total(ms)':>10} {'µs/doc':>8} {'vs json':>8} {'bytes':>12}")
+    for fmt, seconds in timings.items():
+        print(f"{fmt:<8} {seconds * 1e3:10.1f} {seconds / args.docs * 1e6:8.2f} "
+              f"{seconds / base:7.3f}x {sizes[fmt]:12,d}")
+
+
+if __name__ == "__main__":
+    main()
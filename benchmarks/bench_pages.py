@@ -0,0 +1,87 @@
+"""페이지 단위 추출 벤치마크: 전체 text 추출 vs 페이지 순차(조기 종료 끔/켬) vs 페이지 프로세스 풀.
+
+합성 계근지 --docs건을 --pages쪽짜리 OCR 응답으로 만든다(부가 페이지는 FILLER_LINES 40줄).
+
+- front: 계근지가 첫 페이지에 있고 나머지는 첨부 페이지(조기 종료가 바로 걸리는 경우)
+- spread: 계근지 줄을 모든 페이지에 고르게 흩어 놓음(뒤쪽 페이지까지 훑어야 확정)
+
+모드마다 문서당 시간(--repeat번 중 최솟값), 문서당 훑은 페이지 수, 조기 종료 결과가 전체 페이지
+결과와 다른 문서 수(주소를 뒤 페이지에서 못 찾은 경우 등)를 보고한다.
+
+실행: python -m benchmarks.bench_pages [--docs 200 --pages 20 --page-workers 4]
+"""
+import argparse
+import random
+import time
+
+from benchmarks.synthetic import FILLER_LINES, generate_corpus
+from src.parser.cleaner import clean_text
+from src.parser.extractor import OcrExtractor
+from src.pipeline.pages import PageExtractor, PageMode
+from src.utils import metrics
+
+
+def _best(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def _filler(rng):
+    return "\n".join(rng.choice(FILLER_LINES) for _ in range(40))
+
+
+def make_documents(n, pages, layout, seed=0):
+    rng = random.Random(seed)
+    docs = []
+    for ticket in generate_corpus(n, seed=seed):
+        if layout == "front":
+            texts = [ticket.text] + [_filler(rng) for _ in range(pages - 1)]
+        else:
+            lines = ticket.text.split("\n")
+            step = -(-len(lines) // pages)
+            texts = ["\n".join(lines[i * step:(i + 1) * step] + [_filler(rng)]) for i in range(pages)]
+        docs.append({"text": "\n".join(texts), "pages": [{"text": t} for t in texts]})
+    return docs
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--docs", type=int, default=200)
+    parser.add_argument("--pages", type=int, default=20)
+    parser.add_argument("--page-workers", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    base = OcrExtractor(typed=True)
+    modes = {
+        "text": lambda d: base.extract(clean_text(d["text"])),
+        "pages-full": PageExtractor(base, PageMode(early_exit=False)).extract_response,
+        "pages": PageExtractor(base, PageMode()).extract_response,
+    }
+    pool = PageExtractor(base, PageMode(workers=args.page_workers, min_parallel_pages=2))
+    modes[f"pages-w{args.page_workers}"] = pool.extract_response
+    try:
+        print(f"{'layout':<7} {'mode':<11} {'ms/doc':>8} {'pages/doc':>10} {'전체 대비 다른 문서':>14}")
+        for layout in ("front", "spread"):
+            docs = make_documents(args.docs, args.pages, layout)
+            reference = [modes["pages-full"](d) for d in docs]
+            for name, run in modes.items():
+                seconds = _best(lambda: [run(d) for d in docs], args.repeat)
+                m = metrics.enable()
+                try:
+                    differ = sum(run(d) != ref for d, ref in zip(docs, reference))
+                finally:
+                    metrics.disable()
+                scanned = m.counters.get(("pages", (("status", "scanned"),)), len(docs) * args.pages)
+                print(f"{layout:<7} {name:<11} {seconds / len(docs) * 1e3:8.2f} {scanned / len(docs):10.1f} "
+                      f"{differ:>14}")
+    finally:
+        pool.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""결과 표현 벤치마크: 중첩 dict vs ExtractionResult(슬롯) – 메모리와 직렬화 비용.
+
+합성 계근지를 추출한 결과를 --results건(기본 100만 건)만큼 메모리에 들고 있을 때
+tracemalloc으로 잰 할당량과, 결과 한 건의 직렬화 시간을 비교한다.
+문자열/정수 값은 두 표현이 같은 객체를 공유하므로, 차이는 컨테이너(dict 2개 vs 객체 1개) 비용이다.
+
+실행: python -m benchmarks.bench_result_model [--results 1000000]
+"""
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+
+from benchmarks.synthetic import generate_corpus
+from src.parser.cleaner import clean_text
+from src.parser.extractor import OcrExtractor
+from src.parser.result import ExtractionResult
+
+
+def _measure(build):
+    gc.collect()
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    held = build()
+    elapsed = time.perf_counter() - t0
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del held
+    gc.collect()
+    return size, elapsed
+
+
+def _per_call_us(fn, items, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        for x in items:
+            fn(x)
+        best = min(best, time.perf_counter() - t0)
+    return best / len(items) * 1e6
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--results", type=int, default=1_000_000)
+    parser.add_argument("--distinct", type=int, default=2000, help="추출해 둘 서로 다른 결과 수")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    extractor = OcrExtractor()
+    dicts = [extractor.extract(clean_text(t.text)) for t in generate_corpus(args.distinct, seed=args.seed)]
+    typed = [ExtractionResult.from_dict(d) for d in dicts]
+    n, k = args.results, len(dicts)
+
+    # 결과마다 새 컨테이너(파이프라인이 문서마다 만드는 것과 같음), 값 객체는 공유
+    dict_size, dict_s = _measure(lambda: [
+        {**d, "weights": dict(d["weights"])} for d in (dicts[i % k] for i in range(n))
+    ])
+    typed_size, typed_s = _measure(lambda: [typed[i % k].copy() for i in range(n)])
+
+    print(f"결과 {n:,}건 보관 (리스트 포함)")
+    print(f"{'type':<18} {'MB':>8} {'bytes/건':>9} {'build(s)':>9}")
+    print(f"{'dict':<18} {dict_size / 2**20:8.1f} {dict_size / n:9.1f} {dict_s:9.2f}")
+    print(f"{'ExtractionResult':<18} {typed_size / 2**20:8.1f} {typed_size / n:9.1f} {typed_s:9.2f}")
+    print(f"절감: {(dict_size - typed_size) / 2**20:.1f} MB ({1 - typed_size / dict_size:.0%})")
+
+    compact = {"ensure_ascii": False, "separators": (",", ":")}
+    print(f"\n직렬화 (µs/건)")
+    print(f"{'json.dump indent=4 (dict)':<32} {_per_call_us(lambda d: json.dumps(d, ensure_ascii=False, indent=4), dicts):6.2f}")
+    print(f"{'json.dumps 압축 (dict)':<32} {_per_call_us(lambda d: json.dumps(d, **compact), dicts):6.2f}")
+    print(f"{'ExtractionResult.to_json':<32} {_per_call_us(ExtractionResult.to_json, typed):6.2f}")
+    assert all(r.to_json() == json.dumps(d, **compact) for r, d in zip(typed, dicts))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""규칙 팩 벤치마크: 원본에서 컴파일 vs 컴파일 아티팩트 로드, 문서 경계 리로드 확인 비용.
+
+기본 팩을 상속하고 합성 라벨/교정 항목을 --sizes개씩 더한 현장 팩을 임시 디렉터리에 만들어
+워커 시작 시 드는 규칙 준비 시간(--repeat번 중 최솟값)을 비교한다. 마지막으로 합성 계근지를
+정제·추출할 때 문서마다 refresh_rules()(리로드 확인)를 부르는 비용을 함께 잰다.
+
+실행: python -m benchmarks.bench_rule_pack [--sizes 0 1000 10000 --docs 2000]
+"""
+import argparse
+import json
+import random
+import re
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.synthetic import generate_corpus
+from src.parser import rule_pack
+from src.parser.cleaner import clean_text
+from src.parser.extractor import OcrExtractor
+from src.parser.rule_pack import DEFAULT_PACK_DIR, LABEL_CATEGORIES, RuleStore, compile_rules, refresh_rules
+
+HANGUL = [chr(c) for c in range(0xAC00, 0xAC00 + 400)]
+
+
+def write_site_pack(directory: Path, extra: int, seed: int = 0) -> Path:
+    """기본 팩 + 합성 라벨 extra개 + 합성 교정 extra개."""
+    rng = random.Random(seed)
+    default = json.loads((DEFAULT_PACK_DIR / "default.json").read_text(encoding="utf-8"))
+    labels = {category: list(default["labels"][category]) for category in LABEL_CATEGORIES}
+    corrections = directory / "corrections"
+    corrections.mkdir()
+    lines = []
+    for _ in range(extra):
+        word = "".join(rng.choice(HANGUL) for _ in range(rng.randint(2, 5)))
+        labels[rng.choice(LABEL_CATEGORIES)].append(word + ":")
+        lines.append(" ".join(word) + "\t" + word)
+    (corrections / "site.tsv").write_text("\n".join(lines) + "\n", encoding="utf-8")
+    path = directory / "site.json"
+    path.write_text(json.dumps({
+        "name": "site", "version": "1", "extends": str(DEFAULT_PACK_DIR / "default.json"),
+        "labels": labels, "corrections": ["corrections"],
+    }, ensure_ascii=False), encoding="utf-8")
+    return path
+
+
+def _best(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        re.purge()  # sre 내부 캐시 적중 없이 매번 정규식을 새로 컴파일
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[0, 1000, 10000])
+    parser.add_argument("--docs", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    print(f"{'extra':>6} {'compile(ms)':>12} {'artifact(ms)':>13} {'speedup':>8}")
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp = Path(tmp)
+            pack = write_site_pack(tmp, size, args.seed)
+            compile_s = _best(lambda: compile_rules(pack), args.repeat)
+            compile_rules(pack, artifact_dir=tmp / "artifacts")  # 아티팩트 생성
+            artifact_s = _best(lambda: compile_rules(pack, artifact_dir=tmp / "artifacts"), args.repeat)
+        print(f"{size:6d} {compile_s * 1e3:12.1f} {artifact_s * 1e3:13.1f} {compile_s / artifact_s:7.1f}x")
+
+    texts = [t.text for t in generate_corpus(args.docs, seed=args.seed)]
+    extractor = OcrExtractor(typed=True)
+    saved = rule_pack._ACTIVE
+    timings = {}
+    try:
+        for label, interval in (("리로드 끔", 0.0), ("1초마다 확인", 1.0)):
+            rule_pack._ACTIVE = RuleStore(check_interval=interval)
+
+            def run():
+                for text in texts:
+                    refresh_rules()
+                    extractor.extract(clean_text(text))
+
+            timings[label] = _best(run, args.repeat)
+    finally:
+        rule_pack._ACTIVE = saved
+    print(f"\n정제+추출 {args.docs}건 (문서마다 refresh_rules)")
+    for label, seconds in timings.items():
+        print(f"{label:<10} {seconds / args.docs * 1e6:8.1f} µs/건")
+
+
+if __name__ == "__main__":
+    main()
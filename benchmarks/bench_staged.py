@@ -0,0 +1,77 @@
+"""단계형 파이프라인 벤치마크: 순차 루프 vs 읽기/추출/쓰기 단계 분리.
+
+합성 계근지를 임시 디렉터리에 파일로 만들고, 네트워크 마운트처럼 파일마다 읽기 지연
+(--latency-ms, time.sleep)을 넣어 순차 process_file 루프와 StagedPipeline(읽기 스레드 수별)을 비교한다.
+지연 0이면 로컬 디스크 조건이다.
+
+실행: python -m benchmarks.bench_staged [--docs 1000 --latency-ms 0 2 10 --readers 1 4 8]
+"""
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+
+import src.pipeline.document as document
+import src.pipeline.staged as staged
+from benchmarks.synthetic import generate_corpus, to_ocr_response
+from src.parser.extractor import OcrExtractor
+from src.pipeline.ocr_reader import read_ocr_fields
+
+
+def _with_latency(seconds: float):
+    def read(path, fields=("text",)):
+        if seconds:
+            time.sleep(seconds)
+        return read_ocr_fields(path, fields)
+    return read
+
+
+def run_sequential(files, out_dir: Path) -> float:
+    extractor = OcrExtractor()
+    t0 = time.perf_counter()
+    for f in files:
+        document.process_file(f, extractor, out_dir)
+    return time.perf_counter() - t0
+
+
+def run_staged(files, out_dir: Path, readers: int) -> float:
+    t0 = time.perf_counter()
+    for _ in staged.iter_staged(files, out_dir, OcrExtractor(), readers=readers):
+        pass
+    return time.perf_counter() - t0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--docs", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--latency-ms", type=float, nargs="+", default=[0, 2, 10])
+    parser.add_argument("--readers", type=int, nargs="+", default=[1, 4, 8])
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        data_dir, out_dir = tmp / "data", tmp / "outputs"
+        data_dir.mkdir()
+        out_dir.mkdir()
+        files = []
+        for i, ticket in enumerate(generate_corpus(args.docs, seed=args.seed)):
+            path = data_dir / f"synthetic_{i:06d}.json"
+            path.write_text(json.dumps(to_ocr_response(ticket), ensure_ascii=False), encoding="utf-8")
+            files.append(path)
+
+        header = " ".join(f"{'staged r=' + str(r):>12}" for r in args.readers)
+        print(f"{'latency':>8} {'sequential':>12} {header}   (docs/s)")
+        for latency_ms in args.latency_ms:
+            read = _with_latency(latency_ms / 1e3)
+            document.read_ocr_fields = staged.read_ocr_fields = read
+            try:
+                row = [run_sequential(files, out_dir)] + [run_staged(files, out_dir, r) for r in args.readers]
+            finally:
+                document.read_ocr_fields = staged.read_ocr_fields = read_ocr_fields
+            print(f"{latency_ms:>6.0f}ms " + " ".join(f"{args.docs / s:12.0f}" for s in row))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""추출기 시작 비용 벤치마크: 기본 모드 vs NLP 모드(매번 구성 / 직렬화 아티팩트).
+
+모드마다 새 인터프리터를 띄워 import부터 추출기 구성까지의 시간을 잰다
+(워커 프로세스 1개가 시작할 때 치르는 비용). 기본 모드에서 spaCy가
+import되지 않았는지도 함께 보고한다.
+
+실행: python -m benchmarks.bench_startup [--repeat 5]
+"""
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+# 하위 프로세스에서 실행되는 측정 코드
+_CHILD = r'''
+import json, sys, time
+mode, artifact_dir = sys.argv[1], sys.argv[2]
+t0 = time.perf_counter()
+if mode == "base":
+    from src.pipeline.document import build_extractor
+    build_extractor(use_nlp=False)
+else:
+    from src.nlp.engine import load_nlp
+    load_nlp(artifact_dir=None if mode == "nlp-build" else artifact_dir)
+elapsed = time.perf_counter() - t0
+print(json.dumps({"s": elapsed, "spacy_imported": "spacy" in sys.modules}))
+'''
+
+MODES = ("base", "nlp-build", "nlp-artifact")
+
+
+def measure(mode: str, artifact_dir: str) -> dict:
+    root = Path(__file__).resolve().parent.parent
+    out = subprocess.run(
+        [sys.executable, "-c", _CHILD, mode, artifact_dir],
+        cwd=root, capture_output=True, text=True,
+    )
+    if out.returncode != 0:
+        return {"error": out.stderr.strip().splitlines()[-1]}
+    return json.loads(out.stdout)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as artifact_dir:
+        # 아티팩트 모드는 첫 실행에서 아티팩트를 만들므로 한 번 미리 실행해 둔다
+        measure("nlp-artifact", artifact_dir)
+        print(f"{'mode':<13} {'best(ms)':>10} {'median(ms)':>11} {'spacy':>6}")
+        for mode in MODES:
+            runs = [measure(mode, artifact_dir) for _ in range(args.repeat)]
+            if "error" in runs[0]:
+                print(f"{mode:<13} 건너뜀: {runs[0]['error']}")
+                continue
+            times = sorted(r["s"] * 1e3 for r in runs)
+            spacy = "yes" if runs[0]["spacy_imported"] else "no"
+            print(f"{mode:<13} {times[0]:10.1f} {times[len(times) // 2]:11.1f} {spacy:>6}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""감시 모드 벤치마크: 스캔 파일이 들어온 뒤 결과가 나오기까지의 지연(상주 감시 vs 실행마다 main.py).
+
+1) 감시: WatchService를 스레드로 띄우고, 합성 계근지 OCR JSON을 스캐너처럼(임시 이름에 쓴 뒤 이동)
+   --interval초 간격으로 --docs건 떨군다. 파일을 옮긴 시각부터 입력이 done/으로 옮겨질 때까지(결과 JSON은
+   그 전에 기록됨)를 지연으로 재고 p50/p95/최대를 보고한다. inotify와 디렉터리 훑기(poll)를 비교한다.
+   --burst N건을 한꺼번에 떨궈 모두 처리될 때까지의 시간(감지 지연 포함)과 처리량(건/초)도 본다.
+2) 실행마다: 파일 1건이 든 data/로 새 인터프리터에서 main.py를 실행하는 비용(기동 + 규칙 팩 로드 +
+   추출). 주기 실행(cron)이면 여기에 실행 간격의 절반(평균 대기)이 더해진다.
+
+실행: python -m benchmarks.bench_watch [--docs 20 --interval 0.05 --burst 2000 --runs 5]
+"""
+import argparse
+import json
+import logging
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from benchmarks.suite import percentile
+from benchmarks.synthetic import generate_corpus, to_ocr_response
+from src.pipeline.document import build_extractor
+from src.pipeline.watch import DEFAULT_BATCH_SIZE, DEFAULT_BATCH_WAIT, WatchService, open_watcher
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def _drop(inbox, staging, name, ticket):
+    """스캐너처럼 임시 파일에 쓴 뒤 감시 디렉터리로 옮기고, 옮긴 시각을 반환한다."""
+    tmp = staging / name
+    tmp.write_text(json.dumps(to_ocr_response(ticket), ensure_ascii=False), encoding="utf-8")
+    os.replace(tmp, inbox / name)
+    return time.perf_counter()
+
+
+def _wait_done(done, names, deadline=30.0):
+    """names가 done/에 나타난 시각을 잰다(1 ms 간격으로 확인)."""
+    finished = {}
+    limit = time.perf_counter() + deadline
+    while len(finished) < len(names) and time.perf_counter() < limit:
+        for name in names:
+            if name not in finished and (done / name).exists():
+                finished[name] = time.perf_counter()
+        time.sleep(0.001)
+    return finished
+
+
+def bench_watch(backend, tickets, interval, burst, batch_size, batch_wait, poll_interval, settle):
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        inbox, staging = tmp / "inbox", tmp / "staging"
+        inbox.mkdir()
+        staging.mkdir()
+        watcher = open_watcher(inbox, backend, settle=settle)
+        service = WatchService(watcher, tmp / "out", build_extractor(), batch_size=batch_size,
+                               batch_wait=batch_wait, poll_interval=poll_interval)
+        thread = threading.Thread(target=service.serve_forever)
+        thread.start()
+        try:
+            # 한 건씩 떨궈 지연을 잰다
+            latencies = []
+            for i, ticket in enumerate(tickets):
+                name = f"scan_{i:05d}.json"
+                dropped = _drop(inbox, staging, name, ticket)
+                finished = _wait_done(inbox / "done", [name])
+                if name in finished:
+                    latencies.append(finished[name] - dropped)
+                time.sleep(interval)
+            # 한꺼번에 떨궈 배치 처리량을 잰다
+            drained = None
+            if burst:
+                names = [f"burst_{i:05d}.json" for i in range(burst)]
+                for i, name in enumerate(names):
+                    (staging / name).write_text(json.dumps(to_ocr_response(tickets[i % len(tickets)]),
+                                                           ensure_ascii=False), encoding="utf-8")
+                target = service.run_log.documents + burst
+                t0 = time.perf_counter()
+                for name in names:
+                    os.replace(staging / name, inbox / name)
+                # 감시 스레드와 GIL을 덜 다투도록 처리 건수만 가끔 확인한다
+                while service.run_log.documents < target and time.perf_counter() - t0 < 120:
+                    time.sleep(0.005)
+                drained = time.perf_counter() - t0
+        finally:
+            service.stop()
+            thread.join()
+            service.close()
+    return watcher.backend, sorted(latencies), drained, service.batches
+
+
+def bench_cold_run(ticket, runs):
+    """파일 1건으로 새 인터프리터에서 main.py를 실행하는 시간(초)."""
+    samples = []
+    env = {**os.environ, "PYTHONPATH": str(ROOT)}
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        (tmp / "data").mkdir()
+        (tmp / "data" / "scan.json").write_text(json.dumps(to_ocr_response(ticket), ensure_ascii=False),
+                                                encoding="utf-8")
+        for _ in range(runs):
+            t0 = time.perf_counter()
+            subprocess.run([sys.executable, str(ROOT / "main.py")], cwd=tmp, env=env, check=True,
+                           capture_output=True)
+            samples.append(time.perf_counter() - t0)
+    return sorted(samples)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--docs", type=int, default=20, help="지연 측정에 떨굴 문서 수")
+    parser.add_argument("--interval", type=float, default=0.05, help="문서를 떨구는 간격(초)")
+    parser.add_argument("--burst", type=int, default=2000, help="처리량 측정에 한꺼번에 떨굴 문서 수 (0: 생략)")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument("--batch-wait", type=float, default=DEFAULT_BATCH_WAIT)
+    parser.add_argument("--poll-interval", type=float, default=1.0)
+    parser.add_argument("--settle", type=float, default=2.0)
+    parser.add_argument("--backends", nargs="+", default=["inotify", "poll"], choices=["inotify", "poll"])
+    parser.add_argument("--runs", type=int, default=5, help="main.py 실행 횟수")
+    args = parser.parse_args(argv)
+    # 문서별 로그·누락 경고는 측정에서 뺀다
+    logging.disable(logging.WARNING)
+    tickets = list(generate_corpus(max(args.docs, 1), seed=0))
+
+    print(f"감시 모드: {args.docs}건을 {args.interval}초 간격으로 한 건씩, 배치 {args.batch_size}건/"
+          f"{args.batch_wait}초, 훑기 {args.poll_interval}초, settle {args.settle}초")
+    print(f"{'backend':<9} {'p50 s':>7} {'p95 s':>7} {'max s':>7} {'burst s':>8} {'burst docs/s':>13} {'batches':>8}")
+    for backend in args.backends:
+        try:
+            name, latencies, drained, batches = bench_watch(
+                backend, tickets, args.interval, args.burst, args.batch_size, args.batch_wait,
+                args.poll_interval, args.settle)
+        except (OSError, AttributeError) as e:
+            print(f"{backend:<9} 사용할 수 없음: {e}")
+            continue
+        burst = f"{drained:8.2f} {args.burst / drained:13.0f}" if drained else f"{'-':>8} {'-':>13}"
+        print(f"{name:<9} {percentile(latencies, 50):7.3f} {percentile(latencies, 95):7.3f} "
+              f"{latencies[-1] if latencies else 0.0:7.3f} {burst} {batches:>8}")
+
+    samples = bench_cold_run(tickets[0], args.runs)
+    print(f"\n실행마다 main.py(파일 1건, {args.runs}회): p50 {percentile(samples, 50):.3f}초, "
+          f"최대 {samples[-1]:.3f}초 (+ 주기 실행이면 실행 간격의 절반 평균 대기)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+"""파이프라인 단계별 벤치마크 스위트 (합성 계근지 기반).
+
+benchmarks/synthetic.py로 만든 계근지에 대해 단계별 처리량과 지연 분위수
+(p50/p95/p99)를 측정하고, 결과를 JSON 기준선으로 저장·비교한다.
+
+- clean_text: 원문 → 정제 텍스트
+- extract: OcrExtractor.extract (정제 텍스트 입력)
+- parse_weights: OcrExtractor._parse_weights (정제 텍스트 줄 입력)
+- nlp_extract: OcrExtractorWithNlp.extract (spaCy 미설치 시 건너뜀)
+- end_to_end: main.run_cleaning_pipeline 전체 실행(임시 디렉터리, 표본 = 실행 1회)
+
+실행: python -m benchmarks.suite [--docs 2000 --seed 0]
+      [--save benchmarks/baselines/<이름>.json] [--compare benchmarks/baselines/reference.json]
+"""
+import argparse
+import json
+import logging
+import math
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence
+
+from benchmarks.synthetic import generate_corpus, to_ocr_response
+
+ROOT = Path(__file__).resolve().parent.parent
+SCHEMA_VERSION = 1
+WARMUP = 50
+
+
+def percentile(sorted_values: Sequence[float], q: float) -> float:
+    """정렬된 표본의 q 분위수(nearest-rank)."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, min(len(sorted_values), math.ceil(q / 100 * len(sorted_values))))
+    return sorted_values[rank - 1]
+
+
+def summarize(samples_ns: Sequence[int], items_per_sample: int = 1) -> Dict[str, float]:
+    """표본(ns) → 처리량(건/초)과 지연 분위수(µs)."""
+    values = sorted(samples_ns)
+    total_s = sum(values) / 1e9
+    return {
+        "samples": len(values),
+        "throughput_per_s": round(len(values) * items_per_sample / total_s, 1) if total_s else 0.0,
+        "mean_us": round(sum(values) / len(values) / 1e3, 2),
+        "p50_us": round(percentile(values, 50) / 1e3, 2),
+        "p95_us": round(percentile(values, 95) / 1e3, 2),
+        "p99_us": round(percentile(values, 99) / 1e3, 2),
+    }
+
+
+def time_each(fn: Callable, inputs: Sequence) -> List[int]:
+    """입력마다 fn 호출 시간(ns)을 잰다(앞부분으로 예열 후)."""
+    for x in inputs[:WARMUP]:
+        fn(x)
+    clock = time.perf_counter_ns
+    samples = []
+    for x in inputs:
+        t0 = clock()
+        fn(x)
+        samples.append(clock() - t0)
+    return samples
+
+
+def bench_stages(texts: Sequence[str]) -> Dict[str, dict]:
+    from src.parser.cleaner import clean_text
+    from src.parser.extractor import OcrExtractor
+    from src.pipeline.document import build_extractor
+
+    extractor = OcrExtractor()
+    cleaned = [clean_text(t) for t in texts]
+    line_lists = [t.split("\n") for t in cleaned]
+    stages = {
+        "clean_text": summarize(time_each(clean_text, texts)),
+        "extract": summarize(time_each(extractor.extract, cleaned)),
+        "parse_weights": summarize(time_each(extractor._parse_weights, line_lists)),
+    }
+    nlp_extractor = build_extractor(use_nlp=True)
+    if type(nlp_extractor).__name__ == "OcrExtractorWithNlp":
+        stages["nlp_extract"] = summarize(time_each(nlp_extractor.extract, cleaned))
+    else:
+        stages["nlp_extract"] = {"skipped": "spaCy 미설치 또는 NLP 초기화 실패"}
+    return stages
+
+
+def bench_end_to_end(tickets: Sequence, repeat: int) -> Dict[str, float]:
+    """임시 작업 디렉터리에 data/*.json을 만들고 run_cleaning_pipeline을 repeat회 실행한다."""
+    import main
+
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = Path(tmp) / "data"
+        data_dir.mkdir()
+        for i, ticket in enumerate(tickets):
+            path = data_dir / f"synthetic_{i:06d}.json"
+            path.write_text(json.dumps(to_ocr_response(ticket), ensure_ascii=False), encoding="utf-8")
+        os.chdir(tmp)
+        try:
+            samples = []
+            for _ in range(repeat):
+                t0 = time.perf_counter_ns()
+                main.run_cleaning_pipeline()
+                samples.append(time.perf_counter_ns() - t0)
+        finally:
+            os.chdir(cwd)
+    summary = summarize(samples, items_per_sample=len(tickets))
+    summary["docs_per_run"] = len(tickets)
+    return summary
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                             capture_output=True, text=True, check=True)
+        return out.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_suite(docs: int, seed: int, e2e_docs: int, e2e_repeat: int) -> dict:
+    tickets = list(generate_corpus(docs, seed=seed))
+    stages = bench_stages([t.text for t in tickets])
+    stages["end_to_end"] = bench_end_to_end(tickets[:e2e_docs], e2e_repeat)
+    return {
+        "schema": SCHEMA_VERSION,
+        "meta": {
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "docs": docs, "seed": seed, "e2e_docs": e2e_docs, "e2e_repeat": e2e_repeat,
+        },
+        "stages": stages,
+    }
+
+
+def compare(current: dict, baseline: dict, tolerance: float) -> List[str]:
+    """기준선 대비 p50/p95가 (1 + tolerance)배를 넘은 단계 목록과 비교표를 출력한다."""
+    regressions = []
+    print(f"\n기준선 비교 (commit {baseline['meta'].get('commit')} → {current['meta'].get('commit')})")
+    keys = ("docs", "seed", "e2e_docs")
+    if any(current["meta"].get(k) != baseline["meta"].get(k) for k in keys):
+        print("주의: 측정 조건(docs/seed/e2e_docs)이 기준선과 달라 비교가 부정확할 수 있습니다")
+    print(f"{'stage':<14} {'p50':>8} {'p95':>8} {'p99':>8}")
+    for name, cur in current["stages"].items():
+        base = baseline["stages"].get(name)
+        if not base or "skipped" in cur or "skipped" in base:
+            continue
+        ratios = {q: cur[f"{q}_us"] / base[f"{q}_us"] if base[f"{q}_us"] else 1.0 for q in ("p50", "p95", "p99")}
+        print(f"{name:<14} " + " ".join(f"{ratios[q]:7.2f}x" for q in ("p50", "p95", "p99")))
+        if ratios["p50"] > 1 + tolerance or ratios["p95"] > 1 + tolerance:
+            regressions.append(name)
+    return regressions
+
+
+def print_report(result: dict) -> None:
+    print(f"{'stage':<14} {'docs/s':>10} {'p50(µs)':>10} {'p95(µs)':>10} {'p99(µs)':>10}")
+    for name, s in result["stages"].items():
+        if "skipped" in s:
+            print(f"{name:<14} 건너뜀: {s['skipped']}")
+            continue
+        print(f"{name:<14} {s['throughput_per_s']:10.1f} {s['p50_us']:10.1f} {s['p95_us']:10.1f} {s['p99_us']:10.1f}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--docs", type=int, default=2000, help="단계별 측정 문서 수")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--e2e-docs", type=int, default=500, help="end_to_end 실행당 문서 수")
+    parser.add_argument("--e2e-repeat", type=int, default=5, help="end_to_end 실행 횟수")
+    parser.add_argument("--save", metavar="PATH", help="결과 JSON 저장 경로")
+    parser.add_argument("--compare", metavar="PATH", help="비교할 기준선 JSON")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="회귀로 판정할 p50/p95 증가율 (기본 0.2)")
+    args = parser.parse_args(argv)
+
+    # 파이프라인의 문서별 경고/완료 로그가 측정과 출력에 섞이지 않게 한다
+    logging.getLogger().addHandler(logging.NullHandler())
+
+    result = run_suite(args.docs, args.seed, args.e2e_docs, args.e2e_repeat)
+    print_report(result)
+    if args.save:
+        path = Path(args.save)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(result, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        print(f"\n저장: {path}")
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        regressions = compare(result, baseline, args.tolerance)
+        if regressions:
+            print(f"회귀 감지: {', '.join(regressions)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
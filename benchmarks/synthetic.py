@@ -0,0 +1,155 @@
+"""합성 계근지(계량증명서) OCR 텍스트 생성기.
+
+data/ 샘플에서 관찰한 변형을 확률적으로 섞어 정답(expected)과 함께 만든다.
+
+- OCR 노이즈: clean_text 교정 테이블이 다루는 오인식/중복/노이즈 줄, '*' 장식
+- 분리된 숫자: '13 460 kg' (merge_split_number_kg 대상)
+- 라벨 누락: 실중량/차량번호 라벨 없음(산술 추론, N/A 경로)
+- 하단 발급사: '(주)' 없이 문서 끝부분에만 나오는 발급 회사명
+- 문서 길이: 라벨과 겹치지 않는 부가 줄(품명/구분/TEL 등)을 중간에 삽입
+
+expected는 정제·추출 후 기대값이다. 휴리스틱에 의존하는 issuer_name은
+'(주)' 표기가 있는 경우에만 채운다(그 외는 None = 검사 제외).
+"""
+import random
+from typing import Dict, Iterator, List, NamedTuple, Optional
+
+HEADERS = ["계 량 증 명 서", "* 계 그 표 *", "** 계 량 확 인 서 **", "계 량 증 명 표"]
+DATE_LABELS = ["계량일자:", "날 짜:", "일 시", "계량 일자:"]
+CAR_LABELS = ["차량번호:", "차번호:", "차량 No."]
+CLIENT_LABELS = ["거 래 처:", "상 호:", "고객사:"]
+TOTAL_LABELS = ["총중량:", "총 중 량 :"]
+EMPTY_LABELS = ["차중량:", "공차중량 :"]
+NET_LABELS = ["실중량:", "실 중 량 :"]
+CAR_PREFIXES = ["", "80구", "12가", "34나", "56다"]
+COMPANIES = ["고요환경", "장원C&S", "신성푸디스트", "정우리사이클링", "하은펄프", "동우바이오", "한솔자원", "대명산업"]
+# (OCR 오인식 원문, 정제 후 값) – data/corrections/default.tsv 참고
+NOISY_COMPANIES = [("곰욕환경폐기물", "고요환경")]
+NOISE_LINES = ["공육을 unle", "입 고입고", "·", ",", "N", "(공급자 보관용)"]
+FILLER_LINES = [
+    "품 명: 식물", "구 분: 입고", "품 명 국판 구 분", "TEL : (031)359-9127", "FAX : (031)359-9128",
+    "계량횟수 0022", "비 고", "ID-NO : 010889", "감 량 0", "출",
+]
+ADDRESSES = ["경기도 화성시 팔탄면 노하길454번길 23", "서울 강남구 테헤란로 1", "충남 아산시 배방읍 2"]
+NOTICES = ["* 위와 같이 계량하였음을 확인함.", "* 상기와 같이 계량하였음을 증명합니다. *", "계량표는 상기와 같이 계량하였음을 증명함."]
+
+
+class Ticket(NamedTuple):
+    text: str
+    expected: Dict[str, object]
+
+
+def _kg(value: int, split: bool) -> str:
+    if split and value >= 1000:
+        return f"{value // 1000} {value % 1000:03d} kg"
+    return f"{value:,} kg"
+
+
+def _time(rng: random.Random) -> str:
+    return f"{rng.randint(0, 23):02d}:{rng.randint(0, 59):02d} "
+
+
+def generate_ticket(
+    rng: random.Random,
+    noise: float = 0.3,
+    split_numbers: float = 0.3,
+    missing_labels: float = 0.1,
+    bottom_issuer: float = 0.5,
+    filler_lines: int = 10,
+) -> Ticket:
+    """계근지 한 장을 만든다. 확률 인자는 각 변형이 나타날 확률, filler_lines는 부가 줄 최대 개수."""
+    lines: List[str] = []
+    date = f"20{rng.randint(20, 26)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+    car = rng.choice(CAR_PREFIXES) + f"{rng.randint(1000, 9999)}"
+    empty = rng.randint(5, 15) * 1000 + rng.randint(0, 99) * 10
+    net = rng.randint(1, 80) * 100 + rng.randint(0, 9) * 10
+    total = empty + net
+    split = rng.random() < split_numbers
+
+    header = rng.choice(HEADERS)
+    lines.append(f"* {header} *" if rng.random() < noise else header)
+
+    issuer: Optional[str] = None
+    at_bottom = rng.random() < bottom_issuer
+    company = rng.choice(COMPANIES)
+    if not at_bottom:
+        lines.append(f"(주) {company}")
+        issuer = f"(주){company}"
+        if rng.random() < 0.5:
+            lines.append(rng.choice(ADDRESSES))
+
+    lines.append(f"{rng.choice(DATE_LABELS)} {date} {rng.randint(1, 9999):04d}")
+    car_known = rng.random() >= missing_labels
+    lines.append(f"{rng.choice(CAR_LABELS)} {car}" if car_known else f"{car}")
+
+    if rng.random() < noise:
+        client_raw, client = rng.choice(NOISY_COMPANIES)
+    else:
+        client_raw = client = rng.choice([c for c in COMPANIES if c != company])
+    lines.append(f"{rng.choice(CLIENT_LABELS)} {client_raw}")
+
+    for _ in range(rng.randint(0, filler_lines)):
+        lines.append(rng.choice(FILLER_LINES))
+        if rng.random() < noise:
+            lines.append(rng.choice(NOISE_LINES))
+
+    lines.append(f"{rng.choice(TOTAL_LABELS)} {_time(rng)}{_kg(total, split)}")
+    lines.append(f"{rng.choice(EMPTY_LABELS)} {_time(rng)}{_kg(empty, split)}")
+    # 실중량 라벨 누락 → 총중량-공차중량 산술 추론
+    if rng.random() >= missing_labels:
+        lines.append(f"{rng.choice(NET_LABELS)} {_kg(net, split)}")
+
+    lines.append(rng.choice(NOTICES))
+    if at_bottom:
+        lines.append(company)
+    lines.append(f"{date} {_time(rng).strip()}:{rng.randint(0, 59):02d}")
+    if rng.random() < 0.5:
+        lines.append(f"37.{rng.randint(100000, 999999)}, 127.{rng.randint(100000, 999999)}")
+
+    expected = {
+        "car_number": car if car_known else None,
+        "date": date,
+        "client_name": client,
+        "issuer_name": issuer,
+        "weights": {"unit": "kg", "total": total, "empty": empty, "net": net},
+    }
+    return Ticket("\n".join(line + " " for line in lines), expected)
+
+
+def rescan(text: str, rng: random.Random, edits: int = 3) -> str:
+    """같은 계근지를 다시 스캔한 것처럼 OCR 노이즈만 바꾼 사본을 만든다(숫자는 그대로).
+
+    줄 앞뒤 장식('*'), 글자 사이 공백, 노이즈 줄 삽입, 한글 한 글자 탈락을 edits번 섞는다.
+    """
+    lines = text.split("\n")
+    for _ in range(edits):
+        i = rng.randrange(len(lines))
+        line = lines[i]
+        kind = rng.randrange(4)
+        if kind == 0:
+            lines[i] = f"* {line.strip()} *"
+        elif kind == 1 and line.strip():
+            j = rng.randrange(len(line))
+            lines[i] = line[:j] + " " + line[j:]
+        elif kind == 2:
+            lines.insert(i, rng.choice(NOISE_LINES) + " ")
+        else:
+            # 숫자 사이 글자(차량번호 '12가3456'의 '가')는 빼지 않는다(숫자가 이어 붙으면 다른 값)
+            hangul = [j for j, ch in enumerate(line) if "가" <= ch <= "힣"
+                      and not (line[j - 1:j].isdigit() or line[j + 1:j + 2].isdigit())]
+            if hangul:
+                j = rng.choice(hangul)
+                lines[i] = line[:j] + line[j + 1:]
+    return "\n".join(lines)
+
+
+def generate_corpus(n: int, seed: int = 0, **kwargs) -> Iterator[Ticket]:
+    """결정적(seed 고정) 합성 계근지 n장을 만든다. kwargs는 generate_ticket 인자."""
+    rng = random.Random(seed)
+    for _ in range(n):
+        yield generate_ticket(rng, **kwargs)
+
+
+def to_ocr_response(ticket: Ticket) -> dict:
+    """파이프라인 입력(OCR 응답 JSON)과 같은 최상위 구조로 감싼다."""
+    return {"apiVersion": "1.1", "confidence": 0.92, "mimeType": "multipart/form-data", "text": ticket.text}
@@ -1,94 +1,398 @@
-import json
 import logging
 from pathlib import Path
 import argparse
-import os
-from src.parser.cleaner import clean_text
-from src.parser.extractor import OcrExtractor
+import signal
+from typing import Optional
+from src.parser.rule_pack import DEFAULT_PACK, use_rules
+from src.parser.version import extraction_fingerprint
+from src.pipeline.columnar import DEFAULT_ROW_GROUP_SIZE, FORMATS, ColumnarWriter, check_format
+from src.pipeline.corpus import DEFAULT_CHECKPOINT_EVERY, Corpus, stream_corpus, stream_corpus_parallel
+from src.pipeline.dedup import DEFAULT_THRESHOLD, DEFAULT_WINDOW, Deduplicator
+from src.pipeline.document import build_extractor, output_path_for, process_file, resolve_use_nlp
+from src.pipeline.manifest import Manifest
+from src.pipeline.pages import DEFAULT_MIN_PARALLEL_PAGES, PageMode
+from src.pipeline.parallel import iter_parallel
+from src.pipeline.result_cache import DEFAULT_MAX_ENTRIES, CachedExtractor
+from src.pipeline.routing import DEFAULT_MIN_CONFIDENCE, NLP_FIELDS, RoutePolicy, RoutingExtractor
+from src.pipeline.staged import DEFAULT_QUEUE_SIZE, DEFAULT_READERS, iter_staged
+from src.pipeline.streaming import stream_jsonl
+from src.pipeline.watch import (BACKENDS, DEFAULT_BATCH_SIZE, DEFAULT_BATCH_WAIT, DEFAULT_POLL_INTERVAL,
+                                DEFAULT_SETTLE, WatchService, open_watcher)
+from src.utils import metrics
+from src.utils.log import LOG_FORMATS, RunLog, configure_logging
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_MANIFEST = "outputs/.manifest.sqlite"
 
-def setup_logging():
-    """콘솔 + 파일 동시 출력 로깅 설정"""
-    log_dir = Path("logs")
-    log_dir.mkdir(exist_ok=True)
 
-    formatter = logging.Formatter(
-        "[%(asctime)s] %(levelname)s - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S"
-    )
+def setup_logging(log_format: str = "text", async_handlers: bool = False):
+    """콘솔 + 파일 동시 출력 로깅 설정 (비동기 모드면 QueueListener를 반환)"""
+    return configure_logging("logs/pipeline.log", log_format=log_format, async_handlers=async_handlers)
 
-    # 콘솔 핸들러
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(logging.INFO)
-    console_handler.setFormatter(formatter)
 
-    # 파일 핸들러
-    file_handler = logging.FileHandler("logs/pipeline.log", encoding="utf-8")
-    file_handler.setLevel(logging.INFO)
-    file_handler.setFormatter(formatter)
-
-    root_logger = logging.getLogger()
-    root_logger.setLevel(logging.INFO)
-    root_logger.addHandler(console_handler)
-    root_logger.addHandler(file_handler)
-
-
-def run_cleaning_pipeline(use_nlp: bool = False):
+def run_cleaning_pipeline(use_nlp: bool = False, workers: int = 1,
+                          cache_path: Optional[str] = None, cache_size: int = DEFAULT_MAX_ENTRIES,
+                          manifest_path: Optional[str] = None, layout: bool = False,
+                          output_format: str = "json", output_path: Optional[str] = None,
+                          row_group_size: int = DEFAULT_ROW_GROUP_SIZE, staged: bool = False,
+                          readers: int = DEFAULT_READERS, queue_size: int = DEFAULT_QUEUE_SIZE,
+                          log_sample: int = 1, dedup: bool = False,
+                          dedup_threshold: float = DEFAULT_THRESHOLD, dedup_window: int = DEFAULT_WINDOW,
+                          rules: Optional[str] = None, rules_reload: float = 0.0,
+                          route: Optional[RoutePolicy] = None, pages: Optional[PageMode] = None):
     data_dir = Path("data")
     output_dir = Path("outputs")
     output_dir.mkdir(exist_ok=True)
 
+    # 열 지향 출력(csv/parquet): 문서별 JSON 대신 파일 하나에 row group 단위로 기록
+    writer = None
+    if output_format != "json":
+        if manifest_path:
+            # 증분 실행은 바뀐 문서만 처리하므로, 매 실행 새로 쓰는 단일 결과 파일과 맞지 않는다
+            raise ValueError("증분 실행은 json 출력에서만 지원합니다")
+        writer = ColumnarWriter(output_path or output_dir / f"results.{output_format}",
+                                fmt=output_format, row_group_size=row_group_size, mark_duplicates=dedup)
+    file_output_dir = output_dir if writer is None else None
+
     # 선택적 NLP 보조 모드 (플래그 또는 환경변수 USE_NLP)
-    use_nlp = use_nlp or str(os.getenv("USE_NLP", "")).lower() in {"1", "true", "yes", "on"}
-    if use_nlp:
-        try:
-            from src.nlp.engine import build_nlp  # lazy import
-            from src.parser.extractor import OcrExtractor as BaseExtractor
-            from src.parser.extractor_nlp_wrapper import OcrExtractorWithNlp
-            nlp = build_nlp()
-            extractor = OcrExtractorWithNlp(base=BaseExtractor(), nlp=nlp)
-            logger.info("NLP 보조 모드 활성화: EntityRuler 적용")
-        except Exception as e:
-            logger.warning("NLP 보조 모드 초기화 실패: %s (기본 모드로 진행)", e)
-            extractor = OcrExtractor()
+    use_nlp = resolve_use_nlp(use_nlp)
+    # 규칙 팩: 매니페스트 지문에 반영되도록 추출기보다 먼저 정한다(워커 프로세스에는 rules를 넘겨 각자 로드)
+    if rules or rules_reload:
+        use_rules(rules or DEFAULT_PACK, check_interval=rules_reload)
+    # 파일 순서를 고정해 결과/경고 로그를 결정적으로 유지
+    json_files = sorted(data_dir.glob("*.json"))
+
+    # 증분 모드: 새 파일/변경된 파일/다른 규칙 버전으로 처리된 파일만 처리
+    manifest = None
+    states = {}
+    if manifest_path:
+        # 경로 선택 모드는 일부 문서에 NLP 보조를 쓰므로 NLP 코드 지문까지 반영한다
+        # (페이지 단위 추출은 중단 시점에 따라 주소가 달라질 수 있어 따로 구분한다)
+        manifest = Manifest(manifest_path, extraction_fingerprint(use_nlp or route is not None, layout,
+                                                                  pages=pages is not None and not use_nlp))
+        removed = manifest.forget_missing(f.name for f in json_files)
+        todo, skipped = manifest.plan(json_files)
+        states = {state.path.name: state for state in todo}
+        json_files = [state.path for state in todo]
+        logger.info("증분 실행: 처리 대상 %d건, 변경 없음 %d건 건너뜀, 삭제된 입력 %d건 정리",
+                    len(json_files), skipped, removed)
+
+    deduplicator = None
+    if dedup:
+        # 중복 스캔 제거(단일 프로세스): 묶음 안에서 text 지문이 같은 계량인 문서는 처음 나온 문서만 추출한다
+        if staged or workers > 1:
+            raise ValueError("중복 스캔 제거는 단일 프로세스 순차 실행에서만 지원합니다")
+        extractor = build_extractor(use_nlp, cache_path=cache_path, cache_size=cache_size, layout=layout,
+                                    route=route, pages=pages)
+        deduplicator = Deduplicator(extractor, file_output_dir, threshold=dedup_threshold, window=dedup_window)
+        results = deduplicator.process(json_files)
+    elif staged:
+        # 단계형: 읽기 스레드 / 추출(스레드 또는 프로세스 풀) / 쓰기 스레드를 제한된 큐로 연결
+        extractor = None
+        if workers <= 1:
+            extractor = build_extractor(use_nlp, cache_path=cache_path, cache_size=cache_size, layout=layout,
+                                        route=route, pages=pages)
+        results = iter_staged(json_files, file_output_dir, extractor, workers=workers, use_nlp=use_nlp,
+                              cache_path=cache_path, cache_size=cache_size, layout=layout,
+                              rules=rules, rules_reload=rules_reload, route=route, pages=pages,
+                              readers=readers, queue_size=queue_size)
+    elif workers > 1:
+        # 프로세스 풀: 워커당 추출기 1회 생성, 결과는 파일 순서대로 수신
+        results = iter_parallel(json_files, workers, use_nlp, file_output_dir,
+                                cache_path=cache_path, cache_size=cache_size, layout=layout,
+                                rules=rules, rules_reload=rules_reload, route=route, pages=pages)
+        extractor = None
     else:
-        extractor = OcrExtractor()
-
-    for json_file in data_dir.glob("*.json"):
-        with open(json_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            raw_text = data.get('text', '')
-
-            cleaned = clean_text(raw_text)
-            extracted_data = extractor.extract(cleaned)
-
-            # 필드 누락 경고
-            if extracted_data['car_number'] == "N/A":
-                logger.warning("[%s] 차량번호 추출 실패", json_file.name)
-            if extracted_data['date'] == "N/A":
-                logger.warning("[%s] 날짜 추출 실패", json_file.name)
-
-            # 무게 검증
-            w = extracted_data['weights']
-            if w['total'] > 0 and w['empty'] > 0 and w['net'] > 0:
-                if w['total'] != w['empty'] + w['net']:
-                    logger.warning(
-                        "[%s] 무게 산술 불일치: total(%d) != empty(%d) + net(%d)",
-                        json_file.name, w['total'], w['empty'], w['net']
-                    )
-
-            # 결과물 JSON 파일로 저장
-            output_path = output_dir / f"{json_file.stem}_result.json"
-            with open(output_path, 'w', encoding='utf-8') as out_f:
-                json.dump(extracted_data, out_f, ensure_ascii=False, indent=4)
-
-            logger.info("[%s] 처리 완료 → %s", json_file.name, extracted_data)
+        extractor = build_extractor(use_nlp, cache_path=cache_path, cache_size=cache_size, layout=layout,
+                                    route=route, pages=pages)
+        results = (process_file(f, extractor, file_output_dir) for f in json_files)
+
+    # 경고는 모두, 성공 줄은 log_sample건마다 1건 기록하고 끝에 실행 요약을 남긴다
+    duplicate_of = deduplicator.duplicate_of if deduplicator is not None else {}
+    run_log = RunLog(logger, sample_every=log_sample)
+    try:
+        for name, extracted_data, warnings in results:
+            run_log.document(name, extracted_data, warnings)
+            if writer is not None:
+                writer.write(name, extracted_data, duplicate_of=duplicate_of.get(name))
+            if manifest is not None:
+                # 결과 파일을 쓴 뒤 파일 단위로 기록 → 중단 후 재실행 시 이어서 처리
+                manifest.record(states[name], output_path_for(states[name].path, output_dir))
+    except BaseException:
+        if writer is not None:
+            writer.abort()
+        raise
+    finally:
+        # 단계형 파이프라인은 중단 시 이미 읽은 문서를 마저 쓰고 스레드를 정리한다
+        close = getattr(results, "close", None)
+        if close is not None:
+            close()
 
+    if writer is not None:
+        path = writer.close()
+        logger.info("열 지향 출력: %s (%d건, row group %d개)", path, writer.rows_written, writer.row_groups)
+    if manifest is not None:
+        manifest.close()
+    if deduplicator is not None:
+        logger.info("중복 스캔: %d건 중 %d건은 대표 문서 결과로 기록", deduplicator.index.documents, len(duplicate_of))
+    _log_cache_stats(extractor)
+    _log_route_stats(extractor)
+    run_log.log_summary()
     logger.info("전체 파이프라인 완료")
 
 
+def run_streaming_pipeline(src: str, dest: str = "-", use_nlp: bool = False,
+                           cache_path: Optional[str] = None, cache_size: int = DEFAULT_MAX_ENTRIES,
+                           layout: bool = False, rules: Optional[str] = None, rules_reload: float = 0.0,
+                           workers: int = 1, checkpoint: Optional[str] = None,
+                           checkpoint_every: int = DEFAULT_CHECKPOINT_EVERY,
+                           route: Optional[RoutePolicy] = None, pages: Optional[PageMode] = None):
+    """JSONL 스트리밍 모드: 레코드를 한 줄씩 처리해 JSONL로 기록한다('-'는 표준 입출력).
+
+    입력 파일에 workers > 1이나 checkpoint를 주면 mmap 코퍼스 리더(줄 오프셋 인덱스)로 처리한다:
+    workers개 바이트 범위 샤드를 병렬로 처리하고, 중단 후 다시 실행하면 체크포인트부터 이어서 처리한다.
+    """
+    use_nlp = resolve_use_nlp(use_nlp)
+    if workers > 1:
+        count = stream_corpus_parallel(src, dest, workers, use_nlp, cache_path=cache_path, cache_size=cache_size,
+                                       layout=layout, rules=rules, rules_reload=rules_reload,
+                                       checkpoint=checkpoint, checkpoint_every=checkpoint_every, route=route,
+                                       pages=pages)
+        logger.info("스트리밍 파이프라인 완료: %d건 (샤드 %d개 병렬)", count, workers)
+        return
+    extractor = build_extractor(use_nlp, cache_path=cache_path, cache_size=cache_size,
+                                layout=layout, rules=rules, rules_reload=rules_reload, route=route, pages=pages)
+    if checkpoint:
+        with Corpus(src) as corpus:
+            count = stream_corpus(corpus, dest, extractor, checkpoint=checkpoint, checkpoint_every=checkpoint_every)
+    else:
+        count = stream_jsonl(src, dest, extractor)
+    _log_cache_stats(extractor)
+    _log_route_stats(extractor)
+    logger.info("스트리밍 파이프라인 완료: %d건", count)
+
+
+def run_watch_pipeline(watch_dir: str, use_nlp: bool = False, workers: int = 1,
+                       cache_path: Optional[str] = None, cache_size: int = DEFAULT_MAX_ENTRIES,
+                       layout: bool = False, rules: Optional[str] = None, rules_reload: float = 0.0,
+                       route: Optional[RoutePolicy] = None, pages: Optional[PageMode] = None,
+                       log_sample: int = 1, batch_size: int = DEFAULT_BATCH_SIZE,
+                       batch_wait: float = DEFAULT_BATCH_WAIT, poll_interval: float = DEFAULT_POLL_INTERVAL,
+                       settle: float = DEFAULT_SETTLE, backend: str = "auto",
+                       done_dir: Optional[str] = None, mark: bool = False):
+    """감시 모드: watch_dir에 들어오는 OCR JSON을 마이크로 배치로 처리해 outputs/에 기록한다.
+
+    추출기(workers > 1이면 워커 풀)는 한 번만 구성해 감시가 끝날 때까지 재사용한다.
+    SIGINT/SIGTERM을 받으면 처리 중인 배치를 마치고 멈춘다.
+    """
+    use_nlp = resolve_use_nlp(use_nlp)
+    extractor = None
+    if workers <= 1:
+        extractor = build_extractor(use_nlp, cache_path=cache_path, cache_size=cache_size, layout=layout,
+                                    rules=rules, rules_reload=rules_reload, route=route, pages=pages)
+    run_log = RunLog(logger, sample_every=log_sample)
+    service = WatchService(open_watcher(watch_dir, backend, settle=settle), Path("outputs"), extractor,
+                           batch_size=batch_size, batch_wait=batch_wait, poll_interval=poll_interval,
+                           done_dir=done_dir, mark=mark, workers=workers, use_nlp=use_nlp,
+                           cache_path=cache_path, cache_size=cache_size, layout=layout, rules=rules,
+                           rules_reload=rules_reload, route=route, pages=pages, run_log=run_log)
+    handlers = {sig: signal.signal(sig, lambda signum, frame: service.stop())
+                for sig in (signal.SIGINT, signal.SIGTERM)}
+    try:
+        service.serve_forever()
+    finally:
+        for sig, handler in handlers.items():
+            signal.signal(sig, handler)
+        service.close()
+    logger.info("입력 감시 종료: 배치 %d개, 실패 %d건", service.batches, service.failed)
+    _log_cache_stats(extractor)
+    _log_route_stats(extractor)
+    run_log.log_summary()
+
+
+def _log_cache_stats(extractor) -> None:
+    """결과 캐시 사용 시 적중/미스/제거 카운터를 기록한다(단일 프로세스 실행 기준)."""
+    # 페이지/경로 선택 래퍼 안쪽의 캐시까지 찾는다
+    while extractor is not None and not isinstance(extractor, CachedExtractor):
+        extractor = getattr(extractor, "base", None)
+    if extractor is not None:
+        stats = extractor.cache.stats()
+        logger.info("결과 캐시: 적중 %d / 미스 %d / 제거 %d",
+                    stats["hits"], stats["misses"], stats["evictions"])
+
+
+def _log_route_stats(extractor) -> None:
+    """경로 선택 모드의 경로별 문서 수를 기록한다(단일 프로세스 실행 기준)."""
+    if isinstance(extractor, RoutingExtractor):
+        routes = extractor.routes
+        logger.info("경로 선택: 기본 %d건 / NLP 보조 %d건 (confidence %d, 단어 confidence %d, 필드 누락 %d)",
+                    routes["base"], sum(routes.values()) - routes["base"],
+                    routes["confidence"], routes["word_confidence"], routes["missing"])
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="계근지 OCR 텍스트 파싱 파이프라인")
+    parser.add_argument("--nlp", action="store_true", help="NLP 보조 모드 사용 (USE_NLP 환경변수와 동일)")
+    parser.add_argument("--workers", type=int, default=1, help="병렬 처리 프로세스 수 (기본 1: 단일 프로세스)")
+    parser.add_argument("--route", action="store_true",
+                        help="문서별 경로 선택: 기본 추출 후 confidence가 낮거나 NLP 보조 필드가 N/A인 문서만 NLP 보조")
+    parser.add_argument("--route-confidence", type=float, default=DEFAULT_MIN_CONFIDENCE, metavar="X",
+                        help=f"경로 선택: 문서 confidence가 X 미만이면 NLP 보조 (기본 {DEFAULT_MIN_CONFIDENCE})")
+    parser.add_argument("--route-word-confidence", type=float, metavar="X",
+                        help="경로 선택: confidence X 미만 단어가 10%% 넘으면 NLP 보조 (pages를 읽으므로 기본 끔)")
+    parser.add_argument("--route-fields", nargs="+", choices=NLP_FIELDS, default=list(NLP_FIELDS), metavar="FIELD",
+                        help=f"경로 선택: 이 필드가 N/A면 NLP 보조 (기본 {' '.join(NLP_FIELDS)})")
+    parser.add_argument("--pages", action="store_true",
+                        help="페이지 단위 추출: 여러 페이지 문서를 페이지 순서대로 훑고 필수 필드가 확정되면 중단 "
+                             "(--cache와 함께 쓰면 여러 페이지 문서는 페이지별 원문 text를 키로 캐시)")
+    parser.add_argument("--pages-full", action="store_true",
+                        help="페이지 단위 추출에서 필수 필드가 확정돼도 모든 페이지를 훑음 (뒤 페이지의 주소까지)")
+    parser.add_argument("--page-workers", type=int, default=1, metavar="N",
+                        help=f"페이지 단위 추출: 남은 페이지가 {DEFAULT_MIN_PARALLEL_PAGES}쪽 이상인 문서를 "
+                             "N개 프로세스로 나눠 훑음 (기본 1: 순차, 단일 프로세스 실행 전용)")
+    parser.add_argument("--layout", action="store_true",
+                        help="레이아웃 모드: OCR 단어 상자 위치로 라벨-값을 짝지음 (NumPy 필요)")
+    parser.add_argument("--staged", action="store_true",
+                        help="단계형 실행: 읽기 스레드/추출/쓰기 스레드를 제한된 큐로 겹쳐 실행 (네트워크 마운트 입력에 유리)")
+    parser.add_argument("--readers", type=int, default=DEFAULT_READERS,
+                        help=f"단계형 실행의 읽기 스레드 수 (기본 {DEFAULT_READERS})")
+    parser.add_argument("--queue-size", type=int, default=DEFAULT_QUEUE_SIZE,
+                        help=f"단계형 실행의 단계 간 큐 크기 (기본 {DEFAULT_QUEUE_SIZE}건)")
+    parser.add_argument("--dedup", action="store_true",
+                        help="중복 스캔 제거: text 지문이 같은 계량으로 보이는 문서는 한 번만 추출하고 duplicate_of로 표시")
+    parser.add_argument("--dedup-threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help=f"중복 판정 텍스트 유사도(추정 Jaccard, 기본 {DEFAULT_THRESHOLD})")
+    parser.add_argument("--dedup-window", type=int, default=DEFAULT_WINDOW,
+                        help=f"중복을 찾는 묶음 크기 (기본 {DEFAULT_WINDOW}건)")
+    parser.add_argument("--rules", metavar="PACK",
+                        help=f"규칙 팩 이름(data/rule_packs/<이름>.json) 또는 팩 파일 경로 (기본 {DEFAULT_PACK})")
+    parser.add_argument("--rules-reload", type=float, default=0.0, metavar="SECONDS",
+                        help="규칙 팩/교정 파일 변경을 SECONDS초마다 확인해 실행 중 다시 로드 (기본 0: 끔)")
+    parser.add_argument("--cache", metavar="PATH", help="추출 결과 캐시(SQLite) 파일 경로")
+    parser.add_argument("--cache-size", type=int, default=DEFAULT_MAX_ENTRIES, help="결과 캐시 최대 항목 수 (LRU 제거)")
+    parser.add_argument("--incremental", action="store_true",
+                        help=f"증분 실행: 변경된 입력만 처리 (매니페스트 기본 경로 {DEFAULT_MANIFEST})")
+    parser.add_argument("--manifest", metavar="PATH", help="증분 실행 매니페스트 경로 (지정 시 증분 실행)")
+    parser.add_argument("--metrics", metavar="DIR",
+                        help="단계별 계측을 켜고 종료 시 DIR/metrics.json, DIR/metrics.prom 기록")
+    parser.add_argument("--output-format", choices=("json",) + FORMATS, default="json",
+                        help="결과 형식: json(문서별 파일, 기본) / csv / parquet(단일 파일, row group 단위 기록)")
+    parser.add_argument("--output", metavar="PATH",
+                        help="csv/parquet 결과 파일 경로 (기본 outputs/results.<형식>)")
+    parser.add_argument("--row-group-size", type=int, default=DEFAULT_ROW_GROUP_SIZE,
+                        help=f"csv/parquet 기록 묶음 크기 (기본 {DEFAULT_ROW_GROUP_SIZE}건)")
+    parser.add_argument("--log-format", choices=LOG_FORMATS, default="text",
+                        help="로그 형식: text(기본) / json(한 줄 JSON, 파일명·결과·요약 필드 포함)")
+    parser.add_argument("--async-log", action="store_true",
+                        help="로그 포맷·출력을 백그라운드 스레드(QueueListener)에서 처리")
+    parser.add_argument("--log-sample", type=int, default=1, metavar="N",
+                        help="문서별 성공 로그를 N건마다 1건만 기록 (기본 1: 모두, 0: 기록 안 함, 경고는 항상 기록)")
+    parser.add_argument("--jsonl-in", metavar="PATH", help="JSONL 스트리밍 입력 ('-'는 stdin)")
+    parser.add_argument("--jsonl-out", metavar="PATH", default="-", help="JSONL 스트리밍 출력 (기본 '-': stdout)")
+    parser.add_argument("--checkpoint", metavar="PATH",
+                        help="JSONL 입력 처리 위치 체크포인트: 중단 후 같은 명령으로 다시 실행하면 이어서 처리")
+    parser.add_argument("--checkpoint-every", type=int, default=DEFAULT_CHECKPOINT_EVERY, metavar="N",
+                        help=f"체크포인트 기록 간격 (기본 {DEFAULT_CHECKPOINT_EVERY}건)")
+    parser.add_argument("--watch", metavar="DIR",
+                        help="감시 모드: DIR에 들어오는 OCR JSON을 마이크로 배치로 바로 처리해 outputs/에 기록 "
+                             "(Ctrl+C/SIGTERM으로 종료)")
+    parser.add_argument("--watch-batch", type=int, default=DEFAULT_BATCH_SIZE, metavar="N",
+                        help=f"감시 모드: 배치 하나의 최대 문서 수 (기본 {DEFAULT_BATCH_SIZE})")
+    parser.add_argument("--watch-wait", type=float, default=DEFAULT_BATCH_WAIT, metavar="SECONDS",
+                        help=f"감시 모드: 배치의 첫 파일이 들어온 뒤 배치를 닫기까지 최대 대기 (기본 {DEFAULT_BATCH_WAIT}초)")
+    parser.add_argument("--watch-poll", type=float, default=DEFAULT_POLL_INTERVAL, metavar="SECONDS",
+                        help=f"감시 모드: 디렉터리 훑기 간격 (기본 {DEFAULT_POLL_INTERVAL}초)")
+    parser.add_argument("--watch-settle", type=float, default=DEFAULT_SETTLE, metavar="SECONDS",
+                        help="감시 모드: inotify 이벤트 없이 찾은 파일은 SECONDS초 동안 바뀌지 않아야 처리 "
+                             f"(기본 {DEFAULT_SETTLE}초)")
+    parser.add_argument("--watch-backend", choices=BACKENDS, default="auto",
+                        help="감시 방식: auto(기본, inotify를 쓸 수 없으면 훑기) / inotify / poll")
+    parser.add_argument("--watch-done", metavar="DIR",
+                        help="감시 모드: 처리한 입력을 옮길 디렉터리 (기본 <감시 DIR>/done, 실패는 <감시 DIR>/failed)")
+    parser.add_argument("--watch-mark", action="store_true",
+                        help="감시 모드: 입력을 옮기지 않고 제자리에서 .done/.failed 접미어를 붙임")
+    args = parser.parse_args(argv)
+    if args.output_format != "json" and (args.incremental or args.manifest):
+        parser.error("--incremental/--manifest는 json 출력에서만 사용할 수 있습니다")
+    if args.output_format != "json":
+        # 문서를 처리하기 전에 csv/parquet 의존성(pandas/pyarrow)을 확인한다
+        try:
+            check_format(args.output_format)
+        except ImportError as e:
+            parser.error(str(e))
+    if args.rules_reload < 0:
+        parser.error("--rules-reload는 0 이상이어야 합니다")
+    if args.dedup and (args.jsonl_in or args.staged or args.workers > 1):
+        parser.error("--dedup은 파일(data/*.json) 순차 실행에서만 사용할 수 있습니다(--workers/--staged/--jsonl-in 제외)")
+    if args.checkpoint and not args.jsonl_in:
+        parser.error("--checkpoint는 --jsonl-in과 함께 사용해야 합니다")
+    if args.jsonl_in and (args.checkpoint or args.workers > 1) and "-" in (args.jsonl_in, args.jsonl_out):
+        parser.error("--jsonl-in의 --checkpoint/--workers는 파일 입력·출력(--jsonl-out PATH)에서만 사용할 수 있습니다")
+    if args.route and args.nlp:
+        parser.error("--route와 --nlp는 함께 사용할 수 없습니다(--nlp는 모든 문서에 NLP 보조)")
+    if args.pages and (args.nlp or args.layout):
+        parser.error("--pages는 --nlp/--layout과 함께 사용할 수 없습니다(페이지 단위 추출은 기본 텍스트 경로 전용)")
+    if (args.pages_full or args.page_workers != 1) and not args.pages:
+        parser.error("--pages-full/--page-workers는 --pages와 함께 사용해야 합니다")
+    if args.page_workers < 1 or (args.page_workers > 1 and args.workers > 1):
+        parser.error("--page-workers는 1 이상이며, --workers(문서 단위 병렬)와 함께 늘릴 수 없습니다")
+    if args.checkpoint_every < 1:
+        parser.error("--checkpoint-every는 1 이상이어야 합니다")
+    watch_options = (args.watch_batch != DEFAULT_BATCH_SIZE or args.watch_wait != DEFAULT_BATCH_WAIT
+                     or args.watch_poll != DEFAULT_POLL_INTERVAL or args.watch_settle != DEFAULT_SETTLE
+                     or args.watch_backend != "auto" or args.watch_done or args.watch_mark)
+    if watch_options and not args.watch:
+        parser.error("--watch-* 옵션은 --watch와 함께 사용해야 합니다")
+    if args.watch and (args.jsonl_in or args.staged or args.dedup or args.incremental or args.manifest
+                       or args.output_format != "json"):
+        parser.error("--watch는 --jsonl-in/--staged/--dedup/--incremental/--manifest/열 지향 출력과 함께 "
+                     "사용할 수 없습니다(결과는 문서별 JSON)")
+    if args.watch_batch < 1 or args.watch_wait < 0 or args.watch_poll <= 0 or args.watch_settle < 0:
+        parser.error("--watch-batch는 1 이상, --watch-wait/--watch-settle은 0 이상, --watch-poll은 0보다 커야 합니다")
+    if args.watch_done and args.watch_mark:
+        parser.error("--watch-done과 --watch-mark는 함께 사용할 수 없습니다")
+    return args
+
+
 if __name__ == "__main__":
-    setup_logging()
-    run_cleaning_pipeline()
+    args = parse_args()
+    route = (RoutePolicy(args.route_confidence, args.route_word_confidence, tuple(args.route_fields))
+             if args.route else None)
+    pages = PageMode(early_exit=not args.pages_full, workers=args.page_workers) if args.pages else None
+    listener = setup_logging(args.log_format, args.async_log)
+    try:
+        if args.metrics:
+            metrics.enable()
+        if args.watch:
+            run_watch_pipeline(args.watch, use_nlp=args.nlp, workers=args.workers,
+                               cache_path=args.cache, cache_size=args.cache_size, layout=args.layout,
+                               rules=args.rules, rules_reload=args.rules_reload, route=route, pages=pages,
+                               log_sample=args.log_sample, batch_size=args.watch_batch,
+                               batch_wait=args.watch_wait, poll_interval=args.watch_poll,
+                               settle=args.watch_settle, backend=args.watch_backend,
+                               done_dir=args.watch_done, mark=args.watch_mark)
+        elif args.jsonl_in:
+            run_streaming_pipeline(args.jsonl_in, args.jsonl_out, use_nlp=args.nlp,
+                                   cache_path=args.cache, cache_size=args.cache_size, layout=args.layout,
+                                   rules=args.rules, rules_reload=args.rules_reload,
+                                   workers=args.workers, checkpoint=args.checkpoint,
+                                   checkpoint_every=args.checkpoint_every, route=route, pages=pages)
+        else:
+            manifest_path = args.manifest or (DEFAULT_MANIFEST if args.incremental else None)
+            run_cleaning_pipeline(use_nlp=args.nlp, workers=args.workers,
+                                  cache_path=args.cache, cache_size=args.cache_size,
+                                  manifest_path=manifest_path, layout=args.layout,
+                                  output_format=args.output_format, output_path=args.output,
+                                  row_group_size=args.row_group_size, staged=args.staged,
+                                  readers=args.readers, queue_size=args.queue_size,
+                                  log_sample=args.log_sample, dedup=args.dedup,
+                                  dedup_threshold=args.dedup_threshold, dedup_window=args.dedup_window,
+                                  rules=args.rules, rules_reload=args.rules_reload, route=route, pages=pages)
+        if args.metrics:
+            json_path, prom_path = metrics.disable().export(args.metrics)
+            logger.info("계측 결과 저장: %s, %s", json_path, prom_path)
+    finally:
+        if listener is not None:
+            # 큐에 남은 레코드를 모두 기록하고 리스너 스레드를 멈춘다(예외로 끝나도 로그 유실 없음)
+            listener.stop()
@@ -1,7 +1,18 @@
 import json
+import logging
+import os
+import shutil
+import tempfile
 from pathlib import Path
 from typing import Optional, Any
 
+from src.parser.version import fingerprint_files
+
+logger = logging.getLogger(__name__)
+
+# 직렬화된 파이프라인 아티팩트 기본 위치: <dir>/<버전>/
+DEFAULT_ARTIFACT_DIR = "cache/nlp"
+
 
 def _load_external_patterns(dir_path: Path) -> list:
     patterns = []
@@ -18,6 +29,24 @@ def _load_external_patterns(dir_path: Path) -> list:
     return patterns
 
 
+def _import_spacy() -> Any:
+    try:
+        import spacy  # type: ignore
+    except Exception as e:
+        raise ImportError(
+            "spaCy가 설치되어 있지 않습니다. NLP 보조 모드를 사용하려면 'pip install -r requirements.txt' 또는 'pip install spacy==3.7.2'를 실행하세요."
+        ) from e
+    return spacy
+
+
+def pipeline_version(extra_patterns_dir: Optional[str] = "data/patterns", spacy_version: str = "") -> str:
+    """파이프라인 구성(이 모듈 + 외부 패턴 파일 + spaCy 버전)의 지문."""
+    files = [Path(__file__)]
+    if extra_patterns_dir and Path(extra_patterns_dir).is_dir():
+        files.extend(sorted(Path(extra_patterns_dir).glob("*.json")))
+    return f"{spacy_version or 'spacy'}-{fingerprint_files(files)}"
+
+
 def build_nlp(extra_patterns_dir: Optional[str] = "data/patterns") -> Any:
     """경량 spaCy 파이프라인을 구성한다.
 
@@ -25,13 +54,7 @@ def build_nlp(extra_patterns_dir: Optional[str] = "data/patterns") -> Any:
     - 기본 ORG/LOC 패턴 내장
     - data/patterns/*.json 이 있으면 병합 로드
     """
-    try:
-        import spacy  # type: ignore
-        from spacy.pipeline import EntityRuler  # type: ignore
-    except Exception as e:
-        raise ImportError(
-            "spaCy가 설치되어 있지 않습니다. NLP 보조 모드를 사용하려면 'pip install -r requirements.txt' 또는 'pip install spacy==3.7.2'를 실행하세요."
-        ) from e
+    spacy = _import_spacy()
 
     nlp = spacy.blank("xx")
     ruler = nlp.add_pipe("entity_ruler", config={"overwrite_ents": True})
@@ -56,3 +79,61 @@ def build_nlp(extra_patterns_dir: Optional[str] = "data/patterns") -> Any:
             ruler.add_patterns(ext)
 
     return nlp
+
+
+def save_artifact(extra_patterns_dir: Optional[str] = "data/patterns",
+                  artifact_dir: str = DEFAULT_ARTIFACT_DIR) -> Path:
+    """파이프라인을 구성해 <artifact_dir>/<버전>/ 에 직렬화하고 그 경로를 반환한다.
+
+    임시 디렉터리에 쓴 뒤 이름을 바꿔, 동시에 시작한 워커가 반쯤 쓴 아티팩트를 읽지 않게 한다.
+    """
+    spacy = _import_spacy()
+    target = Path(artifact_dir) / pipeline_version(extra_patterns_dir, spacy.__version__)
+    if target.is_dir():
+        return target
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp = Path(tempfile.mkdtemp(prefix=target.name + ".", dir=target.parent))
+    try:
+        build_nlp(extra_patterns_dir).to_disk(tmp)
+        os.replace(tmp, target)
+    except OSError:
+        # 다른 프로세스가 먼저 같은 버전을 저장한 경우
+        if not target.is_dir():
+            raise
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+    return target
+
+
+def load_nlp(extra_patterns_dir: Optional[str] = "data/patterns",
+             artifact_dir: Optional[str] = DEFAULT_ARTIFACT_DIR) -> Any:
+    """직렬화된 파이프라인이 현재 버전이면 불러오고, 없으면 구성 후 저장한다.
+
+    패턴 파일이나 이 모듈이 바뀌면 버전이 달라져 새 아티팩트를 만든다.
+    artifact_dir=None이면 매번 build_nlp로 구성한다. 저장 실패는 베스트에포트로 무시한다.
+    """
+    if not artifact_dir:
+        return build_nlp(extra_patterns_dir)
+    spacy = _import_spacy()
+    target = Path(artifact_dir) / pipeline_version(extra_patterns_dir, spacy.__version__)
+    if target.is_dir():
+        try:
+            return spacy.load(target)
+        except Exception as e:
+            logger.warning("NLP 파이프라인 아티팩트 로드 실패: %s (재구성)", e)
+            shutil.rmtree(target, ignore_errors=True)
+    try:
+        return spacy.load(save_artifact(extra_patterns_dir, artifact_dir))
+    except OSError as e:
+        logger.warning("NLP 파이프라인 아티팩트 저장 실패: %s", e)
+        return build_nlp(extra_patterns_dir)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="NLP 보조 파이프라인 아티팩트 빌드")
+    parser.add_argument("--patterns", default="data/patterns", help="외부 패턴 디렉터리")
+    parser.add_argument("--out", default=DEFAULT_ARTIFACT_DIR, help="아티팩트 저장 디렉터리")
+    args = parser.parse_args()
+    print(save_artifact(args.patterns, args.out))
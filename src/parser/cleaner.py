@@ -1,30 +1,41 @@
 import re
+from typing import Optional
 
-def clean_text(text: str) -> str:
+from src.parser.corrections import Corrector
+from src.parser.fuzzy import LabelIndex
+from src.parser.rule_pack import current_rules
+
+_ASTERISK_RE = re.compile(r'[\*]+')
+_MULTI_SPACE_RE = re.compile(r' +')
+
+
+def clean_text(text: str, corrector: Optional[Corrector] = None, label_index: Optional[LabelIndex] = None) -> str:
+    """OCR 텍스트 정제. corrector를 생략하면 활성 규칙 팩의 교정기와 퍼지 라벨 색인을 쓴다
+    (corrector를 직접 주면 label_index도 직접 준 경우에만 라벨 머리를 고친다)."""
     if not text:
         return ""
+    if corrector is None:
+        rules = current_rules()
+        corrector = rules.corrector
+        if label_index is None:
+            label_index = rules.label_index
 
     # 1. 별표(*) 및 불필요한 특수기호 제거
-    text = re.sub(r'[\*]+', '', text)
+    text = _ASTERISK_RE.sub('', text)
 
     # 2. OCR 오타 및 중복 텍스트 교정
-    replacements = {
-        "계 그 표": "계근표",          # sample_02: 도메인 표기 정규화
-        "입 고입고": "입고",           # sample_04 중복
-        "공육을 unle": "",             # sample_03 의미없는 노이즈
-        "곰욕환경폐기물": "고요환경",     # sample_01 업체명 오인식 교정
-        "품종명랑": "품명:",           # sample_01 오타
-        "명:": "명 :",                 # 일관성 있는 라벨링
-        "중 량:": "중량 :",
-        "날 짜:": "날짜 :"
-    }
-    
-    for old, new in replacements.items():
-        text = text.replace(old, new)
+    # 활성 규칙 팩의 교정 테이블(기본 팩은 data/corrections)을 한 번의 좌→우 스캔으로 적용한다
+    # (예: "계 그 표" → "계근표", "품종명랑" → "품명 :", 우선순위는 corrections.py 참고)
+    text = corrector.apply(text)
+
+    # 2-1. 교정 테이블에 없는 라벨 오인식: 줄 앞 라벨 자리를 퍼지 라벨 색인으로 찾아 고친다
+    # (예: "차랑번호:" → "차량번호:", "실 중 랑 :" → "실중량 :", src/parser/fuzzy.py 참고)
+    if label_index is not None:
+        text = label_index.repair(text)
 
     # 3. 불필요한 공백 및 줄바꿈 정리
     # 여러 개의 공백을 하나로
-    text = re.sub(r' +', ' ', text)
+    text = _MULTI_SPACE_RE.sub(' ', text)
     # 양끝 공백 제거
     text = text.strip()
 
@@ -0,0 +1,106 @@
+"""사전 기반 OCR 교정 엔진.
+
+교정 테이블(data/corrections/*.tsv, *.json)을 읽어 트라이 정규식 하나로 컴파일하고,
+텍스트를 한 번의 좌→우 스캔으로 교정합니다. 비용은 텍스트 길이에 비례하며
+사전 크기(8개 → 1만 개)에는 거의 영향을 받지 않습니다.
+
+겹침 우선순위
+1) 왼쪽 우선: 더 앞에서 시작하는 원문이 먼저 교정된다.
+2) 같은 위치에서는 가장 긴 원문이 우선한다.
+3) 교정 결과는 다시 스캔하지 않고, 교정된 구간 바로 뒤부터 이어서 스캔한다.
+4) 같은 원문이 여러 파일에 있으면 파일명 순으로 나중 파일의 교정값이 우선한다.
+
+테이블 형식
+- TSV: '원문<TAB>교정' 한 줄에 하나, '#'으로 시작하면 주석, 탭 없이 원문만 있으면 삭제
+- JSON: {"원문": "교정", ...} 객체 또는 [["원문", "교정"], ...] 목록
+"""
+import json
+import re
+from pathlib import Path
+from typing import Dict, Iterable, Mapping, Optional, Union
+
+from src.parser.matcher import trie_regex
+
+# 기본 교정 테이블 위치 (작업 디렉터리와 무관하게 저장소 기준)
+DEFAULT_CORRECTIONS_DIR = Path(__file__).resolve().parents[2] / "data" / "corrections"
+
+
+def _read_tsv(path: Path) -> Dict[str, str]:
+    table: Dict[str, str] = {}
+    with open(path, "r", encoding="utf-8") as f:
+        for lineno, line in enumerate(f, start=1):
+            line = line.rstrip("\r\n")
+            if not line or line.startswith("#"):
+                continue
+            old, _, new = line.partition("\t")
+            if not old:
+                raise ValueError(f"{path}:{lineno}: 원문이 비어 있습니다")
+            table[old] = new
+    return table
+
+
+def _read_json(path: Path) -> Dict[str, str]:
+    data = json.loads(path.read_text(encoding="utf-8"))
+    pairs = data.items() if isinstance(data, dict) else data
+    table: Dict[str, str] = {}
+    for old, new in pairs:
+        if not old:
+            raise ValueError(f"{path}: 원문이 비어 있습니다")
+        table[str(old)] = str(new)
+    return table
+
+
+def load_correction_table(paths: Iterable[Union[str, Path]]) -> Dict[str, str]:
+    """교정 테이블 파일들을 순서대로 병합한다(나중 파일이 우선)."""
+    table: Dict[str, str] = {}
+    for p in paths:
+        p = Path(p)
+        if p.suffix == ".json":
+            table.update(_read_json(p))
+        else:
+            table.update(_read_tsv(p))
+    return table
+
+
+def table_files(dir_path: Union[str, Path]) -> list:
+    """디렉터리의 교정 테이블 파일 목록(파일명 순)."""
+    d = Path(dir_path)
+    if not d.is_dir():
+        return []
+    return sorted(p for p in d.iterdir() if p.suffix in (".tsv", ".json"))
+
+
+class Corrector:
+    """교정 테이블을 컴파일한 단일 패스 교정기."""
+
+    def __init__(self, table: Mapping[str, str]):
+        self.table: Dict[str, str] = {k: v for k, v in table.items() if k}
+        body = trie_regex(self.table)
+        self._pattern = re.compile(body) if body else None
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+    def apply(self, text: str) -> str:
+        """텍스트 전체를 한 번 훑으며 모든 교정을 적용한다."""
+        if self._pattern is None or not text:
+            return text
+        table = self.table
+        return self._pattern.sub(lambda m: table[m.group()], text)
+
+    @classmethod
+    def from_dirs(cls, dirs: Iterable[Union[str, Path]]) -> "Corrector":
+        """디렉터리들의 테이블을 차례로 병합해 교정기를 만든다(뒤 디렉터리가 우선)."""
+        files = [f for d in dirs for f in table_files(d)]
+        return cls(load_correction_table(files))
+
+
+_default_corrector: Optional[Corrector] = None
+
+
+def default_corrector() -> Corrector:
+    """기본 교정 테이블(data/corrections)로 만든 교정기(최초 호출 시 1회 컴파일)."""
+    global _default_corrector
+    if _default_corrector is None:
+        _default_corrector = Corrector.from_dirs([DEFAULT_CORRECTIONS_DIR])
+    return _default_corrector
@@ -1,19 +1,111 @@
 import re
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+from time import perf_counter
+from src.utils import metrics
+from src.parser.gazetteer import Gazetteer
+from src.parser.result import ExtractionResult
 from src.utils.formatter import merge_split_number_kg, is_noise_line, extract_number_value
-from src.parser.rules import (
-    DATE_LABELS,
-    CAR_LABELS,
-    CAR_PART_HINTS,
-    CLIENT_LABELS,
-    ISSUER_HINTS,
-    DATE_REGEX,
-    ADDRESS_PREFIX_PATTERN,
+from src.parser.matcher import (
+    KeywordMatcher,
+    DATE,
+    CAR,
+    CLIENT,
+    ISSUER,
+    NET_WEIGHT,
+    EMPTY_WEIGHT,
+    TOTAL_WEIGHT,
+    WEIGHT,
+    NOTICE,
 )
+from src.parser.rule_pack import CompiledRules, current_rules
 
+# import 시 1회 컴파일되는 정규식(라벨/날짜/주소 규칙은 규칙 팩의 CompiledRules가 가진다)
+_GUIHA_RE = re.compile(r'^(.+?)\s+귀하\s*$')
+_KOREAN_SPACE_RE = re.compile(r'(?<=[가-힣])\s(?=[가-힣])')
+_JU_SPACE_RE = re.compile(r'\s*\(주\)\s*')
+# 발급사 후보에서 제외할 날짜/무게/좌표 줄
+_LEADING_DATE_RE = re.compile(r'^\d{4}[-/.]\d{2}[-/.]\d{2}')
+_KG_VALUE_RE = re.compile(r'[\d,]+\s*kg', re.IGNORECASE)
+_COORDINATE_RE = re.compile(r'^\d{2,3}\.\d{5,}')
 
-def _contains_any(text: str, keywords):
-    """문자열에 키워드 목록 중 하나라도 포함되는지 검사"""
-    return any(k in text for k in keywords)
+
+class _Line:
+    """한 줄의 정규화 형태를 한 번씩만 계산해 여러 단계가 공유하는 표현.
+
+    - raw: 원문 줄 / stripped: 양끝 공백 제거 / lower: 소문자(중량 파싱용)
+    - compact: 공백(' ') 제거 검색용, hits: compact의 라벨 범주
+    - label_norm: 한글 사이 공백 제거 + strip (라벨·발급사 판정용), label_hits: 그 라벨 범주
+    - matcher: 라벨 범주 판정에 쓴 매처(생략하면 현재 활성 규칙 팩의 매처)
+    """
+
+    __slots__ = ("raw", "stripped", "lower", "compact", "hits", "label_norm", "label_hits", "matcher")
+
+    def __init__(self, raw: str, matcher: Optional[KeywordMatcher] = None):
+        if matcher is None:
+            matcher = current_rules().matcher
+        self.matcher = matcher
+        self.raw = raw
+        self.stripped = raw.strip()
+        self.lower = raw.lower()
+        self.compact = raw.replace(" ", "")
+        self.hits = matcher.scan(self.compact)
+        # remove_spaces(line).strip() == remove_spaces(line.strip()):
+        # 한글 사이 공백은 줄 양끝에 올 수 없으므로 strip 순서와 무관하다.
+        self.label_norm = OcrExtractor._remove_spaces_between_korean(raw).strip()
+        self.label_hits = self.hits if self.label_norm == self.compact else matcher.scan(self.label_norm)
+
+    def weight_hits(self):
+        """중량 라벨 판정용 범주(소문자·공백 제거 형태 기준)."""
+        if self.lower == self.raw:
+            return self.hits
+        return self.matcher.scan(self.lower.replace(" ", ""))
+
+
+class _WeightAccumulator:
+    """줄 단위로 중량 값을 누적한다(_parse_weights와 단일 패스 extract가 공유)."""
+
+    __slots__ = ("weights", "temp_weight", "unspecified_vals")
+
+    def __init__(self):
+        self.weights = {"total": 0, "empty": 0, "net": 0}
+        self.temp_weight = 0
+        # 라벨이 없는 '... kg' 값(예: '05:26:18 12,480 kg')을 순서대로 수집
+        self.unspecified_vals = []
+
+    def feed(self, ln: "_Line") -> None:
+        val = extract_number_value(ln.lower)
+        if val == 0:
+            return
+
+        # 공백 제거 후 키워드 매칭 (중량 라벨 범주를 한 번에 스캔)
+        hits = ln.weight_hits()
+        weights = self.weights
+        if NET_WEIGHT in hits:
+            if weights['net'] == 0:
+                weights['net'] = val
+        elif EMPTY_WEIGHT in hits:
+            if weights['empty'] == 0:
+                weights['empty'] = val
+        elif TOTAL_WEIGHT in hits:
+            if weights['total'] == 0:
+                weights['total'] = val
+        elif WEIGHT in hits:
+            if self.temp_weight == 0:
+                self.temp_weight = val
+        else:
+            # 라벨 명시 없이 'kg'가 포함된 라인의 값은 순서를 보존해 수집한다.
+            if 'kg' in ln.lower:
+                self.unspecified_vals.append(val)
+
+    def finish(self):
+        weights = self.weights
+        unspecified_vals = self.unspecified_vals
+        # 라벨 없는 값 보조 매핑(안전한 최소 규칙): 1번째=총중량, 2번째=공차
+        if weights['total'] == 0 and len(unspecified_vals) >= 1:
+            weights['total'] = unspecified_vals[0]
+        if weights['empty'] == 0 and len(unspecified_vals) >= 2:
+            weights['empty'] = unspecified_vals[1]
+        return weights, self.temp_weight
 
 
 def _extract_after_label(label_norm: str, labels):
@@ -27,17 +119,38 @@ def _extract_after_label(label_norm: str, labels):
     return ""
 
 
+def _registry_name(value: str, gazetteer: Optional[Gazetteer]) -> str:
+    """거래처 값 전체가 등록부 이름이면 정식 명칭, 아니면 값 그대로.
+
+    줄의 다른 자리(라벨 앞 발급사명 등)나 값의 일부에 있는 이름으로 바꾸지 않는다.
+    """
+    if gazetteer is not None:
+        name = gazetteer.match(value)
+        if name is not None and name.alone:
+            return name.canonical
+    return value
+
+
 class OcrExtractor:
     """
     OCR 텍스트에서 차량번호, 날짜, 중량(총중량, 공차, 실중량),
     발급회사(issuer), 거래처/고객사(client)를 추출하고 검증하는 클래스입니다.
+
+    typed=True이면 extract가 dict 대신 ExtractionResult(슬롯 기반 압축 결과, dict 호환)를 반환합니다.
+    라벨/패턴은 규칙 팩(src/parser/rule_pack.py)에서 온다. rules를 주면 그 팩으로 고정하고,
+    생략하면 extract 호출마다 현재 활성 팩의 스냅숏을 잡는다(핫 리로드 반영).
+    결과의 rules_version에는 사용한 팩의 '이름@버전'을 기록합니다.
     """
 
+    def __init__(self, typed: bool = False, rules: Optional[CompiledRules] = None):
+        self.typed = typed
+        self.rules = rules
+
     @staticmethod
-    def _extract_date_from_line(line: str) -> str:
+    def _extract_date_from_line(line: str, date_re: Optional["re.Pattern"] = None) -> str:
         """한 줄에서 날짜(YYYY-MM-DD/./)를 찾아 '-' 포맷으로 반환. 실패 시 빈 문자열.
         """
-        m = re.search(DATE_REGEX, line)
+        m = (date_re or current_rules().date_re).search(line)
         if m:
             return m.group(1).replace('.', '-')
         return ""
@@ -49,10 +162,14 @@ class OcrExtractor:
         예: '(주) 하 은 펄 프' → '(주)하은펄프'
             '거 래 처:' → '거래처:'
         """
-        text = re.sub(r'(?<=[가-힣])\s(?=[가-힣])', '', text)
-        text = re.sub(r'\s*\(주\)\s*', '(주)', text)
+        text = _KOREAN_SPACE_RE.sub('', text)
+        text = _JU_SPACE_RE.sub('(주)', text)
         return text
 
+    @staticmethod
+    def _to_lines(lines):
+        return [ln if isinstance(ln, _Line) else _Line(ln) for ln in lines]
+
     # ── 내부: 중량 파서 ────────────────────────────────────────
     def _parse_weights(self, lines):
         """라인 목록에서 중량 관련 숫자를 추출하여 사전으로 반환.
@@ -60,43 +177,10 @@ class OcrExtractor:
         우선순위/매칭 규칙은 기존 extract의 로직을 그대로 따른다.
         반환: (weights_dict, temp_weight)
         """
-        weights = {"total": 0, "empty": 0, "net": 0}
-        temp_weight = 0
-        # 라벨이 없는 '... kg' 값(예: '05:26:18 12,480 kg')을 순서대로 수집
-        unspecified_vals = []
-
-        for line in lines:
-            line_lower = line.lower()
-            val = extract_number_value(line_lower)
-            if val == 0:
-                continue
-
-            # 공백 제거 후 키워드 매칭
-            clean_line = line_lower.replace(" ", "")
-
-            if any(k in clean_line for k in ["실중량", "순중량"]):
-                if weights['net'] == 0:
-                    weights['net'] = val
-            elif any(k in clean_line for k in ["공차중량", "차중량"]):
-                if weights['empty'] == 0:
-                    weights['empty'] = val
-            elif "총중량" in clean_line:
-                if weights['total'] == 0:
-                    weights['total'] = val
-            elif '중량' in clean_line:
-                if temp_weight == 0:
-                    temp_weight = val
-            else:
-                # 라벨 명시 없이 'kg'가 포함된 라인의 값은 순서를 보존해 수집한다.
-                if 'kg' in line_lower:
-                    unspecified_vals.append(val)
-        # 라벨 없는 값 보조 매핑(안전한 최소 규칙): 1번째=총중량, 2번째=공차
-        if weights['total'] == 0 and len(unspecified_vals) >= 1:
-            weights['total'] = unspecified_vals[0]
-        if weights['empty'] == 0 and len(unspecified_vals) >= 2:
-            weights['empty'] = unspecified_vals[1]
-
-        return weights, temp_weight
+        acc = _WeightAccumulator()
+        for ln in self._to_lines(lines):
+            acc.feed(ln)
+        return acc.finish()
 
     # ── 내부: 중량 산술 추론 ───────────────────────────────────
     @staticmethod
@@ -116,76 +200,119 @@ class OcrExtractor:
                 w['empty'] = calculated_empty
         return w
 
+    # ── 내부: 1단계 메타데이터 (한 줄) ─────────────────────────
+    @staticmethod
+    def _extract_metadata(ln: _Line, results: dict, rules: CompiledRules) -> None:
+        line = ln.raw
+
+        # [날짜 추출]
+        if results['date'] == "N/A" and DATE in ln.hits:
+            dv = OcrExtractor._extract_date_from_line(line, rules.date_re)
+            if dv:
+                results['date'] = dv
+
+        # [차량번호 추출]
+        if results['car_number'] == "N/A" and CAR in ln.hits:
+            parts = line.split()
+            for i, part in enumerate(parts):
+                if rules.car_part_re.search(part):
+                    # 콜론이 같은 토큰에 붙어있으면 다음 토큰이 값
+                    if ':' in part or '.' in part:
+                        if i + 1 < len(parts):
+                            # '입고' 같은 부가 키워드 제외
+                            val = parts[i + 1]
+                            if val not in ("입고", "출고"):
+                                results['car_number'] = val
+                                break
+
+        # [거래처/고객사 추출] - 라벨 기반 (한글 사이 공백이 제거된 label_norm, 목록 순서 우선)
+        if results['client_name'] == "N/A" and CLIENT in ln.label_hits:
+            val = _extract_after_label(ln.label_norm, rules.client_labels)
+            if val:
+                results['client_name'] = _registry_name(val, rules.gazetteer)
+
+        # [거래처/고객사 추출] - "XXX 귀하" 패턴
+        if results['client_name'] == "N/A":
+            guiha_match = _GUIHA_RE.search(ln.stripped)
+            if guiha_match:
+                results['client_name'] = _registry_name(guiha_match.group(1).strip(), rules.gazetteer)
+
+    @staticmethod
+    def _is_issuer_candidate(ln: _Line) -> bool:
+        """4-1) '(주)', '주식회사' 패턴 줄 중 날짜/무게/좌표/귀하 줄이 아닌지."""
+        if ISSUER not in ln.label_hits:
+            return False
+        ls = ln.stripped
+        # 날짜/시간/무게/좌표 줄 제외
+        if _LEADING_DATE_RE.search(ls):
+            return False
+        if _KG_VALUE_RE.search(ls):
+            return False
+        if _COORDINATE_RE.search(ls):
+            return False
+        # 거래처(귀하 패턴)와 겹치지 않게
+        return '귀하' not in ln.label_norm
+
     # ── 메인 추출 ──────────────────────────────────────────────
-    def extract(self, text: str) -> dict:
+    def extract(self, text: str) -> Union[dict, ExtractionResult]:
+        # 문서 하나는 처음 잡은 규칙 스냅숏으로 끝까지 처리한다(도중에 리로드되어도 섞이지 않음)
+        rules = self.rules or current_rules()
+
+        # 계측(꺼져 있으면 m is None 분기만 든다)
+        m = metrics.ACTIVE
+        if m is not None:
+            t0 = perf_counter()
+
+        # ── 단일 패스: 메타데이터 / 중량 누적 / 발급사 후보 / 주소 ──
+        scan = _DocumentScan()
+        scan.feed(text, rules)
+        if m is not None:
+            m.observe("extract.scan", perf_counter() - t0)
+        return self._finish(scan, rules)
+
+    def extract_pages(self, pages: Sequence[str], early_exit: bool = True) -> Union[dict, ExtractionResult]:
+        """페이지별 (정제된) 텍스트를 순서대로 훑어 추출한다(pages는 순서대로 한 번씩만 꺼낸다).
+
+        extract('\n'.join(pages))와 같은 우선순위(앞 페이지 값 우선)를 따르며, 페이지 경계를
+        넘는 분리 숫자('13\n460 kg')만 병합하지 않는다. early_exit이면 필수 필드(차량번호/날짜/
+        중량/발급사/거래처)가 남은 페이지와 무관하게 확정되는 즉시 멈춘다. 이때 주소는 훑은
+        페이지에서만 찾는다.
+        """
+        rules = self.rules or current_rules()
+        m = metrics.ACTIVE
+        if m is not None:
+            t0 = perf_counter()
+        scan = _DocumentScan()
+        scanned = 0
+        for page in pages:
+            scan.feed(page, rules)
+            scanned += 1
+            if early_exit and scan.resolved():
+                break
+        if m is not None:
+            m.observe("extract.scan", perf_counter() - t0)
+            m.incr("pages", scanned, status="scanned")
+            m.incr("pages", len(pages) - scanned, status="skipped")
+        return self._finish(scan, rules)
+
+    def _finish(self, scan: "_DocumentScan", rules: CompiledRules) -> Union[dict, ExtractionResult]:
+        """훑은 상태로 중량 추론, 발급사·주소 결정을 마치고 결과를 만든다."""
+        found = scan.results
         results = {
-            "car_number": "N/A",
-            "date": "N/A",
+            "car_number": found["car_number"],
+            "date": found["date"],
             "issuer_name": "N/A",
             "issuer_address": "N/A",
-            "client_name": "N/A",
+            "client_name": found["client_name"],
             # 출력 표준화: 단위를 명시하여 해석성을 높인다.
-            "weights": {"unit": "kg", "total": 0, "empty": 0, "net": 0}
+            "weights": {"unit": "kg", "total": 0, "empty": 0, "net": 0},
+            "rules_version": rules.pack_id,
         }
+        m = metrics.ACTIVE
+        if m is not None:
+            t1 = perf_counter()
 
-        # [전처리] 숫자 사이 공백 합치기 (예: "13 460 kg" → "13460kg")
-        # 숫자와 'kg' 사이 공백으로 분리된 경우 병합 처리 (예: "13 460 kg" -> "13460kg")
-        processed_text = merge_split_number_kg(text)
-        lines = processed_text.split('\n')
-
-        # ── 1단계: 메타데이터 추출 (날짜, 차량번호, 거래처/고객사) ──
-        for line in lines:
-            # 공백을 모두 제거한 검색용 문자열
-            clean_kw = line.replace(" ", "")
-            # 한글 사이 공백만 제거한 라벨 정규화 문자열
-            label_norm = self._remove_spaces_between_korean(line).strip()
-
-            # [날짜 추출]
-            if results['date'] == "N/A" and any(k in clean_kw for k in DATE_LABELS):
-                dv = self._extract_date_from_line(line)
-                if dv:
-                    results['date'] = dv
-
-            # [차량번호 추출]
-            if results['car_number'] == "N/A":
-                if any(k in clean_kw for k in CAR_LABELS):
-                    parts = line.split()
-                    for i, part in enumerate(parts):
-                        if any(k in part for k in CAR_PART_HINTS):
-                            # 콜론이 같은 토큰에 붙어있으면 다음 토큰이 값
-                            if ':' in part or '.' in part:
-                                if i + 1 < len(parts):
-                                    # '입고' 같은 부가 키워드 제외
-                                    val = parts[i + 1]
-                                    if val not in ("입고", "출고"):
-                                        results['car_number'] = val
-                                        break
-            # (중복 로직 제거: 위 분기와 동일하므로 별도 Fallback 불필요)
-
-            # [거래처/고객사 추출] - 라벨 기반
-            if results['client_name'] == "N/A":
-                # 한글 사이 공백이 제거된 label_norm에서 키워드 탐색
-                for keyword in CLIENT_LABELS:
-                    if keyword in label_norm:
-                        val = label_norm.split(keyword, 1)[1].strip()
-                        if val:
-                            results['client_name'] = val
-                        break
-            # 라벨 기반 헬퍼 활용(동일 로직) - 값이 없을 때만 보조 적용
-            if results['client_name'] == "N/A":
-                val2 = _extract_after_label(label_norm, CLIENT_LABELS)
-                if val2:
-                    results['client_name'] = val2
-
-            # [거래처/고객사 추출] - "XXX 귀하" 패턴
-            if results['client_name'] == "N/A":
-                guiha_match = re.search(r'^(.+?)\s+귀하\s*$', line.strip())
-                if guiha_match:
-                    results['client_name'] = guiha_match.group(1).strip()
-
-        # ── 2단계: 중량 데이터 추출 ──
-        w, temp_weight = self._parse_weights(lines)
-
+        w, temp_weight = scan.acc.finish()
         # 라벨 누락 값 보충 (동작 동일)
         if w['net'] > 0 and temp_weight > 0 and w['empty'] == 0:
             w['empty'] = temp_weight
@@ -194,62 +321,141 @@ class OcrExtractor:
         w = self._infer_weights(w)
         # unit을 보존하면서 숫자 항목만 갱신
         results['weights'].update(w)
+        if m is not None:
+            t2 = perf_counter()
+            m.observe("extract.infer", t2 - t1)
 
         # ── 4단계: 발급 회사명 추출 ──
+        # 이미 추출된 값 집합 (중복 방지용)
+        extracted_vals = {
+            results['car_number'], results['date'], results['client_name']
+        }
+
+        # 4-1) '(주)', '주식회사' 패턴 후보 중 첫 번째(거래처 등과 중복 제외)
+        # (등록부에 있는 후보는 중복 검사 뒤 정식 명칭으로)
+        for label_norm in scan.issuer_candidates:
+            if label_norm not in extracted_vals:
+                results['issuer_name'] = scan.canonical.get(label_norm, label_norm)
+                break
+
+        # 4-2) 문서 하단 휴리스틱
         if results['issuer_name'] == "N/A":
-            # 이미 추출된 값 집합 (중복 방지용)
-            extracted_vals = {
-                results['car_number'], results['date'], results['client_name']
-            }
-
-            # 4-1) '(주)', '주식회사' 패턴 탐색
-            for line in lines:
-                ls = line.strip()
-                norm = self._remove_spaces_between_korean(ls)
-                if _contains_any(norm, ISSUER_HINTS):
-                    # 날짜/시간/무게/좌표 줄 제외
-                    if re.search(r'^\d{4}[-/.]\d{2}[-/.]\d{2}', ls):
-                        continue
-                    if re.search(r'[\d,]+\s*kg', ls, re.IGNORECASE):
-                        continue
-                    if re.search(r'^\d{2,3}\.\d{5,}', ls):
-                        continue
-                    # 거래처(귀하 패턴)와 겹치지 않게
-                    if norm.strip() in extracted_vals:
-                        continue
-                    if '귀하' in norm:
-                        continue
-                    results['issuer_name'] = norm
-                    break
-
-            # 4-2) 문서 하단 휴리스틱
-            if results['issuer_name'] == "N/A":
-                potential = []
-                for line in lines[-5:]:
-                    ls = line.strip()
-                    if not ls:
-                        continue
-                    # 날짜/시간/좌표/순수숫자/무게(kg) 등 노이즈 라인은 제외
-                    if is_noise_line(ls):
-                        continue
-                    # 안내문/증명 문구는 제외(발급처 오탐 방지)
-                    if any(kw in ls for kw in ["계량표는", "확인함", "증명", "확인"]):
-                        continue
-                    if ls in extracted_vals:
-                        continue
-                    potential.append(ls)
-                if potential:
-                    results['issuer_name'] = self._remove_spaces_between_korean(
-                        potential[-1]
-                    )
+            potential = []
+            for ls, label_norm in scan.tail:
+                if not ls:
+                    continue
+                # 날짜/시간/좌표/순수숫자/무게(kg) 등 노이즈 라인은 제외
+                if is_noise_line(ls):
+                    continue
+                # 안내문/증명 문구는 제외(발급처 오탐 방지)
+                if NOTICE in rules.matcher.scan(ls):
+                    continue
+                if ls in extracted_vals:
+                    continue
+                potential.append(label_norm)
+            if potential:
+                results['issuer_name'] = potential[-1]
+
+        if m is not None:
+            t3 = perf_counter()
+            m.observe("extract.issuer", t3 - t2)
 
         # ── 5단계: 발급 회사 주소 추출 ──
-        # "경기도", "서울", "충청" 등 광역시/도로 시작하는 줄을 주소로 간주
-        if results['issuer_address'] == "N/A":
-            for line in lines:
-                ls = line.strip()
-                if re.match(ADDRESS_PREFIX_PATTERN, ls):
-                    results['issuer_address'] = ls
-                    break
-
-        return results
+        if scan.address is not None:
+            results['issuer_address'] = scan.address
+        if m is not None:
+            m.observe("extract.address", perf_counter() - t3)
+
+        # 줄 단위 루프에서는 dict가 빠르므로 작업용 dict로 추출한 뒤 마지막에 한 번 변환
+        return ExtractionResult.from_dict(results) if self.typed else results
+
+
+# 발급사 하단 휴리스틱이 보는 문서 끝 줄 수
+_TAIL_LINES = 5
+
+
+class _DocumentScan:
+    """문서 하나를 한 번 훑으며 모으는 상태(메타데이터, 중량 누적, 발급사 후보, 주소, 끝 줄).
+
+    줄을 여러 번에 나눠 feed해도(페이지 단위) 한 번에 feed한 것과 결과가 같고, 따로 훑은 연속
+    구간 둘은 merge로 합칠 수 있다(앞 구간 값 우선). 발급사 후보와 끝 줄은 문자열만 보관하므로
+    프로세스 간에 주고받을 수 있다.
+    """
+
+    __slots__ = ("results", "acc", "issuer_candidates", "canonical", "address", "tail")
+
+    def __init__(self):
+        # 줄 순서상 처음 찾은 값이 우선인 필드
+        self.results = {"car_number": "N/A", "date": "N/A", "client_name": "N/A"}
+        self.acc = _WeightAccumulator()
+        # 발급사 후보 줄의 label_norm
+        self.issuer_candidates: List[str] = []
+        # 등록부에 있는 후보의 정식 명칭
+        self.canonical: Dict[str, str] = {}
+        self.address: Optional[str] = None
+        # 끝 줄의 (stripped, label_norm)
+        self.tail: List[Tuple[str, str]] = []
+
+    def feed(self, text: str, rules: CompiledRules) -> None:
+        # [전처리] 숫자와 'kg' 사이 공백으로 분리된 경우 병합 처리 (예: "13 460 kg" -> "13460kg")
+        lines = [_Line(line, rules.matcher) for line in merge_split_number_kg(text).split('\n')]
+        results, acc, candidates = self.results, self.acc, self.issuer_candidates
+        address = self.address
+        gazetteer = rules.gazetteer
+        name = None
+        # 각 단계의 상태는 서로 독립이므로 한 번의 순회로 합친다.
+        # (발급사 후보의 중복 검사만 1단계 결과가 확정된 뒤에 수행)
+        for ln in lines:
+            # 등록부 회사명(가제티어가 있으면 줄마다 한 번 찾아 발급사 후보 판정에 쓴다.
+            # 거래처 값은 라벨 뒤/'귀하' 앞 값만 따로 대조한다)
+            if gazetteer is not None:
+                name = gazetteer.match(ln.raw)
+            # ── 1단계: 메타데이터 추출 (날짜, 차량번호, 거래처/고객사) ──
+            OcrExtractor._extract_metadata(ln, results, rules)
+            # ── 2단계: 중량 데이터 추출 ──
+            acc.feed(ln)
+            # ── 4-1단계 후보: '(주)', '주식회사' 패턴, 등록부 회사명만 있는 줄 ──
+            # (등록부 이름이 거래처 라벨 줄에 있으면 그 이름은 거래처다)
+            if name is None:
+                if OcrExtractor._is_issuer_candidate(ln):
+                    candidates.append(ln.label_norm)
+            elif CLIENT not in ln.label_hits and (name.alone or OcrExtractor._is_issuer_candidate(ln)):
+                candidates.append(ln.label_norm)
+                self.canonical[ln.label_norm] = name.canonical
+            # ── 5단계: "경기도", "서울", "충청" 등 광역시/도로 시작하는 첫 줄 ──
+            if address is None and rules.address_re.match(ln.stripped):
+                address = ln.stripped
+        self.address = address
+        self.tail = (self.tail + [(ln.stripped, ln.label_norm) for ln in lines[-_TAIL_LINES:]])[-_TAIL_LINES:]
+
+    def merge(self, other: "_DocumentScan") -> None:
+        """바로 뒤 구간을 따로 훑은 상태를 합친다(앞 구간 값 우선)."""
+        results = self.results
+        for key, value in other.results.items():
+            if results[key] == "N/A":
+                results[key] = value
+        acc, other_acc = self.acc, other.acc
+        for key, value in other_acc.weights.items():
+            if acc.weights[key] == 0:
+                acc.weights[key] = value
+        if acc.temp_weight == 0:
+            acc.temp_weight = other_acc.temp_weight
+        acc.unspecified_vals.extend(other_acc.unspecified_vals)
+        self.issuer_candidates.extend(other.issuer_candidates)
+        self.canonical.update(other.canonical)
+        if self.address is None:
+            self.address = other.address
+        self.tail = (self.tail + other.tail)[-_TAIL_LINES:]
+
+    def resolved(self) -> bool:
+        """필수 필드(차량번호/날짜/거래처/중량/발급사)가 뒤에 올 줄과 무관하게 확정됐는지."""
+        results = self.results
+        if "N/A" in (results["car_number"], results["date"], results["client_name"]):
+            return False
+        # 총중량·공차가 있으면 실중량은 그 차로 정해진다(음수면 실중량 라벨 값이 필요)
+        w = self.acc.weights
+        if not (w["total"] and w["empty"] and (w["total"] >= w["empty"] or w["net"])):
+            return False
+        # 발급사: 앞선 필드 값과 겹치지 않는 첫 후보(하단 휴리스틱은 문서 끝을 봐야 하므로 제외)
+        taken = {results["car_number"], results["date"], results["client_name"]}
+        return any(label_norm not in taken for label_norm in self.issuer_candidates)
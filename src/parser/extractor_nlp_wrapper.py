@@ -1,5 +1,17 @@
 import re
-from typing import Any
+from time import perf_counter
+from typing import Any, Dict, FrozenSet, Iterable, List, Sequence, Tuple
+
+from src.utils import metrics
+
+# 문서 간 줄 단위 엔티티 라벨 캐시 상한(머리글/주소/회사명 줄은 문서마다 반복된다)
+DEFAULT_LABEL_CACHE_SIZE = 50_000
+# nlp.pipe 배치 크기
+DEFAULT_BATCH_SIZE = 256
+
+_GUIHA_SUFFIX_RE = re.compile(r"\s*귀\s*하\s*$")
+_KOREAN_SPACE_RE = re.compile(r'(?<=[가-힣])\s+(?=[가-힣])')
+_JU_RE = re.compile(r'\(\s*주\s*\)')
 
 
 class OcrExtractorWithNlp:
@@ -7,57 +19,121 @@ class OcrExtractorWithNlp:
 
     - 기본 결과를 변경하지 않기 위해, base.extract() 실행 후 비어있는 필드만 보완한다.
     - 숫자/날짜/차량번호 등은 건드리지 않는다.
+    - 보조가 필요한 문서의 고유 줄만 nlp.pipe로 한 번에 처리하고, 줄별 엔티티 라벨을
+      캐시해 issuer_name / issuer_address / client_name 보조가 같은 결과를 공유한다.
     """
 
-    def __init__(self, base: Any, nlp: Any):
+    def __init__(self, base: Any, nlp: Any, label_cache_size: int = DEFAULT_LABEL_CACHE_SIZE,
+                 batch_size: int = DEFAULT_BATCH_SIZE):
         self.base = base
         self.nlp = nlp
+        # 결과 형태(dict / ExtractionResult)는 기반 추출기를 따른다
+        self.typed = getattr(base, "typed", False)
+        self.batch_size = batch_size
+        self._label_cache_size = label_cache_size
+        self._labels: Dict[str, FrozenSet[str]] = {}
 
     def extract(self, text: str) -> dict:
-        results = self.base.extract(text)
+        return self.extract_batch([text])[0]
+
+    def extract_batch(self, texts: Sequence[str]) -> List[dict]:
+        """여러 문서를 추출한다. 보조에 필요한 줄은 문서 전체에 걸쳐 한 번만 nlp에 보낸다."""
+        batch = [self.base.extract(text) for text in texts]
+        self.assist_batch(zip(texts, batch))
+        return batch
+
+    def assist_batch(self, pairs: Iterable[Tuple[str, dict]]) -> None:
+        """이미 추출한 (정제 텍스트, 결과) 쌍들의 N/A 필드를 제자리에서 보조 채운다."""
+        batch = []
+        pending: List[str] = []
+        for text, results in pairs:
+            lines = self._candidate_lines(text, results)
+            if lines:
+                pending.extend(lines)
+                batch.append((results, lines))
 
-        lines = text.split("\n")
+        self._annotate(pending)
+        for results, lines in batch:
+            self._fill(results, lines)
 
+    @staticmethod
+    def _candidate_lines(text: str, results: dict) -> List[str]:
+        """보조가 필요한 필드에 대해 nlp에 보낼 줄(strip, 비어있지 않음) 목록."""
+        need_all = results.get("issuer_name") == "N/A" or results.get("issuer_address") == "N/A"
+        need_client = results.get("client_name") == "N/A"
+        if not (need_all or need_client):
+            return []
+        lines = []
+        for line in text.split("\n"):
+            ls = line.strip()
+            if ls and (need_all or '귀' in ls):
+                lines.append(ls)
+        return lines
+
+    def _annotate(self, lines: Iterable[str]) -> None:
+        """캐시에 없는 고유 줄을 nlp.pipe로 한 번에 처리해 라벨을 캐시한다."""
+        labels = self._labels
+        lines = list(lines)
+        todo = list(dict.fromkeys(ls for ls in lines if ls not in labels))
+        if todo and len(labels) + len(todo) > self._label_cache_size:
+            # 상한을 넘으면 비우고, 이미 캐시돼 있던 이번 배치의 줄까지 다시 처리한다
+            labels.clear()
+            todo = list(dict.fromkeys(lines))
+        m = metrics.ACTIVE
+        if m is not None:
+            m.incr("nlp_lines", len(lines) - len(todo), source="cache")
+            m.incr("nlp_lines", len(todo), source="pipe")
+        if not todo:
+            return
+        if m is not None:
+            t0 = perf_counter()
+        pipe = getattr(self.nlp, "pipe", None)
+        docs = pipe(todo, batch_size=self.batch_size) if pipe else map(self.nlp, todo)
+        for ls, doc in zip(todo, docs):
+            labels[ls] = frozenset(getattr(ent, 'label_', None) for ent in getattr(doc, 'ents', []))
+        if m is not None:
+            m.observe("nlp.pipe", perf_counter() - t0)
+
+    def _has(self, line: str, label: str) -> bool:
+        # _annotate는 캐시를 비우면 현재 배치의 줄을 모두 다시 채우므로 항상 캐시에 있다
+        return label in self._labels[line]
+
+    def _fill(self, results: dict, lines: List[str]) -> None:
+        m = metrics.ACTIVE
+        if m is not None:
+            missing = [f for f in ("issuer_name", "issuer_address", "client_name") if results.get(f) == "N/A"]
         # issuer_name 보조: ORG 엔티티가 있는 의미 라인 채택
         if results.get("issuer_name") == "N/A":
-            for line in lines:
-                ls = line.strip()
-                if not ls:
-                    continue
-                doc = self.nlp(ls)
-                if any(getattr(ent, 'label_', None) == "ORG" for ent in getattr(doc, 'ents', [])):
+            for ls in lines:
+                if self._has(ls, "ORG"):
                     results['issuer_name'] = self._norm_korean(ls)
                     break
 
         # issuer_address 보조: LOC 엔티티가 있는 줄
         if results.get("issuer_address") == "N/A":
-            for line in lines:
-                ls = line.strip()
-                if not ls:
-                    continue
-                doc = self.nlp(ls)
-                if any(getattr(ent, 'label_', None) == "LOC" for ent in getattr(doc, 'ents', [])):
+            for ls in lines:
+                if self._has(ls, "LOC"):
                     results['issuer_address'] = ls
                     break
 
         # client_name 보조: '귀하' 패턴 포함 줄에서 ORG 엔티티가 있을 때
         if results.get("client_name") == "N/A":
-            for line in lines:
-                ls = line.strip()
-                if not ls or '귀' not in ls:
-                    continue
-                doc = self.nlp(ls)
-                if any(getattr(ent, 'label_', None) == "ORG" for ent in getattr(doc, 'ents', [])):
-                    name = re.sub(r"\s*귀\s*하\s*$", "", ls).strip()
+            for ls in lines:
+                if '귀' in ls and self._has(ls, "ORG"):
+                    name = _GUIHA_SUFFIX_RE.sub("", ls).strip()
                     results['client_name'] = self._norm_korean(name)
                     break
 
-        return results
+        if m is not None:
+            # 보조가 실행된 횟수와 실제로 값을 채운 횟수
+            for field in missing:
+                m.incr("nlp_fallback", field=field)
+                if results.get(field) != "N/A":
+                    m.incr("nlp_fallback_filled", field=field)
 
     @staticmethod
     def _norm_korean(text: str) -> str:
         # 한글 사이 불필요 공백 제거 + '(주)' 주변 공백 정리
-        text = re.sub(r'(?<=[\uAC00-\uD7A3])\s+(?=[\uAC00-\uD7A3])', '', text)
-        text = re.sub(r'\(\s*주\s*\)', '(주)', text)
+        text = _KOREAN_SPACE_RE.sub('', text)
+        text = _JU_RE.sub('(주)', text)
         return text
-
@@ -0,0 +1,193 @@
+"""OCR로 깨진 필드 라벨을 찾는 퍼지 라벨 색인(symmetric delete).
+
+교정 테이블은 알려진 오인식만 고친다. 새로 나타난 오인식('차랑번호', '실 중 랑')은 라벨 매칭에서
+빠져 필드를 잃는다. LabelIndex는 규칙 팩의 라벨마다 자모를 최대 d개 지운 변형을 미리 색인해 두고,
+조회할 때 토큰의 삭제 변형만 찾아본다. 두 문자열의 편집 거리가 d 이하이면 삭제 변형 하나를
+공유하므로, 라벨 수와 무관하게 토큰 길이로만 정해지는 수의 사전 조회로 후보를 찾는다.
+후보는 실제 편집 거리(Levenshtein)로 다시 확인한다.
+
+- 거리 단위: 한글 음절은 초성/중성/종성 자모로 풀어서 잰다. OCR 오인식은 대개 자모 하나가 바뀐
+  음절이다('량'→'랑', '중'→'증', '자'→'저'). 음절 하나가 통째로 다르거나 더해진 머리('총수량',
+  '거래일', '계량자')는 다른 낱말이므로 자모 거리가 2 이상이 되어 고치지 않는다.
+- 라벨 키: 공백을 지우고 끝의 ':'를 뗀 형태('거래처 :' → '거래처'). 3글자 미만 라벨은 색인하지 않는다
+  (2글자 라벨의 오류는 다른 낱말과 구별되지 않는다).
+- 허용 거리(자모): 라벨 길이 3~5글자는 1, 6글자 이상은 2(max_distance로 상한).
+- 가장 가까운 후보가 범주가 다른 라벨 여럿이면('초중량' → 총중량/차중량) 모호하므로 고치지 않는다.
+  같은 범주면 팩에 먼저 적힌 라벨을 쓴다.
+- exact(팩의 전체 라벨 + fuzzy_labels.keep 낱말)와 정확히 같은 머리는 고치지 않는다.
+
+repair(text)는 줄마다 ':'나 숫자 앞의 라벨 자리(한글/영문 머리)만 보고, 그 자리가 라벨과 정확히
+같지 않은데 색인에서 라벨을 찾으면 머리를 라벨로 바꾼다. 값이 없는 줄(회사명, 안내문)은 보지 않는다.
+"""
+import re
+from itertools import combinations
+from typing import Dict, FrozenSet, Iterable, List, Mapping, Optional, Set, Tuple
+
+DEFAULT_MAX_DISTANCE = 2
+# 색인하는 라벨 키 최소 길이
+MIN_LABEL_LENGTH = 3
+# 라벨 자리로 보는 머리 최대 길이(공백 제외) – 주소·문장 줄은 조회하지 않는다
+MAX_HEAD_LENGTH = 10
+# 머리 → 조회 결과 캐시 상한(머리는 문서마다 반복된다)
+_CACHE_SIZE = 10_000
+
+_HANGUL_BASE = 0xAC00
+_HANGUL_LAST = 0xD7A3
+
+# 줄 앞 라벨 자리: 한글/영문/'.'/괄호로 된 머리 뒤에 ':' 또는 숫자(값)가 오는 경우
+_HEAD_RE = re.compile(r"(\s*)([가-힣A-Za-z.()][가-힣A-Za-z.() ]*?)\s*(?::|(?=\d))")
+
+
+def label_key(label: str) -> str:
+    """라벨의 비교용 키(공백 제거, 끝의 ':' 제거)."""
+    return label.replace(" ", "").rstrip(":")
+
+
+def decompose(text: str) -> str:
+    """한글 음절을 초성/중성/종성 자모(U+1100 블록)로 푼다. 다른 글자는 그대로 둔다."""
+    out = []
+    for ch in text:
+        code = ord(ch) - _HANGUL_BASE
+        if 0 <= code <= _HANGUL_LAST - _HANGUL_BASE:
+            out.append(chr(0x1100 + code // 588))
+            out.append(chr(0x1161 + code % 588 // 28))
+            if code % 28:
+                out.append(chr(0x11A7 + code % 28))
+        else:
+            out.append(ch)
+    return "".join(out)
+
+
+def allowed_distance(key: str, max_distance: int = DEFAULT_MAX_DISTANCE) -> int:
+    """라벨 키 길이(글자)에 따른 허용 자모 편집 거리(3글자 미만은 0: 색인하지 않음)."""
+    if len(key) < MIN_LABEL_LENGTH:
+        return 0
+    return min(max_distance, 1 if len(key) < 6 else 2)
+
+
+def _deletes(word: str, d: int) -> Set[str]:
+    """word에서 글자를 0~d개 지운 모든 변형."""
+    variants = {word}
+    n = len(word)
+    for k in range(1, min(d, n) + 1):
+        for idx in combinations(range(n), k):
+            variants.add("".join(ch for i, ch in enumerate(word) if i not in idx))
+    return variants
+
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """Levenshtein 거리(limit를 넘으면 limit + 1)."""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    prev = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        cur = [i]
+        best = i
+        for j, cb in enumerate(b, 1):
+            v = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + (ca != cb))
+            cur.append(v)
+            best = min(best, v)
+        if best > limit:
+            return limit + 1
+        prev = cur
+    return prev[-1]
+
+
+class LabelIndex:
+    """{범주: [라벨, ...]}의 symmetric delete 색인.
+
+    labels: 퍼지 조회 대상 라벨(범주별)
+    exact: 정확히 같으면 고치지 않을 낱말(팩의 전체 라벨과 실제 낱말 목록, 생략 시 labels)
+    색인과 거리 계산은 자모로 푼 키로 하고, 조회 결과는 원래 라벨 키로 돌려준다.
+    """
+
+    def __init__(self, labels: Mapping[str, Iterable[str]], max_distance: int = DEFAULT_MAX_DISTANCE,
+                 exact: Optional[Iterable[str]] = None):
+        self.max_distance = max_distance
+        # 자모 키 → (허용 거리, 범주 집합, 팩 순서)
+        self._keys: Dict[str, Tuple[int, FrozenSet[str], int]] = {}
+        # 자모 키 → 라벨 키
+        self._labels: Dict[str, str] = {}
+        order = 0
+        for category, keywords in labels.items():
+            for label in keywords:
+                key = label_key(label)
+                d = allowed_distance(key, max_distance)
+                if d == 0:
+                    continue
+                jamo = decompose(key)
+                self._labels.setdefault(jamo, key)
+                if jamo in self._keys:
+                    dist, categories, first = self._keys[jamo]
+                    self._keys[jamo] = (dist, categories | {category}, first)
+                else:
+                    self._keys[jamo] = (d, frozenset((category,)), order)
+                    order += 1
+        self._deletes: Dict[str, Tuple[str, ...]] = {}
+        for key, (d, _, _) in self._keys.items():
+            for variant in _deletes(key, d):
+                self._deletes[variant] = self._deletes.get(variant, ()) + (key,)
+        self._query_distance = max((d for d, _, _ in self._keys.values()), default=0)
+        if exact is None:
+            exact = [label for keywords in labels.values() for label in keywords]
+        self._exact: FrozenSet[str] = frozenset(label_key(label) for label in exact)
+        self._cache: Dict[str, Optional[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def lookup(self, token: str) -> Optional[str]:
+        """token(공백 제거된 라벨 자리)에 해당하는 라벨 키. exact와 같거나, 없거나, 모호하면 None."""
+        if token in self._exact or not self._query_distance:
+            return None
+        cache = self._cache
+        try:
+            return cache[token]
+        except KeyError:
+            pass
+        found = self._lookup(token)
+        if len(cache) >= _CACHE_SIZE:
+            cache.clear()
+        cache[token] = found
+        return found
+
+    def _lookup(self, token: str) -> Optional[str]:
+        token = decompose(token)
+        candidates: Set[str] = set()
+        for variant in _deletes(token, self._query_distance):
+            candidates.update(self._deletes.get(variant, ()))
+        best: List[Tuple[int, int, str]] = []
+        for key in candidates:
+            d, _, order = self._keys[key]
+            dist = edit_distance(token, key, d)
+            if dist <= d:
+                best.append((dist, order, key))
+        if not best:
+            return None
+        best.sort()
+        nearest = [key for dist, _, key in best if dist == best[0][0]]
+        if len({self._keys[key][1] for key in nearest}) > 1:
+            return None
+        return self._labels[nearest[0]]
+
+    def repair_line(self, line: str) -> str:
+        m = _HEAD_RE.match(line)
+        if m is None:
+            return line
+        head = m.group(2).replace(" ", "")
+        if not MIN_LABEL_LENGTH <= len(head) <= MAX_HEAD_LENGTH:
+            return line
+        key = self.lookup(head)
+        if key is None:
+            return line
+        return line[:m.start(2)] + key + line[m.end(2):]
+
+    def repair(self, text: str) -> str:
+        """줄마다 깨진 라벨 머리를 라벨 키로 바꾼다."""
+        return "\n".join([self.repair_line(line) for line in text.split("\n")])
+
+    def __getstate__(self):
+        # 조회 캐시는 아티팩트/워커로 보내지 않는다
+        state = self.__dict__.copy()
+        state["_cache"] = {}
+        return state
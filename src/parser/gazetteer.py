@@ -0,0 +1,132 @@
+"""거래처 등록부(회사명 사전)를 한 번에 찾는 회사명 가제티어.
+
+발급사/거래처 이름은 '(주)' 표기, 문서 하단 줄, '귀하' 패턴 같은 휴리스틱으로 찾고, 그래도 없으면
+NLP 보조가 줄마다 ORG 엔티티를 찾는다. 등록부가 있으면 이름을 사전에서 바로 찾아 정식 명칭으로
+채울 수 있다. Gazetteer는 등록부의 모든 이름(정식 명칭 + 별칭)을 정규화한 키로 바꿔 공통 접두사
+트라이 정규식 하나로 컴파일하고, 줄 하나를 한 번 훑어 등장한 이름을 찾는다. 이름이 수만 개여도
+줄당 비용은 줄 길이로만 정해진다.
+
+- 정규화: 법인 표기('(주)', '㈜', '주식회사', '(유)', '유한회사'), 공백, 괄호·가운뎃점을 지우고
+  영문은 소문자로 바꾼다('(주) 하 은 펄 프' → '하은펄프', '신성(푸디스트)' → '신성푸디스트').
+  2글자 미만 키는 쓰지 않는다.
+- 경계: 비교는 공백을 지운 형태로 하되(자간이 벌어진 OCR '하 은 펄 프'), 이름 앞뒤는 줄 끝이거나
+  원문에서 공백·기호였던 자리여야 한다('대명산업개발' 안의 '대명산업'은 찾지 않는다). 이름 바로 뒤의
+  '귀하'는 허용한다.
+- 같은 위치에서는 가장 긴 이름이 우선하고, 같은 키가 여러 정식 명칭에 있으면 나중 파일이 우선한다.
+
+등록부 형식(교정 테이블과 같은 디렉터리 규칙, 파일명 순으로 병합)
+- TSV: '정식 명칭<TAB>별칭<TAB>별칭...' 한 줄에 하나, '#'으로 시작하면 주석
+- JSON: {"정식 명칭": ["별칭", ...], ...} 객체
+"""
+import json
+import re
+from pathlib import Path
+from typing import Dict, Iterable, List, Mapping, NamedTuple, Optional, Set, Tuple, Union
+
+from src.parser.matcher import trie_regex
+
+# 정규화 키 최소 길이
+MIN_NAME_LENGTH = 2
+# 이름 바로 뒤에 와도 되는 한글 접미어
+_SUFFIXES = ("귀하",)
+
+# 공백으로 바꾼 뒤 지우는 법인 표기·괄호
+_DROP_RE = re.compile(r"\(\s*[주유]\s*\)|㈜|주식회사|유한회사|[()\[\]·]")
+_WORD_RE = re.compile(r"[가-힣A-Za-z0-9]")
+
+
+def normalize_name(text: str) -> str:
+    """회사명 비교용 키(법인 표기·공백·괄호 제거, 소문자)."""
+    return "".join(_DROP_RE.sub(" ", text.lower()).split())
+
+
+def _normalize_line(line: str) -> Tuple[str, Set[int]]:
+    """줄의 비교용 형태와, 그 형태에서 원문 공백(지운 표기 포함)이 있던 위치."""
+    parts = _DROP_RE.sub(" ", line.lower()).split()
+    bounds: Set[int] = set()
+    pos = 0
+    for part in parts:
+        pos += len(part)
+        bounds.add(pos)
+    return "".join(parts), bounds
+
+
+def _read_tsv(path: Path) -> Dict[str, List[str]]:
+    registry: Dict[str, List[str]] = {}
+    with open(path, "r", encoding="utf-8") as f:
+        for lineno, line in enumerate(f, start=1):
+            line = line.rstrip("\r\n")
+            if not line or line.startswith("#"):
+                continue
+            canonical, *aliases = line.split("\t")
+            if not canonical.strip():
+                raise ValueError(f"{path}:{lineno}: 정식 명칭이 비어 있습니다")
+            registry[canonical.strip()] = [a for a in aliases if a.strip()]
+    return registry
+
+
+def _read_json(path: Path) -> Dict[str, List[str]]:
+    data = json.loads(path.read_text(encoding="utf-8"))
+    if not isinstance(data, dict):
+        raise ValueError(f"{path}: 등록부는 {{정식 명칭: [별칭, ...]}} 객체여야 합니다")
+    registry: Dict[str, List[str]] = {}
+    for canonical, aliases in data.items():
+        if not canonical.strip() or not isinstance(aliases, list):
+            raise ValueError(f"{path}: 정식 명칭 '{canonical}'의 별칭은 목록이어야 합니다")
+        registry[canonical.strip()] = [str(a) for a in aliases if str(a).strip()]
+    return registry
+
+
+def load_registry(paths: Iterable[Union[str, Path]]) -> Dict[str, List[str]]:
+    """등록부 파일들을 순서대로 병합한다(같은 정식 명칭은 나중 파일이 우선)."""
+    registry: Dict[str, List[str]] = {}
+    for p in paths:
+        p = Path(p)
+        registry.update(_read_json(p) if p.suffix == ".json" else _read_tsv(p))
+    return registry
+
+
+class NameMatch(NamedTuple):
+    """줄에서 찾은 이름. before/after는 정규화된 줄에서 이름 앞뒤에 남은 부분."""
+    canonical: str
+    before: str
+    after: str
+
+    @property
+    def alone(self) -> bool:
+        """줄에 이름 말고 다른 낱말이 없는지(하단 발급사 줄 '동우바이오(주)' 등)."""
+        return not _WORD_RE.search(self.before) and not _WORD_RE.search(self.after)
+
+
+class Gazetteer:
+    """{정식 명칭: [별칭, ...]} 등록부를 컴파일한 단일 패스 회사명 매처."""
+
+    def __init__(self, registry: Mapping[str, Iterable[str]]):
+        # 정규화 키 → 정식 명칭
+        self.names: Dict[str, str] = {}
+        for canonical, aliases in registry.items():
+            for name in (canonical, *aliases):
+                key = normalize_name(name)
+                if len(key) >= MIN_NAME_LENGTH:
+                    self.names[key] = canonical
+        body = trie_regex(self.names)
+        # 전방탐색으로 모든 시작 위치의 가장 긴 이름을 찾는다(경계에 맞지 않는 이름과 겹친 뒤쪽 이름도 본다)
+        self._pattern = re.compile("(?=(" + body + "))") if body else None
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def match(self, line: str) -> Optional[NameMatch]:
+        """줄에서 경계 조건을 만족하는 첫(가장 왼쪽, 가장 긴) 이름. 없으면 None."""
+        if self._pattern is None:
+            return None
+        text, bounds = _normalize_line(line)
+        for m in self._pattern.finditer(text):
+            start, end = m.start(1), m.end(1)
+            if start and start not in bounds and _WORD_RE.match(text, start - 1):
+                continue
+            after = text[end:]
+            if after and end not in bounds and _WORD_RE.match(after) and not after.startswith(_SUFFIXES):
+                continue
+            return NameMatch(self.names[m.group(1)], text[:start], after)
+        return None
@@ -0,0 +1,231 @@
+"""OCR 단어 상자(pages[].words[].boundingBox) 기반 레이아웃 인식 추출.
+
+텍스트 경로는 OCR이 내놓은 줄 순서를 그대로 믿기 때문에, 라벨과 값이 다른 줄로
+흩어지면(sample_01의 '품종명랑 05:26:18 12,480 kg' / '중 량:') 짝을 잃는다.
+여기서는 단어 상자를 NumPy 배열로 올려
+
+- 세로 중심으로 행을 묶고(정렬 + 간격 임계값, 벡터 연산) 행 안에서 x 순으로 읽으며,
+- y0 정렬 인덱스에 이분 탐색해 '이 라벨 오른쪽에 있는 같은 높이의 단어'를 찾는다
+  (후보 창은 최대 글자 높이로 제한 → 페이지 단어 수와 무관하게 O(log n + k)).
+
+NumPy는 레이아웃 모드에서만 필요하므로 이 모듈은 지연 import한다.
+"""
+from typing import Dict, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover - 환경 의존
+    raise ImportError(
+        "NumPy가 설치되어 있지 않습니다. 레이아웃 추출을 사용하려면 'pip install -r requirements.txt' 또는 'pip install numpy'를 실행하세요."
+    ) from e
+
+from src.parser.cleaner import clean_text
+from src.parser.matcher import EMPTY_WEIGHT, NET_WEIGHT, TOTAL_WEIGHT
+from src.parser.rule_pack import current_rules
+from src.utils.formatter import extract_number_value, merge_split_number_kg
+
+# 같은 행으로 묶는 세로 중심 간격(이웃한 두 단어 중 낮은 글자 높이 대비)
+ROW_GAP_RATIO = 0.5
+# '오른쪽 값'으로 인정하는 최소 세로 겹침(두 상자 중 낮은 높이 대비)
+MIN_OVERLAP = 0.5
+# 텍스트 경로에서 N/A일 때 읽기 순서 텍스트로 보충하는 라벨 기반 필드
+FILL_FIELDS = ("car_number", "date", "client_name")
+
+
+class PageIndex:
+    """한 페이지의 단어 상자를 담은 행/열 공간 인덱스.
+
+    - x0, y0, x1, y1, conf: 단어별 float 배열 / texts: 단어 문자열
+    - row: 단어별 행 번호(위→아래) / order: 읽기 순서(행, x) 단어 인덱스
+    """
+
+    def __init__(self, texts: Sequence[str], boxes: "np.ndarray", conf: Optional["np.ndarray"] = None):
+        self.texts = list(texts)
+        n = len(self.texts)
+        boxes = np.asarray(boxes, dtype=np.float64).reshape(n, 4)
+        self.x0, self.y0, self.x1, self.y1 = boxes.T
+        self.conf = np.ones(n) if conf is None else np.asarray(conf, dtype=np.float64)
+        self.h = self.y1 - self.y0
+        self.max_h = float(self.h.max()) if n else 0.0
+
+        # 행 클러스터링: 세로 중심을 정렬해 이웃 간격이 글자 높이에 비해 큰 곳에서 행을 나눈다
+        # (작은 글씨 줄이 큰 글씨 기준 임계값에 묶이지 않도록 이웃 중 낮은 높이를 쓴다)
+        cy = (self.y0 + self.y1) / 2
+        by_cy = np.argsort(cy, kind="stable")
+        h_sorted = self.h[by_cy]
+        breaks = np.diff(cy[by_cy]) > ROW_GAP_RATIO * np.minimum(h_sorted[1:], h_sorted[:-1])
+        self.row = np.empty(n, dtype=np.int64)
+        self.row[by_cy] = np.concatenate(([0], np.cumsum(breaks))) if n else []
+        self.order = np.lexsort((self.x0, self.row))
+
+        # 세로 범위 질의용 y0 정렬 인덱스
+        self._by_y0 = np.argsort(self.y0, kind="stable")
+        self._y0_sorted = self.y0[self._by_y0]
+
+    @classmethod
+    def from_page(cls, page: dict) -> "PageIndex":
+        """OCR 응답의 pages[i] → 인덱스. 꼭짓점(사각형/기울어진 사각형)의 최소·최대로 상자를 만든다."""
+        words = page.get("words") or []
+        texts = [w.get("text", "") for w in words]
+        if not words:
+            return cls([], np.empty((0, 4)))
+        # 단어당 4개 꼭짓점 (x, y)를 한 번에 배열로 만든 뒤 축별 최소/최대
+        pts = np.array(
+            [(v.get("x", 0), v.get("y", 0)) for w in words for v in _vertices(w)],
+            dtype=np.float64,
+        ).reshape(len(words), 4, 2)
+        boxes = np.concatenate((pts.min(axis=1), pts.max(axis=1)), axis=1)
+        conf = np.array([w.get("confidence", 1.0) for w in words], dtype=np.float64)
+        return cls(texts, boxes, conf)
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def rows(self) -> List[List[int]]:
+        """행별 단어 인덱스(x 순)."""
+        if not len(self):
+            return []
+        ordered = self.order
+        splits = np.flatnonzero(np.diff(self.row[ordered])) + 1
+        return [chunk.tolist() for chunk in np.split(ordered, splits)]
+
+    def lines(self) -> List[str]:
+        """읽기 순서(위→아래, 왼→오른쪽)로 재구성한 줄 텍스트."""
+        return [" ".join(self.texts[i] for i in row) for row in self.rows()]
+
+    def right_of(self, i: int, min_overlap: float = MIN_OVERLAP) -> "np.ndarray":
+        """단어 i와 세로로 min_overlap 이상 겹치고 오른쪽에 있는 단어들(x 순)."""
+        y0, y1 = self.y0[i], self.y1[i]
+        # y0_j ∈ (y0_i - max_h, y1_i) 인 후보만 이분 탐색으로 잘라낸다
+        lo = np.searchsorted(self._y0_sorted, y0 - self.max_h, side="right")
+        hi = np.searchsorted(self._y0_sorted, y1, side="left")
+        cand = self._by_y0[lo:hi]
+        overlap = np.minimum(self.y1[cand], y1) - np.maximum(self.y0[cand], y0)
+        need = min_overlap * np.minimum(self.h[cand], y1 - y0)
+        cx = (self.x0[cand] + self.x1[cand]) / 2
+        hits = cand[(overlap >= need) & (cx > self.x1[i])]
+        return hits[np.argsort(self.x0[hits], kind="stable")]
+
+
+def _vertices(word: dict) -> List[dict]:
+    verts = (word.get("boundingBox") or {}).get("vertices") or []
+    if len(verts) == 4:
+        return verts
+    # 꼭짓점이 빠진 상자는 있는 점으로 채운다(없으면 원점)
+    verts = list(verts) or [{"x": 0, "y": 0}]
+    return (verts * 4)[:4]
+
+
+def _kg_value(text: str) -> int:
+    """'kg'가 있는 텍스트의 무게 값(분리 숫자 병합 후). 없으면 0."""
+    lower = merge_split_number_kg(text.lower())
+    return extract_number_value(lower) if "kg" in lower else 0
+
+
+def _has_digit(text: str) -> bool:
+    return any(ch.isdigit() for ch in text)
+
+
+def _value_text(page: "PageIndex", indices) -> str:
+    """값 단어들을 잇되, 숫자 사이에 끼어든 문장부호 단어('·', ',')는 버린다."""
+    return " ".join(t for t in (page.texts[i] for i in indices) if any(ch.isalnum() for ch in t))
+
+
+def page_weight_rows(page: PageIndex) -> List[Tuple[Optional[str], int]]:
+    """행마다 (중량 범주 또는 None, 라벨 오른쪽 kg 값)을 읽기 순서로 반환한다.
+
+    라벨은 행 첫 단어부터 숫자가 나오기 전까지의 단어들이고, 값은 라벨 마지막 단어의
+    오른쪽·같은 높이 단어들에서 읽는다. 라벨 없이 kg 값만 있는 행은 범주 None.
+    라벨 범주는 현재 활성 규칙 팩의 매처로 판정한다.
+    """
+    matcher = current_rules().matcher
+    out: List[Tuple[Optional[str], int]] = []
+    texts = page.texts
+    for row in page.rows():
+        k = 0
+        while k < len(row) and not _has_digit(texts[row[k]]):
+            k += 1
+        if k == 0:
+            value = _kg_value(_value_text(page, row))
+            if value:
+                out.append((None, value))
+            continue
+        label = "".join(texts[i] for i in row[:k]).replace(" ", "").lower()
+        if not any(ch.isalnum() for ch in label):
+            # 문장부호만 있는 행('·', ',')은 옆 행 값을 가로채지 않게 건너뛴다
+            continue
+        hits = matcher.scan(label)
+        value = _kg_value(_value_text(page, page.right_of(row[k - 1])))
+        if not value:
+            continue
+        # 우선순위: 실중량 > 공차중량 > 총중량 (텍스트 경로와 동일), 그 외('중량' 등)는 라벨 없음 취급
+        for category in (NET_WEIGHT, EMPTY_WEIGHT, TOTAL_WEIGHT):
+            if category in hits:
+                out.append((category, value))
+                break
+        else:
+            out.append((None, value))
+    return out
+
+
+def resolve_weights(pages: Sequence[PageIndex]) -> Dict[str, int]:
+    """페이지들의 중량 행에서 total/empty/net을 정한다.
+
+    명시 라벨(실/공차/총중량)이 먼저, 범주가 모호한 값('중량'만 있거나 라벨 없음)은
+    읽기 순서대로 비어 있는 총중량 → 공차중량에 배정한 뒤 산술 추론한다.
+    """
+    from src.parser.extractor import OcrExtractor
+
+    key = {NET_WEIGHT: "net", EMPTY_WEIGHT: "empty", TOTAL_WEIGHT: "total"}
+    w = {"total": 0, "empty": 0, "net": 0}
+    loose: List[int] = []
+    for page in pages:
+        for category, value in page_weight_rows(page):
+            if category is None:
+                loose.append(value)
+            elif w[key[category]] == 0:
+                w[key[category]] = value
+    for slot in ("total", "empty"):
+        if w[slot] == 0 and loose:
+            w[slot] = loose.pop(0)
+    return OcrExtractor._infer_weights(w)
+
+
+def _consistent(w: Dict[str, int]) -> bool:
+    return w["total"] > 0 and w["empty"] > 0 and w["net"] > 0 and w["total"] - w["empty"] == w["net"]
+
+
+class LayoutExtractor:
+    """텍스트 추출기(base)에 단어 상자 기반 보정을 더하는 래퍼.
+
+    - 무게: 레이아웃으로 찾은 값이 산술적으로 맞으면(총 - 공차 = 실) 그 값을 쓴다.
+    - 차량번호/날짜/거래처: 텍스트 경로에서 N/A이면 읽기 순서로 재구성한 텍스트에서 보충한다.
+    - pages가 없는 입력이나 extract(text) 호출은 base와 동일하게 동작한다.
+    """
+
+    # process_file이 OCR 응답에서 읽을 최상위 필드
+    ocr_fields = ("text", "pages")
+
+    def __init__(self, base):
+        self.base = base
+
+    def extract(self, text: str) -> dict:
+        return self.base.extract(text)
+
+    def extract_response(self, data: dict) -> dict:
+        results = self.base.extract(clean_text(data.get("text", "")))
+        pages = [PageIndex.from_page(p) for p in data.get("pages") or [] if p.get("words")]
+        if not pages:
+            return results
+
+        weights = resolve_weights(pages)
+        if _consistent(weights):
+            results["weights"].update(weights)
+
+        if any(results.get(f) == "N/A" for f in FILL_FIELDS):
+            layout_text = clean_text("\n".join(line for page in pages for line in page.lines()))
+            alt = self.base.extract(layout_text)
+            for f in FILL_FIELDS:
+                if results.get(f) == "N/A":
+                    results[f] = alt[f]
+        return results
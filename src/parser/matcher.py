@@ -0,0 +1,125 @@
+"""규칙 팩의 라벨 테이블을 단일 다중 키워드 매처로 컴파일합니다.
+
+모든 라벨 목록을 공통 접두사로 묶은 트라이 정규식 하나로 만들어,
+한 줄을 한 번 훑는 것으로 어떤 라벨 범주가 등장하는지 모두 알려줍니다.
+트라이 분기는 문자 단위로 결정되므로 라벨 수가 늘어도 줄당 비용이 거의 일정합니다.
+"""
+import re
+from typing import Dict, FrozenSet, Iterable, Mapping
+
+# 라벨 범주
+DATE = "date"
+CAR = "car"
+CLIENT = "client"
+ISSUER = "issuer"
+NET_WEIGHT = "net"
+EMPTY_WEIGHT = "empty"
+TOTAL_WEIGHT = "total"
+WEIGHT = "weight"
+NOTICE = "notice"
+
+_END = ""  # 트라이 노드의 '키워드 끝' 표시
+_NO_HITS: FrozenSet[str] = frozenset()
+
+
+# 자식 수가 이보다 많은 트라이 노드는 첫 글자 문자집합으로 이분 분기한다
+_DISPATCH_FANOUT = 8
+
+
+def _char_class(chars) -> str:
+    return "[" + "".join(re.escape(c) for c in chars) + "]"
+
+
+def _alternation(branches, consumed: bool = False) -> str:
+    """[(첫 글자, 나머지 정규식)] 목록을 하나의 대안 그룹으로 만든다.
+
+    sre는 대안을 순서대로 시도하므로, 자식이 많으면 첫 글자 문자집합으로
+    이분 분기해 위치당 비용을 O(log 자식 수)로 유지한다(문자집합 검사는 O(1)).
+    consumed=True이면 첫 글자는 이미 소비된 상태이므로 후방탐색으로 분기한다.
+    """
+    if len(branches) <= _DISPATCH_FANOUT:
+        if consumed:
+            alts = ["(?<=" + re.escape(ch) + ")" + rest for ch, rest in branches]
+        else:
+            alts = [re.escape(ch) + rest for ch, rest in branches]
+        return alts[0] if len(alts) == 1 else "(?:" + "|".join(alts) + ")"
+    mid = len(branches) // 2
+    left, right = branches[:mid], branches[mid:]
+    guard = "(?<=" if consumed else "(?="
+    return (
+        "(?:" + guard + _char_class(ch for ch, _ in left) + ")" + _alternation(left, consumed)
+        + "|" + _alternation(right, consumed) + ")"
+    )
+
+
+def _trie_regex(node: dict) -> str:
+    """트라이를 공통 접두사가 묶인 정규식으로 변환(긴 키워드 우선)."""
+    branches = [(ch, _trie_regex(child)) for ch, child in sorted(node.items()) if ch != _END]
+    if not branches:
+        return ""
+    body = _alternation(branches)
+    if _END in node:
+        body = "(?:" + body + ")?"
+    return body
+
+
+def trie_regex(keywords: Iterable[str]) -> str:
+    """키워드 목록을 트라이 정규식 소스로 만든다(빈 문자열 키워드는 무시).
+
+    같은 위치에서는 가장 긴 키워드가 우선 매칭된다. 첫 글자 종류가 많으면
+    첫 글자를 문자집합 하나로 먼저 소비하게 만들어, sre가 키워드를 시작할 수 없는
+    위치를 C 수준에서 빠르게 건너뛰도록 한다.
+    """
+    trie: dict = {}
+    for kw in keywords:
+        if not kw:
+            continue
+        node = trie
+        for ch in kw:
+            node = node.setdefault(ch, {})
+        node[_END] = {}
+    branches = [(ch, _trie_regex(child)) for ch, child in sorted(trie.items())]
+    if len(branches) <= _DISPATCH_FANOUT:
+        return _trie_regex(trie)
+    return _char_class(ch for ch, _ in branches) + _alternation(branches, consumed=True)
+
+
+class KeywordMatcher:
+    """{범주: 키워드 목록} 테이블을 한 번에 매칭하는 컴파일된 매처.
+
+    scan(text)는 text에 부분 문자열로 등장하는 키워드들의 범주 집합을 돌려주며,
+    결과는 범주마다 any(k in text for k in 키워드목록)을 검사한 것과 같습니다.
+    """
+
+    def __init__(self, table: Mapping[str, Iterable[str]]):
+        owners: Dict[str, set] = {}
+        for category, keywords in table.items():
+            for kw in keywords:
+                if kw:
+                    owners.setdefault(kw, set()).add(category)
+
+        # 위치마다 가장 긴 키워드만 보고되므로, 그 안에 포함된 짧은 키워드의
+        # 범주까지 미리 합쳐 둔다(예: '총중량' → total + weight).
+        self._categories: Dict[str, FrozenSet[str]] = {}
+        for kw in owners:
+            cats = set()
+            for other, other_cats in owners.items():
+                if other in kw:
+                    cats |= other_cats
+            self._categories[kw] = frozenset(cats)
+
+        body = trie_regex(owners)
+        # 전방탐색으로 모든 시작 위치에서 (겹치는 것 포함) 가장 긴 키워드를 찾는다
+        self._pattern = re.compile("(?=(" + body + "))") if body else None
+
+    def scan(self, text: str) -> FrozenSet[str]:
+        """text에 등장하는 모든 라벨 범주를 한 번의 스캔으로 반환한다."""
+        if self._pattern is None or not text:
+            return _NO_HITS
+        found = self._pattern.findall(text)
+        if not found:
+            return _NO_HITS
+        if len(found) == 1:
+            return self._categories[found[0]]
+        return _NO_HITS.union(*[self._categories[kw] for kw in found])
+
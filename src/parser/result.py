@@ -0,0 +1,272 @@
+"""추출 결과의 압축 표현(ExtractionResult)과 직렬화/검증.
+
+기본 결과는 중첩 dict({..., "weights": {...}})라 문서마다 dict 두 개를 만든다.
+ExtractionResult는 같은 내용을 __slots__ 객체 하나(필드 10개)에 담는다.
+rules_version은 결과를 만든 규칙 팩의 '이름@버전'이다(src/parser/rule_pack.py).
+
+- dict 호환: result["car_number"], result.get(...), result["weights"]["net"],
+  result["weights"].update(...), keys()/items(), dict와의 == 비교를 지원해
+  기존 dict 기반 호출 측(경고 수집, NLP/레이아웃 보정, 계측, 열 지향 출력)이 그대로 동작한다.
+  래퍼들이 결과를 제자리에서 고치므로 불변(frozen)이 아닌 가변 객체다.
+- 직렬화: to_json()은 고정 템플릿에 문자열만 이스케이프해 넣는 압축 JSON(json.dumps와 동일 출력),
+  to_dict()는 기존 dict 형태.
+- 검증: validate_result()는 pydantic 스키마로 외부 입력(캐시/파일에서 읽은 결과 등)을 검사한다.
+  pydantic은 이때만 지연 import한다.
+"""
+import json
+from collections.abc import Mapping
+from json.encoder import encode_basestring as _quote  # ensure_ascii=False와 같은 이스케이프(C 구현)
+from typing import Any, Iterator, Optional, Tuple, Union
+
+NA = "N/A"
+TEXT_FIELDS = ("car_number", "date", "issuer_name", "issuer_address", "client_name")
+WEIGHT_KEYS = ("unit", "total", "empty", "net")
+RESULT_KEYS = TEXT_FIELDS + ("weights", "rules_version")
+# 슬롯 이름 그대로 읽고 쓰는 키
+_SCALAR_KEYS = frozenset(TEXT_FIELDS + ("rules_version",))
+
+_JSON_TEMPLATE = (
+    '{"car_number":%s,"date":%s,"issuer_name":%s,"issuer_address":%s,"client_name":%s,'
+    '"weights":{"unit":%s,"total":%d,"empty":%d,"net":%d},"rules_version":%s}'
+)
+
+
+class Weights:
+    """ExtractionResult의 무게 슬롯을 dict처럼 읽고 쓰는 뷰(result["weights"])."""
+
+    __slots__ = ("_result",)
+
+    def __init__(self, result: "ExtractionResult"):
+        self._result = result
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in WEIGHT_KEYS:
+            raise KeyError(key)
+        return getattr(self._result, "weight_" + key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key not in WEIGHT_KEYS:
+            raise KeyError(key)
+        setattr(self._result, "weight_" + key, value)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self._result, "weight_" + key) if key in WEIGHT_KEYS else default
+
+    def update(self, other: Mapping = (), **kwargs: Any) -> None:
+        for key, value in dict(other, **kwargs).items():
+            self[key] = value
+
+    def keys(self) -> Tuple[str, ...]:
+        return WEIGHT_KEYS
+
+    def items(self):
+        r = self._result
+        return [("unit", r.weight_unit), ("total", r.weight_total), ("empty", r.weight_empty), ("net", r.weight_net)]
+
+    def values(self):
+        return [value for _, value in self.items()]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(WEIGHT_KEYS)
+
+    def __len__(self) -> int:
+        return len(WEIGHT_KEYS)
+
+    def __contains__(self, key: object) -> bool:
+        return key in WEIGHT_KEYS
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (Weights, Mapping)):
+            return dict(self.items()) == dict(other.items())
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return repr(dict(self.items()))
+
+
+class ExtractionResult:
+    """추출 결과 한 건(텍스트 필드 5개 + 무게 4개를 슬롯에 평탄화 + 규칙 팩 버전)."""
+
+    __slots__ = TEXT_FIELDS + ("weight_unit", "weight_total", "weight_empty", "weight_net", "rules_version")
+
+    def __init__(self, car_number: str = NA, date: str = NA, issuer_name: str = NA,
+                 issuer_address: str = NA, client_name: str = NA, weight_unit: str = "kg",
+                 weight_total: int = 0, weight_empty: int = 0, weight_net: int = 0, rules_version: str = ""):
+        self.car_number = car_number
+        self.date = date
+        self.issuer_name = issuer_name
+        self.issuer_address = issuer_address
+        self.client_name = client_name
+        self.weight_unit = weight_unit
+        self.weight_total = weight_total
+        self.weight_empty = weight_empty
+        self.weight_net = weight_net
+        self.rules_version = rules_version
+
+    # ── dict 호환 ────────────────────────────────────────────
+    def __getitem__(self, key: str) -> Any:
+        if key in _SCALAR_KEYS:
+            return getattr(self, key)
+        if key == "weights":
+            return Weights(self)
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key in _SCALAR_KEYS:
+            setattr(self, key, value)
+        elif key == "weights":
+            Weights(self).update(value)
+        else:
+            raise KeyError(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def keys(self) -> Tuple[str, ...]:
+        return RESULT_KEYS
+
+    def items(self):
+        return [(key, self[key]) for key in RESULT_KEYS]
+
+    def values(self):
+        return [self[key] for key in RESULT_KEYS]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(RESULT_KEYS)
+
+    def __len__(self) -> int:
+        return len(RESULT_KEYS)
+
+    def __contains__(self, key: object) -> bool:
+        return key in RESULT_KEYS
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ExtractionResult):
+            return self.as_tuple() == other.as_tuple()
+        if isinstance(other, Mapping):
+            return self.to_dict() == dict(other)
+        return NotImplemented
+
+    __hash__ = None  # 가변 객체
+
+    def __str__(self) -> str:
+        # 로그('처리 완료 → %s')는 dict 결과와 같은 모양으로 남긴다
+        return str(self.to_dict())
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"ExtractionResult({fields})"
+
+    # ── 변환/직렬화 ──────────────────────────────────────────
+    def as_tuple(self) -> tuple:
+        return (self.car_number, self.date, self.issuer_name, self.issuer_address, self.client_name,
+                self.weight_unit, self.weight_total, self.weight_empty, self.weight_net, self.rules_version)
+
+    def __reduce__(self):
+        # 슬롯 이름 dict 대신 값 튜플만 피클(프로세스 풀 결과 전송량 축소)
+        return (ExtractionResult, self.as_tuple())
+
+    def copy(self) -> "ExtractionResult":
+        return ExtractionResult(*self.as_tuple())
+
+    def to_dict(self) -> dict:
+        return {
+            "car_number": self.car_number,
+            "date": self.date,
+            "issuer_name": self.issuer_name,
+            "issuer_address": self.issuer_address,
+            "client_name": self.client_name,
+            "weights": {"unit": self.weight_unit, "total": self.weight_total,
+                        "empty": self.weight_empty, "net": self.weight_net},
+            "rules_version": self.rules_version,
+        }
+
+    def to_json(self) -> str:
+        """압축 JSON. json.dumps(to_dict(), ensure_ascii=False, separators=(",", ":"))와 같은 문자열."""
+        return _JSON_TEMPLATE % (
+            _quote(self.car_number), _quote(self.date), _quote(self.issuer_name),
+            _quote(self.issuer_address), _quote(self.client_name), _quote(self.weight_unit),
+            self.weight_total, self.weight_empty, self.weight_net, _quote(self.rules_version),
+        )
+
+    @classmethod
+    def from_dict(cls, data: Mapping) -> "ExtractionResult":
+        w = data.get("weights") or {}
+        return cls(
+            data.get("car_number", NA), data.get("date", NA), data.get("issuer_name", NA),
+            data.get("issuer_address", NA), data.get("client_name", NA),
+            w.get("unit", "kg"), w.get("total", 0), w.get("empty", 0), w.get("net", 0),
+            data.get("rules_version", ""),
+        )
+
+    @classmethod
+    def from_json(cls, text: str) -> "ExtractionResult":
+        return cls.from_dict(json.loads(text))
+
+
+Mapping.register(ExtractionResult)
+Mapping.register(Weights)
+
+
+def as_dict(result: Union[dict, ExtractionResult]) -> dict:
+    """dict 결과는 그대로, ExtractionResult는 dict로(json.dump 등 dict가 필요한 곳용)."""
+    return result.to_dict() if isinstance(result, ExtractionResult) else result
+
+
+def to_json(result: Union[dict, ExtractionResult]) -> str:
+    """결과 한 건의 압축 JSON(ExtractionResult면 빠른 경로)."""
+    if isinstance(result, ExtractionResult):
+        return result.to_json()
+    return json.dumps(result, ensure_ascii=False, separators=(",", ":"))
+
+
+# ── pydantic 스키마(선택) ─────────────────────────────────────
+_SCHEMA: Optional[type] = None
+
+
+def result_schema() -> type:
+    """결과 검증용 pydantic 모델(첫 호출 시 생성). 알 수 없는 키, 음수·비정수 무게를 거부한다."""
+    global _SCHEMA
+    if _SCHEMA is None:
+        try:
+            from pydantic import BaseModel, ConfigDict, Field, StrictInt
+        except ImportError as e:  # pragma: no cover - 환경 의존
+            raise ImportError(
+                "pydantic이 설치되어 있지 않습니다. 결과 검증을 사용하려면 'pip install -r requirements.txt'를 실행하세요."
+            ) from e
+
+        class WeightsSchema(BaseModel):
+            model_config = ConfigDict(extra="forbid")
+            unit: str = "kg"
+            total: StrictInt = Field(0, ge=0)
+            empty: StrictInt = Field(0, ge=0)
+            net: StrictInt = Field(0, ge=0)
+
+        class ResultSchema(BaseModel):
+            model_config = ConfigDict(extra="forbid")
+            car_number: str = NA
+            date: str = NA
+            issuer_name: str = NA
+            issuer_address: str = NA
+            client_name: str = NA
+            weights: WeightsSchema = WeightsSchema()
+            rules_version: str = ""
+
+        _SCHEMA = ResultSchema
+    return _SCHEMA
+
+
+def validate_result(data: Union[str, bytes, Mapping]) -> ExtractionResult:
+    """외부에서 들어온 결과(JSON 문자열 또는 dict)를 스키마로 검증해 ExtractionResult로 만든다.
+
+    검증 실패 시 pydantic.ValidationError를 던진다.
+    """
+    schema = result_schema()
+    if isinstance(data, (str, bytes)):
+        model = schema.model_validate_json(data)
+    else:
+        model = schema.model_validate(as_dict(data))
+    return ExtractionResult.from_dict(model.model_dump())
@@ -0,0 +1,379 @@
+"""버전이 붙은 규칙 팩(data/rule_packs/*.json)의 로드·컴파일·아티팩트 캐시·핫 리로드.
+
+라벨 동의어, 날짜/주소 패턴, 교정 테이블을 코드 상수가 아닌 데이터 팩으로 관리합니다.
+현장이나 스캐너 업체별 팩은 다른 팩을 extends로 상속해 바꿀 항목만 적습니다.
+
+- 컴파일: 팩 → CompiledRules(라벨 매처, 정규식, 교정기, 회사명 가제티어). 추출기는 문서 하나를
+  스냅숏 하나로 처리하고, 결과의 rules_version에 팩의 '이름@버전'을 기록합니다.
+- 아티팩트: 컴파일 결과를 <artifact_dir>/<지문>.pickle로 저장해 다음 시작부터 불러옵니다
+  (트라이 구성과 라벨 범주 병합을 건너뜀, 정규식은 피클 로드 시 sre가 다시 컴파일).
+  지문은 팩/교정/등록부 파일과 컴파일 코드의 내용 해시라 내용이 바뀌면 새 아티팩트를 만듭니다.
+- 핫 리로드: RuleStore.refresh()가 check_interval초마다 팩/교정/등록부 파일 상태(mtime, 크기)를 확인해
+  바뀌었으면 새로 컴파일한 뒤 참조 하나만 교체합니다. 진행 중인 문서는 시작할 때 잡은 스냅숏으로
+  끝까지 처리됩니다. 새 팩이 잘못되었으면(JSON/정규식 오류 등) 경고를 남기고 이전 규칙을 유지합니다.
+
+팩 형식 (JSON 객체, 경로는 그 팩 파일 기준 상대 경로)
+- name, version: 필수 문자열(상속한 팩의 값은 물려받지 않음)
+- extends: 상속할 팩('default' 같은 이름 또는 .json 경로)
+- labels: {범주: [라벨, ...]} – 범주는 LABEL_CATEGORIES, 상속 시 적은 범주만 교체
+- car_part_hints: 차량번호 토큰 힌트 목록
+- patterns: {"date": 날짜 정규식(그룹 1 = 날짜), "address_prefix": 주소 시작 정규식}
+- corrections: 교정 테이블 디렉터리 목록(상속한 팩의 목록 뒤에 이어 붙임, 뒤 디렉터리가 우선)
+- fuzzy_labels: 선택 {"categories": [범주, ...], "max_distance": 정수, "keep": [낱말, ...]} – 이 범주 라벨로
+  퍼지 라벨 색인을 만들어 정제 때 깨진 라벨 머리를 고친다. keep은 라벨과 비슷해도 고치지 않을 실제 낱말
+  (src/parser/fuzzy.py, 없으면 상속한 값, 끝까지 없으면 끔 – 기본 팩은 끄고 ocr_repair 팩이 켠다)
+- gazetteer: 선택, 거래처 등록부 디렉터리 목록(corrections처럼 상속한 목록 뒤에 이어 붙임) – 등록부의
+  회사명으로 발급사/거래처를 정식 명칭으로 찾는다(src/parser/gazetteer.py, 없으면 끔)
+"""
+import json
+import logging
+import os
+import pickle
+import re
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+from src.parser import corrections as _corrections
+from src.parser import fuzzy as _fuzzy
+from src.parser import gazetteer as _gazetteer
+from src.parser import matcher as _matcher
+from src.parser.corrections import Corrector, load_correction_table, table_files
+from src.parser.fuzzy import DEFAULT_MAX_DISTANCE, LabelIndex
+from src.parser.gazetteer import Gazetteer, load_registry
+from src.parser.matcher import (
+    CAR, CLIENT, DATE, EMPTY_WEIGHT, ISSUER, NET_WEIGHT, NOTICE, TOTAL_WEIGHT, WEIGHT, KeywordMatcher,
+)
+from src.parser.version import fingerprint_files
+from src.utils import metrics
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PACK = "default"
+# 기본 팩 위치 (작업 디렉터리와 무관하게 저장소 기준)
+DEFAULT_PACK_DIR = Path(__file__).resolve().parents[2] / "data" / "rule_packs"
+# 컴파일 아티팩트 기본 위치: <dir>/<지문>.pickle
+DEFAULT_ARTIFACT_DIR = "cache/rules"
+
+LABEL_CATEGORIES = (DATE, CAR, CLIENT, ISSUER, NET_WEIGHT, EMPTY_WEIGHT, TOTAL_WEIGHT, WEIGHT, NOTICE)
+PATTERN_KEYS = ("date", "address_prefix")
+# 컴파일 결과에 영향을 주는 코드(아티팩트 지문에 포함)
+_COMPILER_SOURCES = (Path(__file__), Path(_matcher.__file__), Path(_corrections.__file__), Path(_fuzzy.__file__),
+                     Path(_gazetteer.__file__))
+
+PackRef = Union[str, Path]
+
+
+def resolve_pack_path(pack: PackRef, base_dir: Optional[Path] = None) -> Path:
+    """팩 이름('default') → <base_dir 또는 DEFAULT_PACK_DIR>/default.json.
+
+    경로(.json으로 끝나거나 디렉터리 구분자 포함)는 base_dir 기준(없으면 작업 디렉터리 기준)으로 푼다.
+    """
+    text = str(pack)
+    if text.endswith(".json") or "/" in text or os.sep in text:
+        return Path(pack) if base_dir is None else base_dir / pack
+    return (base_dir or DEFAULT_PACK_DIR) / f"{text}.json"
+
+
+def _read_pack(path: Path) -> dict:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        raise ValueError(f"규칙 팩이 없습니다: {path}") from None
+    except json.JSONDecodeError as e:
+        raise ValueError(f"{path}: JSON 형식 오류: {e}") from e
+    if not isinstance(data, dict):
+        raise ValueError(f"{path}: 규칙 팩은 JSON 객체여야 합니다")
+    return data
+
+
+def _str_list(path: Path, key: str, value) -> List[str]:
+    if not isinstance(value, list) or not all(isinstance(v, str) and v for v in value):
+        raise ValueError(f"{path}: {key}는 빈 문자열이 없는 문자열 목록이어야 합니다")
+    return list(value)
+
+
+class RulePack:
+    """상속을 풀어 병합한 팩 정의(컴파일 전).
+
+    pack_files: 상속 체인의 팩 파일(자식 → 부모 순), correction_dirs: 교정 테이블 디렉터리(뒤가 우선)
+    fuzzy_labels: 퍼지 라벨 색인 설정({"categories": [...], "max_distance": n}, 없으면 None)
+    gazetteer_dirs: 거래처 등록부 디렉터리(뒤가 우선)
+    """
+
+    def __init__(self, name: str, version: str, labels: Dict[str, List[str]], car_part_hints: List[str],
+                 patterns: Dict[str, str], correction_dirs: List[Path], pack_files: List[Path],
+                 fuzzy_labels: Optional[dict] = None, gazetteer_dirs: Optional[List[Path]] = None):
+        self.name = name
+        self.version = version
+        self.labels = labels
+        self.car_part_hints = car_part_hints
+        self.patterns = patterns
+        self.correction_dirs = correction_dirs
+        self.pack_files = pack_files
+        self.fuzzy_labels = fuzzy_labels
+        self.gazetteer_dirs = gazetteer_dirs or []
+
+    @property
+    def pack_id(self) -> str:
+        return f"{self.name}@{self.version}"
+
+    def correction_files(self) -> List[Path]:
+        return [f for d in self.correction_dirs for f in table_files(d)]
+
+    def registry_files(self) -> List[Path]:
+        return [f for d in self.gazetteer_dirs for f in table_files(d)]
+
+    def fingerprint(self) -> str:
+        """팩/교정/등록부 파일과 컴파일 코드의 내용 지문."""
+        return fingerprint_files(list(_COMPILER_SOURCES) + self.pack_files + self.correction_files()
+                                 + self.registry_files())
+
+
+def load_rule_pack(pack: PackRef = DEFAULT_PACK) -> RulePack:
+    """팩 파일을 읽고 extends 체인을 부모부터 병합한다. 형식 오류는 ValueError."""
+    path = resolve_pack_path(pack).resolve()
+    chain: List[Tuple[Path, dict]] = []
+    while True:
+        if any(path == p for p, _ in chain):
+            raise ValueError(f"규칙 팩 상속이 순환합니다: {path}")
+        data = _read_pack(path)
+        chain.append((path, data))
+        parent = data.get("extends")
+        if not parent:
+            break
+        path = resolve_pack_path(parent, path.parent).resolve()
+
+    labels: Dict[str, List[str]] = {}
+    patterns: Dict[str, str] = {}
+    hints: Optional[List[str]] = None
+    fuzzy: Optional[dict] = None
+    correction_dirs: List[Path] = []
+    gazetteer_dirs: List[Path] = []
+    for path, data in reversed(chain):
+        pack_labels = data.get("labels") or {}
+        unknown = sorted(set(pack_labels) - set(LABEL_CATEGORIES))
+        if unknown:
+            raise ValueError(f"{path}: 알 수 없는 라벨 범주입니다: {', '.join(unknown)}")
+        for category, keywords in pack_labels.items():
+            labels[category] = _str_list(path, f"labels.{category}", keywords)
+        pack_patterns = data.get("patterns") or {}
+        unknown = sorted(set(pack_patterns) - set(PATTERN_KEYS))
+        if unknown:
+            raise ValueError(f"{path}: 알 수 없는 패턴입니다: {', '.join(unknown)}")
+        patterns.update(pack_patterns)
+        if "car_part_hints" in data:
+            hints = _str_list(path, "car_part_hints", data["car_part_hints"])
+        if "fuzzy_labels" in data:
+            fuzzy = _fuzzy_labels(path, data["fuzzy_labels"])
+        correction_dirs.extend(path.parent / d for d in _str_list(path, "corrections", data.get("corrections", [])))
+        gazetteer_dirs.extend(path.parent / d for d in _str_list(path, "gazetteer", data.get("gazetteer", [])))
+
+    top_path, top = chain[0]
+    for key in ("name", "version"):
+        if not isinstance(top.get(key), str) or not top[key]:
+            raise ValueError(f"{top_path}: {key}는 필수 문자열입니다")
+    missing = [c for c in LABEL_CATEGORIES if c not in labels] + [k for k in PATTERN_KEYS if k not in patterns]
+    if hints is None:
+        missing.append("car_part_hints")
+    if missing:
+        raise ValueError(f"{top_path}: 필수 항목이 없습니다: {', '.join(missing)}")
+    return RulePack(top["name"], top["version"], labels, hints, patterns, correction_dirs,
+                    [p for p, _ in chain], fuzzy, gazetteer_dirs)
+
+
+def _fuzzy_labels(path: Path, value) -> dict:
+    if not isinstance(value, dict):
+        raise ValueError(f"{path}: fuzzy_labels는 JSON 객체여야 합니다")
+    categories = _str_list(path, "fuzzy_labels.categories", value.get("categories", []))
+    unknown = sorted(set(categories) - set(LABEL_CATEGORIES))
+    if unknown:
+        raise ValueError(f"{path}: fuzzy_labels에 알 수 없는 라벨 범주입니다: {', '.join(unknown)}")
+    max_distance = value.get("max_distance", DEFAULT_MAX_DISTANCE)
+    if not isinstance(max_distance, int) or isinstance(max_distance, bool) or not 0 <= max_distance <= 2:
+        raise ValueError(f"{path}: fuzzy_labels.max_distance는 0~2 정수여야 합니다")
+    keep = _str_list(path, "fuzzy_labels.keep", value.get("keep", []))
+    return {"categories": categories, "max_distance": max_distance, "keep": keep}
+
+
+def _compile_pattern(pack: RulePack, key: str) -> "re.Pattern":
+    try:
+        return re.compile(pack.patterns[key])
+    except (re.error, TypeError) as e:
+        raise ValueError(f"규칙 팩 {pack.pack_id}: patterns.{key} 정규식 오류: {e}") from e
+
+
+def _stat(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+class CompiledRules:
+    """컴파일된 규칙 스냅숏(만든 뒤 바꾸지 않는다). 문서 하나는 이 객체 하나로 처리한다."""
+
+    def __init__(self, pack: RulePack, fingerprint: str):
+        self.name = pack.name
+        self.version = pack.version
+        self.pack_id = pack.pack_id
+        self.fingerprint = fingerprint
+        self.matcher = KeywordMatcher({category: pack.labels[category] for category in LABEL_CATEGORIES})
+        self.client_labels: Tuple[str, ...] = tuple(pack.labels[CLIENT])
+        self.date_re = _compile_pattern(pack, "date")
+        if self.date_re.groups < 1:
+            raise ValueError(f"규칙 팩 {pack.pack_id}: patterns.date에는 날짜를 담는 그룹이 있어야 합니다")
+        self.address_re = _compile_pattern(pack, "address_prefix")
+        self.car_part_re = re.compile("|".join(re.escape(k) for k in pack.car_part_hints))
+        self.corrector = Corrector(load_correction_table(pack.correction_files()))
+        # 퍼지 라벨 색인(팩에 fuzzy_labels가 없거나 max_distance가 0이면 None)
+        self.label_index: Optional[LabelIndex] = None
+        fuzzy = pack.fuzzy_labels
+        if fuzzy and fuzzy["categories"] and fuzzy["max_distance"]:
+            self.label_index = LabelIndex({c: pack.labels[c] for c in fuzzy["categories"]}, fuzzy["max_distance"],
+                                          exact=[label for c in LABEL_CATEGORIES for label in pack.labels[c]]
+                                          + fuzzy["keep"])
+        # 회사명 가제티어(팩에 등록부가 없으면 None)
+        registry_files = pack.registry_files()
+        self.gazetteer: Optional[Gazetteer] = Gazetteer(load_registry(registry_files)) if registry_files else None
+        # 핫 리로드 변경 감지 대상(교정/등록부 디렉터리는 파일 추가/삭제도 감지)
+        self.pack_files: Tuple[str, ...] = tuple(str(p) for p in pack.pack_files)
+        self.table_dirs: Tuple[str, ...] = tuple(str(d) for d in pack.correction_dirs + pack.gazetteer_dirs)
+
+    def source_state(self) -> tuple:
+        """팩/교정/등록부 파일의 (경로, mtime, 크기) 목록. 값이 달라지면 다시 컴파일한다."""
+        files = [Path(p) for p in self.pack_files] + [f for d in self.table_dirs for f in table_files(d)]
+        return tuple((str(f), _stat(f)) for f in files)
+
+    def __repr__(self) -> str:
+        return f"CompiledRules({self.pack_id}, {self.fingerprint})"
+
+
+def compile_rules(pack: PackRef = DEFAULT_PACK, artifact_dir: Optional[PackRef] = None) -> CompiledRules:
+    """팩을 컴파일한다. artifact_dir가 있으면 같은 지문의 아티팩트를 불러오고, 없으면 만든 뒤 저장한다.
+
+    아티팩트 로드/저장 실패는 베스트에포트로 무시한다(그때는 직접 컴파일).
+    """
+    loaded = load_rule_pack(pack)
+    fingerprint = loaded.fingerprint()
+    if not artifact_dir:
+        return CompiledRules(loaded, fingerprint)
+
+    target = Path(artifact_dir) / f"{fingerprint}.pickle"
+    if target.is_file():
+        try:
+            with open(target, "rb") as f:
+                rules = pickle.load(f)
+            if isinstance(rules, CompiledRules) and rules.fingerprint == fingerprint:
+                return rules
+        except Exception as e:
+            logger.warning("규칙 팩 아티팩트 로드 실패: %s (재컴파일)", e)
+
+    rules = CompiledRules(loaded, fingerprint)
+    try:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        # 임시 파일에 쓴 뒤 이름을 바꿔, 동시에 시작한 워커가 반쯤 쓴 아티팩트를 읽지 않게 한다
+        fd, tmp = tempfile.mkstemp(prefix=target.name + ".", dir=target.parent)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(rules, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, target)
+        finally:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+    except OSError as e:
+        logger.warning("규칙 팩 아티팩트 저장 실패: %s", e)
+    return rules
+
+
+class RuleStore:
+    """팩 하나의 현재 컴파일 결과를 들고, 파일이 바뀌면 다시 컴파일해 교체한다.
+
+    check_interval: refresh()가 파일 상태를 확인하는 최소 간격(초, 0이면 리로드하지 않음)
+    """
+
+    def __init__(self, pack: PackRef = DEFAULT_PACK, artifact_dir: Optional[PackRef] = None,
+                 check_interval: float = 0.0, clock: Callable[[], float] = time.monotonic):
+        if check_interval < 0:
+            raise ValueError("check_interval은 0 이상이어야 합니다")
+        self.pack = pack
+        self.artifact_dir = artifact_dir
+        self.check_interval = check_interval
+        self.rules = compile_rules(pack, artifact_dir)
+        self.reloads = 0
+        self.failures = 0
+        self._clock = clock
+        self._state = self.rules.source_state()
+        self._next_check = clock() + check_interval
+        self._lock = threading.Lock()
+
+    def refresh(self) -> CompiledRules:
+        """확인 간격이 지났고 파일이 바뀌었으면 다시 컴파일한다. 현재 규칙을 반환한다."""
+        if not self.check_interval or self._clock() < self._next_check:
+            return self.rules
+        with self._lock:
+            now = self._clock()
+            if now < self._next_check:
+                return self.rules
+            self._next_check = now + self.check_interval
+            state = self.rules.source_state()
+            if state != self._state:
+                self._reload(state)
+        return self.rules
+
+    def _reload(self, state: tuple) -> None:
+        old = self.rules
+        try:
+            new = compile_rules(self.pack, self.artifact_dir)
+        except (OSError, ValueError) as e:
+            self.failures += 1
+            # 같은 파일 상태로는 다시 시도하지 않는다(파일이 다시 바뀌면 재시도)
+            self._state = state
+            logger.warning("규칙 팩 리로드 실패: %s (이전 규칙 %s 유지)", e, old.pack_id)
+            return
+        self._state = new.source_state()
+        if new.fingerprint == old.fingerprint:
+            return
+        if new.pack_id == old.pack_id:
+            logger.warning("규칙 팩 %s의 내용이 바뀌었지만 version이 같습니다(결과의 rules_version으로 구분되지 않음)",
+                           new.pack_id)
+        self.rules = new
+        self.reloads += 1
+        m = metrics.ACTIVE
+        if m is not None:
+            m.incr("rule_reloads")
+        logger.info("규칙 팩 리로드: %s → %s", old.pack_id, new.pack_id)
+
+
+# ── 프로세스 전역 활성 팩 ─────────────────────────────────────
+_ACTIVE: Optional[RuleStore] = None
+
+
+def use_rules(pack: PackRef = DEFAULT_PACK, artifact_dir: Optional[PackRef] = DEFAULT_ARTIFACT_DIR,
+              check_interval: float = 0.0) -> CompiledRules:
+    """이 프로세스의 활성 규칙 팩을 정한다(CLI --rules, 워커 initializer에서 호출)."""
+    global _ACTIVE
+    _ACTIVE = RuleStore(pack, artifact_dir, check_interval)
+    logger.info("규칙 팩: %s (지문 %s)", _ACTIVE.rules.pack_id, _ACTIVE.rules.fingerprint)
+    return _ACTIVE.rules
+
+
+def active_store() -> RuleStore:
+    """활성 RuleStore(use_rules 전이면 기본 팩으로 처음 호출 시 1회 컴파일)."""
+    global _ACTIVE
+    if _ACTIVE is None:
+        _ACTIVE = RuleStore(DEFAULT_PACK)
+    return _ACTIVE
+
+
+def current_rules() -> CompiledRules:
+    """현재 활성 규칙 스냅숏(리로드 확인 없음)."""
+    return active_store().rules
+
+
+def refresh_rules() -> CompiledRules:
+    """문서 경계에서 호출: 리로드 확인 후 현재 규칙 스냅숏을 반환한다."""
+    return active_store().refresh()
@@ -1,38 +0,0 @@
-"""추출 규칙 상수 테이블 (동작 불변 유지, 동의어만 포함)
-
-extractor가 참조하는 라벨/키워드 목록을 한 곳에 모읍니다.
-코드 로직 변경 없이 상수만 분리합니다.
-"""
-
-# 날짜 라벨
-DATE_LABELS = [
-    "계량일자", "날짜", "일시", "일자",
-]
-
-# 차량번호 라벨 및 토큰 힌트
-CAR_LABELS = [
-    "차량번호:", "차번호:", "차량No.", "차번:",
-]
-CAR_PART_HINTS = [
-    "번호", "No.",
-]
-
-# 거래처/고객사 라벨
-CLIENT_LABELS = [
-    "거래처:", "거래처 :", "고객사:", "고객사 :", "상호:", "상호 :",
-]
-
-# 발급사 힌트
-ISSUER_HINTS = [
-    "(주)", "주식회사",
-]
-
-# 날짜 패턴 (YYYY-MM-DD / YYYY.MM.DD)
-DATE_REGEX = r"(\d{4}[-\/.]\d{2}[-\/.]\d{2})"
-
-# 주소(광역 시작) 패턴
-ADDRESS_PREFIX_PATTERN = (
-    r'^(경기도|서울|부산|대구|인천|광주|대전|울산|세종|'
-    r'충청북도|충청남도|충북|충남|전라북도|전라남도|전북|전남|'
-    r'경상북도|경상남도|경북|경남|강원도|강원|제주도|제주)'
-)
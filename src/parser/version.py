@@ -0,0 +1,92 @@
+"""추출 규칙/코드의 버전 지문(fingerprint).
+
+추출기/정제기 코드와 규칙 팩(라벨·패턴·교정 테이블) 등 추출 결과에 영향을 주는 파일 내용을
+해시해 짧은 버전 문자열을 만듭니다. 규칙이 한 글자라도 바뀌면 지문이 달라지므로,
+결과 캐시나 처리 매니페스트가 오래된 결과를 재사용하지 않게 하는 데 씁니다.
+"""
+import hashlib
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Iterable, Optional, Tuple, Union
+
+ROOT = Path(__file__).resolve().parents[2]
+
+# 기본 추출 경로(정제 + 규칙 기반 추출)에 영향을 주는 소스
+# (라벨/패턴/교정 테이블은 활성 규칙 팩의 지문으로 따로 반영한다)
+EXTRACTION_SOURCES: Tuple[str, ...] = (
+    "src/parser/rule_pack.py",
+    "src/parser/matcher.py",
+    "src/parser/extractor.py",
+    "src/parser/result.py",
+    "src/parser/cleaner.py",
+    "src/parser/corrections.py",
+    "src/parser/fuzzy.py",
+    "src/parser/gazetteer.py",
+    "src/utils/formatter.py",
+)
+EXTRACTION_DATA_DIRS: Tuple[str, ...] = ()
+
+# NLP 보조 모드에서 추가로 영향을 주는 소스
+NLP_SOURCES: Tuple[str, ...] = (
+    "src/parser/extractor_nlp_wrapper.py",
+    "src/nlp/engine.py",
+)
+NLP_DATA_DIRS: Tuple[str, ...] = (
+    "data/patterns",
+)
+
+# 레이아웃 모드에서 추가로 영향을 주는 소스
+LAYOUT_SOURCES: Tuple[str, ...] = (
+    "src/parser/layout.py",
+)
+
+# 페이지 단위 추출에서 추가로 영향을 주는 소스
+PAGE_SOURCES: Tuple[str, ...] = (
+    "src/pipeline/pages.py",
+)
+
+
+def _iter_files(sources: Iterable[str], data_dirs: Iterable[str]):
+    for rel in sources:
+        yield ROOT / rel
+    for rel in data_dirs:
+        d = ROOT / rel
+        if d.is_dir():
+            yield from sorted(p for p in d.iterdir() if p.is_file())
+
+
+def fingerprint_files(paths: Iterable[Union[str, Path]]) -> str:
+    """파일 경로와 내용을 순서대로 해시한 16자리 지문(없는 파일은 '없음'으로 반영)."""
+    h = hashlib.sha256()
+    for p in paths:
+        p = Path(p)
+        try:
+            rel = p.resolve().relative_to(ROOT).as_posix()
+        except ValueError:
+            rel = p.as_posix()
+        h.update(rel.encode("utf-8") + b"\0")
+        try:
+            h.update(p.read_bytes())
+        except FileNotFoundError:
+            h.update(b"<missing>")
+        h.update(b"\0")
+    return h.hexdigest()[:16]
+
+
+@lru_cache(maxsize=None)
+def code_fingerprint(use_nlp: bool = False, layout: bool = False, pages: bool = False) -> str:
+    """추출 코드(및 NLP 패턴) 버전 지문(프로세스 내 1회 계산)."""
+    sources = (EXTRACTION_SOURCES + (NLP_SOURCES if use_nlp else ()) + (LAYOUT_SOURCES if layout else ())
+               + (PAGE_SOURCES if pages else ()))
+    data_dirs = EXTRACTION_DATA_DIRS + (NLP_DATA_DIRS if use_nlp else ())
+    prefix = ("nlp" if use_nlp else "base") + ("+layout" if layout else "") + ("+pages-" if pages else "-")
+    return prefix + fingerprint_files(_iter_files(sources, data_dirs))
+
+
+def extraction_fingerprint(use_nlp: bool = False, layout: bool = False, rules: Optional[Any] = None,
+                           pages: bool = False) -> str:
+    """코드 지문 + 규칙 팩 지문. rules(CompiledRules)를 생략하면 현재 활성 규칙 팩을 쓴다."""
+    if rules is None:
+        from src.parser.rule_pack import current_rules  # 순환 import 방지(rule_pack이 이 모듈을 쓴다)
+        rules = current_rules()
+    return f"{code_fingerprint(use_nlp, layout, pages)}+{rules.fingerprint}"
@@ -0,0 +1,215 @@
+"""열 지향(CSV/Parquet) 배치 출력.
+
+문서마다 결과 JSON 파일을 하나씩 쓰는 대신, 결과를 평탄화한 행으로 메모리에 모았다가
+row_group_size 건마다 한 번에 기록한다(파일 1개, 열기/교체 1회).
+
+- 행: 입력 파일명(source) + 텍스트 필드 + weights를 펼친 정수 열(weight_total 등)
+  (중복 스캔 표시를 켜면 대표 문서 파일명 열 duplicate_of를 덧붙인다. 대표/단독 문서는 빈 문자열)
+- CSV: pandas.DataFrame.to_csv로 묶음마다 이어 쓴다(헤더는 첫 묶음에만).
+- Parquet: 묶음 하나가 row group 하나가 되도록 pyarrow ParquetWriter로 이어 쓴다
+  (pandas.to_parquet은 파일 전체를 한 번에 쓰므로 이어 쓰기가 안 된다).
+
+pandas/pyarrow는 이 출력 모드에서만 필요하므로 지연 import한다.
+결과는 임시 파일에 쓴 뒤 close()에서 교체해, 중단되어도 반쯤 쓴 파일이 남지 않는다.
+"""
+import os
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+from src.utils import metrics
+
+# 기본 row group(묶음) 크기
+DEFAULT_ROW_GROUP_SIZE = 10_000
+FORMATS = ("csv", "parquet")
+
+# (열 이름, 타입) – 타입은 "str" 또는 "int64"
+COLUMNS: Tuple[Tuple[str, str], ...] = (
+    ("source", "str"),
+    ("car_number", "str"),
+    ("date", "str"),
+    ("issuer_name", "str"),
+    ("issuer_address", "str"),
+    ("client_name", "str"),
+    ("weight_unit", "str"),
+    ("weight_total", "int64"),
+    ("weight_empty", "int64"),
+    ("weight_net", "int64"),
+    ("rules_version", "str"),
+)
+DUPLICATE_COLUMN: Tuple[str, str] = ("duplicate_of", "str")
+_TEXT_FIELDS = ("car_number", "date", "issuer_name", "issuer_address", "client_name")
+_WEIGHT_KEYS = ("total", "empty", "net")
+
+
+def _import_pandas():
+    try:
+        import pandas as pd
+    except ImportError as e:  # pragma: no cover - 환경 의존
+        raise ImportError(
+            "pandas가 설치되어 있지 않습니다. CSV/Parquet 출력을 사용하려면 'pip install -r requirements.txt'를 실행하세요."
+        ) from e
+    return pd
+
+
+def _import_parquet():
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:  # pragma: no cover - 환경 의존
+        raise ImportError(
+            "pyarrow가 설치되어 있지 않습니다. Parquet 출력을 사용하려면 'pip install -r requirements.txt'"
+            "(또는 'pip install pyarrow')를 실행하세요(CSV 출력은 pandas만 필요)."
+        ) from e
+    return pa, pq
+
+
+def check_format(fmt: str) -> None:
+    """fmt 출력에 필요한 패키지가 있는지 확인한다(없으면 설치 방법을 담은 ImportError)."""
+    _import_pandas()
+    if fmt == "parquet":
+        _import_parquet()
+
+
+def format_for(path: Union[str, Path]) -> str:
+    """파일 확장자로 출력 형식을 정한다(.csv / .parquet, .pq)."""
+    suffix = Path(path).suffix.lower()
+    if suffix == ".csv":
+        return "csv"
+    if suffix in (".parquet", ".pq"):
+        return "parquet"
+    raise ValueError(f"출력 형식을 알 수 없는 확장자입니다: {path} (.csv 또는 .parquet)")
+
+
+def flatten_result(source: str, extracted: dict) -> Dict[str, object]:
+    """추출 결과 한 건 → 한 행(weights는 정수 열로 펼친다)."""
+    weights = extracted.get("weights") or {}
+    row: Dict[str, object] = {"source": source}
+    for field in _TEXT_FIELDS:
+        row[field] = extracted.get(field, "N/A")
+    row["weight_unit"] = weights.get("unit", "kg")
+    for key in _WEIGHT_KEYS:
+        row[f"weight_{key}"] = int(weights.get(key, 0) or 0)
+    row["rules_version"] = extracted.get("rules_version", "")
+    return row
+
+
+class ColumnarWriter:
+    """결과를 열 단위 버퍼에 모아 row_group_size 건마다 CSV/Parquet로 기록한다.
+
+    with 문으로 쓰면 정상 종료 시 파일을 교체하고, 예외 시 임시 파일을 지운다.
+    mark_duplicates면 duplicate_of 열을 추가한다(write의 duplicate_of 인자).
+    """
+
+    def __init__(self, path: Union[str, Path], fmt: Optional[str] = None,
+                 row_group_size: int = DEFAULT_ROW_GROUP_SIZE, mark_duplicates: bool = False):
+        self.path = Path(path)
+        self.fmt = fmt or format_for(self.path)
+        if self.fmt not in FORMATS:
+            raise ValueError(f"지원하지 않는 출력 형식입니다: {self.fmt} ({', '.join(FORMATS)})")
+        if row_group_size < 1:
+            raise ValueError("row_group_size는 1 이상이어야 합니다")
+        self.row_group_size = row_group_size
+        self.columns = COLUMNS + (DUPLICATE_COLUMN,) if mark_duplicates else COLUMNS
+        self.rows_written = 0
+        self.row_groups = 0
+
+        # 의존성은 첫 기록 전에 확인해, 처리를 다 하고 나서 실패하지 않게 한다
+        self._pd = _import_pandas()
+        self._pa = self._pq = None
+        if self.fmt == "parquet":
+            self._pa, self._pq = _import_parquet()
+
+        self._buffer: Dict[str, List[object]] = {name: [] for name, _ in self.columns}
+        self._pending = 0
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._tmp_path = self.path.with_name(self.path.name + ".tmp")
+        self._file = None      # CSV 파일 핸들
+        self._pq_writer = None  # Parquet 작성기
+
+    # ── 기록 ─────────────────────────────────────────────────
+    def write(self, source: str, extracted: dict, duplicate_of: Optional[str] = None) -> None:
+        """결과 한 건을 버퍼에 넣고, 묶음이 차면 기록한다."""
+        buffer = self._buffer
+        for name, value in flatten_result(source, extracted).items():
+            buffer[name].append(value)
+        if "duplicate_of" in buffer:
+            buffer["duplicate_of"].append(duplicate_of or "")
+        self._pending += 1
+        if self._pending >= self.row_group_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """버퍼에 모인 행을 묶음(row group) 하나로 기록한다."""
+        if not self._pending:
+            return
+        m = metrics.ACTIVE
+        if m is not None:
+            t0 = time.perf_counter()
+        frame = self._frame()
+        if self.fmt == "csv":
+            if self._file is None:
+                self._file = open(self._tmp_path, "w", encoding="utf-8", newline="")
+            frame.to_csv(self._file, header=self.row_groups == 0, index=False)
+        else:
+            table = self._pa.Table.from_pandas(frame, schema=self._schema(), preserve_index=False)
+            if self._pq_writer is None:
+                self._pq_writer = self._pq.ParquetWriter(str(self._tmp_path), table.schema)
+            self._pq_writer.write_table(table)
+        self.rows_written += self._pending
+        self.row_groups += 1
+        self._buffer = {name: [] for name, _ in self.columns}
+        self._pending = 0
+        if m is not None:
+            m.observe("write_batch", time.perf_counter() - t0)
+
+    def close(self) -> Path:
+        """남은 행을 기록하고 결과 파일로 교체한다. 결과가 0건이어도 헤더/스키마만 있는 파일을 남긴다."""
+        self.flush()
+        if self._file is None and self._pq_writer is None:
+            self._write_empty()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if self._pq_writer is not None:
+            self._pq_writer.close()
+            self._pq_writer = None
+        os.replace(self._tmp_path, self.path)
+        return self.path
+
+    def abort(self) -> None:
+        """기록을 중단하고 임시 파일을 지운다(기존 결과 파일은 그대로 둔다)."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if self._pq_writer is not None:
+            self._pq_writer.close()
+            self._pq_writer = None
+        self._tmp_path.unlink(missing_ok=True)
+
+    def __enter__(self) -> "ColumnarWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    # ── 내부 ─────────────────────────────────────────────────
+    def _frame(self):
+        pd = self._pd
+        return pd.DataFrame({
+            name: pd.Series(self._buffer[name], dtype="int64" if kind == "int64" else object)
+            for name, kind in self.columns
+        })
+
+    def _schema(self):
+        pa = self._pa
+        return pa.schema([(name, pa.int64() if kind == "int64" else pa.string()) for name, kind in self.columns])
+
+    def _write_empty(self) -> None:
+        if self.fmt == "csv":
+            self._frame().to_csv(self._tmp_path, index=False)
+        else:
+            self._pq.write_table(self._schema().empty_table(), str(self._tmp_path))
@@ -0,0 +1,341 @@
+"""대용량 JSONL 코퍼스 리더: mmap + 줄 시작 오프셋 인덱스 + 체크포인트.
+
+수십 GB짜리 OCR 덤프(한 줄에 응답 하나)를 한 프로세스가 처음부터 끝까지 읽지 않아도 되게 한다.
+
+- 인덱스: 줄 시작 바이트 오프셋 배열(array('Q'), 줄당 8바이트). 처음 한 번 파일을 mmap으로
+  훑어(줄바꿈 검색은 C 수준) 만들고 <입력>.idx에 저장한다. 입력 크기·수정 시각이 같으면 다음 실행과
+  워커는 인덱스 파일만 읽는다. 레코드 i는 mm[off[i]:off[i + 1]]로 O(1)에 꺼낸다.
+- 샤드: 바이트 크기가 고르게 나뉘도록 레코드 범위를 자른다(오프셋 배열 이분 탐색). 워커는
+  (시작, 끝) 범위만 받아 각자 파일을 mmap하므로 부모가 본문을 읽어 나눠 주지 않는다.
+- 체크포인트: checkpoint_every건마다 출력을 flush+fsync한 뒤 (다음 레코드, 출력 바이트 수)를 JSON으로
+  원자적으로 기록한다. 중단 후 같은 명령으로 다시 실행하면 출력을 기록된 길이로 자르고 다음 레코드부터
+  이어서 처리한다. 끝까지 처리하면 체크포인트를 지운다.
+
+레코드 식별자는 JSONL 스트리밍 모드와 같은 '<입력>:<줄번호>'다.
+"""
+import json
+import logging
+import mmap
+import os
+import shutil
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Iterator, List, Optional, Tuple, Union
+
+from src.pipeline import parallel
+from src.pipeline.result_cache import DEFAULT_MAX_ENTRIES
+from src.pipeline.pages import PageMode
+from src.pipeline.routing import RoutePolicy
+from src.pipeline.streaming import STDIO, format_result, iter_results, parse_record
+from src.utils import metrics
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHECKPOINT_EVERY = 1000
+
+_INDEX_MAGIC = b"OCRIDX1\n"
+# 입력 크기, 입력 수정 시각(ns), 줄 수 – 오프셋은 리틀 엔디언 uint64
+_INDEX_HEADER = struct.Struct("<QqQ")
+_BIG_ENDIAN = sys.byteorder == "big"
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """임시 파일에 쓴 뒤 교체한다(중단되어도 반쯤 쓴 파일이 남지 않게)."""
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+class LineIndex:
+    """줄 시작 바이트 오프셋. 마지막 원소는 파일 크기라서 줄 i는 [offsets[i], offsets[i + 1])이다."""
+
+    def __init__(self, offsets: array, size: int, mtime_ns: int):
+        self.offsets = offsets
+        self.size = size
+        self.mtime_ns = mtime_ns
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    @classmethod
+    def build(cls, buf: Union[bytes, mmap.mmap], size: int, mtime_ns: int) -> "LineIndex":
+        """buf(파일 전체)를 한 번 훑어 줄 시작 위치를 모은다(마지막 줄은 줄바꿈이 없어도 된다)."""
+        offsets = array("Q", [0])
+        if size:
+            find, append = buf.find, offsets.append
+            pos = find(b"\n")
+            while pos != -1 and pos + 1 < size:
+                append(pos + 1)
+                pos = find(b"\n", pos + 1)
+            append(size)
+        return cls(offsets, size, mtime_ns)
+
+    def save(self, path: Union[str, Path]) -> None:
+        offsets = self.offsets
+        if _BIG_ENDIAN:
+            offsets = array("Q", offsets)
+            offsets.byteswap()
+        header = _INDEX_MAGIC + _INDEX_HEADER.pack(self.size, self.mtime_ns, len(self))
+        _write_atomic(Path(path), header + offsets.tobytes())
+
+    @classmethod
+    def load(cls, path: Union[str, Path], size: int, mtime_ns: int) -> Optional["LineIndex"]:
+        """저장된 인덱스가 입력 크기·수정 시각과 맞을 때만 불러온다(없거나 다르면 None)."""
+        try:
+            with open(path, "rb") as f:
+                magic = f.read(len(_INDEX_MAGIC))
+                header = f.read(_INDEX_HEADER.size)
+                body = f.read()
+        except OSError:
+            return None
+        if magic != _INDEX_MAGIC or len(header) != _INDEX_HEADER.size:
+            return None
+        indexed_size, indexed_mtime, count = _INDEX_HEADER.unpack(header)
+        if (indexed_size, indexed_mtime) != (size, mtime_ns) or len(body) != (count + 1) * 8:
+            return None
+        offsets = array("Q")
+        offsets.frombytes(body)
+        if _BIG_ENDIAN:
+            offsets.byteswap()
+        return cls(offsets, size, mtime_ns)
+
+    def shard(self, n: int) -> List[Tuple[int, int]]:
+        """레코드 범위 (시작, 끝) 최대 n개. 바이트 크기가 고르게 나뉘고 빈 범위는 뺀다."""
+        if n < 1:
+            raise ValueError("샤드 수는 1 이상이어야 합니다")
+        count = len(self)
+        bounds = [0]
+        for k in range(1, n):
+            # 목표 바이트 위치 이후 처음 시작하는 줄에서 자른다
+            i = bisect_left(self.offsets, self.size * k // n, 0, count)
+            bounds.append(max(i, bounds[-1]))
+        bounds.append(count)
+        return [(a, b) for a, b in zip(bounds, bounds[1:]) if a < b]
+
+
+class Corpus:
+    """mmap으로 연 JSONL 입력과 그 줄 인덱스(with 문으로 닫는다).
+
+    index_path: 인덱스 파일 경로(기본 <입력>.idx). 저장에 실패하면(읽기 전용 위치 등) 경고만 남긴다.
+    source: 레코드 식별자 앞부분(기본 입력 경로)
+    """
+
+    def __init__(self, path: Union[str, Path], index_path: Optional[Union[str, Path]] = None,
+                 source: Optional[str] = None):
+        self.path = Path(path)
+        self.source = source or str(path)
+        self.index_path = Path(index_path) if index_path else self.path.with_name(self.path.name + ".idx")
+        self._file = open(self.path, "rb")
+        st = os.fstat(self._file.fileno())
+        # 빈 파일은 mmap할 수 없다
+        self._mm: Union[bytes, mmap.mmap] = (
+            mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if st.st_size else b""
+        )
+        index = LineIndex.load(self.index_path, st.st_size, st.st_mtime_ns)
+        if index is None:
+            m = metrics.ACTIVE
+            if m is None:
+                index = LineIndex.build(self._mm, st.st_size, st.st_mtime_ns)
+            else:
+                with m.time("index"):
+                    index = LineIndex.build(self._mm, st.st_size, st.st_mtime_ns)
+            try:
+                index.save(self.index_path)
+            except OSError as e:
+                logger.warning("줄 인덱스 저장 실패: %s (다음 실행에서 다시 만듦)", e)
+        self.index = index
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def record_id(self, i: int) -> str:
+        return f"{self.source}:{i + 1}"
+
+    def line(self, i: int) -> bytes:
+        """i번째 줄(0부터, 줄바꿈 포함)의 원본 바이트."""
+        offsets = self.index.offsets
+        return self._mm[offsets[i]:offsets[i + 1]]
+
+    def record(self, i: int) -> Optional[dict]:
+        """i번째 레코드의 OCR dict(빈 줄/손상 줄은 None)."""
+        line = self.line(i).strip()
+        return parse_record(line, self.record_id(i)) if line else None
+
+    def iter_records(self, start: int = 0, stop: Optional[int] = None) -> Iterator[Tuple[str, dict]]:
+        """[start, stop) 레코드를 (식별자, OCR dict)로. 빈 줄/손상 줄은 건너뛴다."""
+        offsets, mm, source = self.index.offsets, self._mm, self.source
+        stop = len(self) if stop is None else min(stop, len(self))
+        for i in range(start, stop):
+            line = mm[offsets[i]:offsets[i + 1]].strip()
+            if not line:
+                continue
+            record_id = f"{source}:{i + 1}"
+            data = parse_record(line, record_id)
+            if data is not None:
+                yield record_id, data
+
+    def close(self) -> None:
+        if isinstance(self._mm, mmap.mmap):
+            self._mm.close()
+        self._file.close()
+
+    def __enter__(self) -> "Corpus":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+class Checkpoint:
+    """레코드 범위 하나의 처리 위치(다음 레코드, 출력 바이트 수)를 JSON 파일로 기록한다.
+
+    입력 경로·크기·수정 시각과 범위를 함께 기록해, 다른 입력이나 다른 샤드 구성에서 이어 쓰지 않게 한다.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+
+    @staticmethod
+    def _identity(corpus: Corpus, start: int, stop: int) -> dict:
+        return {"source": str(corpus.path.resolve()), "size": corpus.index.size,
+                "mtime_ns": corpus.index.mtime_ns, "start": start, "stop": stop}
+
+    def load(self, corpus: Corpus, start: int, stop: int) -> Optional[Tuple[int, int]]:
+        """(다음 레코드, 출력 바이트 수). 체크포인트가 없으면 None, 다른 입력/범위의 것이면 ValueError."""
+        try:
+            state = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        if any(state.get(key) != value for key, value in self._identity(corpus, start, stop).items()):
+            raise ValueError(f"체크포인트 {self.path}는 다른 입력 또는 레코드 범위의 것입니다 "
+                             "(입력이나 --workers가 바뀌었으면 체크포인트와 출력을 지우고 다시 실행하세요)")
+        return state["next"], state["output_bytes"]
+
+    def save(self, corpus: Corpus, start: int, stop: int, next_record: int, output_bytes: int) -> None:
+        state = {**self._identity(corpus, start, stop), "next": next_record, "output_bytes": output_bytes}
+        _write_atomic(self.path, json.dumps(state).encode("utf-8"))
+
+    def remove(self) -> None:
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def _commit(out) -> None:
+    out.flush()
+    os.fsync(out.fileno())
+
+
+def stream_corpus(corpus: Corpus, dest: str, extractor: Any, start: int = 0, stop: Optional[int] = None,
+                  checkpoint: Optional[Union[str, Path]] = None,
+                  checkpoint_every: int = DEFAULT_CHECKPOINT_EVERY) -> int:
+    """corpus의 [start, stop) 레코드를 처리해 dest(JSONL 파일 또는 '-')에 기록하고, 이번 실행에서 기록한 건수를 반환한다.
+
+    checkpoint(파일 출력 전용)가 있으면 checkpoint_every건마다 위치를 기록하고, 체크포인트가 남아 있으면
+    그 위치부터 이어서 처리한다. 끝까지 처리하면 체크포인트를 지운다.
+    """
+    if checkpoint_every < 1:
+        raise ValueError("checkpoint_every는 1 이상이어야 합니다")
+    stop = len(corpus) if stop is None else min(stop, len(corpus))
+    ckpt = Checkpoint(checkpoint) if checkpoint else None
+    if ckpt is not None and dest == STDIO:
+        raise ValueError("체크포인트는 파일 출력에서만 사용할 수 있습니다")
+    resume = ckpt.load(corpus, start, stop) if ckpt is not None else None
+
+    next_record, output_bytes = resume or (start, 0)
+    if dest == STDIO:
+        out, owned = sys.stdout.buffer, False
+    elif resume is not None:
+        if not os.path.exists(dest) or os.path.getsize(dest) < output_bytes:
+            raise ValueError(f"체크포인트에 기록된 출력이 없거나 짧습니다: {dest} (체크포인트를 지우고 다시 실행하세요)")
+        logger.info("체크포인트에서 재개: %s 레코드 %d/%d부터", corpus.source, next_record, stop)
+        out, owned = open(dest, "r+b"), True
+        # 마지막 체크포인트 이후 쓰다 만 결과는 버리고 다시 만든다
+        out.truncate(output_bytes)
+        out.seek(output_bytes)
+    else:
+        out, owned = open(dest, "wb"), True
+
+    count = 0
+    try:
+        for record_id, extracted in iter_results(corpus.iter_records(next_record, stop), extractor):
+            out.write(format_result(record_id, extracted).encode("utf-8"))
+            count += 1
+            if ckpt is not None and count % checkpoint_every == 0:
+                _commit(out)
+                # 식별자의 줄 번호(1부터) = 다음 레코드 번호(0부터)
+                ckpt.save(corpus, start, stop, int(record_id.rpartition(":")[2]), out.tell())
+        out.flush()
+    finally:
+        if owned:
+            out.close()
+    if ckpt is not None:
+        ckpt.remove()
+    return count
+
+
+def _stream_shard_in_worker(src: str, index_path: Optional[str], source: str, start: int, stop: int,
+                            part: str, part_checkpoint: Optional[str],
+                            checkpoint_every: int) -> Tuple[int, Optional[metrics.Metrics]]:
+    with Corpus(src, index_path, source) as corpus:
+        count = stream_corpus(corpus, part, parallel._WORKER_EXTRACTOR, start, stop,
+                              part_checkpoint, checkpoint_every)
+    m = metrics.ACTIVE
+    return count, (m.drain() if m is not None else None)
+
+
+def stream_corpus_parallel(src: str, dest: str, workers: int, use_nlp: bool = False,
+                           cache_path: Optional[str] = None, cache_size: int = DEFAULT_MAX_ENTRIES,
+                           layout: bool = False, rules: Optional[str] = None, rules_reload: float = 0.0,
+                           checkpoint: Optional[str] = None,
+                           checkpoint_every: int = DEFAULT_CHECKPOINT_EVERY,
+                           index_path: Optional[str] = None, route: Optional[RoutePolicy] = None,
+                           pages: Optional[PageMode] = None) -> int:
+    """입력을 바이트 크기 기준 샤드 workers개로 나눠 프로세스 풀에서 처리하고, 기록한 건수를 반환한다.
+
+    샤드 k는 <dest>.part<k>(체크포인트는 <checkpoint>.part<k>)에 기록하고, 모두 끝나면 순서대로 dest에
+    이어 붙인 뒤 지운다. 중단 후 같은 workers로 다시 실행하면 샤드마다 체크포인트부터 이어서 처리한다.
+    """
+    if dest == STDIO:
+        raise ValueError("샤드 병렬 처리는 파일 출력에서만 사용할 수 있습니다")
+    # 부모는 인덱스만 만들거나 읽어 샤드를 정한다(워커는 저장된 인덱스를 읽음)
+    with Corpus(src, index_path) as corpus:
+        shards = corpus.index.shard(workers)
+        index_file = str(corpus.index_path)
+    parts = [f"{dest}.part{k}" for k in range(len(shards))]
+    part_checkpoints = [f"{checkpoint}.part{k}" if checkpoint else None for k in range(len(shards))]
+
+    parent_metrics = metrics.ACTIVE
+    total = 0
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=parallel._init_worker,
+        initargs=(use_nlp, None, cache_path, cache_size, parent_metrics is not None, layout, rules, rules_reload,
+                  route, pages),
+    ) as executor:
+        futures = [
+            executor.submit(_stream_shard_in_worker, src, index_file, src, start, stop, part, part_ckpt,
+                            checkpoint_every)
+            for (start, stop), part, part_ckpt in zip(shards, parts, part_checkpoints)
+        ]
+        for future in futures:
+            count, worker_metrics = future.result()
+            total += count
+            if worker_metrics is not None and parent_metrics is not None:
+                parent_metrics.merge(worker_metrics)
+
+    with open(dest, "wb") as out:
+        for part in parts:
+            with open(part, "rb") as f:
+                shutil.copyfileobj(f, out)
+    for part in parts:
+        os.unlink(part)
+    return total
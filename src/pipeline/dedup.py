@@ -0,0 +1,155 @@
+"""배치 내 중복 스캔 탐지(같은 계량을 두세 번 스캔한 문서).
+
+같은 계근지를 다시 스캔하면 OCR 노이즈(장식 기호, 공백, 글자 탈락, 노이즈 줄)만 다르고
+숫자(날짜·시각·차량번호·무게)는 같다. 문서마다 원문 text로 지문을 만들어 묶음(window) 안에서
+중복을 찾고, 중복 묶음(클러스터)마다 처음 나온 문서 하나만 추출한다.
+
+- 블록 키: text의 숫자만 순서대로 이어 붙인 문자열('13 460 kg'과 '13,460kg'은 같은 키).
+  숫자가 하나라도 다르면 다른 계량으로 본다(숫자 오인식이 있는 사본은 어느 쪽이 맞는지
+  알 수 없으므로 합치지 않는다). 숫자가 MIN_DIGITS자 미만인 문서는 항상 따로 추출한다.
+- 텍스트 유사도: 정규화(소문자화, 글자 외 문자 제거)한 텍스트의 글자 SHINGLE-gram
+  집합 Jaccard가 threshold 이상이면 중복이다. 숫자는 블록 키에서 이미 같으므로 글자만 비교한다.
+  shingle 집합은 같은 블록에 두 번째 문서가 들어올 때만 만든다(대부분의 문서는 숫자 키 조회만 한다).
+
+블록 조회가 해시 한 번이라 묶음 크기에 선형이고, 블록 안에서는 대표 문서하고만 비교한다.
+"""
+import re
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple
+
+from src.pipeline.document import (
+    WarningRecord, collect_warnings, output_path_for, process_file, read_document, write_result_json,
+)
+from src.utils import metrics
+
+DEFAULT_THRESHOLD = 0.5
+# 한 번에 지문을 들고 비교하는 문서 수(이 범위 안의 중복만 찾는다)
+DEFAULT_WINDOW = 10_000
+MIN_DIGITS = 12
+SHINGLE = 3
+
+_NON_LETTER_RE = re.compile(r"[\W\d_]+")
+_NON_DIGIT_RE = re.compile(r"\D+")
+
+
+def number_key(text: str) -> str:
+    """text의 숫자만 순서대로 이어 붙인 문자열('13 460 kg'과 '13,460kg'은 같은 키)."""
+    return _NON_DIGIT_RE.sub("", text)
+
+
+def normalize(text: str) -> str:
+    """소문자화하고 글자가 아닌 문자(숫자, 공백, 줄바꿈, 기호)를 지운다('총 중 량 : 13,460 kg' → '총중량kg')."""
+    return _NON_LETTER_RE.sub("", text.lower())
+
+
+def shingles(normalized: str, k: int = SHINGLE) -> FrozenSet[str]:
+    """글자 k-gram 집합."""
+    if len(normalized) <= k:
+        return frozenset((normalized,))
+    return frozenset([normalized[i:i + k] for i in range(len(normalized) - k + 1)])
+
+
+def jaccard(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    """두 shingle 집합의 Jaccard 유사도(둘 다 비었으면 1)."""
+    union = len(a | b)
+    return len(a & b) / union if union else 1.0
+
+
+class _Representative:
+    __slots__ = ("doc_id", "text", "_shingles")
+
+    def __init__(self, doc_id: str, text: Optional[str], doc_shingles: Optional[FrozenSet[str]] = None):
+        self.doc_id = doc_id
+        self.text = text
+        self._shingles = doc_shingles
+
+    def shingles(self) -> FrozenSet[str]:
+        if self._shingles is None:
+            self._shingles = shingles(normalize(self.text))
+            self.text = None
+        return self._shingles
+
+
+class DuplicateIndex:
+    """문서를 차례로 넣으며 앞서 넣은 문서와의 중복 여부를 판정하는 인덱스.
+
+    add()는 중복이면 대표 문서 id를, 아니면 None을 반환한다(이 문서가 새 대표가 된다).
+    """
+
+    def __init__(self, threshold: float = DEFAULT_THRESHOLD):
+        if not 0.0 < threshold <= 1.0:
+            raise ValueError("threshold는 0보다 크고 1 이하여야 합니다")
+        self.threshold = threshold
+        self._blocks: Dict[str, List[_Representative]] = {}
+        self.documents = 0
+        self.duplicates = 0
+
+    def add(self, doc_id: str, text: str) -> Optional[str]:
+        self.documents += 1
+        key = number_key(text)
+        if len(key) < MIN_DIGITS:
+            return None
+        reps = self._blocks.get(key)
+        if reps is None:
+            # shingle 집합은 같은 블록에 다른 문서가 들어올 때 만든다(원문만 보관)
+            self._blocks[key] = [_Representative(doc_id, text)]
+            return None
+        doc_shingles = shingles(normalize(text))
+        for rep in reps:
+            if jaccard(doc_shingles, rep.shingles()) >= self.threshold:
+                self.duplicates += 1
+                return rep.doc_id
+        reps.append(_Representative(doc_id, None, doc_shingles))
+        return None
+
+    def clear(self) -> None:
+        """다음 묶음을 위해 지문을 비운다(카운터는 유지)."""
+        self._blocks.clear()
+
+
+class Deduplicator:
+    """파일을 한 번씩 읽으며 중복 스캔은 추출하지 않고 대표 문서의 결과를 재사용한다.
+
+    결과는 입력 순서대로 (파일명, 추출 결과, 경고)로 돌려준다. 중복 문서의 결과 JSON에는
+    duplicate_of(대표 파일명)를 함께 기록하고, 그 대응은 duplicate_of 속성에도 남긴다.
+    대표 문서의 결과는 현재 묶음(window) 동안만 보관한다.
+    """
+
+    def __init__(self, extractor: Any, output_dir: Optional[Path], threshold: float = DEFAULT_THRESHOLD,
+                 window: int = DEFAULT_WINDOW):
+        if window < 1:
+            raise ValueError("window는 1 이상이어야 합니다")
+        self.extractor = extractor
+        self.output_dir = output_dir
+        self.window = window
+        self.index = DuplicateIndex(threshold)
+        # 중복 파일명 → 대표 파일명
+        self.duplicate_of: Dict[str, str] = {}
+
+    def process(self, json_files: Iterable[Path]) -> Iterator[Tuple[str, dict, List[WarningRecord]]]:
+        extractor, output_dir = self.extractor, self.output_dir
+        results: Dict[str, dict] = {}
+        for i, json_file in enumerate(json_files):
+            json_file = Path(json_file)
+            if i and i % self.window == 0:
+                self.index.clear()
+                results.clear()
+            data = read_document(json_file, extractor)
+            m = metrics.ACTIVE
+            if m is None:
+                rep = self.index.add(json_file.name, data.get("text") or "")
+            else:
+                with m.time("fingerprint"):
+                    rep = self.index.add(json_file.name, data.get("text") or "")
+            if rep is None:
+                name, extracted, warnings = process_file(json_file, extractor, output_dir, data=data)
+                results[name] = extracted
+                yield name, extracted, warnings
+                continue
+            extracted = results[rep]
+            self.duplicate_of[json_file.name] = rep
+            if m is not None:
+                m.incr("duplicates")
+            if output_dir is not None:
+                write_result_json(extracted, output_path_for(json_file, output_dir), duplicate_of=rep)
+            yield json_file.name, extracted, collect_warnings(json_file.name, extracted)
@@ -0,0 +1,215 @@
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, List, Optional, Tuple, Union
+
+from src.parser.cleaner import clean_text
+from src.parser.extractor import OcrExtractor
+from src.parser.result import ExtractionResult, as_dict
+from src.parser.rule_pack import DEFAULT_PACK, refresh_rules, use_rules
+from src.pipeline.ocr_reader import read_ocr_fields
+from src.pipeline.pages import PageExtractor, PageMode
+from src.pipeline.result_cache import DEFAULT_MAX_ENTRIES, CachedExtractor, open_cache
+from src.pipeline.routing import RoutePolicy, RoutingExtractor
+from src.utils import metrics
+
+logger = logging.getLogger(__name__)
+
+# 경고 메시지: (포맷 문자열, 인자 튜플) – 로깅 시점까지 포맷팅을 미룬다.
+WarningRecord = Tuple[str, tuple]
+
+
+def resolve_use_nlp(use_nlp: bool = False) -> bool:
+    """플래그 또는 환경변수 USE_NLP로 NLP 보조 모드 사용 여부를 결정한다."""
+    return use_nlp or str(os.getenv("USE_NLP", "")).lower() in {"1", "true", "yes", "on"}
+
+
+def build_extractor(use_nlp: bool = False, cache_path: Optional[str] = None,
+                    cache_size: int = DEFAULT_MAX_ENTRIES, layout: bool = False,
+                    rules: Optional[str] = None, rules_reload: float = 0.0,
+                    route: Optional[RoutePolicy] = None, pages: Optional[PageMode] = None) -> Any:
+    """추출기를 구성한다. NLP 초기화 실패 시 기본 추출기로 폴백한다.
+
+    rules(팩 이름 또는 경로)나 rules_reload(초)가 주어지면 이 프로세스의 활성 규칙 팩을 정한다
+    (컴파일 아티팩트 사용, rules_reload > 0이면 그 간격으로 파일 변경을 확인해 핫 리로드).
+
+    cache_path가 주어지면 결과 캐시(CachedExtractor)로 감싼다. 캐시 버전은
+    실제로 구성된 모드(기본/NLP)의 규칙 지문을 따른다.
+    layout이면 단어 상자 기반 보정(LayoutExtractor)을 가장 바깥에 씌운다
+    (텍스트 추출 결과만 캐시되고, 레이아웃 보정은 문서마다 수행).
+    route(RoutePolicy)가 주어지면 기본 모드 추출기를 RoutingExtractor로 감싸 어려운 문서만 NLP 보조로
+    올린다(use_nlp면 모든 문서가 NLP 모드이므로 무시).
+    pages(PageMode)가 주어지면 여러 페이지 문서를 페이지 단위로 추출하는 PageExtractor로 감싼다
+    (기본 모드 전용, 경로 선택보다 안쪽: 페이지 단위 결과를 보고 에스컬레이션한다).
+    파이프라인 결과는 ExtractionResult(슬롯 기반, dict 호환)이며 저장 시 dict/압축 JSON으로 직렬화한다.
+    """
+    started = time.perf_counter()
+    if rules or rules_reload:
+        use_rules(rules or DEFAULT_PACK, check_interval=rules_reload)
+    extractor = None
+    if use_nlp:
+        try:
+            # lazy import: 기본 모드에서는 spaCy를 import하지 않는다
+            from src.nlp.engine import load_nlp
+            from src.parser.extractor_nlp_wrapper import OcrExtractorWithNlp
+            nlp = load_nlp()
+            extractor = OcrExtractorWithNlp(base=OcrExtractor(typed=True), nlp=nlp)
+            logger.info("NLP 보조 모드 활성화: EntityRuler 적용")
+        except Exception as e:
+            logger.warning("NLP 보조 모드 초기화 실패: %s (기본 모드로 진행)", e)
+    nlp_active = extractor is not None
+    if extractor is None:
+        extractor = OcrExtractor(typed=True)
+    logger.info("추출기 초기화(%s 모드): %.1f ms", "NLP" if nlp_active else "기본",
+                (time.perf_counter() - started) * 1000)
+
+    if cache_path:
+        cache = open_cache(cache_path, use_nlp=nlp_active, max_entries=cache_size)
+        extractor = CachedExtractor(extractor, cache)
+
+    if layout:
+        try:
+            from src.parser.layout import LayoutExtractor  # lazy import (NumPy)
+            extractor = LayoutExtractor(extractor)
+            logger.info("레이아웃 모드 활성화: 단어 상자 공간 인덱스 적용")
+        except ImportError as e:
+            logger.warning("레이아웃 모드 초기화 실패: %s (텍스트 경로로 진행)", e)
+
+    if pages is not None and not nlp_active:
+        extractor = PageExtractor(extractor, pages)
+        logger.info("페이지 단위 추출 활성화: %s, 페이지 워커 %d개",
+                    "필수 필드 확정 시 중단" if pages.early_exit else "모든 페이지", pages.workers)
+
+    if route is not None and not nlp_active:
+        extractor = RoutingExtractor(extractor, route)
+        logger.info("문서별 경로 선택 활성화: confidence < %s 또는 %s N/A 문서만 NLP 보조",
+                    route.min_confidence, "/".join(route.required))
+    return extractor
+
+
+def collect_warnings(name: str, extracted: dict) -> List[WarningRecord]:
+    """필드 누락/무게 산술 불일치 경고를 수집한다(로깅은 호출 측에서)."""
+    warnings: List[WarningRecord] = []
+
+    # 필드 누락 경고
+    if extracted['car_number'] == "N/A":
+        warnings.append(("[%s] 차량번호 추출 실패", (name,)))
+    if extracted['date'] == "N/A":
+        warnings.append(("[%s] 날짜 추출 실패", (name,)))
+
+    # 무게 검증
+    w = extracted['weights']
+    if w['total'] > 0 and w['empty'] > 0 and w['net'] > 0:
+        if w['total'] != w['empty'] + w['net']:
+            warnings.append((
+                "[%s] 무게 산술 불일치: total(%d) != empty(%d) + net(%d)",
+                (name, w['total'], w['empty'], w['net']),
+            ))
+    return warnings
+
+
+# N/A 계측 대상 필드
+TEXT_FIELDS = ("car_number", "date", "issuer_name", "issuer_address", "client_name")
+
+
+def count_missing_fields(m: "metrics.Metrics", extracted: dict) -> None:
+    """문서 수와 최종 결과에서 N/A(무게는 0)로 남은 필드 수를 센다."""
+    m.incr("documents")
+    for field in TEXT_FIELDS:
+        if extracted.get(field) == "N/A":
+            m.incr("field_na", field=field)
+    for key, value in extracted.get("weights", {}).items():
+        if value == 0:
+            m.incr("field_na", field=f"weights.{key}")
+
+
+def extract_document(data: dict, extractor: Any) -> dict:
+    """OCR 응답(dict)의 text 필드를 정제 후 추출한다.
+
+    추출기가 응답 전체를 받는 extract_response(레이아웃 모드, 문서별 경로 선택, 페이지 단위 추출)를
+    제공하면 그쪽에 맡긴다.
+    문서 경계이므로 여기서 규칙 팩 리로드를 확인한다(정제와 추출이 같은 규칙 스냅숏을 쓴다).
+    """
+    refresh_rules()
+    m = metrics.ACTIVE
+    extract_response = getattr(extractor, "extract_response", None)
+    if extract_response is not None:
+        if m is None:
+            return extract_response(data)
+        with m.time("extract_layout"):
+            extracted = extract_response(data)
+        count_missing_fields(m, extracted)
+        return extracted
+
+    raw_text = data.get('text', '')
+    if m is None:
+        return extractor.extract(clean_text(raw_text))
+    with m.time("clean"):
+        cleaned = clean_text(raw_text)
+    with m.time("extract"):
+        extracted = extractor.extract(cleaned)
+    count_missing_fields(m, extracted)
+    return extracted
+
+
+def output_path_for(json_file: Path, output_dir: Path) -> Path:
+    """입력 파일에 대응하는 결과 JSON 경로."""
+    return Path(output_dir) / f"{Path(json_file).stem}_result.json"
+
+
+def write_result_json(extracted: Union[dict, ExtractionResult], output_path: Path,
+                      duplicate_of: Optional[str] = None) -> None:
+    """결과 JSON 한 건을 기록한다(임시 파일에 쓴 뒤 교체해, 중단되어도 반쯤 쓴 결과가 남지 않게).
+
+    duplicate_of가 주어지면(중복 스캔 문서) 대표 문서 파일명을 duplicate_of 키로 함께 기록한다.
+    """
+    output_path = Path(output_path)
+    tmp_path = output_path.with_name(output_path.name + ".tmp")
+    data = as_dict(extracted)
+    if duplicate_of is not None:
+        data = {**data, "duplicate_of": duplicate_of}
+    with open(tmp_path, 'w', encoding='utf-8') as out_f:
+        json.dump(data, out_f, ensure_ascii=False, indent=4)
+    os.replace(tmp_path, output_path)
+
+
+def read_document(json_file: Path, extractor: Any) -> dict:
+    """추출기에 필요한 OCR 필드만 읽는다(words/boundingBox 배열은 파싱하지 않음, 레이아웃 모드는 pages도,
+    페이지 단위 추출은 페이지별 text만)."""
+    m = metrics.ACTIVE
+    if m is None:
+        return read_ocr_fields(json_file, getattr(extractor, "ocr_fields", ("text",)))
+    with m.time("read"):
+        return read_ocr_fields(json_file, getattr(extractor, "ocr_fields", ("text",)))
+
+
+def process_file(json_file: Path, extractor: Any, output_dir: Optional[Path],
+                 data: Optional[dict] = None) -> Tuple[str, dict, List[WarningRecord]]:
+    """OCR JSON 한 건을 읽어 정제·추출 후 결과 JSON으로 저장한다.
+
+    output_dir이 None이면 파일을 쓰지 않는다(열 지향 배치 출력은 호출 측에서 기록).
+    data(이미 읽은 OCR dict)가 주어지면 파일을 다시 읽지 않는다.
+    반환: (파일명, 추출 결과, 경고 목록)
+    """
+    json_file = Path(json_file)
+    m = metrics.ACTIVE
+    if m is not None:
+        t0 = time.perf_counter()
+    if data is None:
+        data = read_document(json_file, extractor)
+    extracted_data = extract_document(data, extractor)
+    warnings = collect_warnings(json_file.name, extracted_data)
+
+    if m is not None:
+        t1 = time.perf_counter()
+    if output_dir is not None:
+        write_result_json(extracted_data, output_path_for(json_file, output_dir))
+    if m is not None:
+        t2 = time.perf_counter()
+        if output_dir is not None:
+            m.observe("write", t2 - t1)
+        m.observe("document", t2 - t0)
+
+    return json_file.name, extracted_data, warnings
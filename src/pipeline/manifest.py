@@ -0,0 +1,125 @@
+"""증분 재실행용 처리 매니페스트.
+
+입력 파일마다 크기·mtime·내용 해시와, 그 결과를 만든 규칙/코드 버전 지문을
+SQLite에 기록합니다. 재실행 시에는 새 파일, 내용이 바뀐 파일, 다른 규칙 버전으로
+처리된 파일만 다시 처리합니다. 결과 파일을 쓴 직후 파일 단위로 커밋하므로
+중간에 중단되어도 이미 끝난 파일은 다시 처리하지 않습니다.
+"""
+import hashlib
+import sqlite3
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    name         TEXT PRIMARY KEY,
+    size         INTEGER NOT NULL,
+    mtime_ns     INTEGER NOT NULL,
+    sha256       TEXT NOT NULL,
+    version      TEXT NOT NULL,
+    output       TEXT NOT NULL,
+    processed_at REAL NOT NULL
+);
+"""
+
+
+def file_sha256(path: Path, chunk_size: int = 1 << 20) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+@dataclass
+class FileState:
+    """입력 파일의 현재 상태(해시는 필요할 때만 계산)."""
+    path: Path
+    size: int
+    mtime_ns: int
+    sha256: Optional[str] = None
+
+    @classmethod
+    def of(cls, path: Path) -> "FileState":
+        st = path.stat()
+        return cls(path=path, size=st.st_size, mtime_ns=st.st_mtime_ns)
+
+    def digest(self) -> str:
+        if self.sha256 is None:
+            self.sha256 = file_sha256(self.path)
+        return self.sha256
+
+
+class Manifest:
+    """처리 이력 매니페스트(SQLite). 키는 입력 파일명."""
+
+    def __init__(self, path: Union[str, Path], version: str):
+        self.path = Path(path)
+        self.version = version
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), timeout=30, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+    def _lookup(self, name: str) -> Optional[tuple]:
+        return self._conn.execute(
+            "SELECT size, mtime_ns, sha256, version, output FROM files WHERE name = ?", (name,)
+        ).fetchone()
+
+    def is_current(self, state: FileState) -> bool:
+        """이전 처리 결과를 그대로 써도 되는지 판정한다.
+
+        1) 같은 버전·같은 크기/mtime이고 결과 파일이 있으면 해시 없이 통과
+        2) 크기/mtime이 달라도 내용 해시가 같으면 통과(메타데이터만 갱신)
+        """
+        row = self._lookup(state.path.name)
+        if row is None:
+            return False
+        size, mtime_ns, sha256, version, output = row
+        if version != self.version or not Path(output).exists():
+            return False
+        if size == state.size and mtime_ns == state.mtime_ns:
+            return True
+        if state.size == size and state.digest() == sha256:
+            self._conn.execute(
+                "UPDATE files SET mtime_ns = ? WHERE name = ?", (state.mtime_ns, state.path.name)
+            )
+            return True
+        return False
+
+    def plan(self, files: Iterable[Path]) -> Tuple[List[FileState], int]:
+        """처리 대상 목록(입력 순서 유지)과 건너뛸 파일 수를 반환한다."""
+        todo: List[FileState] = []
+        skipped = 0
+        for p in files:
+            state = FileState.of(Path(p))
+            if self.is_current(state):
+                skipped += 1
+            else:
+                todo.append(state)
+        return todo, skipped
+
+    def record(self, state: FileState, output: Union[str, Path]) -> None:
+        """결과 파일을 쓴 뒤 호출: 이 파일을 현재 버전으로 처리 완료로 기록(즉시 커밋)."""
+        self._conn.execute(
+            "INSERT OR REPLACE INTO files (name, size, mtime_ns, sha256, version, output, processed_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (state.path.name, state.size, state.mtime_ns, state.digest(), self.version,
+             str(output), time.time()),
+        )
+
+    def forget_missing(self, present: Iterable[str]) -> int:
+        """입력 디렉터리에서 사라진 파일의 기록을 지운다."""
+        names = set(present)
+        stale = [n for (n,) in self._conn.execute("SELECT name FROM files") if n not in names]
+        self._conn.executemany("DELETE FROM files WHERE name = ?", [(n,) for n in stale])
+        return len(stale)
+
+    def entries(self) -> Dict[str, str]:
+        """{입력 파일명: 처리 버전}"""
+        return dict(self._conn.execute("SELECT name, version FROM files"))
+
+    def close(self) -> None:
+        self._conn.close()
@@ -0,0 +1,262 @@
+"""OCR 응답 JSON에서 필요한 최상위 필드만 점진적으로 읽는 리더.
+
+OCR 응답의 대부분은 pages[].words[] (boundingBox/confidence) 배열이지만
+파이프라인이 쓰는 것은 최상위 'text'(와 선택적으로 'confidence')뿐이다.
+json.load 대신 파일을 청크 단위로 읽으며 최상위 객체만 토큰화하고,
+관심 없는 값은 파이썬 객체를 만들지 않고 바이트 수준에서 건너뛴다.
+
+- 작은 컨테이너(단어 1개 등)는 정규식 한 번으로 통째로 건너뛴다.
+- 버퍼에 다 들어오지 않는 큰 컨테이너(pages 등)는 원소 단위로 내려가며 건너뛴다.
+- 요청한 필드를 모두 찾으면 나머지는 읽지 않고 종료한다(중복 키는 첫 값 우선).
+- 'pages.text'를 요청하면 pages[]에서 페이지별 text만 읽어 문자열 목록으로 돌려준다
+  (words 등 나머지 페이지 내용은 건너뛴다).
+"""
+import json
+import re
+import sys
+from pathlib import Path
+from typing import IO, Dict, Iterable, List, Optional, Tuple, Union
+
+DEFAULT_FIELDS = ("text",)
+# 페이지별 text 목록을 뜻하는 가상 필드
+PAGE_TEXTS = "pages.text"
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+_WS = re.compile(rb"[ \t\r\n]*")
+# 소유(possessive) 수량자는 re가 3.11부터 지원한다. 아래 패턴은 되추적해도 입력을 나누는
+# 방법이 하나뿐인 풀어 쓴 형태(unrolled loop)라 일반 수량자로도 선형이고, 3.11 이상에서는
+# 되추적 상태를 쌓지 않도록 소유 수량자로 바꿔 쓴다.
+_STAR = rb"*+" if sys.version_info >= (3, 11) else rb"*"
+
+
+def _string_pattern(star: bytes = _STAR) -> bytes:
+    """따옴표로 닫히는 JSON 문자열(이스케이프 포함) 정규식 소스."""
+    return rb'"[^"\\]' + star + rb'(?:\\.[^"\\]' + star + rb")" + star + rb'"'
+
+
+_STRING = re.compile(_string_pattern(), re.S)
+_SCALAR = re.compile(rb"-?[0-9][0-9.eE+\-]*|true|false|null")
+
+
+def _nested_pattern(depth: int, star: bytes = _STAR) -> bytes:
+    """깊이 depth까지 중첩을 허용하는 '컨테이너 내부' 정규식 소스.
+
+    re는 재귀를 지원하지 않으므로 깊이를 펼쳐서 만든다. 입력이 유효한 JSON이라고
+    가정하고 괄호 종류([/{)의 짝과 구분자(:/,)는 검사하지 않는다(건너뛰기 용도).
+    문자열·괄호가 아닌 바이트 묶음 뒤에는 항상 문자열이나 괄호가 오도록 풀어 써서
+    (plain*(token plain*)*) 미완결 원소 앞에서 되추적해도 선형으로 끝난다.
+    """
+    string = _string_pattern(star)
+    plain = rb'[^"\[\]{}]' + star
+    inner = plain + rb"(?:" + string + plain + rb")" + star
+    for _ in range(depth):
+        inner = plain + rb"(?:(?:" + string + rb"|[\[{]" + inner + rb"[\]}])" + plain + rb")" + star
+    return inner
+
+
+# OCR 단어 항목(words[i])은 깊이 4, pages 전체는 9 – 더 깊으면 원소 단위로 내려간다.
+# _INNER: 버퍼 안에서 완결된 원소들을 한 번에 소비(미완결 원소 앞에서 멈춤)
+_INNER = re.compile(_nested_pattern(9), re.S)
+_CONTAINER = re.compile(rb"[\[{]" + _nested_pattern(9) + rb"[\]}]", re.S)
+
+
+class _Scanner:
+    """청크 버퍼 위에서 최상위 JSON 객체를 훑는 최소 토크나이저."""
+
+    def __init__(self, fp: IO[bytes], chunk_size: int):
+        self.fp = fp
+        self.chunk_size = chunk_size
+        self.buf = b""
+        self.pos = 0
+        self.eof = False
+        # 캡처 중인 값의 시작 위치(설정되어 있으면 fill이 그 앞부분만 버린다)
+        self.mark: Optional[int] = None
+
+    def fill(self) -> None:
+        """소비한 앞부분을 버리고 다음 청크를 붙인다(버퍼가 크면 읽기량도 키운다)."""
+        if self.eof:
+            raise ValueError("OCR JSON이 예상보다 일찍 끝났습니다")
+        keep = self.pos if self.mark is None else self.mark
+        rest = self.buf[keep:]
+        chunk = self.fp.read(max(self.chunk_size, len(rest)))
+        if not chunk:
+            self.eof = True
+        self.buf = rest + chunk
+        self.pos -= keep
+        if self.mark is not None:
+            self.mark = 0
+
+    def peek(self) -> bytes:
+        """공백을 건너뛰고 다음 1바이트를 돌려준다(소비하지 않음)."""
+        while True:
+            self.pos = _WS.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos:self.pos + 1]
+            if self.eof:
+                return b""
+            self.fill()
+
+    def expect(self, token: bytes) -> None:
+        if self.peek() != token:
+            raise ValueError(f"OCR JSON 형식 오류: {token.decode()!r} 필요 (offset {self.pos})")
+        self.pos += 1
+
+    def match(self, pattern: "re.Pattern[bytes]", delimited: bool = True) -> bytes:
+        """pattern이 매칭될 때까지 버퍼를 채워 매칭된 바이트를 소비·반환한다.
+
+        delimited=False(숫자 등)는 버퍼 끝에서 끝난 매칭을 확정하지 않는다.
+        """
+        while True:
+            m = pattern.match(self.buf, self.pos)
+            if m and (delimited or m.end() < len(self.buf) or self.eof):
+                self.pos = m.end()
+                return m.group()
+            if self.eof:
+                raise ValueError(f"OCR JSON 형식 오류 (offset {self.pos})")
+            self.fill()
+
+    def read_value(self):
+        """값 하나를 파싱해 반환한다(요청 필드 전용)."""
+        c = self.peek()
+        if c == b'"':
+            return json.loads(self.match(_STRING))
+        if c in (b"[", b"{"):
+            return json.loads(self.capture_container())
+        return json.loads(self.match(_SCALAR, delimited=False))
+
+    def capture_container(self) -> bytes:
+        """컨테이너 하나를 건너뛰되, 그 바이트 범위를 버퍼에 보존해 반환한다."""
+        self.mark = self.pos
+        try:
+            self.skip_value()
+            return self.buf[self.mark:self.pos]
+        finally:
+            self.mark = None
+
+    def skip_value(self) -> None:
+        """값 하나를 객체로 만들지 않고 건너뛴다."""
+        c = self.peek()
+        if c == b'"':
+            self.match(_STRING)
+        elif c in (b"[", b"{"):
+            m = _CONTAINER.match(self.buf, self.pos)
+            if m:
+                self.pos = m.end()
+            else:
+                # 버퍼에 다 없거나 더 깊은 컨테이너 → 원소 단위로 내려간다
+                self._skip_container()
+        else:
+            self.match(_SCALAR, delimited=False)
+
+    def read_page_texts(self) -> List[str]:
+        """pages 배열에서 페이지 객체마다 text만 읽는다(text가 없거나 객체가 아닌 페이지는 빈 문자열)."""
+        texts: List[str] = []
+        if self.peek() != b"[":
+            self.skip_value()
+            return texts
+        self.pos += 1
+        if self.peek() == b"]":
+            self.pos += 1
+            return texts
+        while True:
+            text = ""
+            if self.peek() == b"{":
+                self.pos += 1
+                while self.peek() != b"}":
+                    key = json.loads(self.match(_STRING))
+                    self.expect(b":")
+                    if key == "text" and not text:
+                        text = self.read_value() or ""
+                    else:
+                        self.skip_value()
+                    if self.peek() == b",":
+                        self.pos += 1
+                self.pos += 1
+            else:
+                self.skip_value()
+            texts.append(text)
+            c = self.peek()
+            self.pos += 1
+            if c == b"]":
+                return texts
+            if c != b",":
+                raise ValueError(f"OCR JSON 형식 오류 (offset {self.pos - 1})")
+
+    def _skip_container(self) -> None:
+        """버퍼에 다 들어오지 않은 컨테이너를 건너뛴다.
+
+        완결된 원소들은 _INNER 한 번으로 소비하고, 버퍼 경계에 걸린 원소만
+        버퍼를 채우거나 한 단계 내려가서 처리한다.
+        """
+        self.pos += 1
+        while True:
+            self.pos = _INNER.match(self.buf, self.pos).end()
+            if self.pos >= len(self.buf):
+                self.fill()
+                continue
+            c = self.buf[self.pos:self.pos + 1]
+            if c in (b"]", b"}"):
+                self.pos += 1
+                return
+            if c == b'"':
+                self.match(_STRING)
+            else:
+                self.skip_value()
+
+
+def read_ocr_fields(
+    source: Union[str, Path, IO[bytes]],
+    fields: Iterable[str] = DEFAULT_FIELDS,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Dict[str, object]:
+    """OCR 응답의 최상위 필드 중 fields만 읽어 dict로 반환한다(없는 필드는 생략).
+
+    source: 파일 경로 또는 바이너리 파일 객체
+    fields에 PAGE_TEXTS('pages.text')가 있으면 페이지별 text 목록을 그 키로 돌려준다.
+    """
+    if isinstance(source, (str, Path)):
+        with open(source, "rb") as fp:
+            return read_ocr_fields(fp, fields, chunk_size)
+
+    wanted = set(fields)
+    found: Dict[str, object] = {}
+    sc = _Scanner(source, chunk_size)
+    if sc.peek() == b"\xef":  # UTF-8 BOM
+        sc.pos += 3
+    sc.expect(b"{")
+    if sc.peek() == b"}":
+        return found
+    while True:
+        sc.peek()
+        key = json.loads(sc.match(_STRING))
+        sc.expect(b":")
+        if key in wanted and key not in found:
+            found[key] = sc.read_value()
+            if key == "pages" and PAGE_TEXTS in wanted and PAGE_TEXTS not in found:
+                pages = found[key] if isinstance(found[key], list) else []
+                found[PAGE_TEXTS] = [(p.get("text") if isinstance(p, dict) else None) or "" for p in pages]
+            if len(found) == len(wanted):
+                break
+        elif key == "pages" and PAGE_TEXTS in wanted and PAGE_TEXTS not in found:
+            found[PAGE_TEXTS] = sc.read_page_texts()
+            if len(found) == len(wanted):
+                break
+        else:
+            sc.skip_value()
+        c = sc.peek()
+        sc.pos += 1
+        if c == b"}":
+            break
+        if c != b",":
+            raise ValueError(f"OCR JSON 형식 오류 (offset {sc.pos - 1})")
+    return found
+
+
+def read_ocr_text(
+    source: Union[str, Path, IO[bytes]], with_confidence: bool = False
+) -> Union[str, Tuple[str, Optional[float]]]:
+    """OCR 응답에서 text(와 선택적으로 문서 confidence)만 읽는다."""
+    if not with_confidence:
+        return read_ocr_fields(source, ("text",)).get("text") or ""
+    found = read_ocr_fields(source, ("text", "confidence"))
+    return found.get("text") or "", found.get("confidence")
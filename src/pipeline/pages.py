@@ -0,0 +1,172 @@
+"""여러 페이지 OCR 응답의 페이지 단위 추출.
+
+최상위 text 전체를 한 번에 추출하는 대신 pages[].text를 페이지 순서대로 정제·훑어 부분 결과를
+합친다(OcrExtractor.extract_pages). 필드 우선순위는 전체 텍스트 추출과 같고(앞 페이지 값 우선),
+필수 필드(차량번호/날짜/중량 3종/발급사/거래처)가 확정되면 남은 페이지는 정제도 하지 않는다.
+페이지 경계를 넘는 분리 숫자('13\\n460 kg')는 병합하지 않는다.
+
+workers > 1이면 첫 페이지로 확정되지 않은 긴 문서(min_parallel_pages 이상)의 나머지 페이지를
+프로세스 풀에 묶음 단위로 나눠 훑고, 물결(wave)마다 앞에서부터 합쳐 확정되면 멈춘다.
+페이지 하나를 훑는 비용(수백 µs)이 작업 전달 비용과 비슷하므로, 문서 단위 병렬(--workers)을
+쓰지 않는 단일 프로세스 실행의 긴 문서에만 쓴다(문서 단위 워커 안에서는 순차로 훑는다).
+
+페이지가 2개 미만인 문서는 기반 추출기(결과 캐시 등) 경로를 그대로 쓴다. 기반 추출기가 결과 캐시면
+여러 페이지 문서는 원문 페이지 text들(과 조기 종료 여부)을 키로 캐시한다(정제 전 텍스트이므로
+정제된 전체 텍스트 키와 겹치지 않도록 구분 접두어를 붙인다).
+"""
+import logging
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from time import perf_counter
+from typing import Any, List, NamedTuple, Optional
+
+from src.parser.cleaner import clean_text
+from src.parser.extractor import OcrExtractor, _DocumentScan
+from src.parser.rule_pack import CompiledRules, current_rules
+from src.pipeline.ocr_reader import PAGE_TEXTS
+from src.utils import metrics
+
+logger = logging.getLogger(__name__)
+
+# 첫 페이지 뒤 남은 페이지가 이만큼 이상일 때만 프로세스 풀로 나눈다
+DEFAULT_MIN_PARALLEL_PAGES = 32
+# 풀 작업 하나가 훑는 페이지 수(작업 전달 비용 분산)
+PAGES_PER_TASK = 8
+
+
+class PageMode(NamedTuple):
+    """페이지 단위 추출 설정(워커 프로세스로 그대로 넘길 수 있도록 튜플)."""
+    early_exit: bool = True
+    workers: int = 1
+    min_parallel_pages: int = DEFAULT_MIN_PARALLEL_PAGES
+
+
+def page_texts(data: dict) -> List[str]:
+    """OCR 응답의 페이지별 text(PAGE_TEXTS로 읽었으면 그 값, 아니면 pages[]에서)."""
+    texts = data.get(PAGE_TEXTS)
+    if texts is None:
+        texts = [(p.get("text") if isinstance(p, dict) else None) or "" for p in data.get("pages") or ()]
+    return texts
+
+
+class _CleanedPages(Sequence):
+    """꺼낼 때 정제하는 페이지 목록(조기 종료로 훑지 않는 페이지는 정제하지 않는다)."""
+
+    def __init__(self, texts: List[str], rules: CompiledRules):
+        self.texts = texts
+        self.corrector = rules.corrector
+        self.label_index = rules.label_index
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def __getitem__(self, i):
+        return clean_text(self.texts[i], self.corrector, self.label_index)
+
+
+def _cache_key(texts: List[str], early_exit: bool) -> str:
+    """여러 페이지 문서의 결과 캐시 키(제어 문자 접두어로 정제 텍스트 키와 구분)."""
+    return ("\0pages\0" if early_exit else "\0pages-full\0") + "\f".join(texts)
+
+
+# 페이지 풀 워커의 규칙 스냅숏(풀 초기화 때 부모 프로세스의 규칙을 받는다)
+_WORKER_RULES: Optional[CompiledRules] = None
+
+
+def _init_page_worker(rules: CompiledRules) -> None:
+    global _WORKER_RULES
+    _WORKER_RULES = rules
+
+
+def _scan_pages(texts: List[str]) -> _DocumentScan:
+    """연속된 페이지 묶음을 정제해 훑은 부분 상태(풀 워커에서 실행)."""
+    rules = _WORKER_RULES
+    scan = _DocumentScan()
+    for text in texts:
+        scan.feed(clean_text(text, rules.corrector, rules.label_index), rules)
+    return scan
+
+
+class PageExtractor:
+    """페이지가 여럿인 문서를 페이지 단위로 추출하는 래퍼.
+
+    extract(text)와 한 페이지 문서는 base에 그대로 맡기고, 여러 페이지 문서는 base가 결과 캐시
+    (extract_keyed)면 그 캐시를 거친다. 페이지별 훑기 수는 'pages' 계측 카운터(status=scanned|skipped)에
+    남는다(캐시 적중이면 세지 않는다).
+    """
+
+    def __init__(self, base: Any, mode: PageMode = PageMode()):
+        self.base = base
+        self.mode = mode
+        self.typed = getattr(base, "typed", False)
+        self.ocr_fields = tuple(dict.fromkeys(("text", PAGE_TEXTS) + tuple(getattr(base, "ocr_fields", ("text",)))))
+        self._pages = OcrExtractor(typed=self.typed)
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_rules: Optional[str] = None
+
+    def extract(self, text: str) -> dict:
+        return self.base.extract(text)
+
+    def extract_response(self, data: dict) -> dict:
+        texts = page_texts(data)
+        if len(texts) < 2:
+            base_response = getattr(self.base, "extract_response", None)
+            if base_response is not None:
+                return base_response(data)
+            return self.base.extract(clean_text(data.get("text", "")))
+
+        keyed = getattr(self.base, "extract_keyed", None)
+        if keyed is not None:
+            return keyed(_cache_key(texts, self.mode.early_exit), lambda: self._extract_pages(texts))
+        return self._extract_pages(texts)
+
+    def _extract_pages(self, texts: List[str]) -> dict:
+        rules = current_rules()
+        mode = self.mode
+        if mode.workers > 1 and len(texts) - 1 >= mode.min_parallel_pages:
+            return self._extract_parallel(texts, rules)
+        return self._pages.extract_pages(_CleanedPages(texts, rules), mode.early_exit)
+
+    def _extract_parallel(self, texts: List[str], rules: CompiledRules) -> dict:
+        """첫 페이지는 직접, 나머지는 풀에 물결 단위로 나눠 훑고 앞에서부터 합친다."""
+        m = metrics.ACTIVE
+        if m is not None:
+            t0 = perf_counter()
+        scan = _DocumentScan()
+        scan.feed(clean_text(texts[0], rules.corrector, rules.label_index), rules)
+        done = 1
+        early_exit = self.mode.early_exit
+        if not (early_exit and scan.resolved()):
+            pool = self._pool_for(rules)
+            wave = self.mode.workers * PAGES_PER_TASK
+            while done < len(texts):
+                chunk = texts[done:done + wave]
+                parts = pool.map(_scan_pages, [chunk[i:i + PAGES_PER_TASK]
+                                               for i in range(0, len(chunk), PAGES_PER_TASK)])
+                for part in parts:
+                    scan.merge(part)
+                done += len(chunk)
+                if early_exit and scan.resolved():
+                    break
+        if m is not None:
+            m.observe("extract.scan", perf_counter() - t0)
+            m.incr("pages", done, status="scanned")
+            m.incr("pages", len(texts) - done, status="skipped")
+        return self._pages._finish(scan, rules)
+
+    def _pool_for(self, rules: CompiledRules) -> ProcessPoolExecutor:
+        """규칙 스냅숏을 받은 페이지 풀(규칙이 바뀌면 새로 띄운다)."""
+        if self._pool is not None and self._pool_rules != rules.fingerprint:
+            self.close()
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.mode.workers, initializer=_init_page_worker,
+                                             initargs=(rules,))
+            self._pool_rules = rules.fingerprint
+            logger.info("페이지 병렬 풀 시작: 워커 %d개 (규칙 %s)", self.mode.workers, rules.pack_id)
+        return self._pool
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+            self._pool_rules = None
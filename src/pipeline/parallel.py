@@ -0,0 +1,95 @@
+"""프로세스 풀 기반 배치 처리.
+
+- 워커마다 추출기를 한 번만 구성한다(initializer).
+- 파일 목록을 청크 단위로 분배하되, 결과는 입력 순서대로 돌려준다.
+- 결과 캐시를 쓰면 워커들이 같은 SQLite 파일을 공유한다.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from src.pipeline.document import WarningRecord, build_extractor, collect_warnings, extract_document, process_file
+from src.pipeline.pages import PageMode
+from src.pipeline.result_cache import DEFAULT_MAX_ENTRIES
+from src.pipeline.routing import RoutePolicy
+from src.utils import metrics
+
+# 워커 프로세스 전역 상태 (initializer에서 1회 설정)
+_WORKER_EXTRACTOR = None
+_WORKER_OUTPUT_DIR: Optional[Path] = None
+
+
+def _init_worker(use_nlp: bool, output_dir: Optional[str], cache_path: Optional[str], cache_size: int,
+                 with_metrics: bool = False, layout: bool = False, rules: Optional[str] = None,
+                 rules_reload: float = 0.0, route: Optional[RoutePolicy] = None,
+                 pages: Optional[PageMode] = None) -> None:
+    global _WORKER_EXTRACTOR, _WORKER_OUTPUT_DIR
+    if with_metrics:
+        # fork로 물려받은 부모 계측값을 다시 보내지 않도록 빈 계측기로 시작한다
+        metrics.disable()
+        metrics.enable()
+    if pages is not None:
+        # 문서 단위로 이미 병렬이므로 워커 안에서는 페이지를 순차로 훑는다
+        pages = pages._replace(workers=1)
+    _WORKER_EXTRACTOR = build_extractor(use_nlp, cache_path=cache_path, cache_size=cache_size, layout=layout,
+                                        rules=rules, rules_reload=rules_reload, route=route, pages=pages)
+    _WORKER_OUTPUT_DIR = Path(output_dir) if output_dir is not None else None
+
+
+def _process_in_worker(json_file: Path) -> Tuple[Tuple[str, dict, List[WarningRecord]], Optional[metrics.Metrics]]:
+    result = process_file(json_file, _WORKER_EXTRACTOR, _WORKER_OUTPUT_DIR)
+    # 계측 중이면 이 파일의 계측값을 결과와 함께 부모로 보낸다
+    m = metrics.ACTIVE
+    return result, (m.drain() if m is not None else None)
+
+
+def _extract_in_worker(name: str, data: dict) -> Tuple[Tuple[dict, List[WarningRecord]], Optional[metrics.Metrics]]:
+    """이미 읽은 OCR dict만 받아 추출한다(단계형 파이프라인: 읽기/쓰기는 부모 스레드 담당)."""
+    extracted = extract_document(data, _WORKER_EXTRACTOR)
+    m = metrics.ACTIVE
+    return (extracted, collect_warnings(name, extracted)), (m.drain() if m is not None else None)
+
+
+def default_chunksize(n_items: int, workers: int) -> int:
+    """워커당 약 4개 청크가 돌아가도록 청크 크기를 정한다(multiprocessing.Pool.map과 동일한 방식)."""
+    if n_items <= 0 or workers <= 0:
+        return 1
+    chunksize, extra = divmod(n_items, workers * 4)
+    return chunksize + 1 if extra else max(chunksize, 1)
+
+
+def iter_parallel(
+    json_files: Iterable[Path],
+    workers: int,
+    use_nlp: bool,
+    output_dir: Optional[Path],
+    chunksize: Optional[int] = None,
+    cache_path: Optional[str] = None,
+    cache_size: int = DEFAULT_MAX_ENTRIES,
+    layout: bool = False,
+    rules: Optional[str] = None,
+    rules_reload: float = 0.0,
+    route: Optional[RoutePolicy] = None,
+    pages: Optional[PageMode] = None,
+) -> Iterator[Tuple[str, dict, List[WarningRecord]]]:
+    """파일들을 프로세스 풀에서 처리하고 (파일명, 결과, 경고)를 입력 순서대로 반환한다.
+
+    output_dir이 None이면 워커는 결과 파일을 쓰지 않는다(열 지향 출력은 부모가 기록).
+    rules/rules_reload는 워커마다 활성 규칙 팩을, route는 문서별 NLP 에스컬레이션 기준을,
+    pages는 페이지 단위 추출 설정을 정한다(build_extractor 참고, 워커 안에서 페이지는 순차로 훑는다).
+    호출 시점에 계측이 켜져 있으면 워커도 계측하고, 그 값을 부모 계측기에 합친다.
+    """
+    files = list(json_files)
+    if chunksize is None:
+        chunksize = default_chunksize(len(files), workers)
+    parent_metrics = metrics.ACTIVE
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(use_nlp, str(output_dir) if output_dir is not None else None, cache_path, cache_size, parent_metrics is not None, layout,
+                  rules, rules_reload, route, pages),
+    ) as executor:
+        for result, worker_metrics in executor.map(_process_in_worker, files, chunksize=chunksize):
+            if worker_metrics is not None and parent_metrics is not None:
+                parent_metrics.merge(worker_metrics)
+            yield result
@@ -0,0 +1,200 @@
+"""내용 주소 기반(content-addressed) 추출 결과 캐시.
+
+키 = sha256(규칙/코드 버전 지문 + 정제된 텍스트). 규칙이 바뀌면 지문이 달라져
+예전 항목은 절대 적중하지 않습니다. 다른 버전의 항목은 열 때 지우지 않으므로(팩을 오가거나
+같은 파일을 여러 모드가 공유해도 서로의 항목이 남는다) LRU 제거에 맡기거나
+purge_other_versions()로 명시적으로 정리합니다.
+실행 중 규칙 팩이 핫 리로드되면 CachedExtractor가 새 팩 지문으로 키를 바꿉니다.
+저장소는 SQLite(WAL) 파일 하나이고, 항목 수 상한을 넘으면 가장 오래 쓰이지 않은
+항목부터 제거(LRU)합니다. 여러 워커 프로세스가 같은 파일을 공유할 수 있고, 연결은 잠금으로
+보호하므로 연 스레드와 다른 스레드(단계 분리 파이프라인의 추출 스레드 등)에서도 쓸 수 있습니다.
+"""
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+
+from src.parser.result import ExtractionResult, to_json
+from src.parser.rule_pack import current_rules
+from src.parser.version import extraction_fingerprint
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 100_000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key         TEXT PRIMARY KEY,
+    version     TEXT NOT NULL,
+    value       TEXT NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_results_last_access ON results(last_access);
+"""
+
+
+class ResultCache:
+    """SQLite 기반 LRU 결과 캐시. 적중/미스/제거 카운터를 제공한다."""
+
+    def __init__(self, path: Union[str, Path], version: str,
+                 max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.path = Path(path)
+        self.version = version
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), timeout=30, isolation_level=None,
+                                     check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._count = self._conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def key_for(self, text: str) -> str:
+        h = hashlib.sha256(self.version.encode("utf-8") + b"\0")
+        h.update(text.encode("utf-8"))
+        return h.hexdigest()
+
+    def get(self, text: str) -> Optional[dict]:
+        key = self.key_for(text)
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM results WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._conn.execute("UPDATE results SET last_access = ? WHERE key = ?", (time.time(), key))
+        return json.loads(row[0])
+
+    def put(self, text: str, value: dict) -> None:
+        key = self.key_for(text)
+        value = to_json(value)
+        with self._lock:
+            cur = self._conn.execute(
+                "INSERT OR REPLACE INTO results (key, version, value, last_access) VALUES (?, ?, ?, ?)",
+                (key, self.version, value, time.time()),
+            )
+            if cur.rowcount:
+                self._count += 1
+            if self._count > self.max_entries:
+                self._evict()
+
+    def _evict(self) -> None:
+        """상한의 90%까지 가장 오래 쓰이지 않은 항목을 지운다(매 삽입마다 지우지 않도록 여유를 둔다).
+
+        호출 측(put)이 잠금을 쥔 상태에서 부른다.
+        """
+        # 다른 프로세스가 쓴 항목까지 반영해 실제 개수를 다시 센다
+        self._count = self._conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+        excess = self._count - int(self.max_entries * 0.9)
+        if excess <= 0:
+            return
+        removed = self._conn.execute(
+            "DELETE FROM results WHERE key IN "
+            "(SELECT key FROM results ORDER BY last_access ASC LIMIT ?)",
+            (excess,),
+        ).rowcount
+        self.evictions += removed
+        self._count -= removed
+
+    def purge_other_versions(self) -> int:
+        """현재 버전이 아닌 항목을 모두 지운다(유지보수용, 지운 개수 반환)."""
+        with self._lock:
+            removed = self._conn.execute("DELETE FROM results WHERE version != ?",
+                                         (self.version,)).rowcount
+            self._count -= removed
+        if removed:
+            logger.info("결과 캐시: 다른 규칙 버전 항목 %d개 삭제", removed)
+        return removed
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class CachedExtractor:
+    """OcrExtractor / OcrExtractorWithNlp를 감싸 결과 캐시를 적용하는 래퍼.
+
+    extract(text)의 입력은 정제된 텍스트이며, 같은 텍스트·같은 규칙 버전이면
+    추출을 건너뛰고 캐시된 결과(새 dict 또는 ExtractionResult)를 돌려준다.
+    """
+
+    def __init__(self, base: Any, cache: ResultCache):
+        self.base = base
+        self.cache = cache
+        # 기반 추출기가 ExtractionResult를 반환하면 캐시 적중 결과도 같은 형태로 돌려준다
+        self.typed = getattr(base, "typed", False)
+        # 규칙 팩 지문이 붙은 버전(open_cache)이면 리로드 시 지문 부분만 바꾼다
+        self._rules = current_rules()
+        prefix, sep, fingerprint = cache.version.rpartition("+")
+        self._version_prefix = prefix if sep and fingerprint == self._rules.fingerprint else None
+
+    def _sync_rules(self) -> None:
+        rules = current_rules()
+        if rules is not self._rules:
+            self._rules = rules
+            if self._version_prefix is not None:
+                self.cache.version = f"{self._version_prefix}+{rules.fingerprint}"
+
+    def _lookup(self, text: str) -> Optional[dict]:
+        cached = self.cache.get(text)
+        if cached is not None and self.typed:
+            return ExtractionResult.from_dict(cached)
+        return cached
+
+    def extract(self, text: str) -> dict:
+        self._sync_rules()
+        cached = self._lookup(text)
+        if cached is not None:
+            return cached
+        result = self.base.extract(text)
+        self.cache.put(text, result)
+        return result
+
+    def extract_keyed(self, key: str, compute: Callable[[], dict]) -> dict:
+        """정제된 전체 텍스트가 없는 경로(페이지 단위 추출)의 결과를 key로 캐시한다.
+
+        key는 호출 측이 정제 텍스트와 겹치지 않게 만든다(PageExtractor는 원문 페이지 text들).
+        """
+        self._sync_rules()
+        cached = self._lookup(key)
+        if cached is not None:
+            return cached
+        result = compute()
+        self.cache.put(key, result)
+        return result
+
+    def extract_batch(self, texts: Sequence[str]) -> List[dict]:
+        """캐시 미스만 모아 기반 추출기의 배치 API(있으면)로 한 번에 추출한다."""
+        self._sync_rules()
+        results: List[Optional[dict]] = [self._lookup(text) for text in texts]
+        misses = [i for i, r in enumerate(results) if r is None]
+        if misses:
+            todo = [texts[i] for i in misses]
+            batch = getattr(self.base, "extract_batch", None)
+            extracted = batch(todo) if batch else [self.base.extract(t) for t in todo]
+            for i, text, result in zip(misses, todo, extracted):
+                self.cache.put(text, result)
+                results[i] = result
+        return results
+
+
+def open_cache(path: Union[str, Path], use_nlp: bool = False,
+               max_entries: int = DEFAULT_MAX_ENTRIES) -> ResultCache:
+    """현재 규칙/코드 버전 지문으로 결과 캐시를 연다."""
+    return ResultCache(path, extraction_fingerprint(use_nlp), max_entries=max_entries)
@@ -0,0 +1,136 @@
+"""문서별 추출 경로 선택: 기본 추출기 → 어려운 문서만 NLP 보조.
+
+NLP 모드를 실행 전체에 켜는 대신, 모든 문서를 먼저 기본 추출기로 처리하고 아래 중 하나에
+해당하는 문서만 NLP 보조(OcrExtractorWithNlp.assist_batch)로 올린다.
+
+- confidence: OCR 응답의 문서 confidence가 min_confidence 미만
+- word_confidence: 단어 confidence가 min_word_confidence 미만인 단어가 LOW_WORD_SHARE 넘게 섞임
+  (pages를 읽어야 하므로 min_word_confidence를 줄 때만 확인)
+- missing: 필수 필드(기본: NLP 보조가 채울 수 있는 필드)가 N/A
+
+NLP 보조는 N/A 필드만 채우므로, 에스컬레이션된 문서도 이미 채워진 값은 바뀌지 않는다.
+spaCy 파이프라인은 프로세스에서 첫 에스컬레이션 때 한 번 로드해 계속 쓴다(워커 프로세스마다
+따로 로드하고, 에스컬레이션이 없는 워커는 로드하지 않는다). 로드에 실패하면 기본 결과를 쓴다.
+"""
+import logging
+import time
+from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple
+
+from src.parser.cleaner import clean_text
+from src.parser.extractor import OcrExtractor
+from src.utils import metrics
+
+logger = logging.getLogger(__name__)
+
+# NLP 보조가 채울 수 있는 필드
+NLP_FIELDS = ("issuer_name", "issuer_address", "client_name")
+DEFAULT_MIN_CONFIDENCE = 0.85
+# 저신뢰 단어가 이 비율을 넘으면 에스컬레이션
+LOW_WORD_SHARE = 0.1
+
+ROUTES = ("base", "confidence", "word_confidence", "missing")
+
+
+class RoutePolicy(NamedTuple):
+    """에스컬레이션 기준(워커 프로세스로 그대로 넘길 수 있도록 튜플)."""
+    min_confidence: Optional[float] = DEFAULT_MIN_CONFIDENCE
+    min_word_confidence: Optional[float] = None
+    required: Tuple[str, ...] = NLP_FIELDS
+
+
+def low_word_share(pages: Any, threshold: float) -> float:
+    """confidence가 threshold 미만인 단어의 비율(단어가 없으면 0)."""
+    words = low = 0
+    for page in pages or ():
+        for word in page.get("words") or ():
+            confidence = word.get("confidence")
+            if isinstance(confidence, (int, float)):
+                words += 1
+                low += confidence < threshold
+    return low / words if words else 0.0
+
+
+def load_nlp_assist() -> Any:
+    """NLP 보조 추출기(지연 임포트: 에스컬레이션이 없으면 spaCy를 import하지 않는다)."""
+    from src.nlp.engine import load_nlp
+    from src.parser.extractor_nlp_wrapper import OcrExtractorWithNlp
+    return OcrExtractorWithNlp(base=OcrExtractor(typed=True), nlp=load_nlp())
+
+
+class RoutingExtractor:
+    """기본 추출기(base) 결과를 보고 어려운 문서만 NLP 보조로 올리는 래퍼.
+
+    extract_response(OCR dict)는 confidence 기준까지, extract(text)는 필수 필드 기준만 본다.
+    경로별 문서 수는 routes 속성과 'route' 계측 카운터에 남는다.
+    """
+
+    def __init__(self, base: Any, policy: RoutePolicy = RoutePolicy(),
+                 nlp_factory: Callable[[], Any] = load_nlp_assist):
+        self.base = base
+        self.policy = policy
+        self.typed = getattr(base, "typed", False)
+        fields = ("text", "confidence") + (("pages",) if policy.min_word_confidence is not None else ())
+        self.ocr_fields = tuple(dict.fromkeys(fields + tuple(getattr(base, "ocr_fields", ("text",)))))
+        self.routes: Dict[str, int] = dict.fromkeys(ROUTES, 0)
+        self._nlp_factory = nlp_factory
+        self._nlp: Any = None
+        self._nlp_failed = False
+
+    def reason(self, results: dict, data: Optional[dict] = None) -> Optional[str]:
+        """에스컬레이션 사유(ROUTES 중 하나, 기본 경로면 None)."""
+        policy = self.policy
+        if data is not None:
+            confidence = data.get("confidence")
+            if (policy.min_confidence is not None and isinstance(confidence, (int, float))
+                    and confidence < policy.min_confidence):
+                return "confidence"
+            if (policy.min_word_confidence is not None
+                    and low_word_share(data.get("pages"), policy.min_word_confidence) > LOW_WORD_SHARE):
+                return "word_confidence"
+        if any(results.get(field) == "N/A" for field in policy.required):
+            return "missing"
+        return None
+
+    def extract(self, text: str) -> dict:
+        return self._route(text, self.base.extract(text), None)
+
+    def extract_response(self, data: dict) -> dict:
+        base_response = getattr(self.base, "extract_response", None)
+        if base_response is not None:
+            results = base_response(data)
+            return self._route(None, results, data)
+        text = clean_text(data.get("text", ""))
+        return self._route(text, self.base.extract(text), data)
+
+    def _route(self, text: Optional[str], results: dict, data: Optional[dict]) -> dict:
+        reason = self.reason(results, data)
+        self.routes[reason or "base"] += 1
+        m = metrics.ACTIVE
+        if m is not None:
+            m.incr("route", tier=reason or "base")
+        if reason is None:
+            return results
+        nlp = self._assistant()
+        if nlp is None:
+            return results
+        if text is None:
+            text = clean_text(data.get("text", ""))
+        if m is None:
+            nlp.assist_batch([(text, results)])
+        else:
+            with m.time("nlp_assist"):
+                nlp.assist_batch([(text, results)])
+        return results
+
+    def _assistant(self) -> Any:
+        """NLP 보조 추출기(첫 에스컬레이션 때 로드, 실패하면 이후 시도하지 않음)."""
+        if self._nlp is None and not self._nlp_failed:
+            started = time.perf_counter()
+            try:
+                self._nlp = self._nlp_factory()
+            except Exception as e:
+                self._nlp_failed = True
+                logger.warning("NLP 보조 초기화 실패: %s (에스컬레이션 문서도 기본 결과 사용)", e)
+                return None
+            logger.info("NLP 보조 로드(첫 에스컬레이션): %.1f ms", (time.perf_counter() - started) * 1000)
+        return self._nlp
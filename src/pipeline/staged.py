@@ -0,0 +1,301 @@
+"""단계형(생산자/소비자) 배치 처리: 읽기 스레드 → 추출 → 쓰기 스레드.
+
+순차 루프는 읽기 → 정제·추출 → 쓰기를 한 줄로 실행해, 디스크(특히 네트워크 마운트)를
+기다리는 동안 CPU가 놀고 추출하는 동안 디스크가 논다. 여기서는 단계를 나눠 겹쳐 돌린다.
+
+    경로 ─▶ [읽기 스레드 × readers] ─read_q─▶ [추출] ─write_q─▶ [쓰기 스레드] ─done_q─▶ 호출 측
+
+- 추출 단계: workers <= 1이면 스레드 하나에서 추출기를 직접 호출하고(배치 API가 있으면
+  큐에 쌓인 문서를 묶어 넘긴다), workers > 1이면 프로세스 풀에 넘긴다(읽기/쓰기는 부모 스레드).
+- 배압(backpressure): 단계 사이 큐는 모두 queue_size로 제한되고, 읽기를 시작하려면
+  in-flight 티켓을 얻어야 한다. 결과가 호출 측으로 나가야 티켓이 반환되므로, 쓰기가 느리거나
+  호출 측이 소비를 멈추면 읽기도 멈춘다(메모리 사용량 ≤ max_inflight 문서).
+- 순서: 단계 안에서는 도착 순서대로 처리하고, 호출 측에는 입력 순서대로 돌려준다.
+- 종료: 정상 종료 시 모든 문서를 흘려보낸다. 예외/중단(제너레이터 close, Ctrl+C) 시에는
+  새 문서 읽기를 멈추고 이미 읽은 문서는 추출·쓰기까지 마친 뒤(반쯤 쓴 결과 없음) 스레드를 정리한다.
+- 계측: 스레드 간 경합을 피하도록 단계마다 한 스레드에서만 기록한다(read는 읽기 시간을 문서에 실어
+  추출 스레드가 기록).
+"""
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from src.pipeline.document import (
+    WarningRecord, collect_warnings, extract_document, output_path_for, write_result_json,
+)
+from src.pipeline.ocr_reader import PAGE_TEXTS, read_ocr_fields
+from src.pipeline.pages import PageMode
+from src.pipeline.parallel import _extract_in_worker, _init_worker
+from src.pipeline.result_cache import DEFAULT_MAX_ENTRIES
+from src.pipeline.routing import RoutePolicy
+from src.pipeline.streaming import BATCH_SIZE, _iter_batched
+from src.utils import metrics
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_READERS = 4
+DEFAULT_QUEUE_SIZE = 32
+# 종료 신호(단계마다 한 번씩 다음 큐로 전달)
+_DONE = object()
+# 티켓 대기 중 종료 요청을 확인하는 간격(초)
+_POLL = 0.05
+
+
+class _Item:
+    """파이프라인을 흐르는 문서 한 건."""
+
+    __slots__ = ("index", "path", "data", "read_s", "extracted", "warnings", "error")
+
+    def __init__(self, index: int, path: Path):
+        self.index = index
+        self.path = path
+        self.data: Optional[dict] = None
+        self.read_s = 0.0
+        self.extracted: Optional[dict] = None
+        self.warnings: List[WarningRecord] = []
+        self.error: Optional[BaseException] = None
+
+
+class StagedPipeline:
+    """읽기/추출/쓰기 단계를 제한된 큐로 연결한 배치 처리기.
+
+    extractor: workers <= 1일 때 추출 스레드가 쓸 추출기
+    workers > 1: use_nlp/cache_path/cache_size/layout/rules/route/pages로 워커 프로세스마다 추출기를 만든다
+    output_dir: None이면 결과 JSON을 쓰지 않는다(열 지향 출력은 호출 측에서 기록)
+    """
+
+    def __init__(self, output_dir: Optional[Path], extractor: Any = None, workers: int = 1,
+                 use_nlp: bool = False, cache_path: Optional[str] = None,
+                 cache_size: int = DEFAULT_MAX_ENTRIES, layout: bool = False,
+                 rules: Optional[str] = None, rules_reload: float = 0.0,
+                 route: Optional[RoutePolicy] = None, pages: Optional[PageMode] = None,
+                 readers: int = DEFAULT_READERS, queue_size: int = DEFAULT_QUEUE_SIZE,
+                 max_inflight: Optional[int] = None):
+        if workers <= 1 and extractor is None:
+            raise ValueError("workers <= 1이면 extractor가 필요합니다")
+        if readers < 1 or queue_size < 1:
+            raise ValueError("readers와 queue_size는 1 이상이어야 합니다")
+        self.output_dir = Path(output_dir) if output_dir is not None else None
+        self.extractor = extractor
+        self.workers = workers
+        self.worker_args = (use_nlp, None, cache_path, cache_size, False, layout, rules, rules_reload, route,
+                            pages)
+        self.readers = readers
+        self.queue_size = queue_size
+        # 기본 상한: 세 큐가 모두 찬 상태 + 읽는 중인 문서
+        self.max_inflight = max_inflight or 3 * queue_size + readers
+        if extractor is not None:
+            self.ocr_fields = getattr(extractor, "ocr_fields", ("text",))
+        else:
+            fields = ["text"]
+            if route is not None and not use_nlp:
+                fields.append("confidence")
+            if layout or (route is not None and route.min_word_confidence is not None):
+                fields.append("pages")
+            if pages is not None and not use_nlp:
+                fields.append(PAGE_TEXTS)
+            self.ocr_fields = tuple(fields)
+
+    # ── 호출 측 ──────────────────────────────────────────────
+    def run(self, json_files: Iterable[Path]) -> Iterator[Tuple[str, dict, List[WarningRecord]]]:
+        """(파일명, 추출 결과, 경고)를 입력 순서대로 반환한다.
+
+        문서 처리 중 예외가 나면 그 문서 차례에 예외를 다시 던진다(이전 문서는 모두 반환됨).
+        """
+        self._stop = threading.Event()
+        self._tickets = threading.Semaphore(self.max_inflight)
+        self._paths = enumerate(json_files)
+        self._paths_lock = threading.Lock()
+        self._read_q: "queue.Queue" = queue.Queue(self.queue_size)
+        self._write_q: "queue.Queue" = queue.Queue(self.queue_size)
+        self._done_q: "queue.Queue" = queue.Queue(self.queue_size)
+
+        threads = [threading.Thread(target=self._read_stage, name=f"reader-{i}", daemon=True)
+                   for i in range(self.readers)]
+        threads.append(threading.Thread(target=self._extract_stage, name="extractor", daemon=True))
+        threads.append(threading.Thread(target=self._write_stage, name="writer", daemon=True))
+        for t in threads:
+            t.start()
+
+        pending: Dict[int, _Item] = {}
+        next_index = 0
+        finished = False
+        try:
+            while True:
+                item = self._done_q.get()
+                if item is _DONE:
+                    finished = True
+                    break
+                pending[item.index] = item
+                while next_index in pending:
+                    ready = pending.pop(next_index)
+                    next_index += 1
+                    self._tickets.release()
+                    if ready.error is not None:
+                        raise ready.error
+                    yield ready.path.name, ready.extracted, ready.warnings
+        finally:
+            if not finished:
+                # 새 읽기를 멈추고, 이미 읽은 문서가 추출·쓰기를 마칠 때까지 흘려보낸다
+                self._stop.set()
+                while self._done_q.get() is not _DONE:
+                    self._tickets.release()
+            for t in threads:
+                t.join()
+
+    # ── 단계 ─────────────────────────────────────────────────
+    def _next_path(self) -> Optional[Tuple[int, Path]]:
+        with self._paths_lock:
+            return next(self._paths, None)
+
+    def _read_stage(self) -> None:
+        try:
+            while not self._stop.is_set():
+                # 티켓이 없으면(in-flight 상한) 대기 – 종료 요청은 주기적으로 확인
+                if not self._tickets.acquire(timeout=_POLL):
+                    continue
+                nxt = self._next_path()
+                if nxt is None or self._stop.is_set():
+                    self._tickets.release()
+                    break
+                item = _Item(nxt[0], Path(nxt[1]))
+                t0 = time.perf_counter()
+                try:
+                    item.data = read_ocr_fields(item.path, self.ocr_fields)
+                except Exception as e:
+                    item.error = e
+                item.read_s = time.perf_counter() - t0
+                self._read_q.put(item)
+        finally:
+            self._read_q.put(_DONE)
+
+    def _extract_stage(self) -> None:
+        try:
+            if self.workers > 1:
+                self._extract_in_pool()
+            else:
+                self._extract_in_thread()
+        finally:
+            self._write_q.put(_DONE)
+
+    def _reader_items(self, limit: int = 1) -> Tuple[List[_Item], bool]:
+        """read_q에서 최대 limit개를 꺼낸다(첫 개만 대기). 반환: (문서들, 읽기 단계 종료 여부)."""
+        items: List[_Item] = []
+        while len(items) < limit:
+            try:
+                item = self._read_q.get(block=not items)
+            except queue.Empty:
+                break
+            if item is _DONE:
+                self._readers_done += 1
+                if self._readers_done == self.readers:
+                    return items, True
+                continue
+            items.append(item)
+        return items, False
+
+    def _observe_read(self, items: List[_Item]) -> None:
+        m = metrics.ACTIVE
+        if m is not None:
+            for item in items:
+                m.observe("read", item.read_s)
+
+    def _extract_in_thread(self) -> None:
+        extractor = self.extractor
+        # 배치 API(NLP 모드)는 큐에 이미 쌓인 문서를 묶어 한 번에 넘긴다
+        limit = BATCH_SIZE if hasattr(extractor, "extract_batch") else 1
+        self._readers_done = 0
+        done = False
+        while not done:
+            items, done = self._reader_items(limit=limit)
+            self._observe_read(items)
+            ok = [item for item in items if item.error is None]
+            try:
+                records = [(item.path.name, item.data) for item in ok]
+                if limit > 1:
+                    results = [extracted for _, extracted in _iter_batched(records, extractor)]
+                else:
+                    results = [extract_document(data, extractor) for _, data in records]
+                for item, extracted in zip(ok, results):
+                    item.extracted = extracted
+                    item.warnings = collect_warnings(item.path.name, extracted)
+            except Exception as e:
+                for item in ok:
+                    item.error = e
+            for item in items:
+                item.data = None
+                self._write_q.put(item)
+
+    def _extract_in_pool(self) -> None:
+        """문서를 풀에 넘기고(이 스레드), 결과는 수집 스레드가 제출 순서대로 받아 쓰기 단계로 보낸다."""
+        parent_metrics = metrics.ACTIVE
+        init_args = self.worker_args[:4] + (parent_metrics is not None,) + self.worker_args[5:]
+        # 풀에 넘긴(결과 대기 중) 문서 수 제한: 추출이 느리면 제출이 멈추고 read_q가 찬다
+        submitted: "queue.Queue" = queue.Queue(self.workers * 2)
+        collector = threading.Thread(target=self._collect, args=(submitted, parent_metrics),
+                                     name="collector", daemon=True)
+        with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                 initargs=init_args) as pool:
+            collector.start()
+            try:
+                self._readers_done = 0
+                done = False
+                while not done:
+                    items, done = self._reader_items()
+                    self._observe_read(items)
+                    for item in items:
+                        future = None
+                        if item.error is None:
+                            try:
+                                future = pool.submit(_extract_in_worker, item.path.name, item.data)
+                            except Exception as e:  # 워커 비정상 종료(BrokenProcessPool) 등
+                                item.error = e
+                            item.data = None
+                        submitted.put((item, future))
+            finally:
+                submitted.put(_DONE)
+                collector.join()
+
+    def _collect(self, submitted: "queue.Queue", parent_metrics: Optional[metrics.Metrics]) -> None:
+        while True:
+            entry = submitted.get()
+            if entry is _DONE:
+                return
+            item, future = entry
+            if future is not None:
+                try:
+                    (item.extracted, item.warnings), worker_metrics = future.result()
+                    if worker_metrics is not None and parent_metrics is not None:
+                        parent_metrics.merge(worker_metrics)
+                except Exception as e:
+                    item.error = e
+            self._write_q.put(item)
+
+    def _write_stage(self) -> None:
+        try:
+            while True:
+                item = self._write_q.get()
+                if item is _DONE:
+                    break
+                if item.error is None and self.output_dir is not None:
+                    m = metrics.ACTIVE
+                    t0 = time.perf_counter()
+                    try:
+                        write_result_json(item.extracted, output_path_for(item.path, self.output_dir))
+                    except Exception as e:
+                        item.error = e
+                    if m is not None:
+                        m.observe("write", time.perf_counter() - t0)
+                self._done_q.put(item)
+        finally:
+            self._done_q.put(_DONE)
+
+
+def iter_staged(json_files: Iterable[Path], output_dir: Optional[Path], extractor: Any = None,
+                **kwargs) -> Iterator[Tuple[str, dict, List[WarningRecord]]]:
+    """StagedPipeline(output_dir, extractor, **kwargs).run(json_files)의 축약형."""
+    return StagedPipeline(output_dir, extractor, **kwargs).run(json_files)
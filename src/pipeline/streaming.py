@@ -0,0 +1,124 @@
+"""JSONL 스트리밍 입출력.
+
+OCR 레코드를 한 줄씩 읽어 정제·추출하고, 결과를 한 줄씩 기록한다.
+모든 단계가 제너레이터로 연결되어 코퍼스 크기와 무관하게 메모리 사용량이 일정하다.
+"""
+import json
+import logging
+import sys
+from contextlib import contextmanager
+from itertools import islice
+from json.encoder import encode_basestring
+from typing import IO, Any, Iterable, Iterator, Optional, Tuple, Union
+
+from src.parser.cleaner import clean_text
+from src.parser.result import to_json
+from src.parser.rule_pack import refresh_rules
+from src.pipeline.document import collect_warnings, count_missing_fields, extract_document
+from src.utils import metrics
+
+logger = logging.getLogger(__name__)
+
+STDIO = "-"
+# 배치 API(extract_batch)가 있는 추출기(NLP 모드)에 한 번에 넘길 레코드 수
+BATCH_SIZE = 64
+
+
+@contextmanager
+def open_text(path: str, mode: str):
+    """경로가 '-'이면 표준 입출력을, 아니면 UTF-8 파일을 연다."""
+    if path == STDIO:
+        yield sys.stdin if "r" in mode else sys.stdout
+        return
+    with open(path, mode, encoding="utf-8") as f:
+        yield f
+
+
+def parse_record(line: Union[str, bytes], record_id: str) -> Optional[dict]:
+    """JSONL 한 줄(앞뒤 공백 제거됨) → OCR dict. 손상 줄/객체가 아닌 레코드는 경고 후 None."""
+    m = metrics.ACTIVE
+    try:
+        if m is None:
+            data = json.loads(line)
+        else:
+            with m.time("read"):
+                data = json.loads(line)
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+        logger.warning("[%s] JSON 파싱 실패: %s", record_id, e)
+        return None
+    if not isinstance(data, dict):
+        logger.warning("[%s] 객체가 아닌 레코드 건너뜀", record_id)
+        return None
+    return data
+
+
+def iter_records(lines: Iterable[str], source: str = STDIO) -> Iterator[Tuple[str, dict]]:
+    """JSONL 줄을 (레코드 식별자, OCR dict)로 변환한다. 빈 줄/손상 줄은 건너뛴다."""
+    for lineno, line in enumerate(lines, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        record_id = f"{source}:{lineno}"
+        data = parse_record(line, record_id)
+        if data is not None:
+            yield record_id, data
+
+
+def iter_results(records: Iterable[Tuple[str, dict]], extractor: Any) -> Iterator[Tuple[str, dict]]:
+    """(레코드 식별자, OCR dict) → (레코드 식별자, 추출 결과). 경고는 레코드마다 즉시 로깅한다.
+
+    추출기에 extract_batch가 있으면 BATCH_SIZE개씩 묶어 추출한다(메모리는 배치 크기로 제한).
+    """
+    if hasattr(extractor, "extract_batch"):
+        results = _iter_batched(records, extractor)
+    else:
+        results = ((record_id, extract_document(data, extractor)) for record_id, data in records)
+    for record_id, extracted in results:
+        for fmt, args in collect_warnings(record_id, extracted):
+            logger.warning(fmt, *args)
+        yield record_id, extracted
+
+
+def _iter_batched(records: Iterable[Tuple[str, dict]], extractor: Any) -> Iterator[Tuple[str, dict]]:
+    records = iter(records)
+    while True:
+        chunk = list(islice(records, BATCH_SIZE))
+        if not chunk:
+            return
+        # 배치 경계에서 규칙 팩 리로드를 확인한다(배치 하나는 같은 규칙으로 처리)
+        refresh_rules()
+        m = metrics.ACTIVE
+        if m is None:
+            texts = [clean_text(data.get('text', '')) for _, data in chunk]
+            yield from zip((record_id for record_id, _ in chunk), extractor.extract_batch(texts))
+            continue
+        with m.time("clean_batch"):
+            texts = [clean_text(data.get('text', '')) for _, data in chunk]
+        with m.time("extract_batch"):
+            batch = extractor.extract_batch(texts)
+        for extracted in batch:
+            count_missing_fields(m, extracted)
+        yield from zip((record_id for record_id, _ in chunk), batch)
+
+
+def format_result(record_id: str, extracted: dict) -> str:
+    """출력 한 줄. json.dumps({"source": ..., "result": ...}, separators=(",", ":"))와 같은 문자열."""
+    return '{"source":%s,"result":%s}\n' % (encode_basestring(record_id), to_json(extracted))
+
+
+def write_results(results: Iterable[Tuple[str, dict]], out: IO[str]) -> int:
+    """결과를 한 줄 JSON으로 기록하고 기록 건수를 반환한다."""
+    count = 0
+    for record_id, extracted in results:
+        out.write(format_result(record_id, extracted))
+        count += 1
+    out.flush()
+    return count
+
+
+def stream_jsonl(src: str, dest: str, extractor: Any) -> int:
+    """src(JSONL 파일 또는 '-')를 처리해 dest(JSONL 파일 또는 '-')로 기록한다."""
+    source_name = "stdin" if src == STDIO else src
+    with open_text(src, "r") as fin, open_text(dest, "w") as fout:
+        records = iter_records(fin, source_name)
+        return write_results(iter_results(records, extractor), fout)
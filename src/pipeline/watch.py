@@ -0,0 +1,397 @@
+"""입력 디렉터리 감시 모드(--watch): 스캐너가 떨군 OCR JSON을 마이크로 배치로 바로 처리한다.
+
+main.py를 주기적으로(cron 등) 실행하면 실행마다 인터프리터 기동·규칙 팩/추출기 구성을 다시 치르고,
+결과는 실행 간격만큼 늦는다. WatchService는 추출기(또는 워커 풀)를 한 번 구성해 둔 채 디렉터리를
+지켜보다가, 새 파일을 작은 배치로 묶어 처리한다.
+
+- 감지: Linux에서는 inotify(IN_CLOSE_WRITE, IN_MOVED_TO)로 쓰기가 끝난 파일을 바로 알고, 그 밖의
+  환경에서는 poll_interval초마다 디렉터리를 훑는다. inotify를 쓸 때도 같은 훑기로 이벤트 없이 생긴
+  파일(시작 전에 쌓인 파일, 이벤트 큐 넘침)을 찾는다. 이벤트 없이 찾은 파일은 mtime 이후 settle초
+  동안 바뀌지 않아야 준비된 것으로 본다(쓰는 중인 파일을 읽지 않도록).
+- 마이크로 배치: 준비된 파일이 batch_size건 모이거나 배치의 첫 파일이 들어온 뒤 batch_wait초가
+  지나면 처리한다. 한가할 때는 파일 하나도 batch_wait 안에 처리되고, 몰릴 때는 배치 단위로 워커 풀에
+  나눠 처리량을 유지한다.
+- 완료 표시: 결과 JSON을 원자적으로 쓴 뒤(write_result_json) 입력을 done 디렉터리로 os.replace한다
+  (mark면 제자리에서 '.done' 접미어를 붙임). 처리에 실패한 입력은 failed 디렉터리(mark면 '.failed')로
+  옮긴다. done/failed는 감시 디렉터리와 같은 파일 시스템에 있어야 한다. 결과 기록과 이동 사이에
+  중단되면 입력이 남아 다음 실행에서 다시 처리된다(같은 결과 파일을 덮어씀).
+"""
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import stat
+import struct
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import Any, Callable, Iterable, List, Optional, Set, Tuple, Union
+
+from src.pipeline.document import WarningRecord, process_file
+from src.pipeline.pages import PageMode
+from src.pipeline.parallel import _init_worker, _process_in_worker
+from src.pipeline.result_cache import DEFAULT_MAX_ENTRIES
+from src.pipeline.routing import RoutePolicy
+from src.utils import metrics
+from src.utils.log import RunLog
+
+logger = logging.getLogger(__name__)
+
+BACKENDS = ("auto", "inotify", "poll")
+DEFAULT_PATTERN = "*.json"
+# 배치 하나의 최대 문서 수
+DEFAULT_BATCH_SIZE = 32
+# 배치의 첫 파일이 들어온 뒤 배치를 닫기까지 기다리는 최대 시간(초)
+DEFAULT_BATCH_WAIT = 0.5
+# 디렉터리 훑기 간격(초, inotify에서는 이벤트 대기 상한)
+DEFAULT_POLL_INTERVAL = 1.0
+# 이벤트 없이 찾은 파일이 바뀌지 않아야 하는 시간(초)
+DEFAULT_SETTLE = 2.0
+DONE_DIR = "done"
+FAILED_DIR = "failed"
+DONE_SUFFIX = ".done"
+FAILED_SUFFIX = ".failed"
+
+# <sys/inotify.h>
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+# struct inotify_event { int wd; uint32_t mask, cookie, len; char name[]; }
+_EVENT = struct.Struct("iIII")
+
+
+class DirectoryWatcher:
+    """디렉터리 훑기 기반 감시(모든 플랫폼). poll()은 준비된 새 파일을 mtime 순으로 돌려준다.
+
+    돌려준 파일은 release()하기 전까지(처리 후 옮기기 전까지) 다시 돌려주지 않는다.
+    clock은 mtime과 비교하므로 벽시계(time.time)여야 한다.
+    """
+    backend = "poll"
+
+    def __init__(self, directory: Union[str, Path], pattern: str = DEFAULT_PATTERN,
+                 settle: float = DEFAULT_SETTLE, clock: Callable[[], float] = time.time):
+        if settle < 0:
+            raise ValueError("settle은 0 이상이어야 합니다")
+        self.directory = Path(directory)
+        if not self.directory.is_dir():
+            raise NotADirectoryError(f"감시할 디렉터리가 없습니다: {self.directory}")
+        self.pattern = pattern
+        self.settle = settle
+        self.clock = clock
+        # 배치에 넘겼지만 아직 옮기지 않은 파일 이름
+        self._claimed: Set[str] = set()
+        # 쓰기 완료 이벤트를 받은 파일 이름(settle 대기 생략)
+        self._closed: Set[str] = set()
+
+    def poll(self) -> List[Path]:
+        now = self.clock()
+        ready: List[Tuple[float, str]] = []
+        present: Set[str] = set()
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                name = entry.name
+                if name in self._claimed or not fnmatch(name, self.pattern):
+                    continue
+                try:
+                    st = entry.stat()
+                except FileNotFoundError:
+                    continue
+                if not stat.S_ISREG(st.st_mode):
+                    continue
+                present.add(name)
+                if name in self._closed or now - st.st_mtime >= self.settle:
+                    ready.append((st.st_mtime, name))
+        ready.sort()
+        self._closed &= present
+        for _, name in ready:
+            self._closed.discard(name)
+            self._claimed.add(name)
+        return [self.directory / name for _, name in ready]
+
+    def release(self, path: Union[str, Path]) -> None:
+        """처리를 마친(옮긴) 파일을 잊는다. 같은 이름의 새 파일이 오면 다시 돌려준다."""
+        self._claimed.discard(Path(path).name)
+
+    def wait(self, timeout: float) -> None:
+        """다음 poll()까지 기다린다."""
+        if timeout > 0:
+            time.sleep(timeout)
+
+    def close(self) -> None:
+        pass
+
+
+class InotifyWatcher(DirectoryWatcher):
+    """Linux inotify로 쓰기 완료/이동 이벤트를 받아, 이벤트가 온 파일은 settle 없이 바로 돌려준다.
+
+    libc에 inotify가 없거나(다른 OS) 초기화에 실패하면 생성 시 OSError/AttributeError를 낸다.
+    """
+    backend = "inotify"
+
+    def __init__(self, directory: Union[str, Path], pattern: str = DEFAULT_PATTERN,
+                 settle: float = DEFAULT_SETTLE, clock: Callable[[], float] = time.time):
+        super().__init__(directory, pattern, settle, clock)
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, f"inotify_init1 실패: {os.strerror(err)}")
+        if libc.inotify_add_watch(fd, os.fsencode(self.directory), _IN_CLOSE_WRITE | _IN_MOVED_TO) < 0:
+            err = ctypes.get_errno()
+            os.close(fd)
+            raise OSError(err, f"inotify_add_watch 실패: {os.strerror(err)}")
+        self._fd = fd
+
+    def wait(self, timeout: float) -> None:
+        """이벤트가 오거나 timeout초가 지날 때까지 기다리고, 받은 이벤트를 모두 읽는다."""
+        readable, _, _ = select.select([self._fd], [], [], max(timeout, 0.0))
+        if readable:
+            self._drain()
+
+    def _drain(self) -> None:
+        while True:
+            try:
+                buf = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                return
+            offset = 0
+            while offset < len(buf):
+                _, mask, _, length = _EVENT.unpack_from(buf, offset)
+                offset += _EVENT.size
+                name = buf[offset:offset + length].rstrip(b"\0")
+                offset += length
+                # 큐 넘침(IN_Q_OVERFLOW)으로 놓친 파일은 다음 훑기에서 settle 후 찾는다
+                if name and mask & (_IN_CLOSE_WRITE | _IN_MOVED_TO):
+                    name = os.fsdecode(name)
+                    if fnmatch(name, self.pattern):
+                        self._closed.add(name)
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+def open_watcher(directory: Union[str, Path], backend: str = "auto", pattern: str = DEFAULT_PATTERN,
+                 settle: float = DEFAULT_SETTLE) -> DirectoryWatcher:
+    """감시기를 연다. auto면 inotify를 시도하고 쓸 수 없으면 디렉터리 훑기로 폴백한다."""
+    if backend not in BACKENDS:
+        raise ValueError(f"알 수 없는 감시 방식입니다: {backend} (선택: {', '.join(BACKENDS)})")
+    if backend != "poll":
+        try:
+            return InotifyWatcher(directory, pattern, settle)
+        except (OSError, AttributeError) as e:
+            if backend == "inotify":
+                raise
+            logger.info("inotify를 쓸 수 없어 디렉터리 훑기로 감시합니다: %s", e)
+    return DirectoryWatcher(directory, pattern, settle)
+
+
+class MicroBatcher:
+    """준비된 파일을 batch_size건 또는 첫 파일이 들어온 뒤 max_wait초 단위로 묶는다."""
+
+    def __init__(self, batch_size: int = DEFAULT_BATCH_SIZE, max_wait: float = DEFAULT_BATCH_WAIT,
+                 clock: Callable[[], float] = time.monotonic):
+        if batch_size < 1:
+            raise ValueError("batch_size는 1 이상이어야 합니다")
+        if max_wait < 0:
+            raise ValueError("max_wait는 0 이상이어야 합니다")
+        self.batch_size = batch_size
+        self.max_wait = max_wait
+        self.clock = clock
+        self._pending: List[Path] = []
+        self._since: Optional[float] = None
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def add(self, paths: Iterable[Path]) -> None:
+        paths = list(paths)
+        if paths and not self._pending:
+            self._since = self.clock()
+        self._pending.extend(paths)
+
+    def due(self) -> bool:
+        """배치를 처리할 때인지(가득 찼거나 첫 파일이 max_wait초 넘게 기다림)."""
+        if not self._pending:
+            return False
+        return len(self._pending) >= self.batch_size or self.clock() - self._since >= self.max_wait
+
+    def take(self) -> List[Path]:
+        """앞에서부터 최대 batch_size건을 꺼낸다(남은 파일은 이미 기다린 시간을 이어서 센다)."""
+        batch, self._pending = self._pending[:self.batch_size], self._pending[self.batch_size:]
+        if not self._pending:
+            self._since = None
+        return batch
+
+    def timeout(self, limit: float) -> float:
+        """배치 마감까지 남은 시간(limit초 상한, 기다리는 파일이 없으면 limit)."""
+        if not self._pending:
+            return limit
+        return max(0.0, min(limit, self._since + self.max_wait - self.clock()))
+
+
+class WatchService:
+    """감시기 + 마이크로 배치 + 상주 추출기(workers > 1이면 상주 프로세스 풀).
+
+    extractor: 단일 프로세스 실행의 추출기(workers > 1이면 무시하고, 워커마다 build_extractor 인자로 구성)
+    done_dir/failed_dir: 처리를 마친/실패한 입력을 옮길 디렉터리(기본 감시 디렉터리 아래 done/, failed/)
+    mark: 옮기지 않고 제자리에서 '.done'/'.failed' 접미어를 붙인다
+    """
+
+    def __init__(self, watcher: DirectoryWatcher, output_dir: Union[str, Path], extractor: Any = None,
+                 batch_size: int = DEFAULT_BATCH_SIZE, batch_wait: float = DEFAULT_BATCH_WAIT,
+                 poll_interval: float = DEFAULT_POLL_INTERVAL, done_dir: Optional[Union[str, Path]] = None,
+                 failed_dir: Optional[Union[str, Path]] = None, mark: bool = False,
+                 workers: int = 1, use_nlp: bool = False, cache_path: Optional[str] = None,
+                 cache_size: int = DEFAULT_MAX_ENTRIES, layout: bool = False, rules: Optional[str] = None,
+                 rules_reload: float = 0.0, route: Optional[RoutePolicy] = None,
+                 pages: Optional[PageMode] = None, run_log: Optional[RunLog] = None):
+        if poll_interval <= 0:
+            raise ValueError("poll_interval은 0보다 커야 합니다")
+        if extractor is None and workers <= 1:
+            raise ValueError("단일 프로세스 실행에는 extractor가 필요합니다")
+        self.watcher = watcher
+        self.output_dir = Path(output_dir)
+        if self.output_dir.resolve() == watcher.directory.resolve():
+            # 결과 파일(<이름>_result.json)이 다시 입력으로 잡히지 않도록
+            raise ValueError("결과 디렉터리는 감시 디렉터리와 달라야 합니다")
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.batcher = MicroBatcher(batch_size, batch_wait)
+        self.poll_interval = poll_interval
+        self.mark = mark
+        self.done_dir = Path(done_dir) if done_dir is not None else watcher.directory / DONE_DIR
+        self.failed_dir = Path(failed_dir) if failed_dir is not None else watcher.directory / FAILED_DIR
+        if not mark:
+            self.done_dir.mkdir(parents=True, exist_ok=True)
+            self.failed_dir.mkdir(parents=True, exist_ok=True)
+        self.extractor = extractor
+        self.run_log = run_log or RunLog(logger)
+        self.batches = 0
+        self.failed = 0
+        self._running = False
+        self._executor = None
+        self._parent_metrics = None
+        if workers > 1:
+            # 워커마다 추출기를 한 번 구성하고 감시가 끝날 때까지 재사용한다
+            self._parent_metrics = metrics.ACTIVE
+            self._executor = ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(use_nlp, str(self.output_dir), cache_path, cache_size, self._parent_metrics is not None,
+                          layout, rules, rules_reload, route, pages),
+            )
+
+    def run_once(self) -> int:
+        """새 파일을 찾아 배치에 넣고, 마감된 배치가 있으면 하나를 처리한다. 처리한 파일 수를 반환한다."""
+        if len(self.batcher) < self.batcher.batch_size:
+            # 밀린 파일이 한 배치 넘게 남아 있으면 디렉터리를 다시 훑지 않는다
+            self.batcher.add(self.watcher.poll())
+        if not self.batcher.due():
+            return 0
+        return self.process_batch(self.batcher.take())
+
+    def serve_forever(self, max_batches: Optional[int] = None) -> None:
+        """stop()이 불릴 때까지(또는 max_batches개 배치를 처리할 때까지) 감시한다."""
+        self._running = True
+        logger.info("입력 감시 시작: %s (%s, 배치 %d건/%.2f초)", self.watcher.directory, self.watcher.backend,
+                    self.batcher.batch_size, self.batcher.max_wait,
+                    extra={"data": {"event": "watch_start", "directory": str(self.watcher.directory),
+                                    "backend": self.watcher.backend}})
+        try:
+            while self._running:
+                if self.run_once() and max_batches is not None and self.batches >= max_batches:
+                    break
+                if not self.batcher.due():
+                    self.watcher.wait(self.batcher.timeout(self.poll_interval))
+        finally:
+            self._running = False
+
+    def stop(self) -> None:
+        """감시를 멈춘다(시그널 처리기에서 불러도 된다: 처리 중인 배치는 마치고 멈춘다)."""
+        self._running = False
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        self.watcher.close()
+
+    def process_batch(self, batch: List[Path]) -> int:
+        started = time.perf_counter()
+        if self._executor is None:
+            outcomes = (self._process_local(path) for path in batch)
+        else:
+            futures = [self._executor.submit(_process_in_worker, path) for path in batch]
+            outcomes = (self._collect(future) for future in futures)
+        m = metrics.ACTIVE
+        failed = 0
+        max_latency = 0.0
+        for path, outcome in zip(batch, outcomes):
+            try:
+                arrived = path.stat().st_mtime
+            except FileNotFoundError:
+                arrived = None
+            if isinstance(outcome, Exception):
+                failed += 1
+                dest = self._finish(path, failed=True)
+                logger.warning("[%s] 처리 실패 → %s: %s", path.name, dest, outcome,
+                               extra={"data": {"file": path.name, "warning": "watch_failed"}})
+            else:
+                name, extracted, warnings = outcome
+                self.run_log.document(name, extracted, warnings)
+                self._finish(path)
+            if arrived is not None:
+                # 스캔 파일이 생긴(마지막으로 쓰인) 시각부터 결과 기록·입력 이동까지
+                latency = max(0.0, time.time() - arrived)
+                max_latency = max(max_latency, latency)
+                if m is not None:
+                    m.observe("watch_latency", latency)
+        self.batches += 1
+        self.failed += failed
+        elapsed = time.perf_counter() - started
+        if m is not None:
+            m.observe("watch_batch", elapsed)
+            if failed:
+                m.incr("watch_failed", failed)
+        logger.info("마이크로 배치: %d건 (실패 %d건), %.1f ms, 최대 지연 %.2f초", len(batch), failed,
+                    elapsed * 1e3, max_latency,
+                    extra={"data": {"event": "batch", "documents": len(batch), "failed": failed,
+                                    "elapsed_s": round(elapsed, 4), "max_latency_s": round(max_latency, 3)}})
+        return len(batch)
+
+    def _process_local(self, path: Path) -> Union[Tuple[str, dict, List[WarningRecord]], Exception]:
+        try:
+            return process_file(path, self.extractor, self.output_dir)
+        except Exception as e:
+            return e
+
+    def _collect(self, future: Future) -> Union[Tuple[str, dict, List[WarningRecord]], Exception]:
+        try:
+            result, worker_metrics = future.result()
+        except BrokenProcessPool:
+            # 워커가 죽으면 남은 입력은 옮기지 않고 멈춘다(다시 시작하면 처리)
+            raise
+        except Exception as e:
+            return e
+        if worker_metrics is not None and self._parent_metrics is not None:
+            self._parent_metrics.merge(worker_metrics)
+        return result
+
+    def _finish(self, path: Path, failed: bool = False) -> Path:
+        """입력을 완료/실패 위치로 원자적으로 옮긴다."""
+        if self.mark:
+            dest = path.with_name(path.name + (FAILED_SUFFIX if failed else DONE_SUFFIX))
+        else:
+            dest = (self.failed_dir if failed else self.done_dir) / path.name
+        try:
+            os.replace(path, dest)
+        except FileNotFoundError:
+            # 처리 중에 누가 지웠거나 옮겼다(결과는 이미 기록됨)
+            dest = path
+        self.watcher.release(path)
+        return dest
@@ -1,5 +1,15 @@
 import re
 
+# import 시 1회 컴파일되는 정규식
+_SPLIT_NUMBER_KG_RE = re.compile(r"(\d+)\s+(\d+)\s*kg", re.IGNORECASE)
+_LEADING_DATE_RE = re.compile(r"^\d{4}[-\/.]\d{2}[-\/.]\d{2}")
+_KG_VALUE_RE = re.compile(r"[\d,]+\s*kg", re.IGNORECASE)
+_TIME_RE = re.compile(r"\b\d{2}:\d{2}\b")
+_COORDINATE_RE = re.compile(r"^\d{2,3}\.\d{5,}")
+_DIGITS_RE = re.compile(r"\d+")
+_KG_NUMBER_RE = re.compile(r"(\d+(?:,\d{3})*)\s*kg")
+_NUMBER_CHUNK_RE = re.compile(r"(\d[\d,]+)")
+
 
 def merge_split_number_kg(text: str) -> str:
     """'kg' 앞의 숫자가 공백으로 분리된 경우 병합한다.
@@ -8,7 +18,7 @@ def merge_split_number_kg(text: str) -> str:
     """
     if not text:
         return ""
-    return re.sub(r"(\d+)\s+(\d+)\s*kg", r"\1\2kg", text, flags=re.IGNORECASE)
+    return _SPLIT_NUMBER_KG_RE.sub(r"\1\2kg", text)
 
 
 def is_noise_line(line: str) -> bool:
@@ -22,19 +32,19 @@ def is_noise_line(line: str) -> bool:
 
     ls = line.strip()
     # 줄 시작의 날짜 패턴(예: 2025-12-01, 2025.12.01)
-    if re.search(r"^\d{4}[-\/.]\d{2}[-\/.]\d{2}", ls):
+    if _LEADING_DATE_RE.search(ls):
         return True
     # 무게 단위 'kg'가 포함된 경우
-    if re.search(r"[\d,]+\s*kg", ls, re.IGNORECASE):
+    if _KG_VALUE_RE.search(ls):
         return True
     # 시간 패턴(예: 02:07)
-    if re.search(r"\b\d{2}:\d{2}\b", ls):
+    if _TIME_RE.search(ls):
         return True
     # 좌표 유사 소수 패턴(예: 37.12345)
-    if re.search(r"^\d{2,3}\.\d{5,}", ls):
+    if _COORDINATE_RE.search(ls):
         return True
     # 순수 숫자만 있는 경우
-    if re.fullmatch(r"\d+", ls):
+    if _DIGITS_RE.fullmatch(ls):
         return True
     return False
 
@@ -48,7 +58,7 @@ def extract_number_value(line_lower: str) -> int:
     실패 시 0 반환. 기존 extractor 로직과 동일한 우선순위를 따른다.
     """
     # [우선순위 1] 'kg' 단위 숫자 추출
-    kg_match = re.search(r"(\d+(?:,\d{3})*)\s*kg", line_lower)
+    kg_match = _KG_NUMBER_RE.search(line_lower)
     if kg_match:
         try:
             return int(kg_match.group(1).replace(',', ''))
@@ -56,7 +66,7 @@ def extract_number_value(line_lower: str) -> int:
             return 0
 
     # [우선순위 2] 줄 마지막 숫자 덩어리
-    raw_nums = re.findall(r"(\d[\d,]+)", line_lower)
+    raw_nums = _NUMBER_CHUNK_RE.findall(line_lower)
     if not raw_nums:
         return 0
     try:
@@ -0,0 +1,146 @@
+"""파이프라인 로깅 구성: 동기/비동기(큐) 핸들러, 텍스트/JSON 한 줄 형식, 실행 요약.
+
+비동기 모드에서는 로거에 QueueHandler 하나만 붙이고, 실제 콘솔/파일 핸들러는
+QueueListener의 백그라운드 스레드에서 실행한다. 표준 QueueHandler는 큐에 넣기 전에
+호출 스레드에서 메시지를 포맷하므로, 같은 프로세스 안의 큐에서는 포맷을 건너뛰고
+레코드를 그대로 넘긴다(포맷·I/O 비용이 모두 리스너 스레드로 이동).
+
+문서별 로그는 RunLog가 맡는다. 경고는 항상 기록하고, 성공 줄은 표본(sample_every건마다
+1건)만 남기며, 실행이 끝나면 건수/경고 종류별 개수/처리 속도를 요약 한 줄로 기록한다.
+"""
+import json
+import logging
+import logging.handlers
+import queue
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+TEXT_FORMAT = "[%(asctime)s] %(levelname)s - %(message)s"
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+LOG_FORMATS = ("text", "json")
+
+
+class JsonFormatter(logging.Formatter):
+    """레코드 → 한 줄 JSON. extra={"data": {...}}로 넘긴 필드를 함께 기록한다.
+
+    data에 "event"가 있으면 필드가 메시지를 대신하므로 메시지 포맷(msg % args)을 생략한다.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": self.formatTime(record, DATE_FORMAT),
+            "level": record.levelname,
+            "logger": record.name,
+        }
+        data = getattr(record, "data", None) or {}
+        if "event" not in data:
+            entry["msg"] = record.getMessage()
+        entry.update(data)
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, separators=(",", ":"), default=_json_default)
+
+
+def _json_default(value: Any) -> Any:
+    # ExtractionResult 등 dict 변환을 제공하는 객체는 구조 그대로, 그 외는 문자열로
+    to_dict = getattr(value, "to_dict", None)
+    return to_dict() if to_dict is not None else str(value)
+
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """포맷하지 않고 레코드를 그대로 큐에 넣는 QueueHandler(같은 프로세스 리스너 전용).
+
+    인자(args)는 리스너 스레드에서 포맷되므로, 로깅 후 내용을 바꾸는 가변 객체를 넘기지 않는다.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def build_handlers(log_path: Union[str, Path], log_format: str = "text") -> List[logging.Handler]:
+    """콘솔 + 파일 핸들러(INFO)를 만든다."""
+    if log_format not in LOG_FORMATS:
+        raise ValueError(f"지원하지 않는 로그 형식입니다: {log_format} ({', '.join(LOG_FORMATS)})")
+    formatter = JsonFormatter() if log_format == "json" else logging.Formatter(TEXT_FORMAT, datefmt=DATE_FORMAT)
+    log_path = Path(log_path)
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+
+    # 콘솔 핸들러
+    console_handler = logging.StreamHandler()
+    # 파일 핸들러
+    file_handler = logging.FileHandler(log_path, encoding="utf-8")
+    handlers: List[logging.Handler] = [console_handler, file_handler]
+    for handler in handlers:
+        handler.setLevel(logging.INFO)
+        handler.setFormatter(formatter)
+    return handlers
+
+
+def configure_logging(log_path: Union[str, Path] = "logs/pipeline.log", log_format: str = "text",
+                      async_handlers: bool = False) -> Optional[logging.handlers.QueueListener]:
+    """루트 로거를 구성한다. 비동기 모드면 시작된 QueueListener를 반환한다(종료 시 stop() 호출)."""
+    handlers = build_handlers(log_path, log_format)
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.INFO)
+    if not async_handlers:
+        for handler in handlers:
+            root_logger.addHandler(handler)
+        return None
+    log_queue: "queue.SimpleQueue" = queue.SimpleQueue()
+    root_logger.addHandler(DeferredQueueHandler(log_queue))
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    return listener
+
+
+def warning_kind(fmt: str) -> str:
+    """경고 포맷 문자열 → 요약용 종류 이름('[%s] 무게 산술 불일치: ...' → '무게 산술 불일치')."""
+    if fmt.startswith("[%s] "):
+        fmt = fmt[5:]
+    return fmt.split(":", 1)[0].strip()
+
+
+class RunLog:
+    """문서별 로그(경고 전체 + 성공 줄 표본)와 실행 요약.
+
+    sample_every: 성공 줄을 몇 건마다 1건 남길지(1 = 모두, 0 = 남기지 않음)
+    """
+
+    def __init__(self, logger: logging.Logger, sample_every: int = 1):
+        if sample_every < 0:
+            raise ValueError("sample_every는 0 이상이어야 합니다")
+        self.logger = logger
+        self.sample_every = sample_every
+        self.documents = 0
+        self.warnings: Dict[str, int] = {}
+        self.started = time.perf_counter()
+
+    def document(self, name: str, extracted: dict, warnings: Iterable[Tuple[str, tuple]]) -> None:
+        self.documents += 1
+        logger = self.logger
+        for fmt, args in warnings:
+            kind = warning_kind(fmt)
+            self.warnings[kind] = self.warnings.get(kind, 0) + 1
+            logger.warning(fmt, *args, extra={"data": {"file": name, "warning": kind}})
+        every = self.sample_every
+        if every and (every == 1 or self.documents % every == 1):
+            logger.info("[%s] 처리 완료 → %s", name, extracted,
+                        extra={"data": {"event": "document", "file": name, "result": extracted}})
+
+    def summary(self) -> dict:
+        elapsed = time.perf_counter() - self.started
+        return {
+            "documents": self.documents,
+            "warnings": dict(sorted(self.warnings.items())),
+            "elapsed_s": round(elapsed, 3),
+            "docs_per_s": round(self.documents / elapsed, 1) if elapsed > 0 else 0.0,
+        }
+
+    def log_summary(self) -> dict:
+        s = self.summary()
+        warnings = ", ".join(f"{k} {v}건" for k, v in s["warnings"].items()) or "없음"
+        self.logger.info("실행 요약: 문서 %d건, 경고 %s, %.3f초 (%.1f건/초)",
+                         s["documents"], warnings, s["elapsed_s"], s["docs_per_s"],
+                         extra={"data": {"event": "run_summary", **s}})
+        return s
@@ -0,0 +1,189 @@
+"""파이프라인 단계별 시간/카운터 계측.
+
+기본은 꺼져 있다(ACTIVE is None). 계측 지점은 다음 형태로 작성해,
+꺼져 있을 때는 전역 조회와 분기 한 번만 든다.
+
+    m = metrics.ACTIVE
+    if m is not None:
+        t0 = perf_counter()
+    ...
+    if m is not None:
+        m.observe("extract.scan", perf_counter() - t0)
+
+켜져 있을 때는 단계별 지연 히스토그램(고정 버킷)과 카운터를 모아
+JSON 요약(summary)과 Prometheus 텍스트 형식(to_prometheus)으로 내보낸다.
+프로세스 풀 워커의 계측값은 drain()으로 꺼내 부모에서 merge()한다.
+"""
+import json
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+# 지연 히스토그램 버킷 상한(초)
+BUCKETS: Tuple[float, ...] = (
+    1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4, 1e-3, 2.5e-3, 5e-3,
+    0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+PROM_PREFIX = "ocr_pipeline"
+
+CounterKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+class Histogram:
+    """누적 전 버킷별 개수(마지막 칸은 +Inf), 합계, 개수."""
+
+    __slots__ = ("counts", "total", "count")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect_left(BUCKETS, seconds)] += 1
+        self.total += seconds
+        self.count += 1
+
+    def quantile(self, q: float) -> float:
+        """버킷 상한으로 근사한 q 분위수(초). +Inf 버킷이면 마지막 유한 상한."""
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        seen = 0
+        for i, c in enumerate(self.counts):
+            seen += c
+            if seen >= target:
+                return BUCKETS[min(i, len(BUCKETS) - 1)]
+        return BUCKETS[-1]
+
+    def merge(self, other: "Histogram") -> None:
+        for i, c in enumerate(other.counts):
+            self.counts[i] += c
+        self.total += other.total
+        self.count += other.count
+
+
+class Metrics:
+    """단계별 지연 히스토그램과 (이름, 라벨) 카운터 모음."""
+
+    def __init__(self):
+        self.histograms: Dict[str, Histogram] = {}
+        self.counters: Dict[CounterKey, int] = {}
+
+    def observe(self, stage: str, seconds: float) -> None:
+        h = self.histograms.get(stage)
+        if h is None:
+            h = self.histograms[stage] = Histogram()
+        h.observe(seconds)
+
+    def incr(self, name: str, n: int = 1, **labels: str) -> None:
+        key = (name, tuple(sorted(labels.items())))
+        self.counters[key] = self.counters.get(key, 0) + n
+
+    @contextmanager
+    def time(self, stage: str) -> Iterator[None]:
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, time.perf_counter() - t0)
+
+    # ── 병합(프로세스 풀) ──────────────────────────────────────
+    def drain(self) -> "Metrics":
+        """지금까지의 계측값을 떼어 반환하고 비운다(워커 → 부모 전송용, 피클 가능)."""
+        out = Metrics()
+        out.histograms, self.histograms = self.histograms, {}
+        out.counters, self.counters = self.counters, {}
+        return out
+
+    def merge(self, other: "Metrics") -> None:
+        for stage, h in other.histograms.items():
+            mine = self.histograms.get(stage)
+            if mine is None:
+                mine = self.histograms[stage] = Histogram()
+            mine.merge(h)
+        for key, n in other.counters.items():
+            self.counters[key] = self.counters.get(key, 0) + n
+
+    # ── 내보내기 ──────────────────────────────────────────────
+    def summary(self) -> dict:
+        """JSON 직렬화 가능한 요약(단계별 개수/합계/평균/분위수, 카운터)."""
+        stages = {}
+        for stage, h in sorted(self.histograms.items()):
+            stages[stage] = {
+                "count": h.count,
+                "sum_s": round(h.total, 6),
+                "mean_ms": round(h.total / h.count * 1e3, 4) if h.count else 0.0,
+                "p50_ms_le": h.quantile(0.50) * 1e3,
+                "p95_ms_le": h.quantile(0.95) * 1e3,
+                "p99_ms_le": h.quantile(0.99) * 1e3,
+            }
+        counters: List[dict] = [
+            {"name": name, "labels": dict(labels), "value": value}
+            for (name, labels), value in sorted(self.counters.items())
+        ]
+        return {"stages": stages, "counters": counters}
+
+    def to_prometheus(self) -> str:
+        """Prometheus 텍스트 노출 형식(node_exporter textfile collector 등에서 수집)."""
+        out = []
+        if self.histograms:
+            name = f"{PROM_PREFIX}_stage_seconds"
+            out.append(f"# HELP {name} Pipeline stage latency in seconds.")
+            out.append(f"# TYPE {name} histogram")
+            for stage, h in sorted(self.histograms.items()):
+                cumulative = 0
+                for bound, c in zip(BUCKETS + (float("inf"),), h.counts):
+                    cumulative += c
+                    le = "+Inf" if bound == float("inf") else repr(bound)
+                    out.append(f'{name}_bucket{{stage="{stage}",le="{le}"}} {cumulative}')
+                out.append(f'{name}_sum{{stage="{stage}"}} {h.total!r}')
+                out.append(f'{name}_count{{stage="{stage}"}} {h.count}')
+        by_name: Dict[str, list] = {}
+        for (name, labels), value in sorted(self.counters.items()):
+            by_name.setdefault(name, []).append((labels, value))
+        for name, series in by_name.items():
+            metric = f"{PROM_PREFIX}_{name}_total"
+            out.append(f"# TYPE {metric} counter")
+            for labels, value in series:
+                label_str = ",".join(f'{k}="{_escape(v)}"' for k, v in labels)
+                out.append(f"{metric}{{{label_str}}} {value}" if label_str else f"{metric} {value}")
+        return "\n".join(out) + "\n"
+
+    def export(self, directory: Union[str, Path]) -> Tuple[Path, Path]:
+        """directory/metrics.json, directory/metrics.prom 을 기록하고 경로를 반환한다."""
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        json_path = directory / "metrics.json"
+        prom_path = directory / "metrics.prom"
+        json_path.write_text(json.dumps(self.summary(), ensure_ascii=False, indent=2), encoding="utf-8")
+        # textfile collector가 반쯤 쓴 파일을 읽지 않도록 임시 파일에 쓴 뒤 교체
+        tmp = prom_path.with_name(prom_path.name + ".tmp")
+        tmp.write_text(self.to_prometheus(), encoding="utf-8")
+        tmp.replace(prom_path)
+        return json_path, prom_path
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+# 프로세스 전역 계측기 (None이면 계측 꺼짐)
+ACTIVE: Optional[Metrics] = None
+
+
+def enable() -> Metrics:
+    """계측을 켜고 전역 계측기를 반환한다(이미 켜져 있으면 그대로)."""
+    global ACTIVE
+    if ACTIVE is None:
+        ACTIVE = Metrics()
+    return ACTIVE
+
+
+def disable() -> Optional[Metrics]:
+    """계측을 끄고 그동안 모은 계측기를 반환한다."""
+    global ACTIVE
+    m, ACTIVE = ACTIVE, None
+    return m
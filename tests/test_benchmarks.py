@@ -0,0 +1,30 @@
+from benchmarks.suite import percentile, summarize
+from benchmarks.synthetic import generate_corpus
+from src.parser.cleaner import clean_text
+from src.parser.extractor import OcrExtractor
+
+
+class TestSyntheticTickets:
+    """합성 계근지 생성기와 벤치마크 통계 함수를 검증합니다."""
+
+    def test_deterministic(self):
+        assert list(generate_corpus(20, seed=3)) == list(generate_corpus(20, seed=3))
+        assert list(generate_corpus(20, seed=3)) != list(generate_corpus(20, seed=4))
+
+    def test_extractor_recovers_expected_fields(self):
+        extractor = OcrExtractor()
+        corpus = generate_corpus(300, seed=7, noise=0.6, split_numbers=0.5, missing_labels=0.3)
+        for ticket in corpus:
+            result = extractor.extract(clean_text(ticket.text))
+            for key, expected in ticket.expected.items():
+                if expected is not None:
+                    assert result[key] == expected, (key, ticket.text)
+
+    def test_percentile_and_summary(self):
+        values = list(range(1, 101))
+        assert percentile(values, 50) == 50
+        assert percentile(values, 95) == 95
+        assert percentile(values, 99) == 99
+        summary = summarize([1000] * 10, items_per_sample=2)
+        assert summary["p50_us"] == 1.0
+        assert summary["throughput_per_s"] == 2_000_000.0
@@ -1,5 +1,6 @@
 import pytest
 from src.parser.cleaner import clean_text
+from src.parser.corrections import Corrector
 
 
 class TestCleanText:
@@ -35,3 +36,33 @@ class TestCleanText:
     def test_label_spacing_normalization(self):
         result = clean_text("날 짜: 2026-02-02")
         assert "날짜" in result
+
+
+class TestCorrector:
+    """사전 기반 단일 패스 교정 엔진을 검증합니다."""
+
+    def test_longest_match_wins_at_same_position(self):
+        c = Corrector({"중량": "A", "중량:": "B"})
+        assert c.apply("중량: 10") == "B 10"
+
+    def test_leftmost_match_wins_on_overlap(self):
+        c = Corrector({"가나": "X", "나다": "Y"})
+        assert c.apply("가나다") == "X다"
+
+    def test_replacement_is_not_rescanned(self):
+        c = Corrector({"가": "나", "나": "다"})
+        assert c.apply("가나") == "나다"
+
+    def test_load_tsv_and_json_tables(self, tmp_path):
+        (tmp_path / "10_site.tsv").write_text("# 주석\n계 그 표\t계근표\n노이즈\n", encoding="utf-8")
+        (tmp_path / "20_override.json").write_text('{"계 그 표": "계량표"}', encoding="utf-8")
+        c = Corrector.from_dirs([tmp_path])
+        assert c.apply("계 그 표 노이즈") == "계량표 "
+
+    def test_clean_text_with_custom_corrector(self):
+        result = clean_text("거 래 처: 곰욕", corrector=Corrector({"곰욕": "고요"}))
+        assert result == "거 래 처: 고요"
+
+    def test_default_table_chain_is_precomposed(self):
+        """'품종명랑' → '품명:' → '명 :' 순차 치환 결과를 단일 패스에서도 유지"""
+        assert clean_text("품종명랑 식물") == "품명 : 식물"
@@ -0,0 +1,128 @@
+import json
+import sys
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+
+from src.parser.extractor import OcrExtractor
+from src.pipeline.columnar import COLUMNS, ColumnarWriter, check_format, flatten_result, format_for
+from src.pipeline.document import process_file
+from src.pipeline.parallel import iter_parallel
+
+TEXT_COLUMNS = {name: str for name, kind in COLUMNS if kind == "str"}
+
+
+def _results(n):
+    extractor = OcrExtractor()
+    return [
+        (f"doc_{i:02d}.json", extractor.extract(f"차량번호: 12가{1000 + i}\n총중량: {10000 + i} kg\n차중량: 6000 kg"))
+        for i in range(n)
+    ]
+
+
+@pytest.fixture
+def data_files(tmp_path):
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    files = []
+    for i, text in enumerate(["총중량: 10000 kg\n차중량: 6000 kg", "날짜: 2026-02-02"]):
+        p = data_dir / f"doc_{i:02d}.json"
+        p.write_text(json.dumps({"text": text}, ensure_ascii=False), encoding="utf-8")
+        files.append(p)
+    return files
+
+
+class TestFlatten:
+    """결과 평탄화와 출력 형식 판별을 검증합니다."""
+
+    def test_weights_become_int_columns(self):
+        _, result = _results(1)[0]
+        row = flatten_result("doc_00.json", result)
+        assert [name for name, _ in COLUMNS] == list(row)
+        assert row["source"] == "doc_00.json"
+        assert (row["weight_total"], row["weight_empty"], row["weight_net"]) == (10000, 6000, 4000)
+        assert row["weight_unit"] == "kg"
+
+    def test_format_for(self):
+        assert format_for("out/results.csv") == "csv"
+        assert format_for("out/results.PARQUET") == "parquet"
+        with pytest.raises(ValueError):
+            format_for("out/results.json")
+
+
+class TestCsvWriter:
+    """CSV 묶음 기록(헤더 1회, row group 단위, 원자적 교체)을 검증합니다."""
+
+    def test_row_groups_and_types(self, tmp_path):
+        path = tmp_path / "results.csv"
+        with ColumnarWriter(path, row_group_size=2) as writer:
+            for name, result in _results(5):
+                writer.write(name, result)
+            assert not path.exists()  # close 전에는 임시 파일에만 기록
+        assert (writer.rows_written, writer.row_groups) == (5, 3)
+
+        frame = pd.read_csv(path, dtype=TEXT_COLUMNS)
+        assert list(frame["source"]) == [f"doc_{i:02d}.json" for i in range(5)]
+        assert frame["weight_total"].dtype == "int64"
+        assert list(frame["weight_total"]) == [10000 + i for i in range(5)]
+        assert frame.loc[0, "car_number"] == "12가1000"
+
+    def test_empty_run_writes_header(self, tmp_path):
+        path = tmp_path / "results.csv"
+        ColumnarWriter(path).close()
+        assert path.read_text(encoding="utf-8").strip() == ",".join(name for name, _ in COLUMNS)
+
+    def test_error_keeps_previous_file(self, tmp_path):
+        path = tmp_path / "results.csv"
+        path.write_text("previous", encoding="utf-8")
+        with pytest.raises(RuntimeError):
+            with ColumnarWriter(path, row_group_size=1) as writer:
+                name, result = _results(1)[0]
+                writer.write(name, result)
+                raise RuntimeError("중단")
+        assert path.read_text(encoding="utf-8") == "previous"
+        assert not (tmp_path / "results.csv.tmp").exists()
+
+
+class TestParquetWriter:
+    """Parquet row group 기록과 열 타입을 검증합니다."""
+
+    def test_row_groups_and_schema(self, tmp_path):
+        pq = pytest.importorskip("pyarrow.parquet")
+        path = tmp_path / "results.parquet"
+        with ColumnarWriter(path, row_group_size=2) as writer:
+            for name, result in _results(5):
+                writer.write(name, result)
+        parquet = pq.ParquetFile(path)
+        assert parquet.metadata.num_row_groups == 3
+        assert str(parquet.schema_arrow.field("weight_net").type) == "int64"
+        frame = parquet.read().to_pandas()
+        assert list(frame["weight_net"]) == [4000 + i for i in range(5)]
+
+    def test_missing_pyarrow_fails_up_front(self, monkeypatch, capsys):
+        import main
+
+        # sys.modules의 None 항목은 import를 ImportError로 만든다
+        monkeypatch.setitem(sys.modules, "pyarrow", None)
+        monkeypatch.setitem(sys.modules, "pyarrow.parquet", None)
+        check_format("csv")
+        with pytest.raises(ImportError, match="pip install"):
+            check_format("parquet")
+        with pytest.raises(SystemExit):
+            main.parse_args(["--output-format", "parquet"])
+        assert "pyarrow" in capsys.readouterr().err
+
+
+class TestNoJsonOutput:
+    """열 지향 출력 시 문서별 결과 JSON을 쓰지 않는지 검증합니다."""
+
+    def test_process_file_without_output_dir(self, data_files, tmp_path):
+        _, result, _ = process_file(data_files[0], OcrExtractor(), None)
+        assert result["weights"]["net"] == 4000
+        assert not list(tmp_path.rglob("*_result.json"))
+
+    def test_parallel_without_output_dir(self, data_files, tmp_path):
+        results = list(iter_parallel(data_files, workers=2, use_nlp=False, output_dir=None, chunksize=1))
+        assert [name for name, _, _ in results] == [f.name for f in data_files]
+        assert not list(tmp_path.rglob("*_result.json"))
@@ -0,0 +1,142 @@
+import json
+import os
+
+import pytest
+
+from src.parser.extractor import OcrExtractor
+from src.pipeline.corpus import Checkpoint, Corpus, LineIndex, stream_corpus, stream_corpus_parallel
+from src.pipeline.streaming import stream_jsonl
+
+TEXTS = [
+    "차량번호: 12가3456\n날짜: 2026-02-02\n총중량: 10000 kg\n차중량: 6000 kg",
+    "총중량: 13 460 kg\n차중량: 7 560 kg\n실중량: 5 900 kg",
+    "계량일자: 2025.12.01\n(주)하은펄프",
+]
+
+
+def _write_dump(path, n, blank_every=0, trailing_newline=True):
+    lines = []
+    for i in range(n):
+        if blank_every and i % blank_every == blank_every - 1:
+            lines.append("")
+        else:
+            lines.append(json.dumps({"text": TEXTS[i % len(TEXTS)] + f"\n번호: {i}"}, ensure_ascii=False))
+    body = "\n".join(lines) + ("\n" if trailing_newline else "")
+    path.write_text(body, encoding="utf-8")
+    return path
+
+
+class FailAfter:
+    """n건 추출 후 예외를 내는 추출기(중단된 실행 흉내)."""
+
+    def __init__(self, n):
+        self.n = n
+        self.inner = OcrExtractor()
+
+    def extract(self, text):
+        if self.n == 0:
+            raise KeyboardInterrupt
+        self.n -= 1
+        return self.inner.extract(text)
+
+
+class TestLineIndex:
+    """줄 오프셋 인덱스 생성, 저장/검증, 샤드 분할을 검증합니다."""
+
+    @pytest.mark.parametrize("body, count", [
+        (b"", 0), (b"a\n", 1), (b"a", 1), (b"a\nb", 2), (b"a\n\nb\n", 3),
+    ])
+    def test_build(self, body, count):
+        index = LineIndex.build(body, len(body), 0)
+        assert len(index) == count
+        lines = [body[index.offsets[i]:index.offsets[i + 1]] for i in range(count)]
+        assert b"".join(lines) == body
+
+    def test_persisted_index_reused_until_input_changes(self, tmp_path):
+        src = _write_dump(tmp_path / "dump.jsonl", 5)
+        with Corpus(src) as corpus:
+            assert corpus.index_path.is_file()
+        st = os.stat(src)
+        assert LineIndex.load(corpus.index_path, st.st_size, st.st_mtime_ns) is not None
+        # 입력이 바뀌면 저장된 인덱스를 쓰지 않는다
+        assert LineIndex.load(corpus.index_path, st.st_size + 1, st.st_mtime_ns) is None
+        _write_dump(src, 7)
+        with Corpus(src) as corpus:
+            assert len(corpus) == 7
+
+    def test_shards_cover_all_records(self, tmp_path):
+        src = _write_dump(tmp_path / "dump.jsonl", 100)
+        with Corpus(src) as corpus:
+            shards = corpus.index.shard(4)
+        assert len(shards) == 4
+        assert shards[0][0] == 0 and shards[-1][1] == 100
+        assert all(a[1] == b[0] for a, b in zip(shards, shards[1:]))
+        # 샤드 수가 레코드 수보다 많으면 빈 샤드는 빠진다
+        assert LineIndex.build(b"a\nb\n", 4, 0).shard(8) == [(0, 1), (1, 2)]
+
+
+class TestCorpus:
+    """O(1) 레코드 접근과 스트리밍 리더와 같은 레코드 식별자를 검증합니다."""
+
+    def test_random_access(self, tmp_path):
+        src = _write_dump(tmp_path / "dump.jsonl", 10, blank_every=4, trailing_newline=False)
+        with Corpus(src) as corpus:
+            assert len(corpus) == 10
+            assert corpus.record(3) is None
+            assert corpus.record(9)["text"].endswith("번호: 9")
+            assert corpus.record_id(9) == f"{src}:10"
+
+    def test_matches_stream_reader(self, tmp_path):
+        src = _write_dump(tmp_path / "dump.jsonl", 12, blank_every=5)
+        with open(src, "a", encoding="utf-8") as f:
+            f.write("{broken\n")
+        stream_jsonl(str(src), str(tmp_path / "a.jsonl"), OcrExtractor())
+        with Corpus(src) as corpus:
+            stream_corpus(corpus, str(tmp_path / "b.jsonl"), OcrExtractor())
+        assert (tmp_path / "a.jsonl").read_bytes() == (tmp_path / "b.jsonl").read_bytes()
+
+
+class TestCheckpoint:
+    """중단 후 체크포인트부터 재개해도 한 번에 처리한 결과와 같은지 검증합니다."""
+
+    def test_resume_after_crash(self, tmp_path):
+        src = _write_dump(tmp_path / "dump.jsonl", 20, blank_every=7)
+        expected = tmp_path / "expected.jsonl"
+        with Corpus(src) as corpus:
+            stream_corpus(corpus, str(expected), OcrExtractor())
+
+        dest, ckpt = tmp_path / "out.jsonl", tmp_path / "run.ckpt"
+        with Corpus(src) as corpus:
+            with pytest.raises(KeyboardInterrupt):
+                stream_corpus(corpus, str(dest), FailAfter(11), checkpoint=ckpt, checkpoint_every=5)
+        state = json.loads(ckpt.read_text(encoding="utf-8"))
+        assert state["output_bytes"] <= dest.stat().st_size
+        extractor = FailAfter(100)
+        with Corpus(src) as corpus:
+            written = stream_corpus(corpus, str(dest), extractor, checkpoint=ckpt, checkpoint_every=5)
+        # 레코드 18건 중 마지막 체크포인트(10건) 이후만 다시 처리한다
+        assert written == 100 - extractor.n == 8
+        assert dest.read_bytes() == expected.read_bytes()
+        assert not ckpt.exists()
+
+    def test_checkpoint_for_other_input_rejected(self, tmp_path):
+        src = _write_dump(tmp_path / "dump.jsonl", 5)
+        with Corpus(src) as corpus:
+            Checkpoint(tmp_path / "run.ckpt").save(corpus, 0, len(corpus), 2, 0)
+        _write_dump(src, 6)
+        with Corpus(src) as corpus, pytest.raises(ValueError, match="다른 입력"):
+            stream_corpus(corpus, str(tmp_path / "out.jsonl"), OcrExtractor(), checkpoint=tmp_path / "run.ckpt")
+
+
+class TestShardedRun:
+    """샤드 병렬 처리 결과가 순차 처리와 같은지 검증합니다."""
+
+    def test_parallel_matches_sequential(self, tmp_path):
+        src = _write_dump(tmp_path / "dump.jsonl", 30, blank_every=9)
+        with Corpus(src) as corpus:
+            stream_corpus(corpus, str(tmp_path / "seq.jsonl"), OcrExtractor())
+        dest = tmp_path / "par.jsonl"
+        count = stream_corpus_parallel(str(src), str(dest), workers=3, checkpoint=str(tmp_path / "run.ckpt"))
+        assert count == 27
+        assert dest.read_bytes() == (tmp_path / "seq.jsonl").read_bytes()
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["dump.jsonl", "dump.jsonl.idx", "par.jsonl", "seq.jsonl"]
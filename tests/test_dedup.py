@@ -0,0 +1,121 @@
+import json
+import random
+
+import pytest
+
+from benchmarks.synthetic import generate_corpus, rescan
+from src.parser.extractor import OcrExtractor
+from src.pipeline.dedup import Deduplicator, DuplicateIndex, jaccard, normalize, number_key, shingles
+
+TICKET = next(generate_corpus(1, seed=7)).text
+
+
+class CountingExtractor:
+    def __init__(self):
+        self.calls = 0
+        self.base = OcrExtractor(typed=True)
+
+    def extract(self, text):
+        self.calls += 1
+        return self.base.extract(text)
+
+
+def _write(directory, named_texts):
+    files = []
+    for name, text in named_texts:
+        path = directory / name
+        path.write_text(json.dumps({"text": text}, ensure_ascii=False), encoding="utf-8")
+        files.append(path)
+    return files
+
+
+class TestFingerprint:
+    """숫자 블록 키와 텍스트 유사도를 검증합니다."""
+
+    def test_number_key_ignores_separators(self):
+        assert number_key("총중량: 13 460 kg") == number_key("* 총 중 량 13,460kg *") == "13460"
+
+    def test_rescan_is_similar(self):
+        copy = rescan(TICKET, random.Random(1))
+        assert number_key(copy) == number_key(TICKET)
+        assert jaccard(shingles(normalize(TICKET)), shingles(normalize(copy))) >= 0.5
+
+
+class TestDuplicateIndex:
+    """중복 판정 규칙(숫자 일치 + 텍스트 유사)을 검증합니다."""
+
+    def test_rescans_map_to_first_document(self):
+        index = DuplicateIndex()
+        rng = random.Random(3)
+        assert index.add("a", TICKET) is None
+        assert index.add("b", rescan(TICKET, rng)) == "a"
+        assert index.add("c", rescan(TICKET, rng)) == "a"
+        assert index.duplicates == 2
+
+    def test_different_weight_is_not_duplicate(self):
+        index = DuplicateIndex()
+        index.add("a", "계량일자: 2026-02-02 0012\n총중량: 10 000 kg\n차중량: 6 000 kg")
+        assert index.add("b", "계량일자: 2026-02-02 0012\n총중량: 10 000 kg\n차중량: 6 010 kg") is None
+
+    def test_same_numbers_different_text_is_not_duplicate(self):
+        index = DuplicateIndex()
+        index.add("a", "계량일자: 2026-02-02 0012\n거래처: 고요환경\n총중량: 10000 kg")
+        assert index.add("b", "입고 번호 2026-02-02 0012 품명 식물 비고 10000") is None
+
+    def test_few_digits_never_merged(self):
+        index = DuplicateIndex()
+        index.add("a", "총중량: 10000 kg")
+        assert index.add("b", "총중량: 10000 kg") is None
+
+    def test_clear_forgets_previous_window(self):
+        index = DuplicateIndex()
+        index.add("a", TICKET)
+        index.clear()
+        assert index.add("b", TICKET) is None
+
+    def test_threshold_range(self):
+        with pytest.raises(ValueError):
+            DuplicateIndex(threshold=0)
+
+
+class TestDeduplicator:
+    """대표 문서만 추출하고 중복 문서를 표시해 기록하는지 검증합니다."""
+
+    def test_extracts_once_and_marks_duplicates(self, tmp_path):
+        rng = random.Random(5)
+        other = next(generate_corpus(1, seed=8)).text
+        files = _write(tmp_path, [("a.json", TICKET), ("b.json", other), ("a2.json", rescan(TICKET, rng))])
+        out_dir = tmp_path / "out"
+        out_dir.mkdir()
+        extractor = CountingExtractor()
+        dedup = Deduplicator(extractor, out_dir)
+        results = list(dedup.process(files))
+
+        assert [name for name, _, _ in results] == ["a.json", "b.json", "a2.json"]
+        assert extractor.calls == 2
+        assert dedup.duplicate_of == {"a2.json": "a.json"}
+        original = json.loads((out_dir / "a_result.json").read_text(encoding="utf-8"))
+        copy = json.loads((out_dir / "a2_result.json").read_text(encoding="utf-8"))
+        assert "duplicate_of" not in original
+        assert copy.pop("duplicate_of") == "a.json"
+        assert copy == original
+
+    def test_window_limits_matching(self, tmp_path):
+        files = _write(tmp_path, [("a.json", TICKET), ("b.json", TICKET)])
+        extractor = CountingExtractor()
+        dedup = Deduplicator(extractor, None, window=1)
+        list(dedup.process(files))
+        assert extractor.calls == 2
+        assert dedup.duplicate_of == {}
+
+    def test_columnar_duplicate_column(self, tmp_path):
+        pd = pytest.importorskip("pandas")
+        from src.pipeline.columnar import ColumnarWriter
+
+        files = _write(tmp_path, [("a.json", TICKET), ("a2.json", rescan(TICKET, random.Random(2)))])
+        dedup = Deduplicator(OcrExtractor(typed=True), None)
+        with ColumnarWriter(tmp_path / "r.csv", mark_duplicates=True) as writer:
+            for name, extracted, _ in dedup.process(files):
+                writer.write(name, extracted, duplicate_of=dedup.duplicate_of.get(name))
+        frame = pd.read_csv(tmp_path / "r.csv", dtype=str, keep_default_na=False)
+        assert list(frame["duplicate_of"]) == ["", "a.json"]
@@ -178,3 +178,20 @@ class TestIssuerExtraction:
         text = "동우바이오(주)\n2026-02-02 05:37:55"
         result = extractor.extract(text)
         assert result['issuer_address'] == "N/A"
+
+
+class TestLineFeatures:
+    """줄 단위 정규화 캐시가 기존 단계별 계산과 같은 값을 내는지 검증합니다."""
+
+    @pytest.mark.parametrize("line", [
+        " (주) 하 은 펄 프 ", "거 래 처 : 고요환경", "\t가 나\t", "동우바이오 (주)", "", "   ",
+    ])
+    def test_label_norm_matches_stripped_variant(self, line):
+        from src.parser.extractor import _Line
+        expected = OcrExtractor._remove_spaces_between_korean(line.strip())
+        assert _Line(line).label_norm == expected
+
+    def test_parse_weights_accepts_plain_lines(self, extractor):
+        weights, temp = extractor._parse_weights(["총중량: 12480 kg", "중 량: 7470 kg", "05:36:01 100 kg"])
+        assert weights == {"total": 12480, "empty": 0, "net": 0}
+        assert temp == 7470
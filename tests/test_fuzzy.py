@@ -0,0 +1,181 @@
+import pickle
+import random
+
+import pytest
+
+from benchmarks.synthetic import generate_corpus
+from src.parser.cleaner import clean_text
+from src.parser.extractor import OcrExtractor
+from src.parser.fuzzy import LabelIndex, allowed_distance, decompose, edit_distance, label_key
+from src.parser.rule_pack import compile_rules
+
+OCR_REPAIR = "ocr_repair"
+
+HANGUL = "가나다라마바사아자차카타파하"
+
+
+def _brute_force(labels, token, max_distance=2):
+    """모든 라벨과 자모 편집 거리를 직접 재는 기준 구현."""
+    keys = {}
+    for category, keywords in labels.items():
+        for label in keywords:
+            keys.setdefault(label_key(label), set()).add(category)
+    best, nearest = None, []
+    for key, categories in keys.items():
+        d = allowed_distance(key, max_distance)
+        if d == 0:
+            continue
+        dist = edit_distance(decompose(token), decompose(key), d)
+        if dist > d:
+            continue
+        if best is None or dist < best:
+            best, nearest = dist, [key]
+        elif dist == best:
+            nearest.append(key)
+    if not nearest or token in keys:
+        return None
+    return nearest if len({c for key in nearest for c in keys[key]}) == 1 else None
+
+
+class TestLabelIndex:
+    """삭제 변형 색인의 조회 결과와 모호성 처리를 검증합니다."""
+
+    @pytest.fixture
+    def index(self):
+        return compile_rules(OCR_REPAIR).label_index
+
+    @pytest.mark.parametrize("token, expected", [
+        ("차랑번호", "차량번호"),
+        ("실중랑", "실중량"),
+        ("공자중량", "공차중량"),
+        ("거레처", "거래처"),
+        ("순증량", "순중량"),
+        ("계량일저", "계량일자"),
+    ])
+    def test_lookup_repairs_garbled_label(self, index, token, expected):
+        assert index.lookup(token) == expected
+
+    @pytest.mark.parametrize("token", [
+        "차량번호",  # 정확히 같은 라벨은 고치지 않는다
+        "중량",  # 퍼지 대상이 아닌 범주의 라벨
+        "초중량",  # 총중량(total)과 차중량(empty) 사이에서 모호
+        "계량횟수",  # 거리 초과
+        # 음절 하나가 통째로 다르거나 더해진 실제 낱말(자모 거리 2 이상)
+        "총수량",
+        "거래일",
+        "계량자",
+    ])
+    def test_lookup_leaves_token(self, index, token):
+        assert index.lookup(token) is None
+
+    def test_same_category_tie_uses_pack_order(self):
+        index = LabelIndex({"net": ["가중량", "각중량"]})
+        assert index.lookup("간중량") == "가중량"
+
+    def test_distance_counts_jamo(self):
+        index = LabelIndex({"total": ["총중량"]})
+        assert index.lookup("총증량") == "총중량"  # 중→증: 중성 하나
+        assert index.lookup("촘중량") == "총중량"  # 총→촘: 종성 하나
+        assert index.lookup("총수량") is None  # 중→수: 초성과 종성
+        assert index.lookup("총중") is None
+
+    def test_keep_words_not_repaired(self):
+        labels = {"client": ["거래처:"]}
+        assert LabelIndex(labels).lookup("거래서") == "거래처"
+        assert LabelIndex(labels, exact=["거래처:", "거래서"]).lookup("거래서") is None
+
+    def test_short_labels_not_indexed(self):
+        index = LabelIndex({"date": ["일자", "날짜"]})
+        assert len(index) == 0
+        assert index.lookup("일저") is None
+
+    def test_long_label_allows_two_jamo_edits(self):
+        index = LabelIndex({"car": ["차량등록번호"]})
+        assert index.lookup("자량등록벤호") == "차량등록번호"
+        assert index.lookup("자랑등륵벤호") is None
+
+    def test_matches_brute_force(self):
+        rng = random.Random(0)
+        labels = {f"c{i % 4}": ["".join(rng.choice(HANGUL) for _ in range(rng.randint(3, 7)))
+                                for _ in range(10)] for i in range(8)}
+        index = LabelIndex(labels)
+        keys = [label_key(label) for keywords in labels.values() for label in keywords]
+        for _ in range(2000):
+            token = list(rng.choice(keys))
+            for _ in range(rng.randint(0, 2)):
+                op, pos = rng.random(), rng.randrange(len(token) + 1)
+                if op < 0.4 and pos < len(token):
+                    token[pos] = rng.choice(HANGUL)
+                elif op < 0.7:
+                    token.insert(pos, rng.choice(HANGUL))
+                elif pos < len(token):
+                    del token[pos]
+            token = "".join(token)
+            expected = _brute_force(labels, token)
+            found = index.lookup(token)
+            assert (found is None) == (expected is None), token
+            if found is not None:
+                assert found in expected
+
+    def test_pickle_drops_cache(self, index):
+        index.lookup("차랑번호")
+        restored = pickle.loads(pickle.dumps(index))
+        assert restored._cache == {}
+        assert restored.lookup("차랑번호") == "차량번호"
+
+
+class TestRepair:
+    """줄 머리만 고치고 값/일반 줄은 그대로 두는지 검증합니다."""
+
+    @pytest.fixture
+    def index(self):
+        return compile_rules(OCR_REPAIR).label_index
+
+    @pytest.mark.parametrize("line, expected", [
+        ("차랑번호: 8713", "차량번호: 8713"),
+        ("실 중 랑 : 5,010 kg", "실중량 : 5,010 kg"),
+        ("거레처 : 한빛자원", "거래처 : 한빛자원"),
+        ("공자중량 6,000 kg", "공차중량 6,000 kg"),
+    ])
+    def test_repairs_label_head(self, index, line, expected):
+        assert index.repair_line(line) == expected
+
+    @pytest.mark.parametrize("line", [
+        "차량번호: 8713",
+        "동우바이오(주)",
+        "경기도 화성시 팔탄면 1",
+        "위와 같이 계량하였음을 증명함",
+        "초중량: 10,000 kg",
+        "총수량: 3",
+        "거래일: 2024-01-01",
+        "계량자: 김",
+    ])
+    def test_leaves_line(self, index, line):
+        assert index.repair_line(line) == line
+
+    def test_near_miss_labels_keep_fields(self):
+        text = ("차량번호: 8713\n거래일: 2024-01-01\n거래처: 가나상사\n총수량: 3 kg\n"
+                "총중량: 12,000 kg\n공차중량: 6,000 kg\n계량자: 김")
+        for rules in (compile_rules(), compile_rules(OCR_REPAIR)):
+            result = OcrExtractor(rules=rules).extract(clean_text(text, rules.corrector, rules.label_index))
+            assert result["client_name"] == "가나상사"
+            assert result["weights"]["total"] == 12000
+
+    def test_default_pack_does_not_repair(self):
+        assert compile_rules().label_index is None
+        assert clean_text("차랑번호: 8713") == "차랑번호: 8713"
+
+    def test_clean_text_recovers_fields(self):
+        rules = compile_rules(OCR_REPAIR)
+        text = "거레처: 한빛자원\n차랑번호: 8713\n계량일저: 2026-02-02\n총증량: 10,000 kg\n공자중량: 6,000 kg"
+        result = OcrExtractor(rules=rules).extract(clean_text(text, rules.corrector, rules.label_index))
+        assert result["client_name"] == "한빛자원"
+        assert result["car_number"] == "8713"
+        assert result["date"] == "2026-02-02"
+        assert result["weights"]["net"] == 4000
+
+    def test_synthetic_corpus_unchanged(self):
+        rules = compile_rules(OCR_REPAIR)
+        for ticket in generate_corpus(300, seed=3):
+            assert clean_text(ticket.text, rules.corrector, rules.label_index) == \
+                clean_text(ticket.text, rules.corrector, None)
@@ -0,0 +1,154 @@
+import json
+import random
+
+import pytest
+
+from benchmarks.synthetic import generate_corpus
+from src.parser.cleaner import clean_text
+from src.parser.extractor import OcrExtractor, _DocumentScan
+from src.parser.gazetteer import Gazetteer, load_registry, normalize_name
+from src.parser.rule_pack import DEFAULT_PACK_DIR, RuleStore, compile_rules
+
+REGISTRY = "# 정식 명칭\t별칭\n고요환경\t곰욕환경\n동우바이오\n장원C&S\t장원씨앤에스\n(주)하은펄프\n신성푸디스트\n대명산업\n"
+
+
+def _site_pack(directory, registry=REGISTRY):
+    (directory / "partners").mkdir(exist_ok=True)
+    (directory / "partners" / "partners.tsv").write_text(registry, encoding="utf-8")
+    path = directory / "site.json"
+    path.write_text(json.dumps({"name": "site", "version": "1.0.0", "extends": str(DEFAULT_PACK_DIR / "default.json"),
+                                "gazetteer": ["partners"]}), encoding="utf-8")
+    return path
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestGazetteer:
+    """정규화, 경계 조건, 가장 긴 이름 우선, 등록부 병합을 검증합니다."""
+
+    @pytest.fixture
+    def gazetteer(self, tmp_path):
+        (tmp_path / "a.tsv").write_text(REGISTRY, encoding="utf-8")
+        return Gazetteer(load_registry([tmp_path / "a.tsv"]))
+
+    @pytest.mark.parametrize("text, key", [
+        ("(주) 하 은 펄 프", "하은펄프"),
+        ("동우바이오(주)", "동우바이오"),
+        ("주식회사 장원C&S", "장원c&s"),
+        ("신성(푸디스트)", "신성푸디스트"),
+    ])
+    def test_normalize_name(self, text, key):
+        assert normalize_name(text) == key
+
+    @pytest.mark.parametrize("line, canonical", [
+        ("거 래 처: 곰욕환경", "고요환경"),
+        ("(주) 하 은 펄 프", "(주)하은펄프"),
+        ("신성(푸디스트) 귀하", "신성푸디스트"),
+        ("주식회사 장원씨앤에스", "장원C&S"),
+        ("상 호: 대명산업, 동우바이오", "대명산업"),
+    ])
+    def test_match_canonical(self, gazetteer, line, canonical):
+        assert gazetteer.match(line).canonical == canonical
+
+    @pytest.mark.parametrize("line", [
+        "대명산업개발",  # 더 긴 낱말 안의 이름
+        "신대명산업",
+        "위와 같이 계량하였음을 확인함.",
+    ])
+    def test_match_requires_boundary(self, gazetteer, line):
+        assert gazetteer.match(line) is None
+
+    def test_overlapping_names_use_boundary(self):
+        gazetteer = Gazetteer({"한솔": [], "솔자원": []})
+        # 가장 왼쪽 '한솔'은 경계가 맞지 않아 건너뛰고 겹친 '솔자원'도 앞 글자 때문에 제외
+        assert gazetteer.match("한솔자원") is None
+        assert gazetteer.match("한솔 자원").canonical == "한솔"
+
+    def test_alone(self, gazetteer):
+        assert gazetteer.match("동우바이오(주)").alone
+        assert not gazetteer.match("동우바이오 대표 홍길동").alone
+
+    def test_later_file_wins(self, tmp_path):
+        (tmp_path / "a.tsv").write_text("고요환경\t고요\n", encoding="utf-8")
+        (tmp_path / "b.json").write_text(json.dumps({"(주)고요환경": ["고요환경"]}), encoding="utf-8")
+        gazetteer = Gazetteer(load_registry([tmp_path / "a.tsv", tmp_path / "b.json"]))
+        assert gazetteer.match("고요환경 귀하").canonical == "(주)고요환경"
+        assert gazetteer.match("고요 귀하").canonical == "고요환경"
+
+    def test_empty_canonical_rejected(self, tmp_path):
+        (tmp_path / "a.tsv").write_text("\t별칭\n", encoding="utf-8")
+        with pytest.raises(ValueError, match="정식 명칭"):
+            load_registry([tmp_path / "a.tsv"])
+
+
+class TestExtraction:
+    """등록부가 있는 팩에서 발급사/거래처가 정식 명칭으로 정해지는지 검증합니다."""
+
+    @pytest.fixture
+    def rules(self, tmp_path):
+        return compile_rules(_site_pack(tmp_path))
+
+    def _extract(self, rules, text):
+        return OcrExtractor(rules=rules).extract(clean_text(text, rules.corrector, rules.label_index))
+
+    def test_client_and_issuer_canonical(self, rules):
+        text = "계량증명서\n(주) 하 은 펄 프\n신성(푸디스트) 귀하\n차량 No. 0580\n총중량 14,230 kg"
+        result = self._extract(rules, text)
+        assert result["issuer_name"] == "(주)하은펄프"
+        assert result["client_name"] == "신성푸디스트"
+
+    def test_bottom_name_line_beats_tail_heuristic(self, rules):
+        text = "거래처: 고요환경\n총중량: 10,000 kg\n동우바이오\n담당 홍길동"
+        # 휴리스틱은 마지막 줄을 발급사로 보지만, 등록부 이름만 있는 줄이 후보가 된다
+        assert OcrExtractor().extract(clean_text(text))["issuer_name"] == "담당홍길동"
+        assert self._extract(rules, text)["issuer_name"] == "동우바이오"
+
+    def test_issuer_skips_client_name(self, rules):
+        text = "거래처: (주)고요환경\n동우바이오(주)"
+        result = self._extract(rules, text)
+        assert result["client_name"] == "고요환경"
+        assert result["issuer_name"] == "동우바이오"
+
+    @pytest.mark.parametrize("line, client", [
+        ("(주)하은펄프 거래처: 고요환경", "고요환경"),
+        ("하은펄프 신성 귀하", "하은펄프 신성"),
+        ("하은펄프 거래처: 신성(푸디스트)", "신성푸디스트"),
+    ])
+    def test_client_ignores_names_outside_value(self, rules, line, client):
+        # 등록부 이름이 라벨 앞이나 값의 일부에만 있으면 거래처 값을 바꾸지 않는다
+        assert self._extract(rules, line)["client_name"] == client
+
+    def test_unknown_names_fall_back_to_heuristics(self, rules):
+        text = "거래처: 미등록상사\n(주) 새회사"
+        result = self._extract(rules, text)
+        assert result["client_name"] == "미등록상사"
+        assert result["issuer_name"] == "(주)새회사"
+
+    def test_early_exit_matches_full_scan(self, rules):
+        rng = random.Random(0)
+        extractor = OcrExtractor(rules=rules)
+        for ticket in generate_corpus(100, seed=8):
+            lines = clean_text(ticket.text, rules.corrector).split("\n")
+            cut = rng.randrange(1, len(lines))
+            pages = ["\n".join(lines[:cut]), "\n".join(lines[cut:])]
+            scan = _DocumentScan()
+            scan.feed(pages[0], rules)
+            if scan.resolved():
+                assert extractor.extract_pages(pages) == extractor.extract_pages(pages, early_exit=False)
+
+    def test_registry_change_reloads(self, tmp_path):
+        path = _site_pack(tmp_path)
+        clock = FakeClock()
+        store = RuleStore(path, check_interval=1, clock=clock)
+        (tmp_path / "partners" / "more.tsv").write_text("새회사\n", encoding="utf-8")
+        clock.now = 1
+        assert store.refresh().gazetteer.match("(주) 새회사").canonical == "새회사"
+
+    def test_default_pack_has_no_gazetteer(self):
+        assert compile_rules().gazetteer is None
@@ -0,0 +1,90 @@
+import json
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.parser.extractor import OcrExtractor
+from src.parser.layout import LayoutExtractor, PageIndex, page_weight_rows, resolve_weights
+from src.pipeline.document import build_extractor, extract_document, process_file
+
+DATA = Path(__file__).resolve().parents[1] / "data"
+
+
+def _word(text, x, y, w=100, h=40):
+    verts = [{"x": x, "y": y}, {"x": x + w, "y": y}, {"x": x + w, "y": y + h}, {"x": x, "y": y + h}]
+    return {"boundingBox": {"vertices": verts}, "confidence": 0.9, "text": text}
+
+
+# 라벨과 값은 같은 높이에 있지만 OCR text의 줄 순서는 뒤섞인 응답
+SCRAMBLED = {
+    "text": "차량번호: 12가3456\n총중량:\n공차중량:\n실중량:\n5,010 kg\n12,480 kg\n7,470 kg",
+    "pages": [{"words": [
+        _word("차량번호:", 10, 10), _word("12가3456", 130, 12),
+        _word("kg", 400, 102), _word("총중량:", 10, 100), _word("12,480", 250, 101),
+        _word("공차중량:", 10, 200, h=44), _word("7,470", 250, 203), _word("kg", 400, 202),
+        _word("5,010", 250, 298), _word("실중량:", 10, 300), _word("kg", 400, 300),
+    ]}],
+}
+
+
+class TestPageIndex:
+    """단어 상자 공간 인덱스(행 묶기, 오른쪽 값 질의)를 검증합니다."""
+
+    def test_rows_follow_geometry_not_word_order(self):
+        page = PageIndex.from_page(SCRAMBLED["pages"][0])
+        assert page.lines() == [
+            "차량번호: 12가3456", "총중량: 12,480 kg", "공차중량: 7,470 kg", "실중량: 5,010 kg",
+        ]
+
+    def test_right_of_uses_vertical_overlap(self):
+        page = PageIndex.from_page(SCRAMBLED["pages"][0])
+        label = page.texts.index("공차중량:")
+        assert [page.texts[i] for i in page.right_of(label)] == ["7,470", "kg"]
+        assert len(page.right_of(page.texts.index("kg"))) == 0
+
+    def test_skewed_vertices_and_empty_page(self):
+        skewed = {"boundingBox": {"vertices": [{"x": 10, "y": 5}, {"x": 50, "y": 8},
+                                                {"x": 48, "y": 40}, {"x": 8, "y": 37}]}, "text": "a"}
+        page = PageIndex.from_page({"words": [skewed]})
+        assert (page.x0[0], page.y0[0], page.x1[0], page.y1[0]) == (8, 5, 50, 40)
+        assert PageIndex.from_page({"words": []}).lines() == []
+
+    def test_sample_01_pairs_scattered_label(self):
+        data = json.loads((DATA / "sample_01.json").read_text(encoding="utf-8"))
+        page = PageIndex.from_page(data["pages"][0])
+        assert "품종명랑 중 량: 05:26:18 12,480 kg" in page.lines()
+        assert resolve_weights([page]) == {"total": 12480, "empty": 7470, "net": 5010}
+
+    def test_punctuation_rows_do_not_steal_values(self):
+        data = json.loads((DATA / "sample_02.json").read_text(encoding="utf-8"))
+        rows = page_weight_rows(PageIndex.from_page(data["pages"][0]))
+        assert rows == [("total", 13460), ("empty", 7560), ("net", 5900)]
+
+
+class TestLayoutExtractor:
+    """레이아웃 보정 추출기와 파이프라인 연동을 검증합니다."""
+
+    def test_fixes_scrambled_line_order(self):
+        text_only = extract_document(SCRAMBLED, OcrExtractor())
+        assert text_only["weights"]["total"] == 5010  # 텍스트 경로는 짝을 잃는다
+        result = LayoutExtractor(OcrExtractor()).extract_response(SCRAMBLED)
+        assert result["weights"] == {"unit": "kg", "total": 12480, "empty": 7470, "net": 5010}
+        assert result["car_number"] == "12가3456"
+
+    def test_without_pages_matches_text_path(self):
+        data = {"text": "총중량: 10000 kg\n차중량: 6000 kg"}
+        assert LayoutExtractor(OcrExtractor()).extract_response(data) == extract_document(data, OcrExtractor())
+
+    def test_samples_unchanged(self):
+        layout = LayoutExtractor(OcrExtractor())
+        for path in sorted(DATA.glob("*.json")):
+            data = json.loads(path.read_text(encoding="utf-8"))
+            assert layout.extract_response(data) == extract_document(data, OcrExtractor()), path.name
+
+    def test_process_file_reads_pages(self, tmp_path):
+        src = tmp_path / "scrambled.json"
+        src.write_text(json.dumps(SCRAMBLED, ensure_ascii=False), encoding="utf-8")
+        _, result, _ = process_file(src, build_extractor(layout=True), tmp_path)
+        assert result["weights"]["total"] == 12480
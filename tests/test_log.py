@@ -0,0 +1,112 @@
+import json
+import logging
+import threading
+
+import pytest
+
+from src.utils.log import DeferredQueueHandler, JsonFormatter, RunLog, configure_logging, warning_kind
+
+
+class ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+@pytest.fixture
+def root_handlers():
+    """configure_logging이 루트 로거에 붙인 핸들러를 테스트 후 원래대로 되돌린다."""
+    root = logging.getLogger()
+    saved, level = root.handlers[:], root.level
+    yield root
+    for h in root.handlers:
+        if h not in saved:
+            h.close()
+    root.handlers[:] = saved
+    root.setLevel(level)
+
+
+def _logger():
+    handler = ListHandler()
+    logger = logging.getLogger("test_log.run")
+    logger.handlers[:] = [handler]
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    return logger, handler
+
+
+RESULT = {"car_number": "12가3456", "weights": {"unit": "kg", "total": 10000, "empty": 6000, "net": 4000}}
+
+
+class TestRunLog:
+    """문서별 로그 표본 기록과 실행 요약을 검증합니다."""
+
+    def test_sampling_keeps_all_warnings(self):
+        logger, handler = _logger()
+        run_log = RunLog(logger, sample_every=3)
+        for i in range(7):
+            run_log.document(f"doc_{i}.json", RESULT, [("[%s] 차량번호 추출 실패", (f"doc_{i}.json",))])
+        info = [r.data["file"] for r in handler.records if r.levelno == logging.INFO]
+        warnings = [r for r in handler.records if r.levelno == logging.WARNING]
+        assert info == ["doc_0.json", "doc_3.json", "doc_6.json"]
+        assert len(warnings) == 7
+
+    def test_sample_zero_logs_no_success_lines(self):
+        logger, handler = _logger()
+        run_log = RunLog(logger, sample_every=0)
+        run_log.document("a.json", RESULT, [])
+        assert handler.records == []
+
+    def test_summary_counts_warning_kinds(self):
+        logger, handler = _logger()
+        run_log = RunLog(logger, sample_every=0)
+        run_log.document("a.json", RESULT, [("[%s] 날짜 추출 실패", ("a.json",))])
+        run_log.document("b.json", RESULT, [
+            ("[%s] 날짜 추출 실패", ("b.json",)),
+            ("[%s] 무게 산술 불일치: total(%d) != empty(%d) + net(%d)", ("b.json", 1, 2, 3)),
+        ])
+        summary = run_log.log_summary()
+        assert summary["documents"] == 2
+        assert summary["warnings"] == {"날짜 추출 실패": 2, "무게 산술 불일치": 1}
+        assert handler.records[-1].data["event"] == "run_summary"
+
+    def test_warning_kind(self):
+        assert warning_kind("[%s] 차량번호 추출 실패") == "차량번호 추출 실패"
+        assert warning_kind("[%s] 무게 산술 불일치: total(%d)") == "무게 산술 불일치"
+
+
+class TestFormatting:
+    """JSON 한 줄 형식과 비동기(큐) 핸들러를 검증합니다."""
+
+    def test_json_event_replaces_message(self):
+        record = logging.LogRecord("x", logging.INFO, __file__, 1, "[%s] 처리 완료 → %s", ("a.json", RESULT), None)
+        record.data = {"event": "document", "file": "a.json", "result": RESULT}
+        entry = json.loads(JsonFormatter().format(record))
+        assert "msg" not in entry
+        assert entry["event"] == "document"
+        assert entry["result"]["weights"]["net"] == 4000
+
+    def test_json_plain_message(self):
+        record = logging.LogRecord("x", logging.WARNING, __file__, 1, "[%s] 날짜 추출 실패", ("a.json",), None)
+        entry = json.loads(JsonFormatter().format(record))
+        assert entry["msg"] == "[a.json] 날짜 추출 실패"
+        assert entry["level"] == "WARNING"
+
+    def test_async_formats_on_listener_thread(self, root_handlers, tmp_path):
+        formatted_on = []
+
+        class Probe:
+            def __str__(self):
+                formatted_on.append(threading.current_thread().name)
+                return "probe"
+
+        listener = configure_logging(tmp_path / "run.log", log_format="text", async_handlers=True)
+        # pytest 로그 캡처 핸들러(호출 스레드에서 포맷)를 빼고 큐 핸들러만 남긴다
+        root_handlers.handlers[:] = [h for h in root_handlers.handlers if isinstance(h, DeferredQueueHandler)]
+        logging.getLogger("test_log.async").info("값: %s", Probe())
+        listener.stop()
+        assert formatted_on and threading.main_thread().name not in formatted_on
+        assert "값: probe" in (tmp_path / "run.log").read_text(encoding="utf-8")
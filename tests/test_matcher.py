@@ -0,0 +1,32 @@
+import pytest
+from src.parser.matcher import KeywordMatcher, DATE, CAR, NET_WEIGHT, EMPTY_WEIGHT, TOTAL_WEIGHT, WEIGHT
+from src.parser.rule_pack import compile_rules
+
+# 기본 규칙 팩의 라벨 매처
+RULE_MATCHER = compile_rules().matcher
+
+
+class TestKeywordMatcher:
+    """단일 스캔 매처가 범주별 any() 검사와 같은 결과를 내는지 검증합니다."""
+
+    def test_weight_categories_overlap(self):
+        """'총중량'은 total과 weight 범주에 동시에 속한다"""
+        assert RULE_MATCHER.scan("총중량:12480kg") == {TOTAL_WEIGHT, WEIGHT}
+        assert RULE_MATCHER.scan("공차중량:7470kg") == {EMPTY_WEIGHT, WEIGHT}
+        assert RULE_MATCHER.scan("실중량:5010kg") == {NET_WEIGHT, WEIGHT}
+
+    def test_multiple_categories_in_one_line(self):
+        assert {DATE, CAR} <= RULE_MATCHER.scan("계량일자:2026-02-02차량번호:8713")
+
+    def test_no_hit(self):
+        assert RULE_MATCHER.scan("37.105317,127.375673") == frozenset()
+        assert RULE_MATCHER.scan("") == frozenset()
+
+    @pytest.mark.parametrize("text", ["ABC", "xABCx", "AB", "BC", "B", "CAB"])
+    def test_overlapping_keywords_in_different_categories(self, text):
+        table = {"x": ["AB"], "y": ["BC"], "z": ["B"]}
+        expected = {c for c, kws in table.items() if any(k in text for k in kws)}
+        assert KeywordMatcher(table).scan(text) == expected
+
+    def test_empty_table(self):
+        assert KeywordMatcher({}).scan("아무 텍스트") == frozenset()
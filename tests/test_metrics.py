@@ -0,0 +1,90 @@
+import json
+
+import pytest
+from src.parser.extractor import OcrExtractor
+from src.pipeline.document import process_file
+from src.pipeline.parallel import iter_parallel
+from src.utils import metrics
+from src.utils.metrics import Metrics
+
+TEXT = "차량번호: 12가3456\n날짜: 2026-02-02\n총중량: 10000 kg\n차중량: 6000 kg"
+
+
+@pytest.fixture
+def active():
+    m = metrics.enable()
+    yield m
+    metrics.disable()
+
+
+class TestMetrics:
+    """계측 히스토그램/카운터/내보내기와 파이프라인 계측 지점을 검증합니다."""
+
+    def test_disabled_by_default(self):
+        assert metrics.ACTIVE is None
+        OcrExtractor().extract(TEXT)
+        assert metrics.ACTIVE is None
+
+    def test_histogram_and_counters(self):
+        m = Metrics()
+        for s in (0.00002, 0.0002, 0.002, 0.02):
+            m.observe("stage", s)
+        m.incr("field_na", field="date")
+        m.incr("field_na", 2, field="date")
+        summary = m.summary()
+        assert summary["stages"]["stage"]["count"] == 4
+        assert summary["stages"]["stage"]["p50_ms_le"] == pytest.approx(0.25)
+        assert summary["counters"] == [{"name": "field_na", "labels": {"field": "date"}, "value": 3}]
+
+    def test_prometheus_format(self):
+        m = Metrics()
+        m.observe("extract", 0.001)
+        m.incr("documents")
+        text = m.to_prometheus()
+        assert '# TYPE ocr_pipeline_stage_seconds histogram' in text
+        assert 'ocr_pipeline_stage_seconds_bucket{stage="extract",le="0.001"} 1' in text
+        assert 'ocr_pipeline_stage_seconds_bucket{stage="extract",le="+Inf"} 1' in text
+        assert 'ocr_pipeline_stage_seconds_count{stage="extract"} 1' in text
+        assert "ocr_pipeline_documents_total 1" in text
+
+    def test_drain_and_merge(self):
+        a, b = Metrics(), Metrics()
+        a.observe("x", 0.001)
+        a.incr("documents")
+        drained = a.drain()
+        assert not a.histograms and not a.counters
+        b.merge(drained)
+        b.merge(drained)
+        assert b.histograms["x"].count == 2
+        assert b.summary()["counters"][0]["value"] == 2
+
+    def test_process_file_records_stages(self, active, tmp_path):
+        src = tmp_path / "a.json"
+        src.write_text(json.dumps({"text": TEXT}, ensure_ascii=False), encoding="utf-8")
+        process_file(src, OcrExtractor(), tmp_path)
+        stages = active.summary()["stages"]
+        for stage in ("read", "clean", "extract", "extract.scan", "extract.infer",
+                      "extract.issuer", "extract.address", "write", "document"):
+            assert stages[stage]["count"] == 1, stage
+        na = {c["labels"]["field"] for c in active.summary()["counters"] if c["name"] == "field_na"}
+        assert {"issuer_address", "client_name"} <= na
+        assert "car_number" not in na and "date" not in na
+
+    def test_parallel_workers_merge_into_parent(self, active, tmp_path):
+        files = []
+        for i in range(5):
+            f = tmp_path / f"doc_{i}.json"
+            f.write_text(json.dumps({"text": TEXT}, ensure_ascii=False), encoding="utf-8")
+            files.append(f)
+        out = tmp_path / "out"
+        out.mkdir()
+        list(iter_parallel(files, workers=2, use_nlp=False, output_dir=out, chunksize=1))
+        assert active.histograms["document"].count == 5
+        assert active.counters[("documents", ())] == 5
+
+    def test_export_writes_json_and_prom(self, tmp_path):
+        m = Metrics()
+        m.observe("extract", 0.001)
+        json_path, prom_path = m.export(tmp_path / "metrics")
+        assert json.loads(json_path.read_text(encoding="utf-8"))["stages"]["extract"]["count"] == 1
+        assert prom_path.read_text(encoding="utf-8").endswith("\n")
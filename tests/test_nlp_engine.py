@@ -0,0 +1,49 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from src.nlp.engine import load_nlp, pipeline_version
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+class TestNlpArtifact:
+    """NLP 파이프라인 아티팩트 버전/재사용과 기본 모드의 spaCy 미사용을 검증합니다."""
+
+    def test_base_mode_does_not_import_spacy(self):
+        code = (
+            "import sys\n"
+            "from src.pipeline.document import build_extractor\n"
+            "build_extractor(use_nlp=False).extract('총중량: 10 kg')\n"
+            "print('spacy' in sys.modules)\n"
+        )
+        out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+        assert out.stdout.strip() == "False"
+
+    def test_version_tracks_pattern_files(self, tmp_path):
+        empty = pipeline_version(str(tmp_path), "3.7.2")
+        assert pipeline_version(str(tmp_path), "3.7.2") == empty
+        (tmp_path / "org.json").write_text(json.dumps([{"label": "ORG", "pattern": "동우바이오"}]), encoding="utf-8")
+        with_patterns = pipeline_version(str(tmp_path), "3.7.2")
+        assert with_patterns != empty
+        assert pipeline_version(str(tmp_path), "3.8.0") != with_patterns
+
+    def test_artifact_round_trip(self, tmp_path):
+        pytest.importorskip("spacy")
+        patterns = tmp_path / "patterns"
+        patterns.mkdir()
+        (patterns / "org.json").write_text(json.dumps([{"label": "ORG", "pattern": "동우바이오"}]), encoding="utf-8")
+        artifacts = tmp_path / "artifacts"
+
+        first = load_nlp(str(patterns), str(artifacts))
+        assert len(list(artifacts.iterdir())) == 1
+        second = load_nlp(str(patterns), str(artifacts))
+        assert len(list(artifacts.iterdir())) == 1
+        for nlp in (first, second):
+            assert [e.label_ for e in nlp("동우바이오").ents] == ["ORG"]
+
+        (patterns / "loc.json").write_text(json.dumps([{"label": "LOC", "pattern": "세종"}]), encoding="utf-8")
+        load_nlp(str(patterns), str(artifacts))
+        assert len(list(artifacts.iterdir())) == 2
@@ -0,0 +1,119 @@
+from src.parser.extractor_nlp_wrapper import OcrExtractorWithNlp
+
+NA = {"issuer_name": "N/A", "issuer_address": "N/A", "client_name": "N/A", "car_number": "12가3456"}
+
+
+class _Ent:
+    def __init__(self, label):
+        self.label_ = label
+
+
+class _Doc:
+    def __init__(self, ents):
+        self.ents = ents
+
+
+class FakeNlp:
+    """'(주)' → ORG, '서울'로 시작 → LOC 로 라벨링하고 처리한 줄을 기록하는 가짜 파이프라인."""
+
+    def __init__(self):
+        self.seen = []
+        self.pipe_calls = 0
+
+    def _doc(self, line):
+        self.seen.append(line)
+        ents = []
+        if "(주)" in line:
+            ents.append(_Ent("ORG"))
+        if line.startswith("서울"):
+            ents.append(_Ent("LOC"))
+        return _Doc(ents)
+
+    def __call__(self, line):
+        return self._doc(line)
+
+    def pipe(self, lines, batch_size=256):
+        self.pipe_calls += 1
+        return (self._doc(line) for line in lines)
+
+
+class FixedBase:
+    def __init__(self, result):
+        self.result = result
+
+    def extract(self, text):
+        return dict(self.result)
+
+
+TEXT = "계량증명서\n  \n서울 강남구 테헤란로 1\n한 국 (주)\n(주)동해 귀 하\n계량증명서"
+
+
+class TestNlpWrapper:
+    """NLP 보조 래퍼의 배치·중복 제거 동작을 검증합니다."""
+
+    def test_fallbacks_share_one_pipe_call(self):
+        nlp = FakeNlp()
+        result = OcrExtractorWithNlp(FixedBase(NA), nlp).extract(TEXT)
+        assert result["issuer_name"] == "한국 (주)"
+        assert result["issuer_address"] == "서울 강남구 테헤란로 1"
+        assert result["client_name"] == "(주)동해"
+        assert nlp.pipe_calls == 1
+        # 고유한 비어있지 않은 줄만 한 번씩
+        assert sorted(nlp.seen) == sorted({l.strip() for l in TEXT.split("\n") if l.strip()})
+
+    def test_no_fallback_needed_skips_nlp(self):
+        nlp = FakeNlp()
+        done = {"issuer_name": "A", "issuer_address": "B", "client_name": "C"}
+        assert OcrExtractorWithNlp(FixedBase(done), nlp).extract(TEXT) == done
+        assert nlp.pipe_calls == 0
+
+    def test_client_only_sends_guiha_lines(self):
+        nlp = FakeNlp()
+        base = FixedBase({"issuer_name": "A", "issuer_address": "B", "client_name": "N/A"})
+        assert OcrExtractorWithNlp(base, nlp).extract(TEXT)["client_name"] == "(주)동해"
+        assert nlp.seen == ["(주)동해 귀 하"]
+
+    def test_batch_matches_single_and_dedupes_across_documents(self):
+        other = "서울 중구\n(주)서해 귀하"
+        single = [OcrExtractorWithNlp(FixedBase(NA), FakeNlp()).extract(t) for t in (TEXT, other, TEXT)]
+        nlp = FakeNlp()
+        batch = OcrExtractorWithNlp(FixedBase(NA), nlp).extract_batch([TEXT, other, TEXT])
+        assert batch == single
+        assert nlp.pipe_calls == 1
+        assert len(nlp.seen) == len(set(nlp.seen))
+
+    def test_label_cache_reused_and_bounded(self):
+        nlp = FakeNlp()
+        wrapper = OcrExtractorWithNlp(FixedBase(NA), nlp, label_cache_size=3)
+        wrapper.extract(TEXT)
+        # 캐시 상한을 넘으면 비운 뒤 다시 채우므로 결과는 그대로
+        assert wrapper.extract(TEXT)["client_name"] == "(주)동해"
+        # 이미 캐시된 줄과 새 줄이 섞인 문서에서 캐시를 비워도 이전 줄을 다시 처리한다
+        result = wrapper.extract("서울 강남구 테헤란로 1\n(주)남해 귀하")
+        assert result["issuer_address"] == "서울 강남구 테헤란로 1"
+        assert result["client_name"] == "(주)남해"
+        small = OcrExtractorWithNlp(FixedBase(NA), nlp)
+        small.extract("서울 중구")
+        calls = nlp.pipe_calls
+        small.extract("서울 중구")
+        assert nlp.pipe_calls == calls
+
+    def test_nlp_without_pipe(self):
+        nlp = FakeNlp()
+        nlp.pipe = None
+        result = OcrExtractorWithNlp(FixedBase(NA), nlp).extract(TEXT)
+        assert result["issuer_name"] == "한국 (주)"
+
+    def test_fallback_counters(self):
+        from src.utils import metrics
+        m = metrics.enable()
+        try:
+            base = FixedBase({"issuer_name": "A", "issuer_address": "N/A", "client_name": "N/A"})
+            OcrExtractorWithNlp(base, FakeNlp()).extract("(주)동해 귀하\n기타")
+        finally:
+            metrics.disable()
+        assert m.counters[("nlp_fallback", (("field", "issuer_address"),))] == 1
+        assert m.counters[("nlp_fallback", (("field", "client_name"),))] == 1
+        assert ("nlp_fallback_filled", (("field", "issuer_address"),)) not in m.counters
+        assert m.counters[("nlp_fallback_filled", (("field", "client_name"),))] == 1
+        assert m.histograms["nlp.pipe"].count == 1
@@ -0,0 +1,99 @@
+import io
+import json
+import re
+import shutil
+import subprocess
+import sys
+
+import pytest
+from src.pipeline.ocr_reader import PAGE_TEXTS, _nested_pattern, _string_pattern, read_ocr_fields, read_ocr_text
+
+
+def _reader(obj):
+    return io.BytesIO(json.dumps(obj, ensure_ascii=False).encode("utf-8"))
+
+
+@pytest.fixture
+def response():
+    word = {
+        "boundingBox": {"vertices": [{"x": 1, "y": 2}, {"x": 3, "y": 4}]},
+        "confidence": 0.97,
+        "id": 0,
+        "text": "총중량: ]}{[ \"kg\"",
+    }
+    return {
+        "apiVersion": "1.1",
+        "confidence": 0.9242,
+        "metadata": {"pages": [{"height": 1920, "page": 1, "width": 1142}]},
+        "pages": [{"id": p, "text": "p", "words": [dict(word, id=i) for i in range(50)]} for p in range(3)],
+        "text": "계량일자: 2026-02-02\n차량번호: 8713",
+    }
+
+
+class TestReadOcrFields:
+    """점진적 OCR 리더가 json.load와 같은 값을 읽는지 검증합니다."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 64, 1 << 16])
+    def test_text_and_confidence(self, response, chunk_size):
+        found = read_ocr_fields(_reader(response), ("text", "confidence"), chunk_size=chunk_size)
+        assert found == {"text": response["text"], "confidence": 0.9242}
+
+    @pytest.mark.parametrize("chunk_size", [3, 1 << 16])
+    def test_container_field(self, response, chunk_size):
+        found = read_ocr_fields(_reader(response), ("pages",), chunk_size=chunk_size)
+        assert found["pages"] == response["pages"]
+
+    @pytest.mark.parametrize("fields", [("text", PAGE_TEXTS), ("pages", PAGE_TEXTS)])
+    @pytest.mark.parametrize("chunk_size", [5, 1 << 16])
+    def test_page_texts(self, response, fields, chunk_size):
+        response["pages"][1]["text"] = "두 번째 \"쪽\""
+        response["pages"].append({"id": 3, "words": []})
+        found = read_ocr_fields(_reader(response), fields, chunk_size=chunk_size)
+        assert found[PAGE_TEXTS] == ["p", "두 번째 \"쪽\"", "p", ""]
+
+    def test_missing_field_is_omitted(self):
+        assert read_ocr_fields(_reader({"pages": []}), ("text",)) == {}
+
+    def test_read_ocr_text_from_sample(self):
+        with open("data/sample_02.json", encoding="utf-8") as f:
+            data = json.load(f)
+        text, confidence = read_ocr_text("data/sample_02.json", with_confidence=True)
+        assert text == data["text"]
+        assert confidence == data["confidence"]
+
+    @pytest.mark.parametrize("broken", [b"", b"[1]", b'{"text":', b'{"a":[1,2'])
+    def test_broken_json_raises(self, broken):
+        with pytest.raises(ValueError):
+            read_ocr_fields(io.BytesIO(broken), ("text",))
+
+
+class TestPython310:
+    """소유 수량자가 없는 Python 3.10에서도 같은 패턴이 동작하는지 검증합니다."""
+
+    def test_plain_quantifiers_match_same_spans(self, response):
+        data = json.dumps(response, ensure_ascii=False).encode("utf-8")
+        plain = re.compile(rb"[\[{]" + _nested_pattern(9, b"*") + rb"[\]}]", re.S)
+        current = re.compile(rb"[\[{]" + _nested_pattern(9) + rb"[\]}]", re.S)
+        assert plain.match(data).end() == current.match(data).end() == len(data)
+        # 버퍼 경계에서 잘린 컨테이너는 맞지 않고, 내부 패턴은 완결된 원소 앞까지만 소비한다
+        inner_plain = re.compile(_nested_pattern(9, b"*"), re.S)
+        inner = re.compile(_nested_pattern(9), re.S)
+        for cut in (len(data) // 3, len(data) // 2, len(data) - 2):
+            assert plain.match(data[:cut]) is None
+            assert inner_plain.match(data, 1, cut).end() == inner.match(data, 1, cut).end()
+        string = b'"a\\"]}"'
+        assert re.match(_string_pattern(b"*"), string).end() == len(string)
+
+    @pytest.mark.skipif(sys.version_info < (3, 11), reason="이 인터프리터가 이미 3.10")
+    def test_import_and_read_on_python310(self):
+        python = shutil.which("python3.10")
+        probe = python and subprocess.run([python, "-c", "import sys; print(sys.version_info[:2])"],
+                                          capture_output=True, text=True)
+        if not probe or probe.stdout.strip() != "(3, 10)":
+            pytest.skip("python3.10을 찾을 수 없음")
+        script = ("from src.pipeline.ocr_reader import read_ocr_text; import src.pipeline.document; "
+                  "print(read_ocr_text('data/sample_02.json'))")
+        out = subprocess.run([python, "-c", script], capture_output=True, text=True, encoding="utf-8")
+        assert out.returncode == 0, out.stderr
+        with open("data/sample_02.json", encoding="utf-8") as f:
+            assert out.stdout == json.load(f)["text"] + "\n"
@@ -0,0 +1,146 @@
+import json
+import random
+
+import pytest
+
+from benchmarks.synthetic import generate_corpus
+from src.parser.cleaner import clean_text
+from src.parser.extractor import OcrExtractor, _DocumentScan
+from src.parser.rule_pack import current_rules
+from src.pipeline.document import build_extractor, process_file
+from src.pipeline.pages import PageExtractor, PageMode
+from src.pipeline.routing import RoutePolicy, RoutingExtractor
+from src.utils import metrics
+
+# 첫 페이지에서 필수 필드가 모두 확정되는 계근지
+HEADER = ("계량증명서\n거래처: 한빛자원\n차량번호: 12가3456\n계량일자: 2026-02-02\n"
+          "총중량: 10,000 kg\n차중량: 6,000 kg\n동우바이오(주)")
+ATTACHMENT = "첨부 사진\n경기도 화성시 팔탄면 1"
+
+
+def _paginate(text, rng, pages=3):
+    """줄 경계에서 text를 pages쪽으로 나눈다."""
+    lines = text.split("\n")
+    cuts = sorted(rng.sample(range(1, len(lines)), pages - 1))
+    return ["\n".join(lines[a:b]) for a, b in zip([0] + cuts, cuts + [len(lines)])]
+
+
+def _response(pages):
+    return {"text": "\n".join(pages), "pages": [{"text": p, "words": []} for p in pages]}
+
+
+class CountingExtractor:
+    def __init__(self):
+        self.calls = 0
+        self.base = OcrExtractor()
+
+    def extract(self, text):
+        self.calls += 1
+        return self.base.extract(text)
+
+
+class TestExtractPages:
+    """페이지 단위 추출이 전체 텍스트 추출과 같은 우선순위를 따르는지 검증합니다."""
+
+    def test_matches_full_text_extraction(self):
+        rng = random.Random(0)
+        extractor = OcrExtractor()
+        for ticket in generate_corpus(200, seed=5):
+            pages = [clean_text(p) for p in _paginate(ticket.text, rng)]
+            full = extractor.extract(clean_text("\n".join(pages)))
+            assert extractor.extract_pages(pages, early_exit=False) == full
+
+    def test_early_exit_skips_remaining_pages(self):
+        m = metrics.enable()
+        try:
+            result = OcrExtractor().extract_pages([HEADER, ATTACHMENT, ATTACHMENT])
+        finally:
+            metrics.disable()
+        assert m.counters[("pages", (("status", "scanned"),))] == 1
+        assert m.counters[("pages", (("status", "skipped"),))] == 2
+        assert result["issuer_name"] == "동우바이오(주)"
+        assert result["weights"]["net"] == 4000
+        # 훑지 않은 페이지의 주소는 찾지 않는다
+        assert result["issuer_address"] == "N/A"
+        full = OcrExtractor().extract_pages([HEADER, ATTACHMENT], early_exit=False)
+        assert full["issuer_address"] == "경기도 화성시 팔탄면 1"
+
+    @pytest.mark.parametrize("text", [
+        HEADER.replace("차중량: 6,000 kg\n", ""),
+        HEADER.replace("거래처: 한빛자원\n", ""),
+        HEADER.replace("동우바이오(주)", "동우바이오"),
+    ])
+    def test_unresolved_document_scans_all_pages(self, text):
+        scan = _DocumentScan()
+        scan.feed(text, current_rules())
+        assert not scan.resolved()
+
+    def test_merge_matches_sequential_scan(self):
+        rules = current_rules()
+        extractor = OcrExtractor()
+        rng = random.Random(1)
+        for ticket in generate_corpus(100, seed=6):
+            pages = _paginate(clean_text(ticket.text), rng, pages=4)
+            sequential = extractor.extract_pages(pages, early_exit=False)
+            head, tail = _DocumentScan(), _DocumentScan()
+            for page in pages[:2]:
+                head.feed(page, rules)
+            for page in pages[2:]:
+                tail.feed(page, rules)
+            head.merge(tail)
+            assert extractor._finish(head, rules) == sequential
+
+
+class TestPageExtractor:
+    """페이지 수에 따른 경로, 프로세스 풀 분할, 파이프라인 구성을 검증합니다."""
+
+    def test_single_page_uses_base(self):
+        base = CountingExtractor()
+        extractor = PageExtractor(base)
+        result = extractor.extract_response(_response([HEADER]))
+        assert base.calls == 1
+        assert result == OcrExtractor().extract(clean_text(HEADER))
+
+    def test_multi_page_bypasses_base(self):
+        base = CountingExtractor()
+        result = PageExtractor(base).extract_response(_response([HEADER, ATTACHMENT]))
+        assert base.calls == 0
+        assert result["client_name"] == "한빛자원"
+
+    def test_multi_page_uses_result_cache(self, tmp_path):
+        data = _response([HEADER, ATTACHMENT])
+        cache_path = str(tmp_path / "cache.sqlite")
+        # 같은 설정으로 다시 열면 적중하고, --pages-full은 결과가 다를 수 있어 따로 캐시한다
+        for early_exit, hits in ((True, 0), (True, 1), (False, 0)):
+            mode = PageMode(early_exit=early_exit)
+            extractor = build_extractor(cache_path=cache_path, pages=mode)
+            try:
+                assert extractor.extract_response(data) == PageExtractor(OcrExtractor(), mode).extract_response(data)
+                assert extractor.base.cache.stats() == {"hits": hits, "misses": 1 - hits, "evictions": 0}
+            finally:
+                extractor.base.cache.close()
+
+    def test_parallel_matches_sequential(self):
+        rng = random.Random(2)
+        ticket = next(generate_corpus(1, seed=7))
+        # 필드가 흩어진 긴 문서: 부가 페이지 사이에 계근지 조각을 끼운다
+        pages = [ATTACHMENT] * 12
+        for i, text in enumerate(_paginate(ticket.text, rng, pages=4)):
+            pages[3 * i + 2] = text
+        data = _response(pages)
+        sequential = PageExtractor(OcrExtractor()).extract_response(data)
+        parallel = PageExtractor(OcrExtractor(), PageMode(workers=2, min_parallel_pages=4))
+        try:
+            assert parallel.extract_response(data) == sequential
+        finally:
+            parallel.close()
+
+    def test_process_file_reads_page_texts(self, tmp_path):
+        route = RoutePolicy(min_confidence=None, required=("issuer_name",))
+        extractor = build_extractor(pages=PageMode(), route=route)
+        assert isinstance(extractor, RoutingExtractor) and isinstance(extractor.base, PageExtractor)
+        path = tmp_path / "doc.json"
+        path.write_text(json.dumps(_response([HEADER, ATTACHMENT]), ensure_ascii=False), encoding="utf-8")
+        _, result, _ = process_file(path, extractor, None)
+        assert result["issuer_address"] == "N/A"
+        assert extractor.routes["base"] == 1
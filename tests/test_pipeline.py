@@ -0,0 +1,162 @@
+import io
+import json
+
+import pytest
+from src.parser.extractor import OcrExtractor
+from src.pipeline.document import collect_warnings, output_path_for, process_file
+from src.pipeline.manifest import Manifest
+from src.pipeline.parallel import default_chunksize, iter_parallel
+from src.pipeline.streaming import iter_records, iter_results, stream_jsonl, write_results
+
+
+@pytest.fixture
+def data_files(tmp_path):
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    texts = [
+        "차량번호: 12가3456\n날짜: 2026-02-02\n총중량: 10000 kg\n차중량: 6000 kg",
+        "총중량: 13 460 kg\n차중량: 7 560 kg\n실중량: 5 900 kg",
+        "계량일자: 2025.12.01\n(주)하은펄프",
+    ]
+    files = []
+    for i, text in enumerate(texts):
+        p = data_dir / f"doc_{i:02d}.json"
+        p.write_text(json.dumps({"text": text}, ensure_ascii=False), encoding="utf-8")
+        files.append(p)
+    return files
+
+
+class TestProcessFile:
+    """단일 문서 처리와 경고 수집을 검증합니다."""
+
+    def test_writes_result_json(self, data_files, tmp_path):
+        out_dir = tmp_path / "outputs"
+        out_dir.mkdir()
+        name, result, _ = process_file(data_files[0], OcrExtractor(), out_dir)
+        saved = json.loads((out_dir / "doc_00_result.json").read_text(encoding="utf-8"))
+        assert name == "doc_00.json"
+        assert saved == result
+        assert result['weights']['net'] == 4000
+
+    def test_missing_fields_warn(self):
+        result = OcrExtractor().extract("총중량: 10000 kg")
+        messages = [fmt for fmt, _ in collect_warnings("x.json", result)]
+        assert "[%s] 차량번호 추출 실패" in messages
+        assert "[%s] 날짜 추출 실패" in messages
+
+
+class TestParallel:
+    """프로세스 풀 처리 결과가 순차 처리와 동일하고 순서가 유지되는지 검증합니다."""
+
+    def test_matches_sequential_in_order(self, data_files, tmp_path):
+        seq_dir = tmp_path / "seq"
+        par_dir = tmp_path / "par"
+        seq_dir.mkdir()
+        par_dir.mkdir()
+        extractor = OcrExtractor()
+        sequential = [process_file(f, extractor, seq_dir) for f in data_files]
+        parallel = list(iter_parallel(data_files, workers=2, use_nlp=False, output_dir=par_dir, chunksize=1))
+        assert parallel == sequential
+
+    def test_default_chunksize(self):
+        assert default_chunksize(0, 4) == 1
+        assert default_chunksize(10, 4) == 1
+        assert default_chunksize(100, 4) == 7
+
+
+class TestStreaming:
+    """JSONL 스트리밍 입출력을 검증합니다."""
+
+    def test_skips_blank_and_broken_lines(self):
+        lines = ['{"text": "날짜: 2026-02-02"}\n', "\n", "{broken\n", "[1, 2]\n"]
+        records = list(iter_records(lines, "in.jsonl"))
+        assert [rid for rid, _ in records] == ["in.jsonl:1"]
+
+    def test_round_trip(self):
+        lines = [
+            json.dumps({"text": "차량번호: 12가3456\n총중량: 10000 kg\n차중량: 6000 kg"}, ensure_ascii=False),
+            json.dumps({"text": "날 짜: 2026-02-02"}, ensure_ascii=False),
+        ]
+        out = io.StringIO()
+        count = write_results(iter_results(iter_records(lines, "in"), OcrExtractor()), out)
+        rows = [json.loads(r) for r in out.getvalue().splitlines()]
+        assert count == 2
+        assert rows[0]["source"] == "in:1"
+        assert rows[0]["result"]["car_number"] == "12가3456"
+        assert rows[0]["result"]["weights"]["net"] == 4000
+        assert rows[1]["result"]["date"] == "2026-02-02"
+
+    def test_stream_jsonl_files(self, tmp_path):
+        src = tmp_path / "in.jsonl"
+        dest = tmp_path / "out.jsonl"
+        src.write_text(json.dumps({"text": "상 호: 고요환경"}, ensure_ascii=False) + "\n", encoding="utf-8")
+        assert stream_jsonl(str(src), str(dest), OcrExtractor()) == 1
+        row = json.loads(dest.read_text(encoding="utf-8"))
+        assert row["result"]["client_name"] == "고요환경"
+
+    def test_batch_extractor_keeps_order(self, monkeypatch):
+        import src.pipeline.streaming as streaming
+
+        class BatchExtractor:
+            def __init__(self):
+                self.base = OcrExtractor()
+                self.batches = []
+
+            def extract_batch(self, texts):
+                self.batches.append(len(texts))
+                return [self.base.extract(t) for t in texts]
+
+        monkeypatch.setattr(streaming, "BATCH_SIZE", 2)
+        lines = [json.dumps({"text": f"날짜: 2026-02-0{i}"}) for i in range(1, 6)]
+        extractor = BatchExtractor()
+        results = list(iter_results(iter_records(lines, "in"), extractor))
+        assert [r["date"] for _, r in results] == [f"2026-02-0{i}" for i in range(1, 6)]
+        assert [rid for rid, _ in results] == [f"in:{i}" for i in range(1, 6)]
+        assert extractor.batches == [2, 2, 1]
+
+
+class TestManifest:
+    """증분 재실행 매니페스트의 재처리 판정을 검증합니다."""
+
+    def _run(self, manifest, files, out_dir):
+        todo, skipped = manifest.plan(files)
+        for state in todo:
+            process_file(state.path, OcrExtractor(), out_dir)
+            manifest.record(state, output_path_for(state.path, out_dir))
+        return [s.path.name for s in todo], skipped
+
+    def test_only_new_or_changed_files_are_processed(self, data_files, tmp_path):
+        out_dir = tmp_path / "outputs"
+        out_dir.mkdir()
+        manifest = Manifest(tmp_path / "m.sqlite", "v1")
+        assert self._run(manifest, data_files, out_dir) == (["doc_00.json", "doc_01.json", "doc_02.json"], 0)
+        assert self._run(manifest, data_files, out_dir) == ([], 3)
+
+        data_files[1].write_text(json.dumps({"text": "총중량: 1 kg"}), encoding="utf-8")
+        assert self._run(manifest, data_files, out_dir) == (["doc_01.json"], 2)
+
+    def test_touch_without_content_change_is_skipped(self, data_files, tmp_path):
+        import os
+        out_dir = tmp_path / "outputs"
+        out_dir.mkdir()
+        manifest = Manifest(tmp_path / "m.sqlite", "v1")
+        self._run(manifest, data_files, out_dir)
+        st = data_files[0].stat()
+        os.utime(data_files[0], ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+        assert self._run(manifest, data_files, out_dir) == ([], 3)
+
+    def test_rules_version_change_reprocesses(self, data_files, tmp_path):
+        out_dir = tmp_path / "outputs"
+        out_dir.mkdir()
+        path = tmp_path / "m.sqlite"
+        self._run(Manifest(path, "v1"), data_files, out_dir)
+        processed, skipped = self._run(Manifest(path, "v2"), data_files, out_dir)
+        assert len(processed) == 3 and skipped == 0
+
+    def test_missing_output_reprocesses(self, data_files, tmp_path):
+        out_dir = tmp_path / "outputs"
+        out_dir.mkdir()
+        manifest = Manifest(tmp_path / "m.sqlite", "v1")
+        self._run(manifest, data_files, out_dir)
+        output_path_for(data_files[2], out_dir).unlink()
+        assert self._run(manifest, data_files, out_dir) == (["doc_02.json"], 2)
@@ -0,0 +1,77 @@
+import pytest
+from src.parser.extractor import OcrExtractor
+from src.parser.version import extraction_fingerprint, fingerprint_files
+from src.pipeline.result_cache import CachedExtractor, ResultCache
+
+TEXT = "차량번호: 12가3456\n날짜: 2026-02-02\n총중량: 10000 kg\n차중량: 6000 kg"
+
+
+class CountingExtractor:
+    def __init__(self):
+        self.calls = 0
+        self.base = OcrExtractor()
+
+    def extract(self, text):
+        self.calls += 1
+        return self.base.extract(text)
+
+
+class TestResultCache:
+    """결과 캐시의 적중/무효화/제거 동작을 검증합니다."""
+
+    def test_hit_skips_extraction(self, tmp_path):
+        base = CountingExtractor()
+        cached = CachedExtractor(base, ResultCache(tmp_path / "c.sqlite", "v1"))
+        first = cached.extract(TEXT)
+        second = cached.extract(TEXT)
+        assert first == second == OcrExtractor().extract(TEXT)
+        assert base.calls == 1
+        assert cached.cache.stats() == {"hits": 1, "misses": 1, "evictions": 0}
+
+    def test_version_change_invalidates(self, tmp_path):
+        path = tmp_path / "c.sqlite"
+        cache = ResultCache(path, "v1")
+        cache.put(TEXT, {"car_number": "old"})
+        cache.close()
+        reopened = ResultCache(path, "v2")
+        assert reopened.get(TEXT) is None
+        reopened.put(TEXT, {"car_number": "new"})
+        reopened.close()
+        # 다른 버전의 항목은 열 때 지우지 않는다(버전을 되돌리면 다시 적중)
+        back = ResultCache(path, "v1")
+        assert back.get(TEXT) == {"car_number": "old"}
+        assert len(back) == 2
+
+    def test_purge_other_versions(self, tmp_path):
+        cache = ResultCache(tmp_path / "c.sqlite", "v1")
+        cache.put(TEXT, {"car_number": "old"})
+        cache.version = "v2"
+        cache.put(TEXT, {"car_number": "new"})
+        assert cache.purge_other_versions() == 1
+        assert len(cache) == 1
+        assert cache.get(TEXT) == {"car_number": "new"}
+
+    def test_lru_eviction(self, tmp_path):
+        cache = ResultCache(tmp_path / "c.sqlite", "v1", max_entries=10)
+        for i in range(10):
+            cache.put(f"doc {i}", {"i": i})
+        cache.get("doc 0")  # 최근 사용으로 갱신
+        cache.put("doc 10", {"i": 10})
+        assert len(cache) <= 10
+        assert cache.evictions >= 1
+        assert cache.get("doc 0") == {"i": 0}
+        assert cache.get("doc 1") is None
+
+
+class TestFingerprint:
+    """규칙 파일이 바뀌면 버전 지문도 바뀌는지 검증합니다."""
+
+    def test_content_change_changes_fingerprint(self, tmp_path):
+        rules = tmp_path / "rules.py"
+        rules.write_text("DATE_LABELS = ['날짜']", encoding="utf-8")
+        before = fingerprint_files([rules])
+        rules.write_text("DATE_LABELS = ['날짜', '일자']", encoding="utf-8")
+        assert fingerprint_files([rules]) != before
+
+    def test_modes_have_distinct_fingerprints(self):
+        assert extraction_fingerprint(False) != extraction_fingerprint(True)
@@ -0,0 +1,88 @@
+import json
+import pickle
+
+import pytest
+
+from benchmarks.synthetic import generate_corpus
+from src.parser.cleaner import clean_text
+from src.parser.extractor import OcrExtractor
+from src.parser.result import ExtractionResult, as_dict, to_json, validate_result
+from src.pipeline.result_cache import CachedExtractor, ResultCache
+
+TEXT = "차량번호: 12가3456\n날짜: 2026-02-02\n총중량: 10000 kg\n차중량: 6000 kg"
+COMPACT = {"ensure_ascii": False, "separators": (",", ":")}
+
+
+class TestExtractionResult:
+    """슬롯 기반 결과의 dict 호환성과 직렬화를 검증합니다."""
+
+    def test_mapping_compatible(self):
+        r = ExtractionResult(car_number="12가3456", weight_total=10000)
+        assert r["car_number"] == "12가3456"
+        assert r.get("missing", "x") == "x"
+        assert r["weights"]["total"] == 10000
+        r["weights"].update({"empty": 6000, "net": 4000})
+        r["client_name"] = "한빛"
+        assert r == {**ExtractionResult().to_dict(), "car_number": "12가3456", "client_name": "한빛",
+                     "weights": {"unit": "kg", "total": 10000, "empty": 6000, "net": 4000}}
+        assert list(r) == list(r.to_dict())
+        with pytest.raises(KeyError):
+            r["weights"]["gross"] = 1
+
+    def test_to_json_matches_json_dumps(self):
+        r = ExtractionResult(issuer_name='(주)"따옴표"\\사', issuer_address="줄\n바꿈\t탭", weight_net=7)
+        assert r.to_json() == json.dumps(r.to_dict(), **COMPACT)
+        assert ExtractionResult.from_json(r.to_json()) == r
+        assert to_json(r.to_dict()) == r.to_json()
+
+    def test_pickle_roundtrip_is_smaller(self):
+        r = ExtractionResult(car_number="12가3456", weight_total=10000, weight_empty=6000, weight_net=4000)
+        data = pickle.dumps(r)
+        assert pickle.loads(data) == r
+        assert len(data) < len(pickle.dumps(r.to_dict()))
+
+    def test_as_dict_passthrough(self):
+        d = {"car_number": "N/A"}
+        assert as_dict(d) is d
+        assert as_dict(ExtractionResult()) == ExtractionResult().to_dict()
+
+
+class TestTypedExtraction:
+    """typed 추출기가 dict 추출기와 같은 내용을 돌려주는지 검증합니다."""
+
+    def test_typed_equals_dict(self):
+        plain, typed = OcrExtractor(), OcrExtractor(typed=True)
+        for ticket in generate_corpus(50, seed=3):
+            text = clean_text(ticket.text)
+            result = typed.extract(text)
+            assert isinstance(result, ExtractionResult)
+            assert result == plain.extract(text)
+            assert result.to_json() == json.dumps(plain.extract(text), **COMPACT)
+
+    def test_cache_hit_keeps_type(self, tmp_path):
+        cached = CachedExtractor(OcrExtractor(typed=True), ResultCache(tmp_path / "c.sqlite", "v1"))
+        first = cached.extract(TEXT)
+        second = cached.extract(TEXT)
+        assert isinstance(second, ExtractionResult)
+        assert first == second
+        assert cached.cache.stats()["hits"] == 1
+
+
+class TestValidation:
+    """pydantic 스키마 검증(경계 입력)을 검증합니다."""
+
+    def test_accepts_valid_json(self):
+        pytest.importorskip("pydantic")
+        r = OcrExtractor(typed=True).extract(TEXT)
+        assert validate_result(r.to_json()) == r
+        assert validate_result(r.to_dict()) == r
+
+    @pytest.mark.parametrize("bad", [
+        {"weights": {"total": -1}},
+        {"weights": {"total": "10000"}},
+        {"car_number": "12가3456", "extra": 1},
+    ])
+    def test_rejects_invalid(self, bad):
+        pydantic = pytest.importorskip("pydantic")
+        with pytest.raises(pydantic.ValidationError):
+            validate_result(bad)
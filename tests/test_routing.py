@@ -0,0 +1,113 @@
+import json
+
+import pytest
+
+from src.parser.cleaner import clean_text
+from src.parser.extractor import OcrExtractor
+from src.parser.extractor_nlp_wrapper import OcrExtractorWithNlp
+from src.pipeline.document import build_extractor, process_file
+from src.pipeline.routing import RoutePolicy, RoutingExtractor, low_word_share
+
+# 발급사 줄이 없어 기본 추출기로는 issuer_name이 N/A인 문서
+HARD = "계량증명서\n차량번호: 12가3456\n계량일자: 2026-02-02\n총중량: 10000 kg\n(주)동해 귀 하"
+EASY = "계량증명서\n거래처: 한빛자원\n차량번호: 8713\n계량일자: 2026-02-02\n총중량: 10000 kg\n동우바이오(주)\n경기도 화성시 1"
+
+
+class _Ent:
+    def __init__(self, label):
+        self.label_ = label
+
+
+class _Doc:
+    def __init__(self, ents):
+        self.ents = ents
+
+
+class FakeNlp:
+    """'(주)'가 있는 줄을 ORG로 라벨링하는 가짜 파이프라인."""
+
+    def __call__(self, line):
+        return _Doc([_Ent("ORG")] if "(주)" in line else [])
+
+
+class CountingFactory:
+    def __init__(self, fail=False):
+        self.calls = 0
+        self.fail = fail
+
+    def __call__(self):
+        self.calls += 1
+        if self.fail:
+            raise ImportError("spaCy 없음")
+        return OcrExtractorWithNlp(base=OcrExtractor(typed=True), nlp=FakeNlp())
+
+
+def _router(factory, **policy):
+    return RoutingExtractor(OcrExtractor(typed=True), RoutePolicy(**policy), nlp_factory=factory)
+
+
+def _words(*confidences):
+    return [{"words": [{"text": "x", "confidence": c} for c in confidences]}]
+
+
+class TestRoutingExtractor:
+    """기본 경로/에스컬레이션 판정과 NLP 보조 지연 로드를 검증합니다."""
+
+    def test_easy_document_never_loads_nlp(self):
+        factory = CountingFactory()
+        router = _router(factory)
+        result = router.extract_response({"text": EASY, "confidence": 0.95})
+        assert result["issuer_name"] != "N/A"
+        assert factory.calls == 0
+        assert router.routes["base"] == 1
+
+    def test_missing_field_matches_full_nlp_mode(self):
+        factory = CountingFactory()
+        router = _router(factory)
+        routed = [router.extract_response({"text": HARD, "confidence": 0.95}) for _ in range(3)]
+        full = OcrExtractorWithNlp(base=OcrExtractor(typed=True), nlp=FakeNlp()).extract(clean_text(HARD))
+        assert routed[0] == full
+        assert routed[0]["client_name"] == "(주)동해"
+        assert router.routes["missing"] == 3
+        # 첫 에스컬레이션에 한 번만 로드해 계속 쓴다
+        assert factory.calls == 1
+
+    @pytest.mark.parametrize("data, policy, reason", [
+        ({"confidence": 0.5}, {}, "confidence"),
+        ({"confidence": 0.5}, {"min_confidence": None}, None),
+        ({"pages": _words(0.2, 0.99, 0.99)}, {"min_word_confidence": 0.5}, "word_confidence"),
+        ({"pages": _words(0.2, *[0.99] * 10)}, {"min_word_confidence": 0.5}, None),
+    ])
+    def test_confidence_reasons(self, data, policy, reason):
+        router = _router(CountingFactory(), **policy)
+        results = OcrExtractor().extract(clean_text(EASY))
+        assert router.reason(results, {"text": EASY, **data}) == reason
+
+    def test_low_word_share(self):
+        assert low_word_share(None, 0.5) == 0.0
+        assert low_word_share(_words(0.1, 0.9, 0.2, 0.8), 0.5) == 0.5
+
+    def test_nlp_load_failure_keeps_base_result(self, caplog):
+        factory = CountingFactory(fail=True)
+        router = _router(factory)
+        for _ in range(2):
+            result = router.extract(clean_text(HARD))
+        assert result["client_name"] == "N/A"
+        assert factory.calls == 1
+        assert "NLP 보조 초기화 실패" in caplog.text
+
+
+class TestRoutingPipeline:
+    """build_extractor 구성과 파일 처리 시 confidence 필드 읽기를 검증합니다."""
+
+    def test_process_file_reads_confidence(self, tmp_path):
+        factory = CountingFactory()
+        extractor = build_extractor(route=RoutePolicy(min_confidence=0.9))
+        assert isinstance(extractor, RoutingExtractor)
+        extractor._nlp_factory = factory
+        path = tmp_path / "doc.json"
+        path.write_text(json.dumps({"confidence": 0.42, "text": EASY, "pages": []}, ensure_ascii=False),
+                        encoding="utf-8")
+        process_file(path, extractor, None)
+        assert extractor.routes["confidence"] == 1
+        assert "confidence" in extractor.ocr_fields and "pages" not in extractor.ocr_fields
@@ -0,0 +1,195 @@
+import json
+import os
+
+import pytest
+
+from src.parser import rule_pack
+from src.parser.cleaner import clean_text
+from src.parser.extractor import OcrExtractor
+from src.parser.matcher import CLIENT, DATE
+from src.parser.result import ExtractionResult
+from src.parser.rule_pack import (
+    DEFAULT_PACK_DIR, LABEL_CATEGORIES, CompiledRules, RuleStore, compile_rules, load_rule_pack,
+)
+from src.pipeline.document import extract_document
+from src.pipeline.result_cache import CachedExtractor, open_cache
+
+DEFAULT_JSON = str(DEFAULT_PACK_DIR / "default.json")
+TEXT = "반 출 처: 한빛자원\n계량일자: 2026-02-02\n차량번호: 8713\n총중량: 10000 kg\n공차중량: 6000 kg"
+
+
+def _write_pack(directory, name="site", version="1.0.0", **fields):
+    path = directory / f"{name}.json"
+    path.write_text(json.dumps({"name": name, "version": version, "extends": DEFAULT_JSON, **fields},
+                               ensure_ascii=False), encoding="utf-8")
+    return path
+
+
+def _site_pack(directory, version="1.0.0"):
+    """거래처 라벨로 '반출처:'를 쓰고, '반 출 처'를 교정하는 현장 팩."""
+    corrections = directory / "site_corrections"
+    corrections.mkdir(exist_ok=True)
+    (corrections / "site.tsv").write_text("반 출 처\t반출처\n", encoding="utf-8")
+    return _write_pack(directory, version=version, labels={CLIENT: ["반출처:"]}, corrections=["site_corrections"])
+
+
+def _touch_later(path):
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def active_store():
+    """테스트가 바꾼 프로세스 전역 활성 팩을 원래대로 돌린다."""
+    saved = rule_pack._ACTIVE
+    yield
+    rule_pack._ACTIVE = saved
+
+
+class TestLoadRulePack:
+    """팩 파일 로드, 상속 병합, 형식 검증을 검증합니다."""
+
+    def test_default_pack(self):
+        pack = load_rule_pack()
+        assert pack.pack_id == "default@1.2.0"
+        assert set(pack.labels) == set(LABEL_CATEGORIES)
+        assert "계량일자" in pack.labels[DATE]
+
+    def test_extends_replaces_only_listed_categories(self, tmp_path):
+        pack = load_rule_pack(_site_pack(tmp_path))
+        default = load_rule_pack()
+        assert pack.pack_id == "site@1.0.0"
+        assert pack.labels[CLIENT] == ["반출처:"]
+        assert pack.labels[DATE] == default.labels[DATE]
+        # 상속한 팩의 교정 디렉터리 뒤에 이어 붙는다(뒤가 우선)
+        assert pack.correction_dirs[-1].name == "site_corrections"
+        assert len(pack.correction_dirs) == len(default.correction_dirs) + 1
+
+    @pytest.mark.parametrize("fields, message", [
+        ({"labels": {"unknown": ["x"]}}, "라벨 범주"),
+        ({"labels": {CLIENT: ["", "상호:"]}}, "labels.client"),
+        ({"patterns": {"time": "x"}}, "패턴"),
+        ({"version": ""}, "version"),
+        ({"fuzzy_labels": {"categories": ["unknown"]}}, "fuzzy_labels"),
+        ({"fuzzy_labels": {"max_distance": 3}}, "max_distance"),
+        ({"fuzzy_labels": {"keep": [""]}}, "fuzzy_labels.keep"),
+    ])
+    def test_invalid_pack(self, tmp_path, fields, message):
+        with pytest.raises(ValueError, match=message):
+            load_rule_pack(_write_pack(tmp_path, **fields))
+
+    def test_fuzzy_labels_can_be_disabled(self, tmp_path):
+        rules = compile_rules(_write_pack(tmp_path, fuzzy_labels={"categories": []}))
+        assert rules.label_index is None
+        # 기본 팩은 끄고, ocr_repair 팩을 고를 때만 켠다
+        assert compile_rules().label_index is None
+        assert compile_rules("ocr_repair").label_index.lookup("차랑번호") == "차량번호"
+
+    def test_extends_cycle(self, tmp_path):
+        (tmp_path / "a.json").write_text('{"name": "a", "version": "1", "extends": "b"}', encoding="utf-8")
+        (tmp_path / "b.json").write_text('{"name": "b", "version": "1", "extends": "a"}', encoding="utf-8")
+        with pytest.raises(ValueError, match="순환"):
+            load_rule_pack(tmp_path / "a.json")
+
+    def test_bad_regex_fails_at_compile(self, tmp_path):
+        with pytest.raises(ValueError, match="patterns.date"):
+            compile_rules(_write_pack(tmp_path, patterns={"date": "(\\d{4}"}))
+
+
+class TestCompiledRules:
+    """추출기가 팩의 라벨/교정을 쓰고 결과에 팩 버전을 기록하는지 검증합니다."""
+
+    def test_pinned_pack_changes_extraction(self, tmp_path):
+        site = compile_rules(_site_pack(tmp_path))
+        text = clean_text(TEXT, site.corrector)
+        result = OcrExtractor(rules=site).extract(text)
+        assert result["client_name"] == "한빛자원"
+        assert result["rules_version"] == "site@1.0.0"
+        assert OcrExtractor().extract(text)["client_name"] == "N/A"
+
+    def test_typed_result_records_version(self):
+        result = OcrExtractor(typed=True).extract(TEXT)
+        assert result.rules_version == "default@1.2.0"
+        assert ExtractionResult.from_json(result.to_json()) == result
+
+    def test_artifact_round_trip(self, tmp_path, monkeypatch):
+        first = compile_rules(_site_pack(tmp_path), artifact_dir=tmp_path / "artifacts")
+        assert (tmp_path / "artifacts" / f"{first.fingerprint}.pickle").is_file()
+
+        def fail(*args, **kwargs):
+            raise AssertionError("아티팩트가 있으면 다시 컴파일하지 않아야 합니다")
+
+        monkeypatch.setattr(CompiledRules, "__init__", fail)
+        loaded = compile_rules(tmp_path / "site.json", artifact_dir=tmp_path / "artifacts")
+        assert loaded.pack_id == first.pack_id
+        assert loaded.matcher.scan("반출처:") == {CLIENT}
+
+    def test_corrupt_artifact_recompiles(self, tmp_path):
+        rules = compile_rules(artifact_dir=tmp_path)
+        (tmp_path / f"{rules.fingerprint}.pickle").write_bytes(b"not a pickle")
+        assert compile_rules(artifact_dir=tmp_path).fingerprint == rules.fingerprint
+
+
+class TestRuleStore:
+    """파일 변경 시 핫 리로드, 실패 시 이전 규칙 유지를 검증합니다."""
+
+    def test_reload_after_interval(self, tmp_path):
+        path = _site_pack(tmp_path)
+        clock = FakeClock()
+        store = RuleStore(path, check_interval=5, clock=clock)
+        old = store.rules
+        path.write_text(path.read_text(encoding="utf-8").replace('"1.0.0"', '"1.1.0"'), encoding="utf-8")
+        _touch_later(path)
+        assert store.refresh() is old  # 확인 간격 전에는 파일을 보지 않는다
+        clock.now = 5
+        assert store.refresh().pack_id == "site@1.1.0"
+        assert store.reloads == 1
+        # 진행 중이던 문서가 잡은 스냅숏은 그대로다
+        assert old.pack_id == "site@1.0.0"
+
+    def test_correction_file_change_reloads(self, tmp_path):
+        path = _site_pack(tmp_path)
+        clock = FakeClock()
+        store = RuleStore(path, check_interval=1, clock=clock)
+        (tmp_path / "site_corrections" / "more.tsv").write_text("한 빛\t한빛\n", encoding="utf-8")
+        clock.now = 1
+        assert store.refresh().corrector.apply("한 빛") == "한빛"
+
+    def test_broken_pack_keeps_previous_rules(self, tmp_path, caplog):
+        path = _site_pack(tmp_path)
+        clock = FakeClock()
+        store = RuleStore(path, check_interval=1, clock=clock)
+        old = store.rules
+        path.write_text("{ broken", encoding="utf-8")
+        _touch_later(path)
+        clock.now = 1
+        assert store.refresh() is old
+        assert store.failures == 1
+        assert "리로드 실패" in caplog.text
+        # 같은 파일 상태로는 다시 시도하지 않는다
+        clock.now = 2
+        store.refresh()
+        assert store.failures == 1
+
+    def test_document_boundary_refresh_and_cache_key(self, tmp_path, active_store):
+        path = _site_pack(tmp_path)
+        clock = FakeClock()
+        rule_pack._ACTIVE = RuleStore(path, check_interval=1, clock=clock)
+        extractor = CachedExtractor(OcrExtractor(typed=True), open_cache(tmp_path / "c.sqlite"))
+        assert extract_document({"text": TEXT}, extractor)["rules_version"] == "site@1.0.0"
+
+        path.write_text(path.read_text(encoding="utf-8").replace('"1.0.0"', '"2.0.0"'), encoding="utf-8")
+        _touch_later(path)
+        clock.now = 1
+        result = extract_document({"text": TEXT}, extractor)
+        # 새 팩 지문으로 키가 바뀌어 이전 팩의 캐시 결과를 쓰지 않는다
+        assert result["rules_version"] == "site@2.0.0"
+        assert extractor.cache.stats()["hits"] == 0
@@ -0,0 +1,120 @@
+import json
+import threading
+import time
+
+import pytest
+
+import src.pipeline.staged as staged
+from src.parser.extractor import OcrExtractor
+from src.pipeline.document import build_extractor, process_file
+from src.pipeline.ocr_reader import read_ocr_fields
+from src.pipeline.staged import StagedPipeline, iter_staged
+from src.utils import metrics
+
+
+@pytest.fixture
+def data_files(tmp_path):
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    files = []
+    for i in range(20):
+        p = data_dir / f"doc_{i:02d}.json"
+        text = f"차량번호: 12가{1000 + i}\n날짜: 2026-02-02\n총중량: {10000 + i} kg\n차중량: 6000 kg"
+        p.write_text(json.dumps({"text": text}, ensure_ascii=False), encoding="utf-8")
+        files.append(p)
+    return files
+
+
+@pytest.fixture
+def read_log(monkeypatch):
+    """읽기 단계가 연 파일 이름을 기록한다."""
+    log = []
+
+    def read(path, fields=("text",)):
+        log.append(path.name)
+        return read_ocr_fields(path, fields)
+
+    monkeypatch.setattr(staged, "read_ocr_fields", read)
+    return log
+
+
+def _stage_threads():
+    return [t for t in threading.enumerate() if t.name.startswith(("reader-", "extractor", "writer"))]
+
+
+class TestStagedPipeline:
+    """단계형 파이프라인의 결과 순서, 배압, 종료 처리를 검증합니다."""
+
+    def test_matches_sequential_in_order(self, data_files, tmp_path):
+        seq_dir, staged_dir = tmp_path / "seq", tmp_path / "staged"
+        seq_dir.mkdir()
+        staged_dir.mkdir()
+        extractor = OcrExtractor()
+        sequential = [process_file(f, extractor, seq_dir) for f in data_files]
+        results = list(iter_staged(data_files, staged_dir, OcrExtractor(), readers=4, queue_size=2))
+        assert results == sequential
+        for f in data_files:
+            name = f"{f.stem}_result.json"
+            assert (staged_dir / name).read_text(encoding="utf-8") == (seq_dir / name).read_text(encoding="utf-8")
+
+    def test_result_cache_from_extractor_thread(self, data_files, tmp_path):
+        # 메인 스레드에서 연 캐시 연결을 추출 스레드가 쓴다
+        cache_path = tmp_path / "cache.sqlite"
+        sequential = [process_file(f, OcrExtractor(), None) for f in data_files]
+        for expected_hits in (0, len(data_files)):
+            extractor = build_extractor(cache_path=str(cache_path))
+            try:
+                assert list(iter_staged(data_files, None, extractor, readers=2)) == sequential
+                assert extractor.cache.hits == expected_hits
+            finally:
+                extractor.cache.close()
+
+    def test_process_pool_extraction(self, data_files, tmp_path):
+        extractor = OcrExtractor()
+        expected = [process_file(f, extractor, None) for f in data_files]
+        results = list(iter_staged(data_files, None, workers=2, readers=2, queue_size=2))
+        assert results == expected
+        assert not list(tmp_path.rglob("*_result.json"))
+
+    def test_backpressure_bounds_reads(self, data_files, tmp_path, read_log):
+        gen = StagedPipeline(tmp_path, OcrExtractor(), readers=4, queue_size=1, max_inflight=3).run(data_files)
+        next(gen)
+        time.sleep(0.2)  # 호출 측이 소비를 멈춘 동안 읽기는 in-flight 상한에서 멈춰야 한다
+        assert len(read_log) <= 4
+        gen.close()
+        assert not _stage_threads()
+
+    def test_close_drains_in_flight_work(self, data_files, tmp_path, read_log):
+        gen = iter_staged(data_files, tmp_path, OcrExtractor(), readers=2, queue_size=2)
+        next(gen)
+        gen.close()
+        assert not _stage_threads()
+        # 읽은 문서는 모두 결과 파일까지 기록되고, 읽지 않은 문서는 손대지 않는다
+        written = sorted(p.name for p in tmp_path.glob("*_result.json"))
+        assert written == sorted(name.replace(".json", "_result.json") for name in read_log)
+        assert len(read_log) < len(data_files)
+
+    def test_error_raised_in_order(self, data_files, tmp_path):
+        data_files[5].write_text("{broken", encoding="utf-8")
+        names = []
+        with pytest.raises(ValueError):
+            for name, _, _ in iter_staged(data_files, tmp_path, OcrExtractor(), readers=3, queue_size=2):
+                names.append(name)
+        assert names == [f.name for f in data_files[:5]]
+        assert not _stage_threads()
+
+    def test_metrics_counted_once_per_document(self, data_files, tmp_path):
+        m = metrics.enable()
+        try:
+            list(iter_staged(data_files, tmp_path, workers=2, readers=2, queue_size=2))
+        finally:
+            metrics.disable()
+        n = len(data_files)
+        assert m.histograms["read"].count == n
+        assert m.histograms["extract"].count == n
+        assert m.histograms["write"].count == n
+        assert m.counters[("documents", ())] == n
+
+    def test_requires_extractor_without_workers(self, tmp_path):
+        with pytest.raises(ValueError):
+            StagedPipeline(tmp_path)
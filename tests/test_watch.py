@@ -0,0 +1,236 @@
+import json
+import os
+import threading
+import time
+
+import pytest
+
+from src.parser.extractor import OcrExtractor
+from src.pipeline.document import output_path_for, process_file
+from src.pipeline.watch import DirectoryWatcher, InotifyWatcher, MicroBatcher, WatchService, open_watcher
+from src.utils import metrics
+
+
+def _write(directory, name, i=0, mtime=None):
+    path = directory / name
+    text = f"차량번호: 12가{1000 + i}\n날짜: 2026-02-02\n총중량: {10000 + i} kg\n차중량: 6000 kg"
+    path.write_text(json.dumps({"text": text}, ensure_ascii=False), encoding="utf-8")
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+    return path
+
+
+class FakeClock:
+    def __init__(self, now=0.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def inbox(tmp_path):
+    directory = tmp_path / "inbox"
+    directory.mkdir()
+    return directory
+
+
+def _inotify_or_skip(inbox, **kwargs):
+    try:
+        return InotifyWatcher(inbox, **kwargs)
+    except (OSError, AttributeError):
+        pytest.skip("inotify를 쓸 수 없는 환경")
+
+
+class TestDirectoryWatcher:
+    """settle 조건, 중복 반환 방지, 패턴 필터를 검증합니다."""
+
+    def test_settle_and_order(self, inbox):
+        clock = FakeClock(1000.0)
+        watcher = DirectoryWatcher(inbox, settle=2.0, clock=clock)
+        _write(inbox, "b.json", mtime=990.0)
+        _write(inbox, "a.json", mtime=995.0)
+        _write(inbox, "c.json", mtime=999.5)  # 아직 쓰는 중일 수 있음
+        assert [p.name for p in watcher.poll()] == ["b.json", "a.json"]
+        clock.now = 1002.0
+        assert [p.name for p in watcher.poll()] == ["c.json"]
+
+    def test_claimed_until_released(self, inbox):
+        watcher = DirectoryWatcher(inbox, settle=0)
+        path = _write(inbox, "a.json")
+        assert watcher.poll() == [path]
+        assert watcher.poll() == []
+        watcher.release(path)
+        assert watcher.poll() == [path]
+
+    def test_pattern_and_regular_files_only(self, inbox):
+        watcher = DirectoryWatcher(inbox, settle=0)
+        _write(inbox, "a.json.tmp")
+        _write(inbox, "a.json.done")
+        (inbox / "dir.json").mkdir()
+        assert watcher.poll() == []
+
+    def test_missing_directory(self, tmp_path):
+        with pytest.raises(NotADirectoryError):
+            DirectoryWatcher(tmp_path / "missing")
+
+    def test_open_watcher_backends(self, inbox):
+        assert open_watcher(inbox, "poll").backend == "poll"
+        watcher = open_watcher(inbox, "auto")
+        assert watcher.backend in ("inotify", "poll")
+        watcher.close()
+        with pytest.raises(ValueError):
+            open_watcher(inbox, "kqueue")
+
+
+class TestInotifyWatcher:
+    """쓰기 완료/이동 이벤트가 온 파일은 settle 없이 바로 준비되는지 검증합니다."""
+
+    def test_close_write_skips_settle(self, inbox):
+        watcher = _inotify_or_skip(inbox, settle=3600)
+        try:
+            _write(inbox, "a.json")
+            watcher.wait(1.0)
+            assert [p.name for p in watcher.poll()] == ["a.json"]
+        finally:
+            watcher.close()
+
+    def test_moved_in(self, inbox, tmp_path):
+        watcher = _inotify_or_skip(inbox, settle=3600)
+        try:
+            staging = _write(tmp_path, "b.json.part")
+            os.replace(staging, inbox / "b.json")
+            _write(inbox, "c.json.part")  # 패턴에 맞지 않는 이벤트
+            watcher.wait(1.0)
+            assert [p.name for p in watcher.poll()] == ["b.json"]
+        finally:
+            watcher.close()
+
+    def test_backlog_still_needs_settle(self, inbox):
+        _write(inbox, "old.json", mtime=time.time() - 10)
+        _write(inbox, "fresh.json")
+        watcher = _inotify_or_skip(inbox, settle=5)
+        try:
+            watcher.wait(0)
+            assert [p.name for p in watcher.poll()] == ["old.json"]
+        finally:
+            watcher.close()
+
+
+class TestMicroBatcher:
+    """크기/시간 기준 배치 마감과 남은 파일 처리를 검증합니다."""
+
+    def test_closes_on_size(self, tmp_path):
+        batcher = MicroBatcher(batch_size=3, max_wait=10, clock=FakeClock())
+        batcher.add([tmp_path / "a", tmp_path / "b"])
+        assert not batcher.due()
+        batcher.add([tmp_path / "c", tmp_path / "d"])
+        assert batcher.due()
+        assert [p.name for p in batcher.take()] == ["a", "b", "c"]
+        # 남은 파일은 이미 기다린 시간을 이어서 센다
+        assert len(batcher) == 1 and not batcher.due()
+
+    def test_closes_on_wait(self, tmp_path):
+        clock = FakeClock()
+        batcher = MicroBatcher(batch_size=10, max_wait=0.5, clock=clock)
+        assert not batcher.due() and batcher.timeout(1.0) == 1.0
+        batcher.add([tmp_path / "a"])
+        clock.now = 0.2
+        batcher.add([tmp_path / "b"])
+        assert not batcher.due()
+        assert batcher.timeout(1.0) == pytest.approx(0.3)
+        clock.now = 0.5
+        assert batcher.due() and batcher.timeout(1.0) == 0.0
+        assert len(batcher.take()) == 2 and len(batcher) == 0
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            MicroBatcher(batch_size=0)
+        with pytest.raises(ValueError):
+            MicroBatcher(max_wait=-1)
+
+
+class TestWatchService:
+    """결과 기록, 입력 이동/표시, 실패 격리, 워커 풀 처리를 검증합니다."""
+
+    def _service(self, inbox, tmp_path, **kwargs):
+        kwargs.setdefault("extractor", OcrExtractor())
+        return WatchService(DirectoryWatcher(inbox, settle=0), tmp_path / "out", batch_wait=0, **kwargs)
+
+    def test_processes_and_moves(self, inbox, tmp_path):
+        files = [_write(inbox, f"doc_{i}.json", i) for i in range(5)]
+        expected = {f.name: process_file(f, OcrExtractor(), None)[1] for f in files}
+        service = self._service(inbox, tmp_path, batch_size=2)
+        assert [service.run_once() for _ in range(4)] == [2, 2, 1, 0]
+        assert sorted(p.name for p in (inbox / "done").iterdir()) == sorted(expected)
+        assert not list(inbox.glob("*.json"))
+        for name, result in expected.items():
+            written = json.loads(output_path_for(inbox / name, tmp_path / "out").read_text(encoding="utf-8"))
+            assert written == json.loads(json.dumps(result))
+        assert service.batches == 3 and service.run_log.documents == 5
+
+    def test_mark_in_place(self, inbox, tmp_path):
+        _write(inbox, "a.json")
+        service = self._service(inbox, tmp_path, mark=True)
+        assert service.run_once() == 1
+        assert sorted(p.name for p in inbox.iterdir()) == ["a.json.done"]
+        # 표시한 파일은 패턴에 맞지 않아 다시 처리하지 않는다
+        assert service.run_once() == 0
+
+    def test_failed_input_isolated(self, inbox, tmp_path):
+        _write(inbox, "a.json")
+        (inbox / "broken.json").write_text('{"text": "차량', encoding="utf-8")
+        service = self._service(inbox, tmp_path)
+        assert service.run_once() == 2
+        assert [p.name for p in (inbox / "failed").iterdir()] == ["broken.json"]
+        assert [p.name for p in (inbox / "done").iterdir()] == ["a.json"]
+        assert service.failed == 1
+
+    def test_same_name_again(self, inbox, tmp_path):
+        service = self._service(inbox, tmp_path)
+        _write(inbox, "a.json", 1)
+        assert service.run_once() == 1
+        _write(inbox, "a.json", 2)
+        assert service.run_once() == 1
+        assert "12가1002" in (tmp_path / "out" / "a_result.json").read_text(encoding="utf-8")
+
+    def test_output_dir_must_differ(self, inbox):
+        with pytest.raises(ValueError):
+            WatchService(DirectoryWatcher(inbox), inbox, OcrExtractor())
+
+    def test_workers_match_single_process(self, inbox, tmp_path):
+        files = [_write(inbox, f"doc_{i}.json", i) for i in range(6)]
+        expected = {f.name: process_file(f, OcrExtractor(), None)[1] for f in files}
+        metrics.enable()
+        service = self._service(inbox, tmp_path, extractor=None, workers=2, batch_size=4)
+        try:
+            assert service.run_once() + service.run_once() == 6
+        finally:
+            service.close()
+            m = metrics.disable()
+        for name, result in expected.items():
+            written = json.loads(output_path_for(inbox / name, tmp_path / "out").read_text(encoding="utf-8"))
+            assert written == json.loads(json.dumps(result))
+        summary = m.summary()
+        assert summary["stages"]["document"]["count"] == 6
+        assert summary["stages"]["watch_latency"]["count"] == 6
+
+    def test_serve_forever_picks_up_new_files(self, inbox, tmp_path):
+        service = WatchService(DirectoryWatcher(inbox, settle=0), tmp_path / "out", OcrExtractor(),
+                               batch_wait=0.05, poll_interval=0.05)
+        _write(inbox, "backlog.json")
+        thread = threading.Thread(target=service.serve_forever)
+        thread.start()
+        try:
+            deadline = time.monotonic() + 5
+            while not (inbox / "done" / "backlog.json").exists() and time.monotonic() < deadline:
+                time.sleep(0.02)
+            _write(inbox, "new.json")
+            while not (inbox / "done" / "new.json").exists() and time.monotonic() < deadline:
+                time.sleep(0.02)
+        finally:
+            service.stop()
+            thread.join(5)
+            service.close()
+        assert not thread.is_alive()
+        assert sorted(p.name for p in (inbox / "done").iterdir()) == ["backlog.json", "new.json"]